@@ -84,8 +84,11 @@ class QualityAuditorAgent:
             evidence: List of evidence items (field, value, quote, confidence)
             source_text: The full text of the document/chunk to verify quotes against
         """
-        from core.text_utils import find_best_substring_match
+        from core.text_utils import get_quote_index
+        from core.token_tracker import usage_from_completion
         
+        # Tokenize the source once for every quote in this extraction
+        quote_index = get_quote_index(source_text) if source_text else None
         audits = []
         
         # We process each field that has evidence
@@ -101,7 +104,7 @@ class QualityAuditorAgent:
             # 1. Verify Quote Existence (Deterministically)
             quote_status = "verified"
             if source_text:
-                matched_text, score, span = find_best_substring_match(source_text, quote, threshold=0.8)
+                matched_text, score, span = quote_index.best_match(quote, threshold=0.8)
                 if matched_text:
                     if score < 1.0:
                         quote = matched_text  # Auto-correct to exact text
@@ -133,13 +136,10 @@ class QualityAuditorAgent:
                 )
                 
                 # Record usage
-                if self.token_tracker and hasattr(completion, 'usage') and completion.usage:
+                usage = usage_from_completion(completion)
+                if self.token_tracker and usage:
                     self.token_tracker.record_usage(
-                        usage={
-                            "prompt_tokens": completion.usage.prompt_tokens,
-                            "completion_tokens": completion.usage.completion_tokens,
-                            "total_tokens": completion.usage.total_tokens
-                        },
+                        usage=usage,
                         model=self.model,
                         operation="quality_audit"
                     )
@@ -178,7 +178,10 @@ class QualityAuditorAgent:
             source_text: The full text of the document/chunk to verify quotes against
         """
         import asyncio
-        from core.text_utils import find_best_substring_match
+        from core.text_utils import get_quote_index
+        from core.token_tracker import usage_from_completion
+        
+        quote_index = get_quote_index(source_text) if source_text else None
         
         # Helper for a single field audit
         async def audit_field(item):
@@ -192,7 +195,7 @@ class QualityAuditorAgent:
             # 1. Verify Quote Existence (Deterministically)
             quote_status = "verified"
             if source_text:
-                matched_text, score, span = find_best_substring_match(source_text, quote, threshold=0.8)
+                matched_text, score, span = quote_index.best_match(quote, threshold=0.8)
                 if matched_text:
                     if score < 1.0:
                         quote = matched_text  # Auto-correct to exact text
@@ -224,13 +227,10 @@ class QualityAuditorAgent:
                 )
                 
                 # Record usage
-                if self.token_tracker and hasattr(completion, 'usage') and completion.usage:
+                usage = usage_from_completion(completion)
+                if self.token_tracker and usage:
                     await self.token_tracker.record_usage_async(
-                        usage={
-                            "prompt_tokens": completion.usage.prompt_tokens,
-                            "completion_tokens": completion.usage.completion_tokens,
-                            "total_tokens": completion.usage.total_tokens
-                        },
+                        usage=usage,
                         model=self.model,
                         operation="quality_audit_async"
                     )
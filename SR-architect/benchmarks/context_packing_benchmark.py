@@ -0,0 +1,111 @@
+"""
+Benchmark extraction context building.
+
+Compares the character-limited stages.build_context with the token-budget
+ContextPacker on the golden dataset papers (after ContentFilter), without
+LLM calls:
+- prompt tokens per paper for the context
+- golden quote recall: share of golden "*_quote" values that can still be
+  located (fuzzy) in the context, a proxy for extraction accuracy
+
+Usage:
+    python -m benchmarks.context_packing_benchmark --model google/gemini-2.5-flash-lite
+"""
+
+import argparse
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, List
+
+from core.config import settings
+from core.content_filter import ContentFilter
+from core.context_packer import ContextPacker
+from core.parser import DocumentParser
+from core.pipeline.stages import build_context
+from core.schema_builder import build_extraction_model, get_case_report_schema
+from core.text_utils import QuoteIndex
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+GOLDEN_DIR = Path("benchmarks/golden_dataset")
+PAPERS_DIR = Path("papers_benchmark")
+QUOTE_THRESHOLD = 0.7
+
+
+def golden_quotes(golden: Dict[str, Any]) -> List[str]:
+    """Non-trivial golden quote values."""
+    return [
+        value for name, value in golden.items()
+        if name.endswith("_quote") and isinstance(value, str) and len(value.strip()) > 10
+    ]
+
+
+def quote_recall(context: str, quotes: List[str]) -> int:
+    """Number of quotes locatable in the context."""
+    index = QuoteIndex(context)
+    return sum(1 for quote in quotes if index.best_match(quote, threshold=QUOTE_THRESHOLD)[0])
+
+
+def run(model: str, budget: int = None) -> Dict[str, Any]:
+    """Build both contexts for every golden paper and aggregate tokens and recall."""
+    parser = DocumentParser()
+    content_filter = ContentFilter()
+    packer = ContextPacker(model, token_budget=budget)
+    fields = list(build_extraction_model(get_case_report_schema(), "SRExtractionModel").model_fields)
+
+    papers = []
+    for golden_path in sorted(GOLDEN_DIR.glob("*.pdf.json")):
+        pdf_path = PAPERS_DIR / golden_path.name[:-len(".json")]
+        if not pdf_path.exists():
+            continue
+        document = parser.parse_pdf(str(pdf_path))
+        chunks = content_filter.filter_chunks(document.chunks).filtered_chunks or document.chunks
+        quotes = golden_quotes(json.loads(golden_path.read_text()).get("final_data", {}))
+
+        baseline = build_context(chunks)
+        packed = packer.pack(chunks, fields)
+        papers.append({
+            "filename": pdf_path.name,
+            "chunks": len(chunks),
+            "quotes": len(quotes),
+            "baseline_tokens": packer.monitor.count_tokens(baseline),
+            "packed_tokens": packed.tokens,
+            "baseline_recall": quote_recall(baseline, quotes),
+            "packed_recall": quote_recall(packed.text, quotes),
+            "trimmed_chars": packed.trimmed_chars,
+        })
+
+    quotes = sum(p["quotes"] for p in papers) or 1
+    return {
+        "model": model,
+        "token_budget": packer.token_budget,
+        "papers": len(papers),
+        "baseline_tokens": sum(p["baseline_tokens"] for p in papers),
+        "packed_tokens": sum(p["packed_tokens"] for p in papers),
+        "baseline_recall": round(sum(p["baseline_recall"] for p in papers) / quotes, 3),
+        "packed_recall": round(sum(p["packed_recall"] for p in papers) / quotes, 3),
+        "per_paper": papers,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model", default=settings.get_model_for_provider())
+    parser.add_argument("--budget", type=int, default=None, help="Token budget (default: CONTEXT_TOKEN_BUDGET)")
+    parser.add_argument("--output", default="benchmarks/context_packing_report.json")
+    args = parser.parse_args()
+
+    report = run(args.model, args.budget)
+    print(f"\n{'':<10} {'tokens':>8} {'recall':>8}")
+    print(f"{'baseline':<10} {report['baseline_tokens']:>8} {report['baseline_recall']:>8.3f}")
+    print(f"{'packed':<10} {report['packed_tokens']:>8} {report['packed_recall']:>8.3f}")
+
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    logger.info(f"Report saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""
+Benchmark evidence extraction modes.
+
+Runs StructuredExtractor.extract_with_evidence in "two_call" and
+"single_call" mode on the golden dataset papers and compares:
+- field accuracy against benchmarks/golden_dataset
+- quote grounding (share of quotes found verbatim in the context)
+- latency, LLM calls and tokens per paper
+
+Usage:
+    python -m benchmarks.evidence_mode_benchmark --limit 3 --provider openrouter
+    python -m benchmarks.evidence_mode_benchmark --limit 3 --llm-cache record   # then --llm-cache replay
+"""
+
+import argparse
+import json
+import logging
+import re
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+from core.cache.llm_responses import LLM_CACHE_MODES, configure_llm_cache
+from core.config import settings
+from core.constants import METADATA_FIELDS
+from core.extractors import EVIDENCE_MODES, StructuredExtractor
+from core.parser import DocumentParser
+from core.pipeline.stages import build_context
+from core.schema_builder import build_extraction_model, get_case_report_schema
+from core.token_tracker import TokenTracker
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+GOLDEN_DIR = Path("benchmarks/golden_dataset")
+PAPERS_DIR = Path("papers_benchmark")
+
+
+def _normalize(value: Any) -> str:
+    return re.sub(r"[^a-z0-9]+", " ", str(value).lower()).strip()
+
+
+def field_matches(predicted: Any, expected: Any) -> bool:
+    """Lenient match: equal after normalization, or one contains the other."""
+    predicted, expected = _normalize(predicted), _normalize(expected)
+    if not predicted or not expected:
+        return predicted == expected
+    return predicted == expected or predicted in expected or expected in predicted
+
+
+def score_fields(predicted: Dict[str, Any], golden: Dict[str, Any]) -> Dict[str, int]:
+    """Count matching core fields (quotes and metadata excluded)."""
+    fields = [
+        name for name, value in golden.items()
+        if value not in (None, "") and not name.endswith("_quote") and name not in METADATA_FIELDS
+    ]
+    correct = sum(1 for name in fields if field_matches(predicted.get(name), golden[name]))
+    return {"correct": correct, "total": len(fields)}
+
+
+def quote_grounding(evidence: List[Dict[str, Any]], context: str) -> Dict[str, int]:
+    """Count non-empty quotes that appear verbatim (whitespace-normalized) in the context."""
+    haystack = " ".join(context.split()).lower()
+    quotes = [e.get("exact_quote") or "" for e in evidence]
+    quotes = [" ".join(q.split()).lower() for q in quotes if q.strip()]
+    return {"grounded": sum(1 for q in quotes if q in haystack), "quotes": len(quotes)}
+
+
+def run_mode(mode: str, papers: List[Dict[str, Any]], schema, provider: str, model: str) -> Dict[str, Any]:
+    """Extract every paper with one evidence mode and aggregate metrics."""
+    tracker = TokenTracker()
+    extractor = StructuredExtractor(
+        provider=provider, model=model, token_tracker=tracker, evidence_mode=mode
+    )
+
+    per_paper = []
+    for paper in papers:
+        calls_before = extractor.call_count
+        start = time.perf_counter()
+        try:
+            extraction = extractor.extract_with_evidence(paper["context"], schema, filename=paper["filename"])
+        except Exception as e:
+            logger.error(f"[{mode}] {paper['filename']}: {e}")
+            per_paper.append({"filename": paper["filename"], "error": str(e)})
+            continue
+        elapsed = time.perf_counter() - start
+
+        evidence = [item.model_dump() for item in extraction.evidence]
+        per_paper.append({
+            "filename": paper["filename"],
+            "seconds": round(elapsed, 2),
+            "calls": extractor.call_count - calls_before,
+            **score_fields(extraction.data, paper["golden"]),
+            **quote_grounding(evidence, paper["context"]),
+        })
+
+    ok = [p for p in per_paper if "error" not in p]
+    total = sum(p["total"] for p in ok) or 1
+    quotes = sum(p["quotes"] for p in ok) or 1
+    usage = tracker.get_session_summary()
+    return {
+        "mode": mode,
+        "papers": len(ok),
+        "errors": len(per_paper) - len(ok),
+        "accuracy": round(sum(p["correct"] for p in ok) / total, 3),
+        "quote_grounding": round(sum(p["grounded"] for p in ok) / quotes, 3),
+        "mean_seconds": round(sum(p["seconds"] for p in ok) / max(len(ok), 1), 2),
+        "calls_per_paper": round(sum(p["calls"] for p in ok) / max(len(ok), 1), 2),
+        "total_tokens": usage["total_tokens"],
+        "cost_usd": usage["total_cost_usd"],
+        "per_paper": per_paper,
+    }
+
+
+def load_papers(limit: int = None) -> List[Dict[str, Any]]:
+    """Parse benchmark PDFs that have a golden result and build their contexts."""
+    parser = DocumentParser()
+    papers = []
+    for golden_path in sorted(GOLDEN_DIR.glob("*.pdf.json")):
+        pdf_path = PAPERS_DIR / golden_path.name[:-len(".json")]
+        if not pdf_path.exists():
+            continue
+        document = parser.parse_pdf(str(pdf_path))
+        papers.append({
+            "filename": pdf_path.name,
+            "context": build_context(document.chunks),
+            "golden": json.loads(golden_path.read_text()).get("final_data", {}),
+        })
+        if limit and len(papers) >= limit:
+            break
+    return papers
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--limit", type=int, default=None, help="Number of papers")
+    parser.add_argument("--provider", default=settings.LLM_PROVIDER)
+    parser.add_argument("--model", default=None)
+    parser.add_argument("--output", default="benchmarks/evidence_mode_report.json")
+    parser.add_argument("--llm-cache", choices=LLM_CACHE_MODES, default=None,
+                        help="LLM response cache mode (replay: re-run from recorded responses only)")
+    args = parser.parse_args()
+    if args.llm_cache:
+        configure_llm_cache(args.llm_cache)
+
+    model = args.model or settings.get_model_for_provider(args.provider)
+    schema = build_extraction_model(get_case_report_schema(), "SRExtractionModel")
+    papers = load_papers(args.limit)
+    logger.info(f"Benchmarking {len(papers)} papers with {model}")
+
+    report = {"model": model, "modes": [run_mode(mode, papers, schema, args.provider, model) for mode in EVIDENCE_MODES]}
+
+    print(f"\n{'mode':<12} {'accuracy':>9} {'grounded':>9} {'sec/paper':>10} {'calls':>6} {'tokens':>8}")
+    for result in report["modes"]:
+        print(
+            f"{result['mode']:<12} {result['accuracy']:>9.3f} {result['quote_grounding']:>9.3f} "
+            f"{result['mean_seconds']:>10.2f} {result['calls_per_paper']:>6.1f} {result['total_tokens']:>8}"
+        )
+
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2, default=str)
+    logger.info(f"Report saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Benchmark per-field-group retrieval against one monolithic context.
+
+For each golden dataset paper (after ContentFilter), without LLM calls:
+- monolithic: one packed context for the whole schema
+- grouped: fields grouped by group_fields, each group's context packed
+  from its top-k BM25-retrieved chunks
+
+Reports context tokens (total and largest single prompt) and golden quote
+recall: the share of golden "<field>_quote" values locatable (fuzzy) in
+the context that field is extracted from.
+
+Usage:
+    python -m benchmarks.field_group_rag_benchmark --top-k 4
+"""
+
+import argparse
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, List
+
+from core.chunk_index import ChunkIndex
+from core.config import settings
+from core.content_filter import ContentFilter
+from core.context_packer import ContextPacker
+from core.parser import DocumentParser
+from core.pipeline.field_groups import group_fields
+from core.schema_builder import build_extraction_model, get_case_report_schema
+from core.text_utils import QuoteIndex
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+GOLDEN_DIR = Path("benchmarks/golden_dataset")
+PAPERS_DIR = Path("papers_benchmark")
+QUOTE_THRESHOLD = 0.7
+
+
+def golden_quotes(golden: Dict[str, Any]) -> Dict[str, str]:
+    """Non-trivial golden quote values keyed by their base field."""
+    return {
+        name[:-len("_quote")]: value for name, value in golden.items()
+        if name.endswith("_quote") and isinstance(value, str) and len(value.strip()) > 10
+    }
+
+
+def found(context: str, quote: str) -> bool:
+    return QuoteIndex(context).best_match(quote, threshold=QUOTE_THRESHOLD)[0] is not None
+
+
+def run(model: str, top_k: int) -> Dict[str, Any]:
+    """Build monolithic and per-group contexts for every golden paper."""
+    parser = DocumentParser()
+    content_filter = ContentFilter()
+    packer = ContextPacker(model)
+    schema = build_extraction_model(get_case_report_schema(), "SRExtractionModel")
+    groups = group_fields(schema)
+    logger.info("Groups: " + "; ".join(f"{g.name}: {', '.join(g.fields)}" for g in groups))
+
+    papers = []
+    for golden_path in sorted(GOLDEN_DIR.glob("*.pdf.json")):
+        pdf_path = PAPERS_DIR / golden_path.name[:-len(".json")]
+        if not pdf_path.exists():
+            continue
+        document = parser.parse_pdf(str(pdf_path))
+        chunks = content_filter.filter_chunks(document.chunks).filtered_chunks or document.chunks
+        quotes = golden_quotes(json.loads(golden_path.read_text()).get("final_data", {}))
+
+        monolithic = packer.pack(chunks, list(schema.model_fields))
+        monolithic_recall = sum(1 for quote in quotes.values() if found(monolithic.text, quote))
+        index = ChunkIndex(chunks)
+        group_tokens: List[int] = []
+        grouped_recall = 0
+        # Short papers are extracted monolithically (as in the pipeline)
+        for group in groups if len(document.chunks) > top_k else []:
+            hits = sorted(index.search(group.query, top_k)) or [(i, 0.0) for i in range(min(top_k, len(chunks)))]
+            best = max(score for _, score in hits) or 1.0
+            packed = packer.pack(
+                [chunks[i] for i, _ in hits], group.fields, [score / best for _, score in hits]
+            )
+            group_tokens.append(packed.tokens)
+            grouped_recall += sum(1 for name in group.fields if name in quotes and found(packed.text, quotes[name]))
+
+        papers.append({
+            "filename": pdf_path.name,
+            "chunks": len(chunks),
+            "quotes": len(quotes),
+            "monolithic_tokens": monolithic.tokens,
+            "grouped_tokens": sum(group_tokens) if group_tokens else monolithic.tokens,
+            "largest_group_tokens": max(group_tokens) if group_tokens else monolithic.tokens,
+            "monolithic_recall": monolithic_recall,
+            "grouped_recall": grouped_recall if group_tokens else monolithic_recall,
+        })
+
+    quotes = sum(p["quotes"] for p in papers) or 1
+    return {
+        "model": model,
+        "top_k": top_k,
+        "groups": [g.name for g in groups],
+        "papers": len(papers),
+        "monolithic_tokens": sum(p["monolithic_tokens"] for p in papers),
+        "grouped_tokens": sum(p["grouped_tokens"] for p in papers),
+        "largest_group_tokens": max((p["largest_group_tokens"] for p in papers), default=0),
+        "monolithic_recall": round(sum(p["monolithic_recall"] for p in papers) / quotes, 3),
+        "grouped_recall": round(sum(p["grouped_recall"] for p in papers) / quotes, 3),
+        "per_paper": papers,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model", default=settings.get_model_for_provider())
+    parser.add_argument("--top-k", type=int, default=settings.FIELD_GROUP_TOP_K, help="Chunks retrieved per group")
+    parser.add_argument("--output", default="benchmarks/field_group_rag_report.json")
+    args = parser.parse_args()
+
+    report = run(args.model, args.top_k)
+    print(f"\n{'':<12} {'tokens':>8} {'recall':>8}")
+    print(f"{'monolithic':<12} {report['monolithic_tokens']:>8} {report['monolithic_recall']:>8.3f}")
+    print(f"{'grouped':<12} {report['grouped_tokens']:>8} {report['grouped_recall']:>8.3f}")
+    print(f"Largest single group prompt: {report['largest_group_tokens']} tokens")
+
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    logger.info(f"Report saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""
+Benchmark fuzzy quote location on long documents.
+
+Compares the previous sliding-window Jaccard scan (one set rebuilt per
+window) with the indexed QuoteIndex lookup on a ~50-page document made by
+concatenating the benchmark papers. Quotes are spans of the document with
+a few words replaced, so every lookup goes through the fuzzy path.
+
+Reports per-quote latency, index build time, and whether both methods
+agree on the best score.
+
+Usage:
+    python -m benchmarks.quote_locator_benchmark --pages 50 --quotes 20
+"""
+
+import argparse
+import json
+import logging
+import random
+import re
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from core.parser import DocumentParser
+from core.text_utils import QuoteIndex, jaccard_score, tokenize
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+PAPERS_DIR = Path("papers_benchmark")
+WORDS_PER_PAGE = 500
+
+
+def legacy_find_best_substring_match(
+    text: str, pattern: str, threshold: float = 0.8, window_slack: float = 0.5
+) -> Tuple[Optional[str], float, Optional[Tuple[int, int]]]:
+    """The sliding-window scan find_best_substring_match used before QuoteIndex."""
+    exact_idx = text.find(pattern)
+    if exact_idx != -1:
+        return pattern, 1.0, (exact_idx, exact_idx + len(pattern))
+
+    pattern_tokens = tokenize(pattern)
+    pattern_set = set(pattern_tokens)
+    min_window = max(1, int(len(pattern_tokens) * (1 - window_slack)))
+    max_window = int(len(pattern_tokens) * (1 + window_slack)) + 1
+    token_map = [(m.group().lower(), m.start(), m.end()) for m in re.finditer(r'\b\w+\b', text)]
+
+    best_score, best = 0.0, None
+    for i in range(len(token_map)):
+        if i + min_window > len(token_map):
+            break
+        for w_len in range(min_window, min(max_window, len(token_map) - i + 1)):
+            score = jaccard_score(set(t[0] for t in token_map[i:i + w_len]), pattern_set)
+            if score > best_score:
+                best_score, best = score, (i, i + w_len)
+
+    if best_score >= threshold and best:
+        start, end = token_map[best[0]][1], token_map[best[1] - 1][2]
+        return text[start:end], best_score, (start, end)
+    return None, best_score, None
+
+
+def build_document(pages: int) -> str:
+    """Concatenate benchmark papers (repeating them) up to the requested page count."""
+    parser = DocumentParser()
+    texts = [parser.parse_pdf(str(path)).full_text for path in sorted(PAPERS_DIR.glob("*.pdf"))]
+    texts = [t for t in texts if t.strip()]
+    if not texts:
+        raise SystemExit(f"No parseable PDFs in {PAPERS_DIR}")
+
+    target = pages * WORDS_PER_PAGE
+    parts, words = [], 0
+    while words < target:
+        for text in texts:
+            parts.append(text)
+            words += len(text.split())
+            if words >= target:
+                break
+    return "\n\n".join(parts)
+
+
+def sample_quotes(document: str, count: int, seed: int = 0) -> List[str]:
+    """Document spans of 8-30 words with one to three words replaced."""
+    rng = random.Random(seed)
+    words = document.split()
+    quotes = []
+    for _ in range(count):
+        length = rng.randint(8, 30)
+        start = rng.randrange(len(words) - length)
+        quote = words[start:start + length]
+        for _ in range(rng.randint(1, 3)):
+            quote[rng.randrange(length)] = rng.choice(["reportedly", "approximately", "notably"])
+        quotes.append(" ".join(quote))
+    return quotes
+
+
+def run(pages: int, quote_count: int, legacy_limit: int) -> Dict[str, Any]:
+    """Time both methods on the same quotes and compare their scores."""
+    document = build_document(pages)
+    quotes = sample_quotes(document, quote_count)
+
+    start = time.perf_counter()
+    index = QuoteIndex(document)
+    build_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    indexed = [index.best_match(quote) for quote in quotes]
+    indexed_seconds = (time.perf_counter() - start) / len(quotes)
+
+    legacy_quotes = quotes[:legacy_limit]
+    start = time.perf_counter()
+    legacy = [legacy_find_best_substring_match(document, quote) for quote in legacy_quotes]
+    legacy_seconds = (time.perf_counter() - start) / max(len(legacy_quotes), 1)
+
+    agree = sum(
+        1 for old, new in zip(legacy, indexed)
+        if (old[0] is None) == (new[0] is None) and (old[0] is None or abs(old[1] - new[1]) < 1e-9)
+    )
+    return {
+        "pages": pages,
+        "words": len(document.split()),
+        "tokens": len(index.tokens),
+        "quotes": len(quotes),
+        "index_build_seconds": round(build_seconds, 4),
+        "indexed_seconds_per_quote": round(indexed_seconds, 5),
+        "legacy_seconds_per_quote": round(legacy_seconds, 3),
+        "speedup": round(legacy_seconds / indexed_seconds, 1) if indexed_seconds else None,
+        "agreement": f"{agree}/{len(legacy_quotes)}",
+        "matched": sum(1 for m in indexed if m[0] is not None),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=50, help="Document length in pages (~500 words each)")
+    parser.add_argument("--quotes", type=int, default=20, help="Number of quotes to locate")
+    parser.add_argument("--legacy-limit", type=int, default=5, help="Quotes to run through the slow legacy scan")
+    parser.add_argument("--output", default="benchmarks/quote_locator_report.json")
+    args = parser.parse_args()
+
+    report = run(args.pages, args.quotes, args.legacy_limit)
+    for key, value in report.items():
+        print(f"{key:<28} {value}")
+
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    logger.info(f"Report saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""
+Benchmark pipeline throughput against the offline stub LLM server.
+
+Starts core.stub_llm.StubLLMServer on STUB_LLM_BASE_URL (unless --external),
+builds synthetic case-report documents and runs them through
+BatchExecutor.process_batch_async with provider "stub". No API spend and no
+local model, so the numbers isolate orchestration overhead:
+- documents per second and wall time
+- LLM requests per document, simulated 429s / 500s
+- succeeded vs failed documents
+
+Usage:
+    python -m benchmarks.throughput_benchmark --docs 2000 --concurrency 64 --latency-ms 50
+    python -m benchmarks.throughput_benchmark --docs 500 --rate-limit-rate 0.05 --error-rate 0.01
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+from urllib.parse import urlparse
+
+from core.batch import BatchExecutor
+from core.config import settings
+from core.parser import DocumentChunk, ParsedDocument
+from core.pipeline import HierarchicalExtractionPipeline
+from core.schema_builder import build_extraction_model, get_case_report_schema
+from core.state_manager import StateManager
+from core.stub_llm import LATENCY_DISTRIBUTIONS, StubLLMConfig, StubLLMServer
+from core.token_tracker import TokenTracker
+from core.utils import setup_logging
+
+logger = logging.getLogger(__name__)
+
+SECTIONS = [
+    ("Abstract", "We report a {age}-year-old {sex} with multiple pulmonary nodules found incidentally (case {i})."),
+    ("Case Presentation", "The patient, a {age}-year-old {sex}, presented with cough. CT showed ground glass nodules up to {size} mm."),
+    ("Pathology", "Wedge resection showed meningothelial-like nodules; EMA and PR were positive in case {i}."),
+    ("Outcome", "At {months} months of follow-up the nodules remained stable without treatment."),
+]
+
+
+def synthetic_documents(count: int) -> List[ParsedDocument]:
+    """Distinct small case reports (no two share a fingerprint)."""
+    documents = []
+    for i in range(count):
+        values = {"i": i, "age": 40 + i % 40, "sex": "woman" if i % 2 else "man", "size": 2 + i % 9, "months": 6 + i % 30}
+        chunks = [DocumentChunk(text=text.format(**values), section=section) for section, text in SECTIONS]
+        documents.append(ParsedDocument(
+            filename=f"synthetic_{i:05d}.pdf",
+            full_text="\n\n".join(chunk.text for chunk in chunks),
+            chunks=chunks,
+        ))
+    return documents
+
+
+def run(docs: int, concurrency: int, max_iterations: int, server: StubLLMServer) -> Dict[str, Any]:
+    """Extract the synthetic documents through BatchExecutor and collect timings."""
+    tracker = TokenTracker(api_key="")
+    pipeline = HierarchicalExtractionPipeline(
+        provider="stub",
+        model=settings.STUB_LLM_MODEL,
+        max_iterations=max_iterations,
+        token_tracker=tracker,
+    )
+    schema = build_extraction_model(get_case_report_schema(), "SRExtractionModel")
+    documents = synthetic_documents(docs)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        executor = BatchExecutor(pipeline, StateManager(Path(tmp) / "checkpoint.json"), max_workers=concurrency)
+        start = time.perf_counter()
+        asyncio.run(executor.process_batch_async(documents, schema, "pulmonary meningothelial nodules", resume=False))
+        elapsed = time.perf_counter() - start
+        state = executor.state_manager.load()
+
+    stub = server.stats() if server is not None else {}
+    succeeded = len(state.results)
+    return {
+        "docs": docs,
+        "concurrency": concurrency,
+        "max_iterations": max_iterations,
+        "seconds": round(elapsed, 2),
+        "docs_per_second": round(docs / elapsed, 2) if elapsed else 0.0,
+        "succeeded": succeeded,
+        "failed": docs - succeeded,
+        "llm_requests": stub.get("requests"),
+        "requests_per_doc": round(stub["requests"] / docs, 2) if stub.get("requests") else None,
+        "rate_limited": stub.get("rate_limited"),
+        "server_errors": stub.get("errors"),
+        "tracked_tokens": tracker.get_session_summary()["total_tokens"],
+        "stub_config": stub.get("config"),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--docs", type=int, default=1000, help="Synthetic documents to extract")
+    parser.add_argument("--concurrency", type=int, default=32, help="Documents in flight")
+    parser.add_argument("--max-iter", type=int, default=1, help="Checker feedback iterations per document")
+    parser.add_argument("--latency", choices=LATENCY_DISTRIBUTIONS, default="lognormal")
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="Mean simulated latency per LLM call")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of calls answered with HTTP 500")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Share of calls answered with HTTP 429")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--external", action="store_true", help="Use a stub server already running on STUB_LLM_BASE_URL")
+    parser.add_argument("--output", default="benchmarks/throughput_report.json")
+    args = parser.parse_args()
+    # Per-document pipeline logging would dominate the measurement
+    setup_logging(level="WARNING")
+
+    server = None
+    if not args.external:
+        url = urlparse(settings.STUB_LLM_BASE_URL)
+        config = StubLLMConfig(
+            latency=args.latency,
+            latency_ms=args.latency_ms,
+            error_rate=args.error_rate,
+            rate_limit_rate=args.rate_limit_rate,
+            seed=args.seed,
+        )
+        server = StubLLMServer(config, host=url.hostname, port=url.port).start()
+    try:
+        report = run(args.docs, args.concurrency, args.max_iter, server)
+    finally:
+        if server is not None:
+            server.stop()
+
+    print(f"\n{report['docs']} docs in {report['seconds']}s -> {report['docs_per_second']} docs/s")
+    print(f"succeeded {report['succeeded']}, failed {report['failed']}")
+    if report["llm_requests"] is not None:
+        print(f"LLM requests {report['llm_requests']} ({report['requests_per_doc']}/doc), "
+              f"429s {report['rate_limited']}, 500s {report['server_errors']}")
+
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Report saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,7 @@ import json
 import time
 from pathlib import Path
 from typing import Optional, List
+from urllib.parse import urlparse
 
 import typer
 from rich.console import Console
@@ -18,6 +19,7 @@ from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskPr
 from rich.table import Table
 from rich.panel import Panel
 
+from core import constants
 from core.config import settings, MODEL_ALIASES
 from core import (
     DocumentParser, 
@@ -82,7 +84,7 @@ def extract(
     schema: str = typer.Option("case_report", "-s", "--schema", help="Schema: case_report, rct, observational, or 'interactive'"),
     interactive: bool = typer.Option(False, "-i", "--interactive", help="Interactive schema builder"),
     limit: Optional[int] = typer.Option(None, "-l", "--limit", help="Limit number of papers to process"),
-    provider: str = typer.Option(settings.LLM_PROVIDER, "-p", "--provider", help="LLM provider: openrouter or ollama"),
+    provider: str = typer.Option(settings.LLM_PROVIDER, "-p", "--provider", help="LLM provider: openrouter, ollama or stub (offline stub server)"),
     model: Optional[str] = typer.Option(settings.LLM_MODEL, "-m", "--model", help="Override LLM model"),
     vectorize: bool = typer.Option(True, "--vectorize/--no-vectorize", help="Store vectors in ChromaDB"),
     verbose: bool = typer.Option(False, "-v", "--verbose", help="Verbose output"),
@@ -103,6 +105,11 @@ def extract(
     # Schema chunking for large schemas
     chunk_schema_flag: bool = typer.Option(True, "--chunk-schema/--no-chunk-schema", help="Auto-chunk large schemas (>30 fields) for cost optimization"),
     max_fields_per_chunk: int = typer.Option(25, "--max-fields-per-chunk", help="Maximum fields per chunk (default: 25)"),
+    # Streaming execution
+    pipelined: bool = typer.Option(False, "--pipelined", help="Overlap PDF parsing with extraction (rows are written as papers finish; hierarchical mode)"),
+    evidence_mode: str = typer.Option(settings.EXTRACTION_EVIDENCE_MODE, "--evidence-mode", help="Evidence extraction: two_call (data, then quotes) or single_call (one call per iteration)"),
+    field_groups: bool = typer.Option(settings.FIELD_GROUP_RETRIEVAL, "--field-groups/--no-field-groups", help="Extract fields in topic groups, each from its top-k retrieved chunks (hierarchical mode)"),
+    llm_cache: Optional[str] = typer.Option(None, "--llm-cache", help="LLM response cache: off, read_write, record or replay (default: LLM_CACHE_MODE)"),
 ):
     """
     Extract structured data from PDFs for systematic review.
@@ -128,6 +135,14 @@ def extract(
     # Initialize logging
     log_file = Path(output).parent / "sr_architect.log"
     setup_logging(level="DEBUG" if verbose else None, log_file=log_file)
+
+    if llm_cache:
+        from core.cache import configure_llm_cache
+        try:
+            configure_llm_cache(llm_cache)
+        except ValueError as e:
+            console.print(f"[red]Error: {e}[/red]")
+            raise typer.Exit(1)
     
     papers_path = Path(papers_dir)
     if not papers_path.exists():
@@ -155,6 +170,7 @@ def extract(
         f"Schema: {schema}\n"
         f"Provider: {provider}\n"
         f"Hybrid Mode: {'[green]Enabled[/green]' if hybrid_mode else '[yellow]Disabled (Sonnet-only)[/yellow]'}\n"
+        f"Evidence Mode: {evidence_mode}\n"
         f"Output: {output}",
         title="Configuration"
     ))
@@ -297,7 +313,10 @@ def extract(
             limit=limit,  # COST-001 fix: pass limit to service
             hybrid_mode=hybrid_mode,  # COST-001 fix: enable local-first extraction
             schema_chunks=schema_chunks,  # Schema chunking for cost optimization
-            callback=progress_callback
+            callback=progress_callback,
+            pipelined=pipelined,
+            evidence_mode=evidence_mode,
+            field_groups=field_groups,
         )
     
     # Final summary with failures
@@ -315,7 +334,18 @@ def extract(
     table.add_row("Successfully parsed", str(execution_summary["parsed_files"]))
     table.add_row("Extraction failures", str(len(execution_summary["failed_files"])))
     table.add_row("Total tokens", f"{summary['total_tokens']:,}")
+    if summary.get("total_cached_prompt_tokens"):
+        table.add_row(
+            "Cached prompt tokens",
+            f"{summary['total_cached_prompt_tokens']:,} ({summary['cache_hit_rate']:.1%})",
+        )
     table.add_row("Total cost (USD)", f"${summary['total_cost_usd']:.4f}")
+    relevance_cache = execution_summary.get("relevance_cache", {})
+    if relevance_cache.get("enabled"):
+        table.add_row(
+            "Relevance cache hits/misses",
+            f"{relevance_cache['hits']}/{relevance_cache['misses']} ({relevance_cache['hit_rate']:.1f}%)",
+        )
     # Hybrid mode stats (Phase 5)
     if hybrid_mode:
         table.add_row("─" * 20, "─" * 12)
@@ -457,7 +487,7 @@ def discover(
     papers_dir: str = typer.Argument(..., help="Directory containing PDFs"),
     sample: int = typer.Option(3, "-n", "--sample", help="Number of papers to analyze"),
     output: str = typer.Option("./discovered_schema.json", "-o", "--output", help="Save schema to JSON"),
-    provider: str = typer.Option(settings.LLM_PROVIDER, "-p", "--provider", help="LLM provider: openrouter or ollama"),
+    provider: str = typer.Option(settings.LLM_PROVIDER, "-p", "--provider", help="LLM provider: openrouter, ollama or stub (offline stub server)"),
     model: Optional[str] = typer.Option(settings.LLM_MODEL, "-m", "--model", help="Override LLM model"),
 ):
     """
@@ -584,5 +614,217 @@ def benchmark(
     console.print("\n[bold green]Benchmark Complete.[/bold green]")
 
 
+cache_app = typer.Typer(help="Inspect and prune the parsed-document and LLM response caches")
+app.add_typer(cache_app, name="cache")
+
+PARSE_CACHE_DIR = ".cache/parsed_docs"
+
+
+def _format_bytes(num_bytes: int) -> str:
+    """Human-readable byte count."""
+    size = float(num_bytes)
+    for unit in ["B", "KB", "MB"]:
+        if size < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+@cache_app.command("stats")
+def cache_stats(
+    cache_dir: str = typer.Option(PARSE_CACHE_DIR, "-d", "--dir", help="Parse cache directory"),
+):
+    """Show parse cache size, hit counts and budget usage."""
+    from core.parsers.cache import ParseCache
+
+    stats = ParseCache(Path(cache_dir)).stats()
+    budget = settings.PARSER_CACHE_MAX_BYTES
+
+    table = Table(title="Parse Cache Statistics")
+    table.add_column("Metric")
+    table.add_column("Value")
+    table.add_row("Directory", stats["cache_dir"])
+    table.add_row("Parser version", stats["parser_version"])
+    table.add_row("Entries", str(stats["entries"]))
+    table.add_row("Size", f"{_format_bytes(stats['total_bytes'])} / {_format_bytes(budget)}")
+    table.add_row("Total hits", str(stats["total_hits"]))
+    for label, key in [("Oldest access", "oldest_access"), ("Newest access", "newest_access")]:
+        value = stats[key]
+        table.add_row(label, time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(value)) if value else "-")
+    console.print(table)
+
+
+@cache_app.command("prune")
+def cache_prune(
+    cache_dir: str = typer.Option(PARSE_CACHE_DIR, "-d", "--dir", help="Parse cache directory"),
+    max_bytes: Optional[int] = typer.Option(None, "--max-bytes", help="Byte budget to prune to (default: PARSER_CACHE_MAX_BYTES; 0 clears the cache)"),
+    reindex: bool = typer.Option(False, "--reindex", help="Rescan the cache directory before pruning"),
+):
+    """Evict least recently used parse cache entries down to a byte budget."""
+    from core.parsers.cache import ParseCache
+
+    cache = ParseCache(Path(cache_dir))
+    if reindex:
+        indexed = cache.rebuild_index()
+        console.print(f"Re-indexed {indexed} entries")
+
+    budget = settings.PARSER_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+    evicted, freed = cache.evict(budget)
+    console.print(
+        f"[green]Evicted {evicted} entries ({_format_bytes(freed)}); "
+        f"cache is now {_format_bytes(cache.index.total_bytes())} / {_format_bytes(budget)}[/green]"
+    )
+
+
+@cache_app.command("llm-stats")
+def cache_llm_stats(
+    cache_dir: str = typer.Option(settings.LLM_CACHE_DIR, "-d", "--dir", help="LLM response cache directory"),
+):
+    """Show LLM response cache size and hit counts."""
+    from core.cache import LLMResponseCache
+
+    stats = LLMResponseCache(Path(cache_dir), mode="read_write").stats()
+    table = Table(title="LLM Response Cache Statistics")
+    table.add_column("Metric")
+    table.add_column("Value")
+    table.add_row("Directory", stats["cache_dir"])
+    table.add_row("Mode (LLM_CACHE_MODE)", settings.LLM_CACHE_MODE)
+    table.add_row("Entries", str(stats["entries"]))
+    table.add_row("Size", f"{_format_bytes(stats['total_bytes'])} / {_format_bytes(settings.LLM_CACHE_MAX_BYTES)}")
+    table.add_row("Total hits", str(stats["total_hits"]))
+    console.print(table)
+
+
+@cache_app.command("llm-prune")
+def cache_llm_prune(
+    cache_dir: str = typer.Option(settings.LLM_CACHE_DIR, "-d", "--dir", help="LLM response cache directory"),
+    max_bytes: Optional[int] = typer.Option(None, "--max-bytes", help="Byte budget to prune to (default: LLM_CACHE_MAX_BYTES; 0 clears the cache)"),
+):
+    """Drop expired LLM responses and evict least recently used ones down to a byte budget."""
+    from core.cache import LLMResponseCache
+
+    cache = LLMResponseCache(Path(cache_dir), mode="read_write")
+    expired, evicted = cache.prune(max_bytes)
+    console.print(
+        f"[green]Dropped {expired} expired and {evicted} evicted responses; "
+        f"cache is now {_format_bytes(cache.stats()['total_bytes'])}[/green]"
+    )
+
+
+daemon_app = typer.Typer(help="Run the warm Docling worker daemon")
+app.add_typer(daemon_app, name="daemon")
+
+
+@daemon_app.command("start")
+def daemon_start(
+    socket_path: str = typer.Option(settings.DOCLING_DAEMON_SOCKET, "--socket", help="Unix socket path"),
+    workers: int = typer.Option(settings.DOCLING_DAEMON_WORKERS, "-w", "--workers", help="Warm converter processes"),
+    timeout: float = typer.Option(settings.DOCLING_JOB_TIMEOUT, "--timeout", help="Per-job timeout in seconds"),
+    max_memory_mb: int = typer.Option(settings.DOCLING_JOB_MAX_MEMORY_MB, "--max-memory-mb", help="Per-worker memory cap in MB (0 = no cap)"),
+):
+    """Start the Docling daemon in the foreground (Ctrl+C to stop)."""
+    from core.parsers.daemon import DoclingDaemon
+
+    daemon = DoclingDaemon(
+        socket_path=socket_path,
+        workers=workers,
+        job_timeout=timeout,
+        max_memory_mb=max_memory_mb,
+    )
+    console.print(f"[cyan]Loading {workers} Docling worker(s)...[/cyan]")
+    try:
+        daemon.start()
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1)
+    console.print(f"[green]Docling daemon listening on {socket_path}[/green]")
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Docling daemon stopped[/yellow]")
+
+
+@daemon_app.command("status")
+def daemon_status(
+    socket_path: str = typer.Option(settings.DOCLING_DAEMON_SOCKET, "--socket", help="Unix socket path"),
+):
+    """Show whether the Docling daemon is running, with job counters."""
+    from core.parsers.daemon import DoclingDaemonClient
+
+    try:
+        status = DoclingDaemonClient(socket_path).status()
+    except (OSError, ValueError):
+        console.print(f"[yellow]Docling daemon not running ({socket_path})[/yellow]")
+        raise typer.Exit(1)
+
+    table = Table(title="Docling Daemon")
+    table.add_column("Metric")
+    table.add_column("Value")
+    for key in ["pid", "workers", "configured_workers", "jobs", "failed", "timeouts", "memory_kills"]:
+        table.add_row(key, str(status.get(key)))
+    console.print(table)
+
+
+@daemon_app.command("stop")
+def daemon_stop(
+    socket_path: str = typer.Option(settings.DOCLING_DAEMON_SOCKET, "--socket", help="Unix socket path"),
+):
+    """Ask a running Docling daemon to shut down."""
+    from core.parsers.daemon import DoclingDaemonClient
+
+    try:
+        DoclingDaemonClient(socket_path).shutdown()
+    except (OSError, ValueError):
+        console.print(f"[yellow]Docling daemon not running ({socket_path})[/yellow]")
+        raise typer.Exit(1)
+    console.print("[green]Docling daemon stopping[/green]")
+
+
+stub_app = typer.Typer(help="Run the offline OpenAI-compatible stub LLM server (provider 'stub')")
+app.add_typer(stub_app, name="stub")
+
+
+@stub_app.command("serve")
+def stub_serve(
+    host: str = typer.Option(urlparse(settings.STUB_LLM_BASE_URL).hostname, "--host", help="Interface to bind"),
+    port: int = typer.Option(urlparse(settings.STUB_LLM_BASE_URL).port, "--port", help="Port to bind (default: from STUB_LLM_BASE_URL)"),
+    latency: str = typer.Option("lognormal", "--latency", help="Latency distribution: none, fixed, uniform, exponential or lognormal"),
+    latency_ms: float = typer.Option(constants.STUB_LLM_LATENCY_MS, "--latency-ms", help="Mean simulated latency per request (ms)"),
+    error_rate: float = typer.Option(0.0, "--error-rate", help="Share of requests answered with HTTP 500"),
+    rate_limit_rate: float = typer.Option(0.0, "--rate-limit-rate", help="Share of requests answered with HTTP 429"),
+    prompt_tokens: Optional[int] = typer.Option(None, "--prompt-tokens", help="Fixed prompt tokens per response (default: estimated)"),
+    completion_tokens: Optional[int] = typer.Option(None, "--completion-tokens", help="Fixed completion tokens per response (default: estimated)"),
+    seed: Optional[int] = typer.Option(None, "--seed", help="Random seed for latency and failures"),
+):
+    """Serve schema-valid fake chat completions in the foreground (Ctrl+C to stop)."""
+    from core.stub_llm import StubLLMConfig, StubLLMServer
+
+    try:
+        config = StubLLMConfig(
+            latency=latency,
+            latency_ms=latency_ms,
+            error_rate=error_rate,
+            rate_limit_rate=rate_limit_rate,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            seed=seed,
+        )
+        server = StubLLMServer(config, host=host, port=port)
+    except (ValueError, OSError) as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1)
+    console.print(f"[green]Stub LLM server listening on {server.base_url}[/green]")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        stats = server.stats()
+        console.print(
+            f"\n[yellow]Stub LLM server stopped after {stats['requests']} requests "
+            f"({stats['rate_limited']} rate limited, {stats['errors']} errors)[/yellow]"
+        )
+    finally:
+        server.server_close()
+
+
 if __name__ == "__main__":
     app()
@@ -155,7 +155,10 @@ class BatchExecutor:
 
         async with semaphore:
             try:
-                result = await self.pipeline.extract_document_async(doc, schema, theme)
+                if isinstance(schema, (list, tuple)):
+                    result = await self.pipeline.extract_document_chunked_async(doc, list(schema), theme)
+                else:
+                    result = await self.pipeline.extract_document_async(doc, schema, theme)
                 serialized = self.handler.serialize_result(result)
                 self.handler.handle_success(doc.filename, serialized, callback, save=False)
                 await self.state_manager.save_async()
@@ -171,6 +174,18 @@ class BatchExecutor:
                 await self.state_manager.save_async()
                 return None
 
+    def _effective_concurrency(self, concurrency_limit: Optional[int]) -> int:
+        """Resolve async concurrency, applying resource-based throttling."""
+        effective_limit = concurrency_limit or self.max_workers
+        
+        # Apply throttling if RM is present
+        if self.resource_manager:
+            recommended = self.resource_manager.get_recommended_workers(effective_limit)
+            if recommended < effective_limit:
+                logger.info(f"Throttling concurrency from {effective_limit} to {recommended} based on system resources.")
+                effective_limit = max(1, recommended)
+        return effective_limit
+
     async def process_batch_async(
         self,
         documents: List[ParsedDocument],
@@ -185,7 +200,8 @@ class BatchExecutor:
         
         Args:
             documents: List of docs to process
-            schema: Pydantic model for extraction
+            schema: Pydantic model for extraction, or a list of schema-chunk
+                models extracted concurrently over one shared context per doc
             theme: Theme string
             resume: Whether to skip already processed files
             callback: Progress callback
@@ -201,14 +217,7 @@ class BatchExecutor:
             final_state = self.state_manager.load()
             return list(final_state.results.values())
             
-        effective_limit = concurrency_limit or self.max_workers
-        
-        # Apply throttling if RM is present
-        if self.resource_manager:
-            recommended = self.resource_manager.get_recommended_workers(effective_limit)
-            if recommended < effective_limit:
-                logger.info(f"Throttling concurrency from {effective_limit} to {recommended} based on system resources.")
-                effective_limit = max(1, recommended)
+        effective_limit = self._effective_concurrency(concurrency_limit)
                 
         logger.info(f"Starting async parallel extraction [concurrency={effective_limit}] for {len(to_process)} documents.")
         
@@ -224,3 +233,55 @@ class BatchExecutor:
         # Reload state to get full results set
         final_state = self.state_manager.load()
         return list(final_state.results.values())
+
+
+    async def process_stream_async(
+        self,
+        queue: "asyncio.Queue[Optional[ParsedDocument]]",
+        schema: Type[T],
+        theme: str,
+        resume: bool = True,
+        callback: Optional[Callable[[str, Any, str], None]] = None,
+        concurrency_limit: Optional[int] = None
+    ) -> List[Any]:
+        """
+        Run extraction on documents as they arrive on a queue.
+        
+        Used by the pipelined service mode so extraction starts while the
+        remaining PDFs are still being parsed. ``None`` on the queue marks
+        the end of the stream. Workers only take a document when they are
+        free, so a bounded queue applies backpressure to the producer.
+        
+        Args:
+            queue: Queue of parsed documents, terminated by None
+            schema: Pydantic model for extraction
+            theme: Theme string
+            resume: Whether to skip already processed files
+            callback: Progress callback
+            concurrency_limit: Max concurrent tasks (defaults to self.max_workers)
+            
+        Returns:
+            List of results
+        """
+        processed = set(self.state_manager.load().processed_files) if resume else set()
+        effective_limit = self._effective_concurrency(concurrency_limit)
+        logger.info(f"Starting streaming extraction [concurrency={effective_limit}].")
+        
+        semaphore = asyncio.Semaphore(effective_limit)
+
+        async def worker():
+            while True:
+                doc = await queue.get()
+                if doc is None:
+                    # Leave the sentinel for the other workers
+                    await queue.put(None)
+                    return
+                if doc.filename in processed:
+                    logger.debug(f"Skipping {doc.filename} (already completed)")
+                    continue
+                await self._execute_single_async(doc, schema, theme, callback, semaphore)
+
+        await asyncio.gather(*(worker() for _ in range(effective_limit)))
+
+        final_state = self.state_manager.load()
+        return list(final_state.results.values())
@@ -1,5 +1,26 @@
 from .manager import CacheManager
 from .models import CacheEntry
-from .constants import DEFAULT_CACHE_PATH
+from .constants import DEFAULT_CACHE_PATH, DEFAULT_FINGERPRINT_PATH
+from .fingerprints import FingerprintStore, Signature, compute_signature
+from .llm_responses import (
+    CachedLLMClient,
+    LLMCacheMiss,
+    LLMResponseCache,
+    configure_llm_cache,
+    get_llm_cache,
+)
 
-__all__ = ["CacheManager", "CacheEntry", "DEFAULT_CACHE_PATH"]
+__all__ = [
+    "CacheManager",
+    "CacheEntry",
+    "DEFAULT_CACHE_PATH",
+    "DEFAULT_FINGERPRINT_PATH",
+    "FingerprintStore",
+    "Signature",
+    "compute_signature",
+    "CachedLLMClient",
+    "LLMCacheMiss",
+    "LLMResponseCache",
+    "configure_llm_cache",
+    "get_llm_cache",
+]
@@ -0,0 +1,293 @@
+"""
+Persistent document fingerprint store with near-duplicate detection.
+
+Each document is fingerprinted by an exact SHA-256 plus MinHash and SimHash
+signatures of its normalized text (case and punctuation are dropped, as are
+preprint line numbers: runs of consecutive counters at the start of lines).
+Numbers in the text itself are kept, so papers that differ only in their
+data never match. MinHash signatures are LSH-banded into an SQLite index,
+so a lookup only compares against candidate buckets. A near-duplicate must
+reach the MinHash threshold and be confirmed by a close SimHash.
+Extraction results are stored as JSON per (document, schema key) and
+reused for exact or near-duplicate documents across runs and processes.
+"""
+import dataclasses
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from core.config import settings
+from core.data_types import IterationRecord, PipelineResult
+from core.utils import get_logger
+from .constants import DEFAULT_FINGERPRINT_PATH
+
+logger = get_logger("FingerprintStore")
+
+SHINGLE_WORDS = 5
+NUM_PERM = 128
+LSH_BANDS = 32  # 4 rows per band: candidates from roughly 0.4 Jaccard upwards
+SIMHASH_MAX_DISTANCE = 3
+SIGNATURE_BLOCK = 4096  # shingles hashed per vectorised block
+
+_PRIME = np.uint64(4294967311)  # smallest prime above 2**32
+_rng = np.random.RandomState(1)
+_PERM_A = _rng.randint(1, 2**31 - 1, size=NUM_PERM, dtype=np.int64).astype(np.uint64)
+_PERM_B = _rng.randint(0, 2**31 - 1, size=NUM_PERM, dtype=np.int64).astype(np.uint64)
+_BITS = np.arange(64, dtype=np.uint64)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    exact_hash TEXT PRIMARY KEY,
+    simhash INTEGER NOT NULL,
+    minhash BLOB NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS bands (
+    band INTEGER NOT NULL,
+    bucket INTEGER NOT NULL,
+    exact_hash TEXT NOT NULL,
+    PRIMARY KEY (band, bucket, exact_hash)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS results (
+    exact_hash TEXT NOT NULL,
+    schema_key TEXT NOT NULL,
+    result TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (exact_hash, schema_key)
+);
+"""
+
+
+def _hash64(data: bytes) -> int:
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "little")
+
+
+def _signed(value: int) -> int:
+    """Map an unsigned 64-bit value onto SQLite's signed INTEGER range."""
+    return value - (1 << 64) if value >= (1 << 63) else value
+
+
+_LINE_NUMBER = re.compile(r"^\s*(\d{1,5})\s+")
+
+
+def _strip_line_numbers(text: str) -> str:
+    """Drop leading per-line counters (a line number continuing or starting a consecutive run)."""
+    lines = text.splitlines()
+    leads = []
+    for line in lines:
+        match = _LINE_NUMBER.match(line)
+        leads.append(int(match.group(1)) if match else None)
+
+    stripped = []
+    for i, line in enumerate(lines):
+        lead = leads[i]
+        counter = lead is not None and (
+            (i > 0 and leads[i - 1] is not None and lead == leads[i - 1] + 1)
+            or (i + 1 < len(lines) and leads[i + 1] is not None and leads[i + 1] == lead + 1)
+        )
+        stripped.append(_LINE_NUMBER.sub("", line, count=1) if counter else line)
+    return "\n".join(stripped)
+
+
+def _normalized_words(text: str) -> List[str]:
+    return re.findall(r"[a-z0-9]+", _strip_line_numbers(text).lower())
+
+
+def _dump_result(result: PipelineResult) -> str:
+    return json.dumps(dataclasses.asdict(result))
+
+
+def _load_result(payload: str) -> PipelineResult:
+    data = json.loads(payload)
+    data["iteration_history"] = [IterationRecord(**record) for record in data.get("iteration_history", [])]
+    return PipelineResult(**data)
+
+
+@dataclass
+class Signature:
+    """Exact and locality-sensitive fingerprints of one document."""
+    exact_hash: str
+    minhash: np.ndarray
+    simhash: int
+
+    def bands(self) -> List[int]:
+        rows = NUM_PERM // LSH_BANDS
+        return [
+            _signed(_hash64(self.minhash[i * rows:(i + 1) * rows].tobytes()))
+            for i in range(LSH_BANDS)
+        ]
+
+
+@dataclass
+class Match:
+    """A stored document that matches a lookup."""
+    exact_hash: str
+    similarity: float
+    exact: bool
+
+
+def compute_signature(text: str, exact_hash: Optional[str] = None) -> Signature:
+    """
+    Fingerprint a document.
+
+    Args:
+        text: Document text
+        exact_hash: Precomputed exact hash (default: SHA-256 of text)
+    """
+    if exact_hash is None:
+        exact_hash = hashlib.sha256(text.encode()).hexdigest()
+
+    words = _normalized_words(text)
+    if len(words) < SHINGLE_WORDS:
+        shingles = [" ".join(words)] if words else [""]
+    else:
+        shingles = [" ".join(words[i:i + SHINGLE_WORDS]) for i in range(len(words) - SHINGLE_WORDS + 1)]
+    hashes = np.fromiter((_hash64(s.encode()) for s in set(shingles)), dtype=np.uint64)
+
+    # MinHash over 32-bit shingle hashes with universal hashing mod a prime;
+    # SimHash as a majority vote of each bit over the 64-bit shingle hashes.
+    # Both run in blocks so memory stays flat on very long documents.
+    minhash = np.full(NUM_PERM, np.iinfo(np.uint64).max, dtype=np.uint64)
+    votes = np.zeros(64, dtype=np.int64)
+    for start in range(0, len(hashes), SIGNATURE_BLOCK):
+        block = hashes[start:start + SIGNATURE_BLOCK]
+        low = block & np.uint64(0xFFFFFFFF)
+        minhash = np.minimum(minhash, ((low[:, None] * _PERM_A + _PERM_B) % _PRIME).min(axis=0))
+        votes += ((block[:, None] >> _BITS) & np.uint64(1)).sum(axis=0).astype(np.int64)
+    votes = votes * 2 - len(hashes)
+    simhash = int(sum(1 << i for i in range(64) if votes[i] > 0))
+    minhash = minhash.astype(np.uint32)
+
+    return Signature(exact_hash=exact_hash, minhash=minhash, simhash=simhash)
+
+
+def jaccard(a: np.ndarray, b: np.ndarray) -> float:
+    """Estimated Jaccard similarity of two MinHash signatures."""
+    return float(np.mean(a == b))
+
+
+def hamming(a: int, b: int) -> int:
+    return bin((a ^ b) & ((1 << 64) - 1)).count("1")
+
+
+class FingerprintStore:
+    """SQLite-backed fingerprint index and result store (safe across processes)."""
+
+    def __init__(self, db_path: Optional[Path] = None, threshold: Optional[float] = None):
+        """
+        Initialize the store.
+
+        Args:
+            db_path: SQLite file (default: DEFAULT_FINGERPRINT_PATH)
+            threshold: Minimum estimated Jaccard similarity for a near-duplicate
+                (default: NEAR_DUPLICATE_THRESHOLD)
+        """
+        self.db_path = Path(db_path or DEFAULT_FINGERPRINT_PATH)
+        self.threshold = settings.NEAR_DUPLICATE_THRESHOLD if threshold is None else threshold
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._connect().executescript(SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Thread- and process-local connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None or getattr(self._local, "pid", None) != os.getpid():
+            conn = sqlite3.connect(str(self.db_path), timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def close(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def add(self, signature: Signature) -> None:
+        """Index a document (idempotent)."""
+        conn = self._connect()
+        with conn:
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO documents (exact_hash, simhash, minhash, created_at) VALUES (?, ?, ?, ?)",
+                (signature.exact_hash, _signed(signature.simhash), signature.minhash.tobytes(), time.time()),
+            )
+            if cursor.rowcount:
+                conn.executemany(
+                    "INSERT OR IGNORE INTO bands (band, bucket, exact_hash) VALUES (?, ?, ?)",
+                    [(band, bucket, signature.exact_hash) for band, bucket in enumerate(signature.bands())],
+                )
+
+    def find(self, signature: Signature) -> List[Match]:
+        """
+        Stored documents matching a signature, best first.
+
+        An exact hash match comes first; LSH candidates are then kept when
+        their estimated Jaccard similarity reaches the threshold and their
+        SimHash is within SIMHASH_MAX_DISTANCE bits.
+        """
+        conn = self._connect()
+        matches: List[Match] = []
+        if conn.execute("SELECT 1 FROM documents WHERE exact_hash = ?", (signature.exact_hash,)).fetchone():
+            matches.append(Match(signature.exact_hash, 1.0, exact=True))
+
+        bands = signature.bands()
+        clause = " OR ".join("(band = ? AND bucket = ?)" for _ in bands)
+        params = [value for pair in enumerate(bands) for value in pair]
+        rows = conn.execute(
+            f"""
+            SELECT d.exact_hash, d.simhash, d.minhash FROM documents d
+            WHERE d.exact_hash IN (SELECT DISTINCT exact_hash FROM bands WHERE {clause})
+              AND d.exact_hash != ?
+            """,
+            (*params, signature.exact_hash),
+        ).fetchall()
+
+        near = []
+        for exact_hash, simhash, minhash in rows:
+            similarity = jaccard(signature.minhash, np.frombuffer(minhash, dtype=np.uint32))
+            if similarity >= self.threshold and hamming(signature.simhash, simhash) <= SIMHASH_MAX_DISTANCE:
+                near.append(Match(exact_hash, similarity, exact=False))
+        near.sort(key=lambda match: match.similarity, reverse=True)
+        return matches + near
+
+    def get_result(self, signature: Signature, schema_key: str) -> Optional[Tuple[Match, PipelineResult]]:
+        """Best matching stored result for a schema, or None."""
+        conn = self._connect()
+        for match in self.find(signature):
+            row = conn.execute(
+                "SELECT result FROM results WHERE exact_hash = ? AND schema_key = ?",
+                (match.exact_hash, schema_key),
+            ).fetchone()
+            if row is None:
+                continue
+            try:
+                return match, _load_result(row[0])
+            except Exception as e:
+                logger.warning(f"Discarding unreadable stored result {match.exact_hash[:8]}: {e}")
+        return None
+
+    def put_result(self, signature: Signature, schema_key: str, result: PipelineResult) -> None:
+        """Index a document and store its extraction result for a schema."""
+        self.add(signature)
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO results (exact_hash, schema_key, result, created_at) VALUES (?, ?, ?, ?)",
+                (signature.exact_hash, schema_key, _dump_result(result), time.time()),
+            )
+
+    def stats(self) -> Dict[str, Any]:
+        conn = self._connect()
+        documents = conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+        results = conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        return {"documents": documents, "results": results, "db_path": str(self.db_path)}
@@ -0,0 +1,474 @@
+"""
+Sharded SQLite cache of LLM responses with record/replay modes.
+
+Responses are keyed by model, messages, response-model schema hash,
+temperature and the remaining generation parameters, and stored across
+LLM_CACHE_SHARDS WAL-mode SQLite files so concurrent writers rarely touch
+the same file. Entries expire after a TTL and each shard is held to its
+share of a byte budget by least-recently-used eviction.
+
+CachedLLMClient wraps the Instructor clients built by LLMClientFactory, so
+callers are unchanged. Modes:
+- read_write: serve hits, call the API and store on a miss
+- record: always call the API and (re)store the response
+- replay: serve hits only and raise LLMCacheMiss on a miss, for
+  deterministic, free benchmark re-runs
+"""
+import asyncio
+import functools
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from core import constants
+from core.config import settings
+from core.utils import get_logger
+
+logger = get_logger("LLMResponseCache")
+
+LLM_CACHE_MODES = ("off", "read_write", "record", "replay")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    payload BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    last_access REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_responses_last_access ON responses(last_access);
+
+CREATE TABLE IF NOT EXISTS totals (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    entries INTEGER NOT NULL,
+    bytes INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO totals (id, entries, bytes) VALUES (0, 0, 0);
+
+CREATE TRIGGER IF NOT EXISTS responses_after_insert AFTER INSERT ON responses BEGIN
+    UPDATE totals SET entries = entries + 1, bytes = bytes + NEW.size WHERE id = 0;
+END;
+CREATE TRIGGER IF NOT EXISTS responses_after_delete AFTER DELETE ON responses BEGIN
+    UPDATE totals SET entries = entries - 1, bytes = bytes - OLD.size WHERE id = 0;
+END;
+CREATE TRIGGER IF NOT EXISTS responses_after_resize AFTER UPDATE OF size ON responses BEGIN
+    UPDATE totals SET bytes = bytes - OLD.size + NEW.size WHERE id = 0;
+END;
+"""
+
+
+class LLMCacheMiss(LookupError):
+    """Raised in replay mode when a request has no cached response."""
+
+
+@functools.lru_cache(maxsize=256)
+def schema_hash(response_model: Any) -> str:
+    """Short hash of a response model's JSON schema ("" without one)."""
+    if response_model is None:
+        return ""
+    try:
+        schema = response_model.model_json_schema()
+    except AttributeError:
+        schema = repr(response_model)
+    return hashlib.sha256(json.dumps(schema, sort_keys=True, default=str).encode()).hexdigest()[:16]
+
+
+def request_key(kwargs: Dict[str, Any]) -> str:
+    """
+    Cache key of a chat completion request.
+
+    Args:
+        kwargs: Keyword arguments of chat.completions.create(_with_completion)
+
+    Returns:
+        SHA-256 hex digest of model, messages, response-model schema hash,
+        temperature and the other parameters that affect the response
+    """
+    params = {
+        name: value for name, value in kwargs.items()
+        if name not in constants.LLM_CACHE_UNKEYED_PARAMS
+        and name not in ("model", "messages", "response_model", "temperature")
+    }
+    payload = {
+        "model": kwargs.get("model"),
+        "messages": kwargs.get("messages"),
+        "schema": schema_hash(kwargs.get("response_model")),
+        "temperature": kwargs.get("temperature"),
+        "params": params,
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def _restore_completion(data: Optional[str]) -> Any:
+    """ChatCompletion from its stored JSON, with usage cleared (hits cost nothing)."""
+    if data is None:
+        return None
+    try:
+        from openai.types.chat import ChatCompletion
+    except ImportError:
+        return None
+    completion = ChatCompletion.model_validate_json(data)
+    completion.usage = None
+    return completion
+
+
+class LLMResponseCache:
+    """Sharded, WAL-mode SQLite store of LLM responses (safe across threads and processes)."""
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        mode: Optional[str] = None,
+        ttl_seconds: Optional[int] = -1,
+        max_bytes: Optional[int] = None,
+        shards: int = constants.LLM_CACHE_SHARDS,
+    ):
+        """
+        Open (or create) the cache.
+
+        Args:
+            cache_dir: Directory of the shard files (default: LLM_CACHE_DIR)
+            mode: read_write, record or replay (default: LLM_CACHE_MODE)
+            ttl_seconds: Maximum entry age, None for no expiry
+                (default: LLM_CACHE_TTL_SECONDS)
+            max_bytes: Byte budget across all shards (default: LLM_CACHE_MAX_BYTES)
+            shards: Number of SQLite files
+        """
+        self.cache_dir = Path(cache_dir or settings.LLM_CACHE_DIR)
+        self.mode = (mode or settings.LLM_CACHE_MODE).lower()
+        if self.mode not in LLM_CACHE_MODES:
+            raise ValueError(f"Unknown LLM cache mode {self.mode!r}; expected one of {LLM_CACHE_MODES}")
+        self.ttl_seconds = settings.LLM_CACHE_TTL_SECONDS if ttl_seconds == -1 else ttl_seconds
+        self.max_bytes = settings.LLM_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+        self.shards = shards
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._stats = {"hits": 0, "misses": 0, "writes": 0, "evictions": 0}
+        self._stats_lock = threading.Lock()
+        for shard in range(self.shards):
+            self._connect(shard).executescript(SCHEMA)
+
+    def _connect(self, shard: int) -> sqlite3.Connection:
+        """Thread- and process-local connection to one shard."""
+        connections = getattr(self._local, "connections", None)
+        if connections is None or getattr(self._local, "pid", None) != os.getpid():
+            connections = self._local.connections = {}
+            self._local.pid = os.getpid()
+        conn = connections.get(shard)
+        if conn is None:
+            conn = sqlite3.connect(str(self.cache_dir / f"shard_{shard:02d}.sqlite"), timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            connections[shard] = conn
+        return conn
+
+    def _shard(self, key: str) -> int:
+        return int(key[:8], 16) % self.shards
+
+    def _count(self, name: str, n: int = 1) -> None:
+        with self._stats_lock:
+            self._stats[name] += n
+
+    def close(self) -> None:
+        for conn in (getattr(self._local, "connections", None) or {}).values():
+            conn.close()
+        self._local.connections = None
+
+    # ------------------------------------------------------------------
+    # Entries
+    # ------------------------------------------------------------------
+
+    def get(self, key: str, response_model: Any = None) -> Optional[Tuple[Any, Any]]:
+        """
+        Cached (result, completion) for a request key, or None.
+
+        Expired entries are dropped, except in replay mode, which serves
+        whatever was recorded.
+        """
+        shard = self._shard(key)
+        conn = self._connect(shard)
+        row = conn.execute("SELECT payload, created_at FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is not None and self.mode != "replay" and self.ttl_seconds is not None \
+                and time.time() - row[1] > self.ttl_seconds:
+            with conn:
+                conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            row = None
+        if row is None:
+            self._count("misses")
+            return None
+
+        try:
+            data = json.loads(zlib.decompress(row[0]))
+            completion = _restore_completion(data.get("completion"))
+            if response_model is None:
+                result = completion
+            else:
+                result = response_model.model_validate_json(data["result"])
+        except Exception as e:
+            logger.warning(f"Discarding unreadable cached response {key[:8]}: {e}")
+            with conn:
+                conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._count("misses")
+            return None
+        if result is None:
+            self._count("misses")
+            return None
+
+        with conn:
+            conn.execute(
+                "UPDATE responses SET hits = hits + 1, last_access = ? WHERE key = ?", (time.time(), key)
+            )
+        self._count("hits")
+        return result, completion
+
+    def put(self, key: str, model: str, result: Any, completion: Any = None) -> bool:
+        """
+        Store a response.
+
+        Args:
+            key: Request key (request_key)
+            model: Model name (kept for inspection)
+            result: Parsed response model instance, or the raw completion
+            completion: Raw completion, when different from result
+
+        Returns:
+            False if the response could not be serialized
+        """
+        completion = result if completion is None else completion
+        try:
+            payload = {
+                "result": result.model_dump_json() if result is not completion else None,
+                "completion": completion.model_dump_json() if hasattr(completion, "model_dump_json") else None,
+            }
+        except Exception as e:
+            logger.debug(f"Not caching response for {model}: {e}")
+            return False
+        if payload["result"] is None and payload["completion"] is None:
+            return False
+
+        blob = zlib.compress(json.dumps(payload).encode())
+        shard = self._shard(key)
+        now = time.time()
+        with self._connect(shard) as conn:
+            conn.execute(
+                """
+                INSERT INTO responses (key, model, payload, size, created_at, last_access, hits)
+                VALUES (?, ?, ?, ?, ?, ?, 0)
+                ON CONFLICT(key) DO UPDATE SET
+                    payload = excluded.payload,
+                    size = excluded.size,
+                    created_at = excluded.created_at,
+                    last_access = excluded.last_access
+                """,
+                (key, model or "", blob, len(blob), now, now),
+            )
+        self._count("writes")
+        self._evict(shard, self.max_bytes // self.shards)
+        return True
+
+    # ------------------------------------------------------------------
+    # Limits
+    # ------------------------------------------------------------------
+
+    def _evict(self, shard: int, budget: int) -> int:
+        """Drop least recently used entries of a shard down to a byte budget."""
+        conn = self._connect(shard)
+        total = conn.execute("SELECT bytes FROM totals WHERE id = 0").fetchone()[0]
+        if total <= budget:
+            return 0
+        keys = []
+        freed = 0
+        for key, size in conn.execute("SELECT key, size FROM responses ORDER BY last_access ASC"):
+            if total - freed <= budget:
+                break
+            keys.append((key,))
+            freed += size
+        with conn:
+            conn.executemany("DELETE FROM responses WHERE key = ?", keys)
+        self._count("evictions", len(keys))
+        return len(keys)
+
+    def prune(self, max_bytes: Optional[int] = None) -> Tuple[int, int]:
+        """
+        Drop expired entries, then evict down to a byte budget.
+
+        Args:
+            max_bytes: Budget across all shards (default: the cache's max_bytes)
+
+        Returns:
+            (expired, evicted) entry counts
+        """
+        budget = self.max_bytes if max_bytes is None else max_bytes
+        expired = evicted = 0
+        for shard in range(self.shards):
+            if self.ttl_seconds is not None:
+                with self._connect(shard) as conn:
+                    expired += conn.execute(
+                        "DELETE FROM responses WHERE created_at < ?", (time.time() - self.ttl_seconds,)
+                    ).rowcount
+            evicted += self._evict(shard, budget // self.shards)
+        return expired, evicted
+
+    def stats(self) -> Dict[str, Any]:
+        """Stored entries and bytes plus this process's hit/miss counts."""
+        entries = total = hits = 0
+        for shard in range(self.shards):
+            conn = self._connect(shard)
+            shard_entries, shard_bytes = conn.execute("SELECT entries, bytes FROM totals WHERE id = 0").fetchone()
+            entries += shard_entries
+            total += shard_bytes
+            hits += conn.execute("SELECT COALESCE(SUM(hits), 0) FROM responses").fetchone()[0]
+        with self._stats_lock:
+            session = dict(self._stats)
+        return {
+            "cache_dir": str(self.cache_dir),
+            "mode": self.mode,
+            "entries": entries,
+            "total_bytes": total,
+            "total_hits": hits,
+            **{f"session_{name}": value for name, value in session.items()},
+        }
+
+
+class _CachedCompletions:
+    """chat.completions of a CachedLLMClient."""
+
+    def __init__(self, owner: "CachedLLMClient"):
+        self._owner = owner
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._owner.client.chat.completions, name)
+
+    def create(self, **kwargs) -> Any:
+        if self._owner.is_async:
+            return self._call_async(kwargs, with_completion=False)
+        return self._call(kwargs, with_completion=False)
+
+    def create_with_completion(self, **kwargs) -> Any:
+        if self._owner.is_async:
+            return self._call_async(kwargs, with_completion=True)
+        return self._call(kwargs, with_completion=True)
+
+    def _lookup(self, key: str, kwargs: Dict[str, Any]) -> Optional[Tuple[Any, Any]]:
+        cache = self._owner.cache
+        if cache.mode == "record":
+            return None
+        hit = cache.get(key, kwargs.get("response_model"))
+        if hit is None and cache.mode == "replay":
+            raise LLMCacheMiss(f"No cached response for {kwargs.get('model')} request {key[:12]} (replay mode)")
+        return hit
+
+    def _method(self, kwargs: Dict[str, Any]) -> Any:
+        """Wrapped client method: raw completions without a response model, else (result, completion)."""
+        completions = self._owner.client.chat.completions
+        if kwargs.get("response_model") is None:
+            return completions.create
+        return completions.create_with_completion
+
+    def _store(self, key: str, kwargs: Dict[str, Any], response: Any) -> None:
+        result, completion = response if kwargs.get("response_model") is not None else (response, response)
+        self._owner.cache.put(key, kwargs.get("model"), result, completion)
+
+    @staticmethod
+    def _unpack(kwargs: Dict[str, Any], response: Any, with_completion: bool) -> Any:
+        if kwargs.get("response_model") is None:
+            return (response, response) if with_completion else response
+        return response if with_completion else response[0]
+
+    def _call(self, kwargs: Dict[str, Any], with_completion: bool) -> Any:
+        key = request_key(kwargs)
+        hit = self._lookup(key, kwargs)
+        if hit is not None:
+            return hit if with_completion else hit[0]
+        response = self._method(kwargs)(**kwargs)
+        self._store(key, kwargs, response)
+        return self._unpack(kwargs, response, with_completion)
+
+    async def _call_async(self, kwargs: Dict[str, Any], with_completion: bool) -> Any:
+        key = request_key(kwargs)
+        hit = await asyncio.to_thread(self._lookup, key, kwargs)
+        if hit is not None:
+            return hit if with_completion else hit[0]
+        response = await self._method(kwargs)(**kwargs)
+        await asyncio.to_thread(self._store, key, kwargs, response)
+        return self._unpack(kwargs, response, with_completion)
+
+
+class _CachedChat:
+    def __init__(self, owner: "CachedLLMClient"):
+        self.completions = _CachedCompletions(owner)
+        self._owner = owner
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._owner.client.chat, name)
+
+
+class CachedLLMClient:
+    """
+    Instructor client whose chat completions go through an LLMResponseCache.
+
+    Only chat.completions.create / create_with_completion are cached; every
+    other attribute is passed through to the wrapped client.
+    """
+
+    def __init__(self, client: Any, cache: LLMResponseCache, is_async: bool = False):
+        """
+        Wrap a client.
+
+        Args:
+            client: Instructor-patched OpenAI or AsyncOpenAI client
+            cache: Response cache (its mode decides hits, misses and writes)
+            is_async: Whether the client's methods are coroutines
+        """
+        self.client = client
+        self.cache = cache
+        self.is_async = is_async
+        self.chat = _CachedChat(self)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.client, name)
+
+
+_default_cache: Optional[LLMResponseCache] = None
+_default_resolved = False
+_default_lock = threading.Lock()
+
+
+def get_llm_cache() -> Optional[LLMResponseCache]:
+    """Process-wide response cache from settings, or None when LLM_CACHE_MODE is off."""
+    global _default_cache, _default_resolved
+    with _default_lock:
+        if not _default_resolved:
+            mode = settings.LLM_CACHE_MODE.lower()
+            _default_cache = LLMResponseCache(mode=mode) if mode != "off" else None
+            _default_resolved = True
+        return _default_cache
+
+
+def configure_llm_cache(mode: Optional[str] = None, cache_dir: Optional[Path] = None) -> Optional[LLMResponseCache]:
+    """
+    Replace the process-wide response cache used by newly created clients.
+
+    Args:
+        mode: off, read_write, record or replay (default: LLM_CACHE_MODE)
+        cache_dir: Shard directory (default: LLM_CACHE_DIR)
+
+    Returns:
+        The new cache, or None when mode is off
+    """
+    global _default_cache, _default_resolved
+    mode = (mode or settings.LLM_CACHE_MODE).lower()
+    if mode not in LLM_CACHE_MODES:
+        raise ValueError(f"Unknown LLM cache mode {mode!r}; expected one of {LLM_CACHE_MODES}")
+    with _default_lock:
+        _default_cache = LLMResponseCache(cache_dir=cache_dir, mode=mode) if mode != "off" else None
+        _default_resolved = True
+        return _default_cache
@@ -107,6 +107,20 @@ class CacheManager:
             )
         """)
         
+        # Chunk relevance cache (skip re-classification)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS relevance_cache (
+                chunk_hash TEXT,
+                context_hash TEXT,
+                model_name TEXT,
+                is_relevant INTEGER,
+                confidence REAL,
+                reason TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (chunk_hash, context_hash, model_name)
+            )
+        """)
+        
         # Create indexes for faster lookups
         cursor.execute("""
             CREATE INDEX IF NOT EXISTS idx_extraction_doc 
@@ -310,6 +324,89 @@ class CacheManager:
         
         return results
     
+    # =========================================================================
+    # Relevance Cache
+    # =========================================================================
+    
+    def get_relevance(
+        self,
+        chunk_hashes: List[str],
+        context_hash: str,
+        model_name: str,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Retrieve cached relevance decisions for a set of chunks.
+        
+        Args:
+            chunk_hashes: Hashes of chunk texts
+            context_hash: Hash of the theme and schema fields
+            model_name: Classifier model (and mode)
+            
+        Returns:
+            Dict of chunk_hash -> {"is_relevant", "confidence", "reason"} for hits
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        results = {}
+        unique = list(dict.fromkeys(chunk_hashes))
+        
+        # Stay well below SQLite's bound-parameter limit
+        for start in range(0, len(unique), 500):
+            batch = unique[start:start + 500]
+            placeholders = ",".join("?" * len(batch))
+            cursor.execute(f"""
+                SELECT chunk_hash, is_relevant, confidence, reason
+                FROM relevance_cache
+                WHERE context_hash = ? AND model_name = ? AND chunk_hash IN ({placeholders})
+            """, (context_hash, model_name, *batch))
+            for row in cursor.fetchall():
+                results[row["chunk_hash"]] = {
+                    "is_relevant": bool(row["is_relevant"]),
+                    "confidence": row["confidence"],
+                    "reason": row["reason"],
+                }
+        
+        self._stats["hits"] += len(results)
+        self._stats["misses"] += len(unique) - len(results)
+        return results
+    
+    def set_relevance(
+        self,
+        entries: List[Dict[str, Any]],
+        context_hash: str,
+        model_name: str,
+    ) -> None:
+        """
+        Cache relevance decisions.
+        
+        Args:
+            entries: Dicts with chunk_hash, is_relevant, confidence, reason
+            context_hash: Hash of the theme and schema fields
+            model_name: Classifier model (and mode)
+        """
+        if not entries:
+            return
+        conn = self._get_connection()
+        now = datetime.now().isoformat()
+        conn.executemany("""
+            INSERT OR REPLACE INTO relevance_cache
+            (chunk_hash, context_hash, model_name, is_relevant, confidence, reason, created_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        """, [
+            (
+                entry["chunk_hash"],
+                context_hash,
+                model_name,
+                int(entry["is_relevant"]),
+                entry["confidence"],
+                entry["reason"],
+                now,
+            )
+            for entry in entries
+        ])
+        conn.commit()
+        self._stats["sets"] += len(entries)
+    
     # =========================================================================
     # Invalidation
     # =========================================================================
@@ -354,6 +451,7 @@ class CacheManager:
         cursor.execute("DELETE FROM document_cache")
         cursor.execute("DELETE FROM extraction_cache")
         cursor.execute("DELETE FROM embedding_cache")
+        cursor.execute("DELETE FROM relevance_cache")
         
         conn.commit()
         logger.warning("All caches cleared")
@@ -373,6 +471,9 @@ class CacheManager:
         cursor.execute("SELECT COUNT(*) FROM extraction_cache")
         field_count = cursor.fetchone()[0]
         
+        cursor.execute("SELECT COUNT(*) FROM relevance_cache")
+        relevance_count = cursor.fetchone()[0]
+        
         hit_rate = 0.0
         total_access = self._stats["hits"] + self._stats["misses"]
         if total_access > 0:
@@ -382,6 +483,7 @@ class CacheManager:
             **self._stats,
             "cached_documents": doc_count,
             "cached_fields": field_count,
+            "cached_relevance": relevance_count,
             "hit_rate": hit_rate,
         }
     
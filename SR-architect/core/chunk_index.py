@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+In-memory lexical index over one document's chunks.
+
+BM25 ranking with no external dependencies, built per document in
+milliseconds and discarded with it. Used to retrieve the few chunks that
+mention a field group's terms instead of sending the whole filtered paper
+with every extraction prompt.
+"""
+
+import math
+import re
+from collections import Counter
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+from core import constants
+from core.parser import DocumentChunk
+
+_WORD = re.compile(r"[a-z0-9]+")
+
+STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "had", "has",
+    "have", "in", "is", "it", "its", "of", "on", "or", "that", "the", "their",
+    "this", "to", "was", "were", "which", "with",
+}
+
+
+def stem(word: str) -> str:
+    """Crude plural folding ("nodules" -> "nodule") so query and chunk terms meet."""
+    return word[:-1] if len(word) > 3 and word.endswith("s") and not word.endswith("ss") else word
+
+
+def index_terms(text: str) -> List[str]:
+    """Lowercased, stemmed terms of a text, without stopwords."""
+    return [stem(w) for w in _WORD.findall(text.lower()) if w not in STOPWORDS]
+
+
+class ChunkIndex:
+    """BM25 index over a list of chunks."""
+
+    def __init__(
+        self,
+        chunks: Sequence[DocumentChunk],
+        k1: float = constants.RETRIEVAL_BM25_K1,
+        b: float = constants.RETRIEVAL_BM25_B,
+    ):
+        """
+        Index the chunks.
+
+        Args:
+            chunks: Chunks to index (positions are the ids returned by search)
+            k1: Term-frequency saturation
+            b: Length normalization
+        """
+        self.chunks = list(chunks)
+        self.k1 = k1
+        self.b = b
+        self.lengths: List[int] = []
+        self.postings: Dict[str, List[Tuple[int, int]]] = {}
+        for i, chunk in enumerate(self.chunks):
+            counts = Counter(index_terms(chunk.text))
+            self.lengths.append(sum(counts.values()))
+            for term, count in counts.items():
+                self.postings.setdefault(term, []).append((i, count))
+        self.average_length = sum(self.lengths) / len(self.lengths) if self.lengths else 0.0
+
+    def __len__(self) -> int:
+        return len(self.chunks)
+
+    def idf(self, term: str) -> float:
+        """BM25 inverse document frequency (always positive)."""
+        frequency = len(self.postings.get(term, ()))
+        return math.log(1 + (len(self.chunks) - frequency + 0.5) / (frequency + 0.5))
+
+    def scores(self, query: Iterable[str]) -> List[float]:
+        """
+        BM25 score of every chunk for a query.
+
+        Args:
+            query: Query text or terms; repeated terms count once
+
+        Returns:
+            One score per chunk, 0.0 for chunks sharing no term with the query
+        """
+        terms = set(index_terms(query) if isinstance(query, str) else index_terms(" ".join(query)))
+        scores = [0.0] * len(self.chunks)
+        for term in terms:
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+            idf = self.idf(term)
+            for i, count in postings:
+                norm = 1 - self.b + self.b * self.lengths[i] / (self.average_length or 1)
+                scores[i] += idf * count * (self.k1 + 1) / (count + self.k1 * norm)
+        return scores
+
+    def search(self, query: Iterable[str], top_k: int) -> List[Tuple[int, float]]:
+        """
+        Best-scoring chunks for a query.
+
+        Args:
+            query: Query text or terms
+            top_k: Maximum number of chunks to return
+
+        Returns:
+            (chunk position, score) pairs with score > 0, best first
+        """
+        scores = self.scores(query)
+        ranked = sorted((i for i, s in enumerate(scores) if s > 0), key=lambda i: (-scores[i], i))
+        return [(i, scores[i]) for i in ranked[:top_k]]
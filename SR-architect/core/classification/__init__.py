@@ -9,6 +9,7 @@ from .helpers import (
     truncate_chunk,
     build_batch_prompt
 )
+from .embedding import EmbeddingRelevanceScorer
 from .classifier import RelevanceClassifier
 
 __all__ = [
@@ -19,4 +20,5 @@ __all__ = [
     "truncate_chunk",
     "build_batch_prompt",
     "RelevanceClassifier",
+    "EmbeddingRelevanceScorer",
 ]
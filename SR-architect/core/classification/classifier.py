@@ -6,12 +6,24 @@ First-pass LLM call to generate binary relevance masks at chunk level,
 efficiently filtering out irrelevant content before detailed extraction.
 """
 
+import asyncio
+import hashlib
+import weakref
 from typing import List, Dict, Any, Optional
 from core import utils
 from core import constants
 from core.parser import DocumentChunk
+from core.token_tracker import usage_from_completion
 from .models import RelevanceResult, RelevanceResponse
 from .helpers import truncate_chunk, build_batch_prompt
+from .embedding import EmbeddingRelevanceScorer
+
+RELEVANCE_MODES = ("llm", "hybrid", "local")
+
+# Reasons of default/fallback decisions, which are never cached
+FALLBACK_REASON_PREFIXES = (
+    "Classification failed", "Not classified", "Ambiguous locally", "Local scoring unavailable",
+)
 
 
 class RelevanceClassifier:
@@ -39,6 +51,11 @@ It's better to include slightly irrelevant content than to miss important data."
         batch_size: int = None,
         preview_chars: int = None,
         token_tracker: Optional["TokenTracker"] = None,
+        max_concurrent_batches: int = None,
+        global_concurrency: int = None,
+        mode: Optional[str] = None,
+        scorer: Optional[EmbeddingRelevanceScorer] = None,
+        cache: Optional["CacheManager"] = None,
     ):
         """
         Initialize the relevance classifier.
@@ -49,6 +66,17 @@ It's better to include slightly irrelevant content than to miss important data."
             api_key: API key
             batch_size: Number of chunks to classify per API call
             preview_chars: Characters per chunk for classification context
+            max_concurrent_batches: Async batches in flight per document
+            global_concurrency: Async batches in flight across all documents
+                classified by this instance
+            mode: "llm" (every chunk via LLM), "hybrid" (local embedding scores,
+                LLM only for ambiguous chunks) or "local" (no LLM calls;
+                ambiguous chunks, or all chunks when the encoder is
+                unavailable, are kept). Default: RELEVANCE_MODE
+            scorer: Optional local scorer (built lazily when omitted)
+            cache: Optional persistent CacheManager; decisions are keyed by
+                (chunk text hash, theme/fields hash, mode, model and, outside
+                "llm" mode, the embedding model and similarity thresholds)
         """
         utils.load_env()
         
@@ -69,8 +97,29 @@ It's better to include slightly irrelevant content than to miss important data."
             batch_size = constants.RELEVANCE_BATCH_SIZE
         if preview_chars is None:
             preview_chars = constants.RELEVANCE_PREVIEW_CHARS
+        if max_concurrent_batches is None:
+            max_concurrent_batches = constants.RELEVANCE_DOC_CONCURRENCY
+        if global_concurrency is None:
+            global_concurrency = constants.RELEVANCE_GLOBAL_CONCURRENCY
         self.batch_size = batch_size
         self.preview_chars = preview_chars
+        self.max_concurrent_batches = max(1, max_concurrent_batches)
+        self.global_concurrency = max(1, global_concurrency)
+        # One global semaphore per event loop (asyncio primitives are loop-bound)
+        self._global_semaphores: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+        self.mode = (mode or settings.RELEVANCE_MODE).lower()
+        if self.mode not in RELEVANCE_MODES:
+            raise ValueError(f"Unknown relevance mode {self.mode!r}; expected one of {RELEVANCE_MODES}")
+        self._scorer = scorer
+        # Local scorer settings, known up front so cache keys never depend on the lazy scorer
+        self._scorer_key = ":".join(str(value) for value in (
+            getattr(scorer, "model_name", settings.RELEVANCE_EMBEDDING_MODEL),
+            getattr(scorer, "high_threshold", settings.RELEVANCE_SIMILARITY_HIGH),
+            getattr(scorer, "low_threshold", settings.RELEVANCE_SIMILARITY_LOW),
+        ))
+        self.cache = cache
+        self.cache_hits = 0
+        self.cache_misses = 0
         self.token_tracker = token_tracker
         self._client = None
         self._instructor_client = None
@@ -99,6 +148,225 @@ It's better to include slightly irrelevant content than to miss important data."
         )
         return self._async_instructor_client
 
+    def _messages(self, user_prompt: str) -> List[Dict[str, str]]:
+        return [
+            {"role": "system", "content": self.SYSTEM_PROMPT},
+            {"role": "user", "content": user_prompt},
+        ]
+
+    def _record_usage(self, completion) -> None:
+        usage = usage_from_completion(completion)
+        if self.token_tracker and usage:
+            self.token_tracker.record_usage(
+                usage=usage,
+                model=self.model,
+                operation="relevance_classification"
+            )
+
+    @staticmethod
+    def _results_from_response(response: RelevanceResponse) -> List[RelevanceResult]:
+        """Map an LLM response to results."""
+        # Use more distinctive confidence values
+        # Relevant chunks: high confidence (0.85+)
+        # Irrelevant chunks: lower confidence (0.5-0.7)
+        return [
+            RelevanceResult(
+                chunk_index=classification.index,
+                is_relevant=classification.relevant == 1,
+                confidence=0.9 if classification.relevant == 1 else 0.5,
+                reason=classification.reason,
+            )
+            for classification in response.classifications
+        ]
+
+    @staticmethod
+    def _fallback_results(batch_start: int, batch_end: int) -> List[RelevanceResult]:
+        """Mark every chunk in a failed batch as relevant (safe default)."""
+        return [
+            RelevanceResult(
+                chunk_index=i,
+                is_relevant=True,
+                confidence=0.5,
+                reason="Classification failed - defaulting to relevant",
+            )
+            for i in range(batch_start, batch_end)
+        ]
+
+    @staticmethod
+    def _order_results(all_results: List[RelevanceResult], num_chunks: int) -> List[RelevanceResult]:
+        """Sort results by chunk index and fill any gaps as relevant."""
+        results_by_index = {r.chunk_index: r for r in all_results}
+        final_results = []
+        
+        for i in range(num_chunks):
+            if i in results_by_index:
+                final_results.append(results_by_index[i])
+            else:
+                # Missing result - default to relevant
+                final_results.append(RelevanceResult(
+                    chunk_index=i,
+                    is_relevant=True,
+                    confidence=0.5,
+                    reason="Not classified - defaulting to relevant",
+                ))
+        
+        return final_results
+
+    def _batch_bounds(self, num_chunks: int) -> List[tuple]:
+        return [
+            (batch_start, min(batch_start + self.batch_size, num_chunks))
+            for batch_start in range(0, num_chunks, self.batch_size)
+        ]
+
+    def _local_results(
+        self,
+        chunks: List[DocumentChunk],
+        theme: str,
+        schema_fields: List[str],
+    ) -> Optional[List[Optional[RelevanceResult]]]:
+        """Local decisions per chunk (None = ambiguous), or None if unavailable."""
+        if self._scorer is None:
+            self._scorer = EmbeddingRelevanceScorer()
+        try:
+            return self._scorer.classify(chunks, theme, schema_fields)
+        except Exception as e:
+            fallback = "keeping all chunks" if self.mode == "local" else "using LLM"
+            self.logger.warning(f"Local relevance scoring unavailable, {fallback}: {e}")
+            return None
+
+    @staticmethod
+    def _unscored_results(num_chunks: int) -> List[RelevanceResult]:
+        """Keep every chunk when local mode has no scorer (it never calls the LLM)."""
+        return [
+            RelevanceResult(
+                chunk_index=i,
+                is_relevant=True,
+                confidence=0.5,
+                reason="Local scoring unavailable - defaulting to relevant",
+            )
+            for i in range(num_chunks)
+        ]
+
+    def _merge_escalated(
+        self,
+        local: List[Optional[RelevanceResult]],
+        ambiguous: List[int],
+        escalated: Optional[List[RelevanceResult]],
+    ) -> List[RelevanceResult]:
+        """Fill ambiguous slots from LLM results (or keep them as relevant)."""
+        if escalated is None:
+            escalated = [
+                RelevanceResult(
+                    chunk_index=chunk_index,
+                    is_relevant=True,
+                    confidence=0.5,
+                    reason="Ambiguous locally - defaulting to relevant",
+                )
+                for chunk_index in ambiguous
+            ]
+        return self._fill(local, ambiguous, escalated)
+
+    # =========================================================================
+    # Persistent cache
+    # =========================================================================
+
+    @staticmethod
+    def _chunk_hash(chunk: DocumentChunk) -> str:
+        return hashlib.sha256(f"{chunk.section}\x00{chunk.text}".encode("utf-8")).hexdigest()
+
+    def _context_hash(self, theme: str, schema_fields: List[str]) -> str:
+        key = "\x00".join([theme, "\x1f".join(schema_fields), str(self.preview_chars)])
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    @property
+    def _cache_model_key(self) -> str:
+        if self.mode == "llm":
+            return f"llm:{self.model}"
+        return f"{self.mode}:{self._scorer_key}:{self.model}"
+
+    def _cache_lookup(
+        self,
+        chunks: List[DocumentChunk],
+        theme: str,
+        schema_fields: List[str],
+    ) -> tuple:
+        """
+        Split chunks into cached results and positions still to classify.
+        
+        Returns:
+            (results with None for misses, miss positions, chunk hashes, context hash)
+        """
+        results: List[Optional[RelevanceResult]] = [None] * len(chunks)
+        if self.cache is None:
+            return results, list(range(len(chunks))), None, None
+        
+        hashes = [self._chunk_hash(chunk) for chunk in chunks]
+        context_hash = self._context_hash(theme, schema_fields)
+        try:
+            hits = self.cache.get_relevance(hashes, context_hash, self._cache_model_key)
+        except Exception as e:
+            self.logger.warning(f"Relevance cache lookup failed: {e}")
+            hits = {}
+        
+        missing = []
+        for i, chunk_hash in enumerate(hashes):
+            hit = hits.get(chunk_hash)
+            if hit is None:
+                missing.append(i)
+            else:
+                results[i] = RelevanceResult(chunk_index=i, **hit)
+        self.cache_hits += len(chunks) - len(missing)
+        self.cache_misses += len(missing)
+        return results, missing, hashes, context_hash
+
+    def _cache_store(
+        self,
+        fresh: List[RelevanceResult],
+        positions: List[int],
+        hashes: Optional[List[str]],
+        context_hash: Optional[str],
+    ) -> None:
+        """Persist fresh decisions, skipping fallback defaults."""
+        if self.cache is None or not fresh:
+            return
+        entries = [
+            {
+                "chunk_hash": hashes[position],
+                "is_relevant": result.is_relevant,
+                "confidence": result.confidence,
+                "reason": result.reason,
+            }
+            for position, result in zip(positions, fresh)
+            if not (result.reason or "").startswith(FALLBACK_REASON_PREFIXES)
+        ]
+        try:
+            self.cache.set_relevance(entries, context_hash, self._cache_model_key)
+        except Exception as e:
+            self.logger.warning(f"Relevance cache write failed: {e}")
+
+    @staticmethod
+    def _fill(
+        results: List[Optional[RelevanceResult]],
+        positions: List[int],
+        fresh: List[RelevanceResult],
+    ) -> List[RelevanceResult]:
+        """Place sub-list results back at their original chunk positions."""
+        merged = list(results)
+        for position, result in zip(positions, fresh):
+            result.chunk_index = position
+            merged[position] = result
+        return merged
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Relevance cache hit/miss counters for run summaries."""
+        total = self.cache_hits + self.cache_misses
+        return {
+            "enabled": self.cache is not None,
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "hit_rate": round(self.cache_hits / total * 100, 1) if total else 0.0,
+        }
+
     def classify_batch(
         self,
         chunks: List[DocumentChunk],
@@ -108,6 +376,8 @@ It's better to include slightly irrelevant content than to miss important data."
         """
         Classify all chunks for relevance to the extraction theme.
         
+        Cached decisions are reused; only cache misses are classified.
+        
         Args:
             chunks: List of document chunks to classify
             theme: Meta-analysis theme description
@@ -119,81 +389,102 @@ It's better to include slightly irrelevant content than to miss important data."
         if not chunks:
             return []
         
+        results, missing, hashes, context_hash = self._cache_lookup(chunks, theme, schema_fields)
+        if missing:
+            fresh = self._classify_fresh([chunks[i] for i in missing], theme, schema_fields)
+            self._cache_store(fresh, missing, hashes, context_hash)
+            results = self._fill(results, missing, fresh)
+        return results
+
+    def _classify_fresh(
+        self,
+        chunks: List[DocumentChunk],
+        theme: str,
+        schema_fields: List[str],
+    ) -> List[RelevanceResult]:
+        """Classify chunks with the configured mode (no cache)."""
+        local = self._local_results(chunks, theme, schema_fields) if self.mode != "llm" else None
+        if local is None and self.mode == "local":
+            return self._unscored_results(len(chunks))
+        if local is None:
+            return self._classify_llm(chunks, theme, schema_fields)
+        
+        ambiguous = [i for i, result in enumerate(local) if result is None]
+        escalated = None
+        if ambiguous and self.mode == "hybrid":
+            escalated = self._classify_llm([chunks[i] for i in ambiguous], theme, schema_fields)
+        self.logger.debug(f"Local relevance decided {len(chunks) - len(ambiguous)}/{len(chunks)} chunks")
+        return self._merge_escalated(local, ambiguous, escalated)
+
+    def _classify_llm(
+        self,
+        chunks: List[DocumentChunk],
+        theme: str,
+        schema_fields: List[str],
+    ) -> List[RelevanceResult]:
+        """Classify chunks with batched LLM calls."""
         client = self._get_client()
         all_results: List[RelevanceResult] = []
         
         # Process in batches
-        for batch_start in range(0, len(chunks), self.batch_size):
-            batch_end = min(batch_start + self.batch_size, len(chunks))
-            batch_chunks = chunks[batch_start:batch_end]
-            
+        for batch_start, batch_end in self._batch_bounds(len(chunks)):
             user_prompt = build_batch_prompt(
-                batch_chunks, batch_start, theme, schema_fields, self.preview_chars
+                chunks[batch_start:batch_end], batch_start, theme, schema_fields, self.preview_chars
             )
             
             try:
                 response, completion = client.chat.completions.create_with_completion(
                     model=self.model,
-                    messages=[
-                        {"role": "system", "content": self.SYSTEM_PROMPT},
-                        {"role": "user", "content": user_prompt},
-                    ],
+                    messages=self._messages(user_prompt),
                     response_model=RelevanceResponse,
                     extra_body={"usage": {"include": True}}
                 )
-                
-                # Record usage
-                if self.token_tracker and hasattr(completion, 'usage') and completion.usage:
-                    self.token_tracker.record_usage(
-                        usage={
-                            "prompt_tokens": completion.usage.prompt_tokens,
-                            "completion_tokens": completion.usage.completion_tokens,
-                            "total_tokens": completion.usage.total_tokens
-                        },
-                        model=self.model,
-                        operation="relevance_classification"
-                    )
-                
-                # Map response to results
-                for classification in response.classifications:
-                    all_results.append(RelevanceResult(
-                        chunk_index=classification.index,
-                        is_relevant=classification.relevant == 1,
-                        # Use more distinctive confidence values
-                        # Relevant chunks: high confidence (0.85+)
-                        # Irrelevant chunks: lower confidence (0.5-0.7)
-                        confidence=0.9 if classification.relevant == 1 else 0.5,
-                        reason=classification.reason,
-                    ))
+                self._record_usage(completion)
+                all_results.extend(self._results_from_response(response))
                     
             except Exception as e:
                 # On error, mark all chunks in batch as relevant (safe default)
                 self.logger.warning(f"Relevance classification failed for batch {batch_start}-{batch_end}: {e}")
-                for i in range(batch_start, batch_end):
-                    all_results.append(RelevanceResult(
-                        chunk_index=i,
-                        is_relevant=True,
-                        confidence=0.5,
-                        reason="Classification failed - defaulting to relevant",
-                    ))
-        
-        # Sort by chunk index and fill any gaps
-        results_by_index = {r.chunk_index: r for r in all_results}
-        final_results = []
-        
-        for i in range(len(chunks)):
-            if i in results_by_index:
-                final_results.append(results_by_index[i])
-            else:
-                # Missing result - default to relevant
-                final_results.append(RelevanceResult(
-                    chunk_index=i,
-                    is_relevant=True,
-                    confidence=0.5,
-                    reason="Not classified - defaulting to relevant",
-                ))
+                all_results.extend(self._fallback_results(batch_start, batch_end))
         
-        return final_results
+        return self._order_results(all_results, len(chunks))
+
+    def _global_semaphore(self) -> asyncio.Semaphore:
+        """Semaphore shared by all documents on the running event loop."""
+        loop = asyncio.get_running_loop()
+        semaphore = self._global_semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.global_concurrency)
+            self._global_semaphores[loop] = semaphore
+        return semaphore
+
+    async def _classify_one_batch_async(
+        self,
+        client,
+        chunks: List[DocumentChunk],
+        batch_start: int,
+        batch_end: int,
+        theme: str,
+        schema_fields: List[str],
+        doc_semaphore: asyncio.Semaphore,
+    ) -> List[RelevanceResult]:
+        """Classify one batch under the per-document and global limits."""
+        user_prompt = build_batch_prompt(
+            chunks[batch_start:batch_end], batch_start, theme, schema_fields, self.preview_chars
+        )
+        try:
+            async with doc_semaphore, self._global_semaphore():
+                response, completion = await client.chat.completions.create_with_completion(
+                    model=self.model,
+                    messages=self._messages(user_prompt),
+                    response_model=RelevanceResponse,
+                    extra_body={"usage": {"include": True}}
+                )
+            self._record_usage(completion)
+            return self._results_from_response(response)
+        except Exception as e:
+            self.logger.warning(f"Async Relevance classification failed for batch {batch_start}-{batch_end}: {e}")
+            return self._fallback_results(batch_start, batch_end)
 
     async def classify_batch_async(
         self,
@@ -203,77 +494,63 @@ It's better to include slightly irrelevant content than to miss important data."
     ) -> List[RelevanceResult]:
         """
         Classify all chunks for relevance (Async).
+        
+        Cached decisions are reused. LLM batches are dispatched concurrently,
+        at most max_concurrent_batches per call and global_concurrency across
+        concurrent calls. A failed batch falls back to "relevant" for its own
+        chunks only. Local scoring (hybrid/local modes) runs in a worker thread.
         """
         if not chunks:
             return []
         
+        results, missing, hashes, context_hash = self._cache_lookup(chunks, theme, schema_fields)
+        if missing:
+            fresh = await self._classify_fresh_async([chunks[i] for i in missing], theme, schema_fields)
+            self._cache_store(fresh, missing, hashes, context_hash)
+            results = self._fill(results, missing, fresh)
+        return results
+
+    async def _classify_fresh_async(
+        self,
+        chunks: List[DocumentChunk],
+        theme: str,
+        schema_fields: List[str],
+    ) -> List[RelevanceResult]:
+        """Classify chunks with the configured mode (no cache, async)."""
+        local = None
+        if self.mode != "llm":
+            local = await asyncio.to_thread(self._local_results, chunks, theme, schema_fields)
+        if local is None and self.mode == "local":
+            return self._unscored_results(len(chunks))
+        if local is None:
+            return await self._classify_llm_async(chunks, theme, schema_fields)
+        
+        ambiguous = [i for i, result in enumerate(local) if result is None]
+        escalated = None
+        if ambiguous and self.mode == "hybrid":
+            escalated = await self._classify_llm_async([chunks[i] for i in ambiguous], theme, schema_fields)
+        self.logger.debug(f"Local relevance decided {len(chunks) - len(ambiguous)}/{len(chunks)} chunks")
+        return self._merge_escalated(local, ambiguous, escalated)
+
+    async def _classify_llm_async(
+        self,
+        chunks: List[DocumentChunk],
+        theme: str,
+        schema_fields: List[str],
+    ) -> List[RelevanceResult]:
+        """Classify chunks with concurrent batched LLM calls."""
         client = self._get_async_client()
-        all_results: List[RelevanceResult] = []
+        doc_semaphore = asyncio.Semaphore(self.max_concurrent_batches)
         
-        # Process in batches
-        for batch_start in range(0, len(chunks), self.batch_size):
-            batch_end = min(batch_start + self.batch_size, len(chunks))
-            batch_chunks = chunks[batch_start:batch_end]
-            
-            user_prompt = build_batch_prompt(
-                batch_chunks, batch_start, theme, schema_fields, self.preview_chars
+        batch_results = await asyncio.gather(*(
+            self._classify_one_batch_async(
+                client, chunks, batch_start, batch_end, theme, schema_fields, doc_semaphore
             )
-            
-            try:
-                response, completion = await client.chat.completions.create_with_completion(
-                    model=self.model,
-                    messages=[
-                        {"role": "system", "content": self.SYSTEM_PROMPT},
-                        {"role": "user", "content": user_prompt},
-                    ],
-                    response_model=RelevanceResponse,
-                    extra_body={"usage": {"include": True}}
-                )
-                
-                # Record usage
-                if self.token_tracker and hasattr(completion, 'usage') and completion.usage:
-                    self.token_tracker.record_usage(
-                        usage={
-                            "prompt_tokens": completion.usage.prompt_tokens,
-                            "completion_tokens": completion.usage.completion_tokens,
-                            "total_tokens": completion.usage.total_tokens
-                        },
-                        model=self.model,
-                        operation="relevance_classification"
-                    )
-                
-                for classification in response.classifications:
-                    all_results.append(RelevanceResult(
-                        chunk_index=classification.index,
-                        is_relevant=classification.relevant == 1,
-                        confidence=0.9 if classification.relevant == 1 else 0.5,
-                        reason=classification.reason,
-                    ))
-                    
-            except Exception as e:
-                self.logger.warning(f"Async Relevance classification failed for batch {batch_start}-{batch_end}: {e}")
-                for i in range(batch_start, batch_end):
-                    all_results.append(RelevanceResult(
-                        chunk_index=i,
-                        is_relevant=True,
-                        confidence=0.5,
-                        reason="Classification failed - defaulting to relevant",
-                    ))
+            for batch_start, batch_end in self._batch_bounds(len(chunks))
+        ))
         
-        # Sorting and filling gaps
-        results_by_index = {r.chunk_index: r for r in all_results}
-        final_results = []
-        for i in range(len(chunks)):
-            if i in results_by_index:
-                final_results.append(results_by_index[i])
-            else:
-                final_results.append(RelevanceResult(
-                    chunk_index=i,
-                    is_relevant=True,
-                    confidence=0.5,
-                    reason="Not classified - defaulting to relevant",
-                ))
-        return final_results
+        all_results = [result for batch in batch_results for result in batch]
+        return self._order_results(all_results, len(chunks))
 
     
     def get_relevant_chunks(
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Local embedding-based relevance scoring.
+
+Scores chunks by cosine similarity to schema-field queries using the same
+sentence-transformers model as ChromaVectorStore, plus keyword boosts from
+FieldLibrary specs. Confident scores are decided locally; only chunks in the
+ambiguous band need an LLM call.
+"""
+
+import re
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from core import constants, utils
+from core.fields.library import FieldLibrary
+from core.fields.spec import ColumnSpec
+from core.parser import DocumentChunk
+from .models import RelevanceResult
+
+try:
+    from sentence_transformers import SentenceTransformer
+except ImportError:
+    SentenceTransformer = None
+
+logger = utils.get_logger("EmbeddingRelevance")
+
+Encoder = Callable[[List[str]], np.ndarray]
+
+
+def library_specs() -> Dict[str, ColumnSpec]:
+    """ColumnSpecs defined on FieldLibrary, keyed by field name."""
+    return {
+        value.key: value
+        for value in vars(FieldLibrary).values()
+        if isinstance(value, ColumnSpec)
+    }
+
+
+def _humanize(field_name: str) -> str:
+    return field_name.replace("_", " ").strip()
+
+
+def _load_encoder(model_name: str) -> Encoder:
+    """
+    Load a local sentence encoder.
+
+    Prefers sentence-transformers; falls back to ChromaDB's bundled ONNX
+    MiniLM, mirroring ChromaVectorStore.
+
+    Raises:
+        ImportError: If neither backend is available
+    """
+    if SentenceTransformer is not None:
+        model = SentenceTransformer(model_name, device="cpu")
+        return lambda texts: model.encode(
+            texts,
+            batch_size=constants.RELEVANCE_EMBED_BATCH_SIZE,
+            convert_to_numpy=True,
+            show_progress_bar=False,
+        )
+    try:
+        from chromadb.utils import embedding_functions
+    except ImportError:
+        raise ImportError(
+            "Local relevance needs sentence-transformers. "
+            "Install with: pip install sentence-transformers"
+        )
+    embed = embedding_functions.DefaultEmbeddingFunction()
+    return lambda texts: np.asarray(embed(texts), dtype=np.float32)
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.maximum(norms, 1e-12)
+
+
+class EmbeddingRelevanceScorer:
+    """Scores chunk relevance locally from embeddings and field keywords."""
+
+    def __init__(
+        self,
+        model_name: Optional[str] = None,
+        high_threshold: Optional[float] = None,
+        low_threshold: Optional[float] = None,
+        encoder: Optional[Encoder] = None,
+        specs: Optional[Dict[str, ColumnSpec]] = None,
+    ):
+        """
+        Initialize the scorer.
+
+        Args:
+            model_name: Sentence-transformers model (default: RELEVANCE_EMBEDDING_MODEL)
+            high_threshold: Score at or above which a chunk is relevant
+            low_threshold: Score below which a chunk is irrelevant
+            encoder: Optional callable mapping texts to an embedding matrix
+                (loaded lazily from model_name when omitted)
+            specs: Field specs for descriptions and keywords (default: FieldLibrary)
+        """
+        from core.config import settings
+
+        self.model_name = model_name or settings.RELEVANCE_EMBEDDING_MODEL
+        self.high_threshold = settings.RELEVANCE_SIMILARITY_HIGH if high_threshold is None else high_threshold
+        self.low_threshold = settings.RELEVANCE_SIMILARITY_LOW if low_threshold is None else low_threshold
+        self.specs = library_specs() if specs is None else specs
+        self._encoder = encoder
+        # (theme, fields) -> normalized query embeddings
+        self._query_cache: Dict[tuple, np.ndarray] = {}
+
+    def _encode(self, texts: List[str]) -> np.ndarray:
+        if self._encoder is None:
+            self._encoder = _load_encoder(self.model_name)
+        return _normalize(self._encoder(texts))
+
+    def field_queries(self, theme: str, schema_fields: Sequence[str]) -> List[str]:
+        """One query text per field: theme, field name and library description."""
+        queries = []
+        for field_name in schema_fields:
+            spec = self.specs.get(field_name)
+            description = f": {spec.description}" if spec else ""
+            queries.append(f"{theme} - {_humanize(field_name)}{description}")
+        return queries or [theme]
+
+    def _keyword_patterns(self, schema_fields: Sequence[str]) -> List[re.Pattern]:
+        patterns = []
+        for field_name in schema_fields:
+            spec = self.specs.get(field_name)
+            for keyword in (spec.high_confidence_keywords or []) if spec else []:
+                # Skip symbol-only keywords such as "+" that match almost anything
+                if len(keyword) > 1 and any(c.isalnum() for c in keyword):
+                    patterns.append(re.compile(rf"(?<!\w){re.escape(keyword)}(?!\w)", re.IGNORECASE))
+        return patterns
+
+    def score(self, chunks: List[DocumentChunk], theme: str, schema_fields: Sequence[str]) -> List[float]:
+        """
+        Score chunks in [0, 1+boost]: best field similarity plus keyword boosts.
+
+        Args:
+            chunks: Chunks to score
+            theme: Extraction theme
+            schema_fields: Field names being extracted
+
+        Returns:
+            One score per chunk, in chunk order
+        """
+        if not chunks:
+            return []
+
+        key = (theme, tuple(schema_fields))
+        queries = self._query_cache.get(key)
+        if queries is None:
+            queries = self._encode(self.field_queries(theme, schema_fields))
+            self._query_cache[key] = queries
+
+        chunk_vectors = self._encode([chunk.text for chunk in chunks])
+        similarity = (chunk_vectors @ queries.T).max(axis=1)
+
+        patterns = self._keyword_patterns(schema_fields)
+        scores = []
+        for chunk, base in zip(chunks, similarity):
+            matches = sum(1 for pattern in patterns if pattern.search(chunk.text))
+            boost = min(matches * constants.RELEVANCE_KEYWORD_BOOST, constants.RELEVANCE_MAX_KEYWORD_BOOST)
+            scores.append(float(base) + boost)
+        return scores
+
+    def classify(
+        self,
+        chunks: List[DocumentChunk],
+        theme: str,
+        schema_fields: Sequence[str],
+    ) -> List[Optional[RelevanceResult]]:
+        """
+        Decide confident chunks locally.
+
+        Returns:
+            One entry per chunk: a RelevanceResult when the score is outside
+            the ambiguous band, None when the chunk should go to the LLM
+        """
+        results: List[Optional[RelevanceResult]] = []
+        for i, score in enumerate(self.score(chunks, theme, schema_fields)):
+            if score >= self.high_threshold:
+                results.append(RelevanceResult(
+                    chunk_index=i,
+                    is_relevant=True,
+                    confidence=round(min(score, 1.0), 3),
+                    reason=f"Local similarity {score:.2f}",
+                ))
+            elif score < self.low_threshold:
+                results.append(RelevanceResult(
+                    chunk_index=i,
+                    is_relevant=False,
+                    confidence=round(1.0 - score, 3),
+                    reason=f"Local similarity {score:.2f}",
+                ))
+            else:
+                results.append(None)
+        return results
@@ -50,7 +50,9 @@ class LLMClientFactory:
             mode = instructor.Mode.TOOLS
             
         # 3. Create Client
-        return instructor.from_openai(OpenAI(**client_args), mode=mode)
+        return LLMClientFactory._with_response_cache(
+            instructor.from_openai(OpenAI(**client_args), mode=mode), is_async=False
+        )
 
     @staticmethod
     def create_async(
@@ -83,7 +85,19 @@ class LLMClientFactory:
             mode = instructor.Mode.TOOLS
 
         # 3. Create Client
-        return instructor.from_openai(AsyncOpenAI(**client_args), mode=mode)
+        return LLMClientFactory._with_response_cache(
+            instructor.from_openai(AsyncOpenAI(**client_args), mode=mode), is_async=True
+        )
+
+    @staticmethod
+    def _with_response_cache(client: Any, is_async: bool) -> Any:
+        """Route chat completions through the LLM response cache unless LLM_CACHE_MODE is off."""
+        from .cache.llm_responses import CachedLLMClient, get_llm_cache
+
+        cache = get_llm_cache()
+        if cache is None:
+            return client
+        return CachedLLMClient(client, cache, is_async=is_async)
 
     @staticmethod
     def _get_client_args(provider: str, api_key: Optional[str], base_url: Optional[str]) -> Dict[str, Any]:
@@ -106,6 +120,11 @@ class LLMClientFactory:
             args["base_url"] = base_url or settings.OPENROUTER_BASE_URL
             args["api_key"] = key
             
+        elif provider == "stub":
+            # Offline OpenAI-compatible stub server (core/stub_llm.py)
+            args["base_url"] = base_url or settings.STUB_LLM_BASE_URL
+            args["api_key"] = api_key or "stub"
+            
         else: # openai or generic
             args["api_key"] = api_key or settings.OPENAI_API_KEY
             if base_url:
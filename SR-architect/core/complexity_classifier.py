@@ -12,6 +12,7 @@ import yaml
 
 from core.utils import get_logger
 from core.parsers.base import ParsedDocument
+from core.parsers.probe import PageProbe, PDFProbe
 
 logger = get_logger("ComplexityClassifier")
 
@@ -137,6 +138,86 @@ class ComplexityClassifier:
         else:
             signals["missing_sections"] = False
             
+        return self._build_result(score, signals)
+    
+    def classify_probe(self, probe: PDFProbe) -> ComplexityResult:
+        """
+        Classify complexity from pre-parse layout signals.
+        
+        Uses the same rule weights and thresholds as classify(), so the
+        parser can be chosen before any text is extracted. Signals that need
+        extracted text (missing_sections) are not scored.
+        
+        Args:
+            probe: Result of core.parsers.probe.probe_pdf
+            
+        Returns:
+            ComplexityResult with level, score, and recommendations
+        """
+        rules = self.config.get("rules", {})
+        signals = {}
+        score = 0
+        
+        def apply(name: str, triggered: bool, default_weight: int):
+            nonlocal score
+            signals[name] = triggered
+            if triggered:
+                score += rules.get(name, {}).get("weight", default_weight)
+        
+        apply("multi_column", probe.multi_column_ratio >= rules.get("multi_column", {}).get("min_page_ratio", 0.5), 2)
+        apply("has_tables", any(self.page_has_table(p) for p in probe.pages), 3)
+        apply("has_figures", probe.image_coverage >= rules.get("has_figures", {}).get("min_image_coverage", 0.25), 1)
+        apply("scanned_document", self._looks_scanned(probe), 5)
+        apply("short_text", probe.text_chars < rules.get("short_text", {}).get("char_threshold", 5000), 1)
+        apply("long_document", probe.page_count > rules.get("long_document", {}).get("page_threshold", 30), 2)
+        apply("font_variety", probe.font_size_count >= rules.get("font_variety", {}).get("min_font_sizes", 12), 1)
+        
+        return self._build_result(score, signals)
+    
+    def page_has_table(self, page: PageProbe) -> bool:
+        """Whether a probed page carries enough ruling lines to hold a table."""
+        min_rulings = self.config.get("rules", {}).get("has_tables", {}).get("min_ruling_lines", 4)
+        return page.ruling_lines >= min_rulings
+    
+    def docling_pages(self, probe: PDFProbe) -> Optional[List[int]]:
+        """
+        Pages that need Docling under page-level hybrid routing.
+        
+        Returns:
+            Sorted 1-based page numbers (possibly empty), or None when page
+            routing is disabled or so many pages qualify that the whole
+            document should go through Docling.
+        """
+        routing = self.config.get("page_routing", {})
+        if not routing.get("enabled", False) or not probe.pages:
+            return None
+        
+        pages = []
+        for page in probe.pages:
+            if routing.get("tables", True) and self.page_has_table(page):
+                pages.append(page.page_number)
+            elif routing.get("scanned", True) and self._is_scanned(page.text_chars, page.image_coverage):
+                pages.append(page.page_number)
+            elif routing.get("multi_column", False) and page.multi_column:
+                pages.append(page.page_number)
+        
+        if len(pages) > routing.get("max_docling_page_ratio", 0.6) * len(probe.pages):
+            return None
+        return pages
+    
+    def _looks_scanned(self, probe: PDFProbe) -> bool:
+        """Image-dominated pages with (almost) no text layer, on average."""
+        return probe.page_count > 0 and self._is_scanned(probe.chars_per_page, probe.image_coverage)
+    
+    def _is_scanned(self, chars_per_page: float, image_coverage: float) -> bool:
+        rule = self.config.get("rules", {}).get("scanned_document", {})
+        return (
+            chars_per_page < rule.get("max_chars_per_page", 200)
+            and image_coverage >= rule.get("min_image_coverage", 0.5)
+        )
+    
+    def _build_result(self, score: int, signals: Dict[str, bool]) -> ComplexityResult:
+        """Map a score to a complexity level and parser recommendation."""
         # Determine level from score
         thresholds = self.config.get("thresholds", self.DEFAULT_THRESHOLDS)
         if score <= thresholds.get("simple", 3):
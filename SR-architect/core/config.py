@@ -60,12 +60,16 @@ class Settings(BaseSettings):
     # ========== LLM Provider Settings ==========
     LLM_PROVIDER: str = Field(
         default="openrouter",
-        description="Default LLM provider (openrouter, openai, ollama)"
+        description="Default LLM provider (openrouter, openai, ollama, stub)"
     )
     LLM_MODEL: Optional[str] = Field(
         default=None,
         description="Override default model selection"
     )
+    PROMPT_CACHE_HINTS: bool = Field(
+        default=True,
+        description="Mark the stable prompt prefix and document text with cache_control breakpoints where the provider supports them"
+    )
     
     # ========== Model Names ==========
     OPENROUTER_MODEL: str = Field(
@@ -111,6 +115,16 @@ class Settings(BaseSettings):
         description="Grace period before force-killing processes (seconds)"
     )
     
+    # ========== Stub LLM Server Settings ==========
+    STUB_LLM_BASE_URL: str = Field(
+        default="http://127.0.0.1:8765/v1",
+        description="Base URL of the offline OpenAI-compatible stub server (provider 'stub')"
+    )
+    STUB_LLM_MODEL: str = Field(
+        default="stub-model",
+        description="Model name sent to the stub server"
+    )
+    
     # ========== Pipeline Settings ==========
     SCORE_THRESHOLD: float = Field(
         default=0.8,
@@ -128,6 +142,22 @@ class Settings(BaseSettings):
         default=True,
         description="Enable hybrid local-first extraction by default"
     )
+    LOCAL_VERIFICATION_ENABLED: bool = Field(
+        default=True,
+        description="Verify evidence quotes and values locally; only failing fields go to the LLM checker/auditor"
+    )
+    EXTRACTION_EVIDENCE_MODE: str = Field(
+        default="two_call",
+        description="Evidence extraction: 'two_call' (data, then quotes) or 'single_call' (values with quotes in one call)"
+    )
+    CONCURRENT_SCHEMA_CHUNKS: bool = Field(
+        default=True,
+        description="Extract schema chunks concurrently over one shared per-document context (async runs)"
+    )
+    FIELD_GROUP_RETRIEVAL: bool = Field(
+        default=False,
+        description="Extract fields in semantic groups, each from its top-k BM25-retrieved chunks (async runs)"
+    )
     
     # ========== Logging Settings ==========
     LOG_LEVEL: str = Field(
@@ -144,6 +174,10 @@ class Settings(BaseSettings):
         default=4,
         description="Number of parallel workers for batch processing"
     )
+    PIPELINE_QUEUE_SIZE: int = Field(
+        default=8,
+        description="Max parsed documents buffered ahead of extraction in pipelined mode"
+    )
     
     # ========== Paths ==========
     VECTOR_DIR: Path = Field(
@@ -173,11 +207,45 @@ class Settings(BaseSettings):
         description="Minimum confidence for validation"
     )
     
+    # ========== Relevance Classification ==========
+    RELEVANCE_MODE: str = Field(
+        default="llm",
+        description="Relevance tier: 'llm', 'hybrid' (local embeddings, LLM for ambiguous chunks) or 'local' (no LLM)"
+    )
+    RELEVANCE_EMBEDDING_MODEL: str = Field(
+        default="all-MiniLM-L6-v2",
+        description="Sentence-transformers model for local relevance scoring"
+    )
+    RELEVANCE_SIMILARITY_HIGH: float = Field(
+        default=0.45,
+        description="Local score at or above which a chunk is relevant without an LLM call"
+    )
+    RELEVANCE_SIMILARITY_LOW: float = Field(
+        default=0.2,
+        description="Local score below which a chunk is irrelevant without an LLM call"
+    )
+    RELEVANCE_CACHE_ENABLED: bool = Field(
+        default=True,
+        description="Persist chunk relevance decisions across extraction runs"
+    )
+    
     # ========== Context and Chunk Limits ==========
     MAX_CONTEXT_CHARS: int = Field(
         default=15000,
         description="Maximum characters for extraction context"
     )
+    CONTEXT_PACKING_ENABLED: bool = Field(
+        default=True,
+        description="Pack extraction context by token budget, relevance and field coverage instead of first-N characters"
+    )
+    CONTEXT_TOKEN_BUDGET: int = Field(
+        default=3000,
+        description="Token budget for packed extraction context (capped by the model's context window)"
+    )
+    FIELD_GROUP_TOP_K: int = Field(
+        default=4,
+        description="Chunks retrieved per field group in field-group retrieval mode"
+    )
     MAX_CHUNK_CHARS: int = Field(
         default=8000,
         description="Maximum characters per chunk for validation"
@@ -196,9 +264,25 @@ class Settings(BaseSettings):
         default=15000,
         description="Maximum characters for Docling parsing"
     )
-    PARSER_CACHE_MAX_SIZE: int = Field(
-        default=100,
-        description="Maximum number of cached parsed documents"
+    DOCLING_DAEMON_SOCKET: str = Field(
+        default=".cache/docling.sock",
+        description="Unix socket of the warm Docling worker daemon (used when running)"
+    )
+    DOCLING_DAEMON_WORKERS: int = Field(
+        default=2,
+        description="Warm Docling converter processes kept by the daemon"
+    )
+    DOCLING_JOB_TIMEOUT: float = Field(
+        default=300.0,
+        description="Seconds before a daemon parse job is killed"
+    )
+    DOCLING_JOB_MAX_MEMORY_MB: int = Field(
+        default=4096,
+        description="Resident memory cap (MB) per daemon worker; exceeding it kills the job"
+    )
+    PARSER_CACHE_MAX_BYTES: int = Field(
+        default=1024 * 1024 * 1024,
+        description="Byte budget for the parse cache (least recently used entries are evicted)"
     )
     PARSER_CHUNK_SIZE: int = Field(
         default=1000,
@@ -208,6 +292,10 @@ class Settings(BaseSettings):
         default=200,
         description="Overlap between parser chunks"
     )
+    PARSER_WORKERS: Optional[int] = Field(
+        default=None,
+        description="Worker processes for parallel PDF parsing (None = CPU count)"
+    )
     PARSER_EXTRACTION_CONTEXT_MAX_CHARS: int = Field(
         default=15000,
         description="Maximum characters for parser extraction context"
@@ -219,6 +307,35 @@ class Settings(BaseSettings):
         description="Characters to use for document hash computation"
     )
     
+    FINGERPRINT_STORE_ENABLED: bool = Field(
+        default=True,
+        description="Persist validated extraction results and reuse them for exact/near-duplicate documents on --resume runs"
+    )
+    NEAR_DUPLICATE_THRESHOLD: float = Field(
+        default=0.85,
+        description="Minimum estimated Jaccard similarity (MinHash) for a near-duplicate document"
+    )
+    FIELD_CACHE_ENABLED: bool = Field(
+        default=True,
+        description="Cache validated values per field; --resume runs only re-extract new or changed schema fields"
+    )
+    LLM_CACHE_MODE: str = Field(
+        default="off",
+        description="LLM response cache: 'off', 'read_write' (serve hits, store misses), 'record' (always call, store) or 'replay' (hits only, fail on a miss)"
+    )
+    LLM_CACHE_DIR: str = Field(
+        default=".cache/llm_responses",
+        description="Directory of the sharded SQLite LLM response cache"
+    )
+    LLM_CACHE_TTL_SECONDS: Optional[int] = Field(
+        default=30 * 24 * 3600,
+        description="Age after which cached LLM responses are refetched (None = never; ignored in replay mode)"
+    )
+    LLM_CACHE_MAX_BYTES: int = Field(
+        default=512 * 1024 * 1024,
+        description="Byte budget for the LLM response cache (least recently used responses are evicted)"
+    )
+    
     # ========== Token Calculation Settings ==========
     CHARS_PER_TOKEN_ESTIMATE: int = Field(
         default=4,
@@ -270,6 +387,7 @@ class Settings(BaseSettings):
         "openai/gpt-4o": {"prompt": 2.5, "completion": 10.0},
         "openai/gpt-4o-mini": {"prompt": 0.15, "completion": 0.6},
         "google/gemini-2.5-flash-lite": {"prompt": 0.0, "completion": 0.0},
+        "stub-model": {"prompt": 0.0, "completion": 0.0},
     }
     
     # ========== Pydantic Settings Config ==========
@@ -304,6 +422,8 @@ class Settings(BaseSettings):
             return self.OPENROUTER_MODEL
         elif provider == "ollama":
             return self.OLLAMA_MODEL
+        elif provider == "stub":
+            return self.STUB_LLM_MODEL
         else:
             # Fallback to OpenRouter model for unknown providers
             return self.OPENROUTER_MODEL
@@ -22,6 +22,46 @@ CIRCUIT_BREAKER_THRESHOLD = 3  # Number of consecutive failures before opening c
 SENTENCE_CONTEXT_WINDOW = 2
 SENTENCE_CONCURRENCY_LIMIT = 10
 
+# === Schema Metadata ===
+METADATA_FIELDS = ("filename", "extraction_status", "extraction_confidence", "extraction_notes")  # Added by schema_builder, not extracted from text
+
 # === Relevance Classification ===
 RELEVANCE_BATCH_SIZE = 10
 RELEVANCE_PREVIEW_CHARS = 500
+RELEVANCE_DOC_CONCURRENCY = 4  # Batches in flight per document
+RELEVANCE_GLOBAL_CONCURRENCY = 16  # Batches in flight per classifier, across documents
+RELEVANCE_KEYWORD_BOOST = 0.15  # Added to a chunk's local score per matched field keyword (capped)
+RELEVANCE_MAX_KEYWORD_BOOST = 0.3
+RELEVANCE_EMBED_BATCH_SIZE = 32
+
+# === Local Evidence Verification ===
+LOCAL_VERIFY_QUOTE_THRESHOLD = 0.8  # Minimum fuzzy score for a quote to count as found
+LOCAL_VERIFY_VALUE_THRESHOLD = 0.7  # Share of value tokens/numbers that must appear in the quote span
+
+# === Context Packing ===
+CONTEXT_WINDOW_SHARE = 0.5  # Max share of a model's usable window given to document context
+CONTEXT_COVERAGE_WEIGHT = 0.5  # Weight of newly covered schema fields vs relevance when ranking chunks
+CONTEXT_DEFAULT_RELEVANCE = 0.5  # Relevance assumed for chunks without a classifier score
+CONTEXT_SHINGLE_SIZE = 8  # Words per shingle when detecting overlapping chunk windows
+CONTEXT_MIN_NOVELTY = 0.3  # Chunks with less new text than this are skipped as duplicates
+CONTEXT_SEPARATOR_TOKENS = 1  # Tokens charged per chunk for the blank-line separator
+
+# === Field-Group Retrieval ===
+RETRIEVAL_BM25_K1 = 1.5  # BM25 term-frequency saturation
+RETRIEVAL_BM25_B = 0.75  # BM25 chunk-length normalization
+FIELD_GROUP_MIN_FIELDS = 2  # Groups with fewer data fields are folded into the general group
+FIELD_GROUP_DESCRIPTION_WEIGHT = 0.25  # Weight of description-word matches vs name-word matches when grouping
+
+# === Prompt Caching ===
+PROMPT_CACHE_CONTROL_PREFIXES = ("anthropic/", "google/gemini")  # OpenRouter models that take cache_control breakpoints
+PROMPT_CACHE_READ_PRICE_RATIO = 0.5  # Cached input price vs uncached when the pricing API gives none (conservative)
+
+# === LLM Response Cache ===
+LLM_CACHE_SHARDS = 16  # SQLite files the response cache is split across (by key prefix)
+LLM_CACHE_UNKEYED_PARAMS = ("max_retries", "extra_body", "timeout")  # Request kwargs that do not change the response
+
+# === Stub LLM Server ===
+STUB_LLM_LATENCY_MS = 200.0  # Mean simulated response latency
+STUB_LLM_LATENCY_SIGMA = 0.5  # Shape of the lognormal latency distribution
+STUB_LLM_RETRY_AFTER_SECONDS = 1  # Retry-After sent with simulated 429 responses
+STUB_LLM_MAX_BODY_BYTES = 32 * 1024 * 1024  # Larger request bodies are rejected with 413
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Token-budget context packing for extraction prompts.
+
+Chooses which relevant chunks go into the extraction context. Chunks are
+ranked by relevance score plus the schema fields they newly cover, text
+already in the context (overlapping parser windows) is trimmed or skipped,
+and selection stops at a token budget derived from the target model's
+context window. Selected chunks are emitted in document order.
+"""
+
+import heapq
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from core import constants
+from core.config import settings
+from core.context_window_monitor import ContextWindowMonitor
+from core.parser import DocumentChunk
+
+_WORD = re.compile(r"\w+")
+
+# Field-name words too generic to signal coverage
+GENERIC_TERMS = {
+    "and", "the", "for", "with", "other", "type", "status", "total", "number",
+    "details", "value", "present", "reported", "description", "quote",
+}
+
+
+@dataclass
+class PackedContext:
+    """A packed extraction context and how it was built."""
+    text: str
+    tokens: int
+    budget: int
+    selected: List[int] = field(default_factory=list)  # chunk indices, document order
+    skipped: List[int] = field(default_factory=list)  # over budget or duplicate
+    trimmed_chars: int = 0  # overlap removed from selected chunks
+
+
+@dataclass
+class _Piece:
+    """A chunk's text after removing what the context already contains."""
+    text: str
+    tokens: int
+    novelty: float
+    trimmed: int
+
+
+class _Candidate:
+    """Chunk text with its word spans, shingles and covered fields."""
+
+    def __init__(self, index: int, chunk: DocumentChunk, score: float, fields: Set[str]):
+        self.index = index
+        self.text = chunk.text
+        self.score = score
+        self.fields = fields
+        matches = list(_WORD.finditer(self.text))
+        self.spans = [m.span() for m in matches]
+        words = [m.group().lower() for m in matches]
+        size = constants.CONTEXT_SHINGLE_SIZE
+        if len(words) <= size:
+            self.shingles = [hash(tuple(words))] if words else []
+        else:
+            self.shingles = [hash(tuple(words[i:i + size])) for i in range(len(words) - size + 1)]
+
+
+def _covered_run(covered: List[bool]) -> int:
+    """Length of the covered run at the start, tolerating one uncovered first
+    shingle (a word cut in half where the parser split its windows)."""
+    start = 1 if len(covered) > 1 and not covered[0] and covered[1] else 0
+    end = start
+    while end < len(covered) and covered[end]:
+        end += 1
+    return end if end > start else 0
+
+
+class ContextPacker:
+    """Packs relevant chunks into a per-model token budget."""
+
+    def __init__(
+        self,
+        model: str = "default",
+        token_budget: Optional[int] = None,
+        monitor: Optional[ContextWindowMonitor] = None,
+    ):
+        """
+        Initialize the packer.
+
+        Args:
+            model: Target model, used to look up its context window
+            token_budget: Context tokens to fill (default: CONTEXT_TOKEN_BUDGET,
+                capped at CONTEXT_WINDOW_SHARE of the model's usable window)
+            monitor: Optional ContextWindowMonitor (tokenizer and limits)
+        """
+        self.monitor = monitor or ContextWindowMonitor(model)
+        window_budget = int(self.monitor.usable_limit * constants.CONTEXT_WINDOW_SHARE)
+        self.token_budget = token_budget or min(settings.CONTEXT_TOKEN_BUDGET, window_budget)
+        self._terms_cache: Dict[Tuple[str, ...], Dict[str, Set[str]]] = {}
+
+    def field_terms(self, schema_fields: Sequence[str]) -> Dict[str, Set[str]]:
+        """Words that signal a chunk covers each field: name words plus library keywords."""
+        key = tuple(schema_fields)
+        if key in self._terms_cache:
+            return self._terms_cache[key]
+
+        try:
+            from core.classification.embedding import library_specs
+            specs = library_specs()
+        except Exception:
+            specs = {}
+
+        terms: Dict[str, Set[str]] = {}
+        for name in schema_fields:
+            if name in constants.METADATA_FIELDS or name.endswith("_quote"):
+                continue
+            words = set(name.lower().split("_"))
+            spec = specs.get(name)
+            for keyword in (spec.high_confidence_keywords or []) if spec else []:
+                words.update(w.lower() for w in _WORD.findall(keyword))
+            words = {w for w in words if len(w) > 2 and w not in GENERIC_TERMS}
+            if words:
+                terms[name] = words
+        self._terms_cache[key] = terms
+        return terms
+
+    def _piece(self, candidate: _Candidate, seen: Set[int]) -> Optional[_Piece]:
+        """Candidate text minus leading/trailing runs already in the context."""
+        shingles = candidate.shingles
+        if not shingles:
+            return None
+        covered = [s in seen for s in shingles]
+        novelty = 1 - sum(covered) / len(covered)
+        if novelty < constants.CONTEXT_MIN_NOVELTY:
+            return None
+
+        lead = _covered_run(covered)
+        trail = _covered_run(covered[::-1])
+        # Leading shingles 0..lead-1 cover words up to lead+size-2; trailing
+        # shingles cover every word from len(shingles)-trail onwards
+        first_word = lead + constants.CONTEXT_SHINGLE_SIZE - 1 if lead else 0
+        last_word = len(shingles) - trail if trail else len(candidate.spans)
+        if first_word >= last_word:
+            return None
+
+        start = candidate.spans[first_word][0] if lead else 0
+        end = candidate.spans[last_word - 1][1] if trail else len(candidate.text)
+        text = candidate.text[start:end].strip()
+        if not text:
+            return None
+        return _Piece(
+            text=text,
+            tokens=self.monitor.count_tokens(text) + constants.CONTEXT_SEPARATOR_TOKENS,
+            novelty=novelty,
+            trimmed=len(candidate.text) - (end - start),
+        )
+
+    def _value(self, candidate: _Candidate, covered_fields: Set[str], field_count: int) -> float:
+        new_fields = len(candidate.fields - covered_fields)
+        return candidate.score + constants.CONTEXT_COVERAGE_WEIGHT * new_fields / max(field_count, 1)
+
+    def pack(
+        self,
+        chunks: List[DocumentChunk],
+        schema_fields: Sequence[str] = (),
+        scores: Optional[Sequence[float]] = None,
+    ) -> PackedContext:
+        """
+        Select and order chunks for one extraction prompt.
+
+        Greedy selection by value (relevance + share of still-uncovered
+        fields the chunk mentions). Values only fall as the context grows,
+        so stale heap entries are re-scored lazily. A chunk is added only
+        if its novel text fits the remaining budget.
+
+        Args:
+            chunks: Relevant chunks in document order
+            schema_fields: Fields being extracted (for coverage)
+            scores: Optional relevance probability per chunk (default 0.5)
+
+        Returns:
+            PackedContext with the context text and selection stats
+        """
+        terms = self.field_terms(schema_fields)
+        candidates = []
+        for i, chunk in enumerate(chunks):
+            words = {w.lower() for w in _WORD.findall(chunk.text)}
+            fields = {name for name, field_words in terms.items() if field_words & words}
+            score = scores[i] if scores is not None and i < len(scores) else constants.CONTEXT_DEFAULT_RELEVANCE
+            candidates.append(_Candidate(i, chunk, float(score), fields))
+
+        seen: Set[int] = set()
+        covered_fields: Set[str] = set()
+        remaining = self.token_budget
+        pieces: Dict[int, str] = {}
+        skipped: List[int] = []
+        trimmed = 0
+
+        heap = [(-self._value(c, covered_fields, len(terms)), c.index) for c in candidates]
+        heapq.heapify(heap)
+        while heap and remaining > 0:
+            stale_value, index = heapq.heappop(heap)
+            candidate = candidates[index]
+            value = self._value(candidate, covered_fields, len(terms))
+            if heap and -value > heap[0][0] and value < -stale_value:
+                heapq.heappush(heap, (-value, index))
+                continue
+
+            piece = self._piece(candidate, seen)
+            if piece is None or piece.tokens > remaining:
+                skipped.append(index)
+                continue
+            pieces[index] = piece.text
+            remaining -= piece.tokens
+            trimmed += piece.trimmed
+            seen.update(candidate.shingles)
+            covered_fields |= candidate.fields
+        skipped.extend(index for _, index in heap)
+
+        if not pieces and candidates:
+            best = max(candidates, key=lambda c: (self._value(c, set(), len(terms)), -c.index))
+            pieces[best.index] = self.monitor.truncate_to_tokens(best.text, self.token_budget)
+            skipped.remove(best.index)
+
+        selected = sorted(pieces)
+        text = "\n\n".join(pieces[i] for i in selected)
+        return PackedContext(
+            text=text,
+            tokens=self.monitor.count_tokens(text),
+            budget=self.token_budget,
+            selected=selected,
+            skipped=sorted(skipped),
+            trimmed_chars=trimmed,
+        )
+
+    def build_context(
+        self,
+        chunks: List[DocumentChunk],
+        schema_fields: Optional[Sequence[str]] = None,
+        scores: Optional[Sequence[float]] = None,
+    ) -> str:
+        """Drop-in replacement for stages.build_context that packs by tokens."""
+        return self.pack(chunks, schema_fields or (), scores).text
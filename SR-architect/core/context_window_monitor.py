@@ -26,10 +26,36 @@ MODEL_CONTEXT_LIMITS = {
     "llama3.1:8b": 8192,
     "mistral": 32768,
     "qwen2.5-coder": 32768,
+    "qwen3": 32768,
+    "gpt-4o-mini": 128000,
+    "claude-3-haiku": 200000,
+    "claude-3.5-sonnet": 200000,
+    "gemini-2.0-flash": 1048576,
+    "gemini-2.5-flash": 1048576,
+    "gemini-2.5-flash-lite": 1048576,
     "default": 8192,
 }
 
 
+def context_limit_for(model: str) -> int:
+    """
+    Context window (tokens) for a model name.
+    
+    Tries the exact name, then the name without a provider prefix
+    ("openai/gpt-4o" -> "gpt-4o"), then the longest known name it starts with
+    ("gpt-4o-2024-08-06" -> "gpt-4o").
+    """
+    name = (model or "").lower()
+    for candidate in (name, name.rsplit("/", 1)[-1]):
+        if candidate in MODEL_CONTEXT_LIMITS:
+            return MODEL_CONTEXT_LIMITS[candidate]
+    base = name.rsplit("/", 1)[-1]
+    prefixes = [key for key in MODEL_CONTEXT_LIMITS if key != "default" and base.startswith(key)]
+    if prefixes:
+        return MODEL_CONTEXT_LIMITS[max(prefixes, key=len)]
+    return MODEL_CONTEXT_LIMITS["default"]
+
+
 class ContextWindowMonitor:
     """
     Monitors and manages context window usage to prevent truncation.
@@ -53,10 +79,7 @@ class ContextWindowMonitor:
         self.safety_margin = safety_margin
         
         # Determine context limit
-        self.context_limit = MODEL_CONTEXT_LIMITS.get(
-            model.lower(), 
-            MODEL_CONTEXT_LIMITS["default"]
-        )
+        self.context_limit = context_limit_for(model)
         self.usable_limit = int(self.context_limit * (1 - safety_margin))
         
         # Initialize tokenizer
@@ -86,6 +109,22 @@ class ContextWindowMonitor:
             # Fallback: ~4 characters per token (rough estimate)
             return len(text) // 4
     
+    def truncate_to_tokens(self, text: str, max_tokens: int) -> str:
+        """
+        Cut text to at most max_tokens tokens, keeping the start.
+        
+        Args:
+            text: Input text
+            max_tokens: Token budget
+            
+        Returns:
+            Truncated text
+        """
+        if self._encoder:
+            return self._encoder.decode(self._encoder.encode(text)[:max_tokens])
+        # Fallback: ~4 characters per token (matches count_tokens)
+        return text[:max_tokens * 4]
+    
     def check_fits(self, text: str) -> bool:
         """
         Check if text fits within usable context window.
@@ -77,6 +77,9 @@ class PipelineResult:
     # Warnings
     warnings: List[str] = field(default_factory=list)
     
+    # Local evidence verification per field (status, score, span)
+    field_verification: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    
     # Source info
     source_filename: str = ""
     extraction_timestamp: str = ""
@@ -110,6 +113,7 @@ class PipelineResult:
                 "filter_stats": self.content_filter_stats,
                 "relevance": self.relevance_stats,
             },
+            "field_verification": self.field_verification,
             "warnings": self.warnings
         }
 
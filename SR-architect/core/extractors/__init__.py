@@ -1,11 +1,14 @@
 """Extractors module for structured data extraction."""
-from .models import EvidenceItem, ExtractionWithEvidence, EvidenceResponse
-from .extractor import StructuredExtractor, EVIDENCE_CONTEXT_MAX_CHARS
+from .models import EvidenceItem, ExtractionWithEvidence, EvidenceResponse, CitedValue, cited_response_model
+from .extractor import StructuredExtractor, EVIDENCE_CONTEXT_MAX_CHARS, EVIDENCE_MODES
 
 __all__ = [
     "StructuredExtractor",
     "EvidenceItem",
     "ExtractionWithEvidence",
     "EvidenceResponse",
+    "CitedValue",
+    "cited_response_model",
     "EVIDENCE_CONTEXT_MAX_CHARS",
+    "EVIDENCE_MODES",
 ]
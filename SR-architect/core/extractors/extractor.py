@@ -11,13 +11,33 @@ from pydantic import BaseModel
 from core import utils
 from core.parser import ParsedDocument
 from core import constants
-from .models import EvidenceItem, ExtractionWithEvidence, EvidenceResponse
+from core.config import settings
+from core.prompt_cache import cached_content, supports_cache_control
+from core.token_tracker import usage_from_completion
+from .models import EvidenceItem, ExtractionWithEvidence, EvidenceResponse, cited_response_model
 
 T = TypeVar('T', bound=BaseModel)
 
 # Evidence extraction constants
 EVIDENCE_CONTEXT_MAX_CHARS = 12000  # Max characters for evidence extraction to avoid token limits
 
+# "two_call": data call, then a separate quote-finding call
+# "single_call": one call returning each value with its quote and confidence
+EVIDENCE_MODES = ("two_call", "single_call")
+
+EVIDENCE_SYSTEM_PROMPT = """You are a citation auditor. Find exact quotes supporting extracted values.
+
+For each extracted field, provide:
+1. The exact quote from the source text
+2. Confidence in the match (0.0-1.0)
+
+If you cannot find a supporting quote, use an empty string for exact_quote."""
+
+SINGLE_CALL_INSTRUCTIONS = """For every field return an object with:
+- value: the extracted value
+- exact_quote: the verbatim sentence or phrase from the text that supports it (empty string if none)
+- confidence: your confidence in the value (0.0-1.0)"""
+
 
 class StructuredExtractor:
     """Extract structured data from text using LLMs with Instructor."""
@@ -53,6 +73,7 @@ Extract the requested fields according to the provided schema."""
         examples: Optional[str] = None,
         token_tracker: Optional["TokenTracker"] = None,
         max_retries: Optional[int] = None,
+        evidence_mode: Optional[str] = None,
     ):
         """
         Initialize the extractor logic.
@@ -65,6 +86,8 @@ Extract the requested fields according to the provided schema."""
             examples: Few-shot examples string to append to prompt
             token_tracker: Optional token usage tracker
             max_retries: Maximum number of retries for failed extractions
+            evidence_mode: How extract_with_evidence gets quotes: "two_call" or
+                "single_call" (default: EXTRACTION_EVIDENCE_MODE)
         """
         self.provider = provider.lower()
         self.api_key = api_key
@@ -73,6 +96,9 @@ Extract the requested fields according to the provided schema."""
         self.examples = examples
         self.token_tracker = token_tracker
         self.max_retries = max_retries if max_retries is not None else constants.MAX_LLM_RETRIES
+        self.evidence_mode = (evidence_mode or settings.EXTRACTION_EVIDENCE_MODE).lower()
+        if self.evidence_mode not in EVIDENCE_MODES:
+            raise ValueError(f"Unknown evidence mode {self.evidence_mode!r}; expected one of {EVIDENCE_MODES}")
         
         # Lazy-initialized clients
         self._instructor_client = None
@@ -167,36 +193,17 @@ Extract the requested fields according to the provided schema."""
         """
         client = self.client
         
-        # Build prompt
-        system_prompt = self.SYSTEM_PROMPT_TEMPLATE
-        if self.examples:
-            system_prompt += f"\n\n{self.examples}"
-        
-        user_prompt = f"Extract the following data from this text:\n\n{text}"
-        
         try:
             # Call LLM with Instructor
             result, completion = client.chat.completions.create_with_completion(
                 model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
+                messages=self._build_extraction_messages(text),
                 response_model=schema,
                 max_retries=self.max_retries,
                 extra_body={"usage": {"include": True}}
             )
             
-            # Track usage
-            usage = None
-            if hasattr(completion, 'usage') and completion.usage:
-                usage = {
-                    "prompt_tokens": completion.usage.prompt_tokens,
-                    "completion_tokens": completion.usage.completion_tokens,
-                    "total_tokens": completion.usage.total_tokens
-                }
-            
-            self._track_usage(self.model, success=True, usage=usage, filename=filename)
+            self._track_usage(self.model, success=True, usage=self._completion_usage(completion), filename=filename)
             return result
             
         except Exception as e:
@@ -215,36 +222,19 @@ Extract the requested fields according to the provided schema."""
         """
         client = self.async_client
         
-        # Build prompt
-        system_prompt = self.SYSTEM_PROMPT_TEMPLATE
-        if self.examples:
-            system_prompt += f"\n\n{self.examples}"
-        
-        user_prompt = f"Extract the following data from this text:\n\n{text}"
-        
         try:
             # Call LLM with Instructor
             result, completion = await client.chat.completions.create_with_completion(
                 model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
+                messages=self._build_extraction_messages(text),
                 response_model=schema,
                 max_retries=self.max_retries,
                 extra_body={"usage": {"include": True}}
             )
             
-            # Track usage
-            usage = None
-            if hasattr(completion, 'usage') and completion.usage:
-                usage = {
-                    "prompt_tokens": completion.usage.prompt_tokens,
-                    "completion_tokens": completion.usage.completion_tokens,
-                    "total_tokens": completion.usage.total_tokens
-                }
-            
-            await self._track_usage_async(self.model, success=True, usage=usage, filename=filename)
+            await self._track_usage_async(
+                self.model, success=True, usage=self._completion_usage(completion), filename=filename
+            )
             return result
             
         except Exception as e:
@@ -319,14 +309,21 @@ Extract the requested fields according to the provided schema."""
             "failure_count": self.failure_count
         }
 
+    def _cache_control(self) -> bool:
+        return supports_cache_control(self.provider, self.model)
+
     def _build_evidence_messages(
         self,
         text: str,
         extracted_data: Dict[str, Any]
-    ) -> List[Dict[str, str]]:
+    ) -> List[Dict[str, Any]]:
         """
         Build messages for evidence extraction call.
         
+        Instructions are in the system message and the source text comes
+        before the extracted data, so every evidence call for a document
+        (one per validation iteration) shares a cacheable prefix.
+        
         Args:
             text: Source text to extract evidence from
             extracted_data: Already-extracted field values
@@ -340,25 +337,170 @@ Extract the requested fields according to the provided schema."""
         
         # Format extracted data
         data_str = "\n".join([f"  {k}: {v}" for k, v in extracted_data.items()])
+        cache_control = self._cache_control()
         
-        user_prompt = f"""For each extracted field below, find the EXACT QUOTE from the source text that supports it.
+        return [
+            {"role": "system", "content": cached_content(EVIDENCE_SYSTEM_PROMPT, cache_control=cache_control)},
+            {"role": "user", "content": cached_content(
+                f"SOURCE TEXT:\n{text}",
+                f"EXTRACTED DATA (find the exact quote supporting each field):\n{data_str}",
+                cache_control=cache_control,
+            )}
+        ]
 
-EXTRACTED DATA:
-{data_str}
+    def _build_extraction_messages(
+        self,
+        text: str,
+        revision_prompts: Optional[List[str]] = None,
+        pre_filled_fields: Optional[Dict[str, Any]] = None,
+        single_call: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """
+        Build messages for the data extraction call.
+        
+        Layout is stable-first for provider prompt caching: the schema goes
+        in the tool definition, instructions and few-shot examples in the
+        system message (identical for every paper), then the document text,
+        then pre-filled values and revision instructions, which change
+        between iterations. Where supported, cache_control breakpoints
+        mark the end of the system prompt and of the document text.
+        
+        Args:
+            text: Source text
+            revision_prompts: Optional revision instructions from previous iterations
+            pre_filled_fields: Optional dict of pre-filled field values
+            single_call: Ask for value, quote and confidence per field
+            
+        Returns:
+            List of message dicts for LLM call
+        """
+        system_prompt = self.SYSTEM_PROMPT_TEMPLATE
+        if self.examples:
+            system_prompt += f"\n\n{self.examples}"
+        if single_call:
+            system_prompt += f"\n\n{SINGLE_CALL_INSTRUCTIONS}"
+        
+        volatile = []
+        if pre_filled_fields:
+            prefilled_str = "\n".join([f"  {k}: {v}" for k, v in pre_filled_fields.items()])
+            volatile.append(f"PRE-EXTRACTED FIELDS (use these values):\n{prefilled_str}")
+        
+        if revision_prompts:
+            revision_text = "\n".join([f"- {prompt}" for prompt in revision_prompts])
+            volatile.append(f"REVISION INSTRUCTIONS:\n{revision_text}")
+        
+        cache_control = self._cache_control()
+        return [
+            {"role": "system", "content": cached_content(system_prompt, cache_control=cache_control)},
+            {"role": "user", "content": cached_content(
+                f"Extract the following data from this text:\n\n{text}",
+                "\n\n".join(volatile),
+                cache_control=cache_control,
+            )}
+        ]
 
-SOURCE TEXT:
-{text}
+    @staticmethod
+    def _completion_usage(completion) -> Optional[Dict[str, int]]:
+        return usage_from_completion(completion)
 
-For each field, provide:
-1. The exact quote from the source text
-2. Confidence in the match (0.0-1.0)
+    def _unwrap_cited(
+        self,
+        result: BaseModel,
+        schema: Type[T],
+        filename: Optional[str],
+        pre_filled_fields: Optional[Dict[str, Any]] = None,
+    ) -> ExtractionWithEvidence:
+        """
+        Split a single-call response into data and evidence.
+        
+        Values are re-validated against the original schema so its own
+        validators apply; if that fails the raw values are kept.
+        """
+        raw = {name: cited.value for name, cited in result}
+        try:
+            data_dict = schema.model_validate(raw).model_dump()
+        except Exception as e:
+            self.logger.warning(f"Single-call values failed schema validation: {e}")
+            data_dict = raw
+        
+        replaced = set()
+        if pre_filled_fields:
+            for key, value in pre_filled_fields.items():
+                if key in data_dict and (data_dict[key] is None or data_dict[key] == ""):
+                    data_dict[key] = value
+                    replaced.add(key)
+        
+        evidence = []
+        for name, cited in result:
+            value = data_dict.get(name)
+            if value is None or value == "":
+                continue
+            evidence.append(EvidenceItem(
+                field_name=name,
+                extracted_value=value,
+                exact_quote="" if name in replaced else cited.exact_quote,
+                confidence=cited.confidence,
+            ))
+        
+        return ExtractionWithEvidence(
+            data=data_dict,
+            evidence=evidence,
+            extraction_metadata={"model": self.model, "filename": filename, "evidence_mode": "single_call"}
+        )
 
-If you cannot find a supporting quote, use an empty string for exact_quote."""
+    def _extract_single_call(
+        self,
+        text: str,
+        schema: Type[T],
+        filename: Optional[str] = None,
+        revision_prompts: Optional[List[str]] = None,
+        pre_filled_fields: Optional[Dict[str, Any]] = None,
+    ) -> ExtractionWithEvidence:
+        """Extract values with quotes and confidences in one structured call."""
+        messages = self._build_extraction_messages(text, revision_prompts, pre_filled_fields, single_call=True)
+        try:
+            result, completion = self.client.chat.completions.create_with_completion(
+                model=self.model,
+                messages=messages,
+                response_model=cited_response_model(schema),
+                max_retries=self.max_retries,
+                extra_body={"usage": {"include": True}}
+            )
+        except Exception as e:
+            self.logger.error(f"Single-call evidence extraction failed: {e}")
+            self._track_usage(self.model, success=False, filename=filename)
+            raise
         
-        return [
-            {"role": "system", "content": "You are a citation auditor. Find exact quotes supporting extracted values."},
-            {"role": "user", "content": user_prompt}
-        ]
+        self._track_usage(self.model, success=True, usage=self._completion_usage(completion), filename=filename)
+        return self._unwrap_cited(result, schema, filename, pre_filled_fields)
+
+    async def _extract_single_call_async(
+        self,
+        text: str,
+        schema: Type[T],
+        filename: Optional[str] = None,
+        revision_prompts: Optional[List[str]] = None,
+        pre_filled_fields: Optional[Dict[str, Any]] = None,
+    ) -> ExtractionWithEvidence:
+        """Extract values with quotes and confidences in one structured call (Async)."""
+        messages = self._build_extraction_messages(text, revision_prompts, pre_filled_fields, single_call=True)
+        try:
+            result, completion = await self.async_client.chat.completions.create_with_completion(
+                model=self.model,
+                messages=messages,
+                response_model=cited_response_model(schema),
+                max_retries=self.max_retries,
+                extra_body={"usage": {"include": True}}
+            )
+        except Exception as e:
+            self.logger.error(f"Async single-call evidence extraction failed: {e}")
+            await self._track_usage_async(self.model, success=False, filename=filename)
+            raise
+        
+        await self._track_usage_async(
+            self.model, success=True, usage=self._completion_usage(completion), filename=filename
+        )
+        return self._unwrap_cited(result, schema, filename, pre_filled_fields)
 
     def extract_with_evidence(
         self,
@@ -381,50 +523,26 @@ If you cannot find a supporting quote, use an empty string for exact_quote."""
         Returns:
             ExtractionWithEvidence with data and evidence
         """
-        client = self.client
-        
-        # Build extraction prompt
-        system_prompt = self.SYSTEM_PROMPT_TEMPLATE
-        if self.examples:
-            system_prompt += f"\n\n{self.examples}"
-        
-        # Add revision prompts if provided
-        user_prompt = f"Extract the following data from this text:\n\n{text}"
+        if self.evidence_mode == "single_call":
+            return self._extract_single_call(text, schema, filename, revision_prompts, pre_filled_fields)
         
-        if revision_prompts:
-            revision_text = "\n".join([f"- {prompt}" for prompt in revision_prompts])
-            user_prompt += f"\n\nREVISION INSTRUCTIONS:\n{revision_text}"
-        
-        # Add pre-filled fields to prompt if provided
-        if pre_filled_fields:
-            prefilled_str = "\n".join([f"  {k}: {v}" for k, v in pre_filled_fields.items()])
-            user_prompt += f"\n\nPRE-EXTRACTED FIELDS (use these values):\n{prefilled_str}"
+        client = self.client
+        messages = self._build_extraction_messages(text, revision_prompts, pre_filled_fields)
         
         try:
             # Step 1: Extract data
             result, completion = client.chat.completions.create_with_completion(
                 model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
+                messages=messages,
                 response_model=schema,
                 max_retries=self.max_retries,
                 extra_body={"usage": {"include": True}}
             )
             
             # Track usage for extraction
-            if hasattr(completion, 'usage') and completion.usage:
-                self._track_usage(
-                    self.model,
-                    success=True,
-                    usage={
-                        "prompt_tokens": completion.usage.prompt_tokens,
-                        "completion_tokens": completion.usage.completion_tokens,
-                        "total_tokens": completion.usage.total_tokens
-                    },
-                    filename=filename
-                )
+            usage = self._completion_usage(completion)
+            if usage:
+                self._track_usage(self.model, success=True, usage=usage, filename=filename)
             
             # Convert to dict
             if hasattr(result, 'model_dump'):
@@ -452,17 +570,9 @@ If you cannot find a supporting quote, use an empty string for exact_quote."""
             )
             
             # Track usage for evidence
-            if hasattr(evidence_completion, 'usage') and evidence_completion.usage:
-                self._track_usage(
-                    self.model,
-                    success=True,
-                    usage={
-                        "prompt_tokens": evidence_completion.usage.prompt_tokens,
-                        "completion_tokens": evidence_completion.usage.completion_tokens,
-                        "total_tokens": evidence_completion.usage.total_tokens
-                    },
-                    filename=filename
-                )
+            usage = self._completion_usage(evidence_completion)
+            if usage:
+                self._track_usage(self.model, success=True, usage=usage, filename=filename)
             
             return ExtractionWithEvidence(
                 data=data_dict,
@@ -496,50 +606,28 @@ If you cannot find a supporting quote, use an empty string for exact_quote."""
         Returns:
             ExtractionWithEvidence with data and evidence
         """
-        client = self.async_client
-        
-        # Build extraction prompt
-        system_prompt = self.SYSTEM_PROMPT_TEMPLATE
-        if self.examples:
-            system_prompt += f"\n\n{self.examples}"
-        
-        # Add revision prompts if provided
-        user_prompt = f"Extract the following data from this text:\n\n{text}"
-        
-        if revision_prompts:
-            revision_text = "\n".join([f"- {prompt}" for prompt in revision_prompts])
-            user_prompt += f"\n\nREVISION INSTRUCTIONS:\n{revision_text}"
+        if self.evidence_mode == "single_call":
+            return await self._extract_single_call_async(
+                text, schema, filename, revision_prompts, pre_filled_fields
+            )
         
-        # Add pre-filled fields to prompt if provided
-        if pre_filled_fields:
-            prefilled_str = "\n".join([f"  {k}: {v}" for k, v in pre_filled_fields.items()])
-            user_prompt += f"\n\nPRE-EXTRACTED FIELDS (use these values):\n{prefilled_str}"
+        client = self.async_client
+        messages = self._build_extraction_messages(text, revision_prompts, pre_filled_fields)
         
         try:
             # Step 1: Extract data
             result, completion = await client.chat.completions.create_with_completion(
                 model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
+                messages=messages,
                 response_model=schema,
                 max_retries=self.max_retries,
                 extra_body={"usage": {"include": True}}
             )
             
             # Track usage for extraction
-            if hasattr(completion, 'usage') and completion.usage:
-                await self._track_usage_async(
-                    self.model,
-                    success=True,
-                    usage={
-                        "prompt_tokens": completion.usage.prompt_tokens,
-                        "completion_tokens": completion.usage.completion_tokens,
-                        "total_tokens": completion.usage.total_tokens
-                    },
-                    filename=filename
-                )
+            usage = self._completion_usage(completion)
+            if usage:
+                await self._track_usage_async(self.model, success=True, usage=usage, filename=filename)
             
             # Convert to dict
             if hasattr(result, 'model_dump'):
@@ -567,17 +655,9 @@ If you cannot find a supporting quote, use an empty string for exact_quote."""
             )
             
             # Track usage for evidence
-            if hasattr(evidence_completion, 'usage') and evidence_completion.usage:
-                await self._track_usage_async(
-                    self.model,
-                    success=True,
-                    usage={
-                        "prompt_tokens": evidence_completion.usage.prompt_tokens,
-                        "completion_tokens": evidence_completion.usage.completion_tokens,
-                        "total_tokens": evidence_completion.usage.total_tokens
-                    },
-                    filename=filename
-                )
+            usage = self._completion_usage(evidence_completion)
+            if usage:
+                await self._track_usage_async(self.model, success=True, usage=usage, filename=filename)
             
             return ExtractionWithEvidence(
                 data=data_dict,
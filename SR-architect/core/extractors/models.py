@@ -5,8 +5,11 @@ Extractor models for evidence-based extraction.
 Contains Pydantic models for evidence items and extraction results.
 """
 
-from typing import Any, Dict, List, Optional
-from pydantic import BaseModel, Field, field_validator
+from functools import lru_cache
+from typing import Annotated, Any, Dict, Generic, List, Optional, Type, TypeVar
+from pydantic import BaseModel, Field, create_model, field_validator
+
+V = TypeVar("V")
 
 
 class EvidenceItem(BaseModel):
@@ -73,3 +76,47 @@ class EvidenceResponse(BaseModel):
         
         return coerced
 
+
+
+class CitedValue(BaseModel, Generic[V]):
+    """A field value together with its supporting quote (single-call mode)."""
+    value: V = Field(description="The extracted value")
+    exact_quote: str = Field(default="", description="Verbatim quote from the source text supporting the value, or empty")
+    confidence: float = Field(ge=0.0, le=1.0, default=0.9, description="Confidence in the value")
+    
+    @field_validator('exact_quote', mode='before')
+    @classmethod
+    def coerce_quote_to_string(_, value) -> str:
+        """Coerce None to empty string for robustness with local LLMs."""
+        if value is None:
+            return ""
+        return str(value)
+
+
+@lru_cache(maxsize=64)
+def cited_response_model(schema: Type[BaseModel]) -> Type[BaseModel]:
+    """
+    Build a response model that wraps every schema field in a CitedValue.
+    
+    Lets one structured call return each value with its quote and
+    confidence. Field descriptions and defaults are kept; schema-level
+    validators run afterwards on the unwrapped values.
+    
+    Args:
+        schema: Extraction schema
+        
+    Returns:
+        Pydantic model with the same field names, each of type CitedValue[...]
+    """
+    fields = {}
+    for name, info in schema.model_fields.items():
+        # Keep Annotated validators (e.g. FlexibleStr) that FieldInfo splits off
+        annotation = Annotated[(info.annotation, *info.metadata)] if info.metadata else info.annotation
+        cited = CitedValue[annotation]
+        if info.is_required():
+            field_info = Field(description=info.description)
+        else:
+            default = cited.model_construct(value=info.get_default(call_default_factory=True))
+            field_info = Field(default=default, description=info.description)
+        fields[name] = (cited, field_info)
+    return create_model(f"{schema.__name__}WithEvidence", __doc__=schema.__doc__, **fields)
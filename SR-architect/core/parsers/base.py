@@ -1,23 +1,153 @@
 """
 Base models and types for document parsing.
 """
-from typing import List, Dict, Any
-from pydantic import BaseModel, Field
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, Field, GetCoreSchemaHandler
+from pydantic_core import core_schema
 
 from ..config import settings
 
 
-class DocumentChunk(BaseModel):
-    """Represents a chunk of parsed document text with metadata."""
-    text: str
-    section: str = ""
-    subsection: str = ""
-    chunk_type: str = "text"  # text, table, figure
-    page_number: int = 0
-    source_file: str = ""
+class DocumentChunk:
+    """
+    Represents a chunk of parsed document text with metadata.
+    
+    A chunk either owns its text or is a (start, end) span into a shared
+    document buffer (normally ParsedDocument.full_text), in which case
+    `text` is sliced lazily on access and the chunk holds no string of its
+    own. Span-backed chunks carry exact character offsets into the document.
+    
+    Keeps the constructor, attribute and model_dump() API of the former
+    Pydantic model and validates inside Pydantic models (ParsedDocument).
+    """
+    
+    __slots__ = (
+        "_buffer", "_lo", "_hi", "start", "end",
+        "section", "subsection", "chunk_type", "page_number", "source_file",
+    )
+    
+    def __init__(
+        self,
+        text: str,
+        section: str = "",
+        subsection: str = "",
+        chunk_type: str = "text",
+        page_number: int = 0,
+        source_file: str = "",
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        **_ignored: Any,
+    ):
+        """
+        Create a chunk that owns its text.
+        
+        Args:
+            text: Chunk text
+            start: Optional offset of the text in the document (provenance hint)
+            end: Optional end offset in the document
+            
+        Unknown keyword arguments are ignored, as with the former Pydantic model.
+        """
+        if not isinstance(text, str):
+            raise TypeError(f"DocumentChunk.text must be str, got {type(text).__name__}")
+        self._buffer = text
+        self._lo = 0
+        self._hi = len(text)
+        self.start = start
+        self.end = end
+        self.section = section or ""
+        self.subsection = subsection or ""
+        self.chunk_type = chunk_type or "text"
+        self.page_number = int(page_number or 0)
+        self.source_file = source_file or ""
+    
+    @classmethod
+    def from_span(cls, buffer: str, start: int, end: int, **metadata: Any) -> "DocumentChunk":
+        """Create a chunk viewing buffer[start:end] without copying the text."""
+        chunk = cls("", **metadata)
+        chunk._bind(buffer, start, end)
+        return chunk
+    
+    def _bind(self, buffer: str, start: int, end: int) -> None:
+        self._buffer = buffer
+        self._lo = self.start = start
+        self._hi = self.end = end
+    
+    @property
+    def text(self) -> str:
+        if self._lo == 0 and self._hi == len(self._buffer):
+            return self._buffer
+        return self._buffer[self._lo:self._hi]
+    
+    @text.setter
+    def text(self, value: str) -> None:
+        self._buffer = value
+        self._lo = 0
+        self._hi = len(value)
+        self.start = self.end = None
+    
+    def is_span_of(self, buffer: str) -> bool:
+        """Whether this chunk is a view into `buffer` (identity, not equality)."""
+        return self._buffer is buffer and self.start is not None
+    
+    def __len__(self) -> int:
+        return self._hi - self._lo
+    
+    def model_dump(self) -> Dict[str, Any]:
+        data = {
+            "text": self.text,
+            "section": self.section,
+            "subsection": self.subsection,
+            "chunk_type": self.chunk_type,
+            "page_number": self.page_number,
+            "source_file": self.source_file,
+        }
+        if self.start is not None:
+            data["start"] = self.start
+            data["end"] = self.end
+        return data
     
     def to_dict(self) -> Dict[str, Any]:
         return self.model_dump()
+    
+    def model_copy(self, update: Optional[Dict[str, Any]] = None) -> "DocumentChunk":
+        """Shallow copy (span-backed copies share the buffer)."""
+        clone = DocumentChunk.__new__(DocumentChunk)
+        for slot in self.__slots__:
+            setattr(clone, slot, getattr(self, slot))
+        for key, value in (update or {}).items():
+            setattr(clone, key, value)
+        return clone
+    
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, DocumentChunk):
+            return NotImplemented
+        return self.model_dump() == other.model_dump()
+    
+    __hash__ = None
+    
+    def __repr__(self) -> str:
+        preview = self.text[:40]
+        return (
+            f"DocumentChunk(text={preview!r}{'...' if len(self) > 40 else ''}, "
+            f"section={self.section!r}, page_number={self.page_number})"
+        )
+    
+    @classmethod
+    def _validate(cls, value: Any) -> "DocumentChunk":
+        if isinstance(value, cls):
+            return value
+        if isinstance(value, dict):
+            return cls(**value)
+        raise TypeError(f"Cannot build DocumentChunk from {type(value).__name__}")
+    
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source_type: Any, handler: GetCoreSchemaHandler) -> core_schema.CoreSchema:
+        return core_schema.no_info_plain_validator_function(
+            cls._validate,
+            serialization=core_schema.plain_serializer_function_ser_schema(lambda chunk: chunk.model_dump()),
+        )
 
 
 class ParsedDocument(BaseModel):
@@ -28,6 +158,41 @@ class ParsedDocument(BaseModel):
     full_text: str = ""
     tables: List[Dict[str, Any]] = Field(default_factory=list)  # Extracted tables
     
+    def bind_chunks(self) -> int:
+        """
+        Re-point chunks at spans of full_text so their text is not stored twice.
+        
+        Chunks are matched in order (offset hints first, then a forward
+        search), so overlapping chunks resolve to the right occurrence. Chunks
+        whose text does not occur verbatim (e.g. tables rendered as markdown)
+        keep their own text.
+        
+        Returns:
+            Number of chunks backed by full_text
+        """
+        buffer = self.full_text
+        cursor = 0
+        bound = 0
+        for chunk in self.chunks:
+            if chunk.is_span_of(buffer):
+                cursor = chunk.start + 1
+                bound += 1
+                continue
+            text = chunk.text
+            if not text:
+                continue
+            if chunk.start is not None and buffer[chunk.start:chunk.start + len(text)] == text:
+                position = chunk.start
+            else:
+                position = buffer.find(text, cursor)
+            if position < 0:
+                continue
+            chunk._bind(buffer, position, position + len(text))
+            # Overlapping chunks still start after the previous chunk's start
+            cursor = position + 1
+            bound += 1
+        return bound
+    
     @property
     def abstract(self) -> str:
         """Extract abstract text."""
@@ -0,0 +1,353 @@
+"""
+Content-addressed binary cache for parsed documents.
+
+Entries are keyed by the SHA-256 of the source file bytes, so a renamed or
+re-downloaded copy of the same PDF is a cache hit. Each entry is a small
+container of independently compressed sections (meta, chunks, full_text),
+which lets callers load chunks without decompressing the full text.
+
+Layout:
+    MAGIC (4 bytes) | header length (u32, big endian) | header | sections...
+
+The header records the codec, the parser version that produced the entry and
+the (offset, length) of each section relative to the end of the header.
+
+Entry sizes, access times and hit counts live in a SQLite index alongside the
+entries (see cache_index.py), which drives byte-budget LRU eviction.
+"""
+import hashlib
+import json
+import os
+import struct
+import zlib
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+from ..utils import get_logger
+from .base import DocumentChunk, ParsedDocument
+from .cache_index import INDEX_FILENAME, ParseCacheIndex
+
+logger = get_logger("ParseCache")
+
+# Bump whenever parser output changes so stale entries are re-parsed
+PARSER_VERSION = "2.2.0"
+
+CACHE_MAGIC = b"SRPC"
+CACHE_SUFFIX = ".srpc"
+HASH_BLOCK_SIZE = 1 << 20
+SECTIONS = ("meta", "chunks", "full_text")
+
+
+def hash_file(path: Path) -> str:
+    """SHA-256 of the file contents, streamed in 1 MiB blocks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class _Codec:
+    """Serialization + compression pair (msgpack+zstd, or json+zlib fallback)."""
+
+    def __init__(self, name: str):
+        self.name = name
+        if name == "msgpack+zstd":
+            if msgpack is None or zstandard is None:
+                raise ImportError("msgpack and zstandard are required for msgpack+zstd")
+            self._compressor = zstandard.ZstdCompressor(level=3)
+            self._decompressor = zstandard.ZstdDecompressor()
+        elif name != "json+zlib":
+            raise ValueError(f"Unknown cache codec: {name}")
+
+    @classmethod
+    def default(cls) -> "_Codec":
+        if msgpack is not None and zstandard is not None:
+            return cls("msgpack+zstd")
+        return cls("json+zlib")
+
+    def encode(self, obj: Any) -> bytes:
+        if self.name == "msgpack+zstd":
+            return self._compressor.compress(msgpack.packb(obj, use_bin_type=True))
+        return zlib.compress(json.dumps(obj).encode("utf-8"))
+
+    def decode(self, data: bytes) -> Any:
+        if self.name == "msgpack+zstd":
+            return msgpack.unpackb(self._decompressor.decompress(data), raw=False)
+        return json.loads(zlib.decompress(data).decode("utf-8"))
+
+
+class ParseCache:
+    """
+    Content-addressed store of ParsedDocument objects.
+
+    File hashes are memoized per (path, mtime, size) so repeated lookups of
+    an unchanged file within a process do not re-read it. Writes and hits are
+    recorded in a ParseCacheIndex so eviction never has to scan the directory.
+    """
+
+    def __init__(self, cache_dir: Path, parser_version: str = PARSER_VERSION):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding cache entries
+            parser_version: Entries written by a different version are misses
+        """
+        self.cache_dir = Path(cache_dir)
+        self.parser_version = parser_version
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._codec = _Codec.default()
+        self._hash_memo: Dict[Tuple[str, int, int], str] = {}
+        self.index = ParseCacheIndex(self.cache_dir / INDEX_FILENAME)
+        if self.index.is_new:
+            # First run against an existing directory: adopt its entries once
+            self.rebuild_index()
+
+    # ------------------------------------------------------------------
+    # Keys
+    # ------------------------------------------------------------------
+
+    def key_for(self, file_path: Path) -> str:
+        """Content hash used as the cache key for a source file."""
+        stat = file_path.stat()
+        memo_key = (str(file_path.resolve()), stat.st_mtime_ns, stat.st_size)
+        key = self._hash_memo.get(memo_key)
+        if key is None:
+            key = hash_file(file_path)
+            self._hash_memo[memo_key] = key
+        return key
+
+    def entry_path(self, key: str) -> Path:
+        """Location of the cache entry for a content hash."""
+        return self.cache_dir / f"{key}{CACHE_SUFFIX}"
+
+    # ------------------------------------------------------------------
+    # Read
+    # ------------------------------------------------------------------
+
+    def _read_header(self, f) -> Optional[Dict[str, Any]]:
+        """Read and validate the entry header, leaving f at the first section."""
+        if f.read(len(CACHE_MAGIC)) != CACHE_MAGIC:
+            return None
+        (header_len,) = struct.unpack(">I", f.read(4))
+        header = json.loads(f.read(header_len).decode("utf-8"))
+        if header.get("parser_version") != self.parser_version:
+            return None
+        return header
+
+    @staticmethod
+    def _is_cacheable(file_path: Path) -> bool:
+        """Zero-byte files all share one hash and are never valid documents."""
+        return file_path.stat().st_size > 0
+
+    def _read_sections(self, file_path: Path, names: Tuple[str, ...]) -> Optional[Dict[str, Any]]:
+        """Decode only the requested sections of an entry and record the hit."""
+        if not self._is_cacheable(file_path):
+            return None
+        key = self.key_for(file_path)
+        entry = self.entry_path(key)
+        if not entry.exists():
+            return None
+        try:
+            with open(entry, "rb") as f:
+                header = self._read_header(f)
+                if header is None:
+                    return None
+                codec = self._codec if header["codec"] == self._codec.name else _Codec(header["codec"])
+                base = f.tell()
+                sections = {}
+                for name in names:
+                    offset, length = header["sections"][name]
+                    f.seek(base + offset)
+                    sections[name] = codec.decode(f.read(length))
+        except Exception as e:
+            logger.warning(f"Cache read failed for {file_path.name}: {e}")
+            return None
+        self._record_hit(key, entry)
+        return sections
+
+    def _record_hit(self, key: str, entry: Path) -> None:
+        """Update the index for a hit; bookkeeping failures never fail a load."""
+        try:
+            if not self.index.record_hit(key):
+                self.index.record_write(key, entry.stat().st_size)
+                self.index.record_hit(key)
+        except Exception as e:
+            logger.warning(f"Cache index update failed for {entry.name}: {e}")
+
+    @staticmethod
+    def _rebind_chunks(chunk_dicts: List[Dict[str, Any]], filename: str) -> List[DocumentChunk]:
+        """Build chunks, pointing source_file at the file actually requested."""
+        chunks = []
+        for data in chunk_dicts:
+            if data.get("source_file"):
+                data["source_file"] = filename
+            chunks.append(DocumentChunk(**data))
+        return chunks
+
+    def load(self, file_path: Path) -> Optional[ParsedDocument]:
+        """Load a full ParsedDocument for a file, or None on a miss."""
+        sections = self._read_sections(file_path, SECTIONS)
+        if sections is None:
+            return None
+        meta = sections["meta"]
+        metadata = dict(meta.get("metadata", {}))
+        if "path" in metadata:
+            metadata["path"] = str(file_path)
+        doc = ParsedDocument(
+            filename=file_path.name,
+            chunks=self._rebind_chunks(sections["chunks"], file_path.name),
+            metadata=metadata,
+            full_text=sections["full_text"],
+            tables=meta.get("tables", []),
+        )
+        doc.bind_chunks()
+        return doc
+
+    def load_chunks(self, file_path: Path) -> Optional[List[DocumentChunk]]:
+        """Load only the chunks of a cached file (full_text stays on disk)."""
+        sections = self._read_sections(file_path, ("chunks",))
+        if sections is None:
+            return None
+        return self._rebind_chunks(sections["chunks"], file_path.name)
+
+    def contains(self, file_path: Path) -> bool:
+        """Whether a current-version entry exists for the file."""
+        if not self._is_cacheable(file_path):
+            return False
+        entry = self.entry_path(self.key_for(file_path))
+        if not entry.exists():
+            return False
+        try:
+            with open(entry, "rb") as f:
+                return self._read_header(f) is not None
+        except Exception:
+            return False
+
+    # ------------------------------------------------------------------
+    # Write
+    # ------------------------------------------------------------------
+
+    def save(self, doc: ParsedDocument, file_path: Path) -> Optional[Path]:
+        """
+        Write a ParsedDocument entry atomically.
+
+        Returns:
+            Path of the written entry, or None for uncacheable (empty) files
+        """
+        if not self._is_cacheable(file_path):
+            return None
+        payloads = {
+            "meta": self._codec.encode({
+                "filename": doc.filename,
+                "metadata": doc.metadata,
+                "tables": doc.tables,
+            }),
+            "chunks": self._codec.encode([c.model_dump() for c in doc.chunks]),
+            "full_text": self._codec.encode(doc.full_text),
+        }
+        offsets = {}
+        position = 0
+        for name in SECTIONS:
+            offsets[name] = (position, len(payloads[name]))
+            position += len(payloads[name])
+        header = json.dumps({
+            "codec": self._codec.name,
+            "parser_version": self.parser_version,
+            "sections": offsets,
+        }).encode("utf-8")
+
+        entry = self.entry_path(self.key_for(file_path))
+        temp_path = entry.with_suffix(f".{os.getpid()}.tmp")
+        with open(temp_path, "wb") as f:
+            f.write(CACHE_MAGIC)
+            f.write(struct.pack(">I", len(header)))
+            f.write(header)
+            for name in SECTIONS:
+                f.write(payloads[name])
+            size = f.tell()
+        temp_path.replace(entry)
+        try:
+            self.index.record_write(entry.stem, size)
+        except Exception as e:
+            logger.warning(f"Cache index update failed for {entry.name}: {e}")
+        return entry
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def evict(self, max_bytes: int) -> Tuple[int, int]:
+        """
+        Evict least recently used entries until the cache fits in max_bytes.
+
+        Cost is one index read when under budget and O(evicted) otherwise.
+
+        Args:
+            max_bytes: Byte budget for all entries
+
+        Returns:
+            (entries evicted, bytes freed)
+        """
+        excess = self.index.total_bytes() - max_bytes
+        if excess <= 0:
+            return 0, 0
+
+        evicted = []
+        freed = 0
+        for key, size in self.index.lru_candidates(excess):
+            try:
+                self.entry_path(key).unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"Failed to evict cache entry {key}: {e}")
+                continue
+            evicted.append(key)
+            freed += size
+        self.index.remove(evicted)
+        if evicted:
+            logger.debug(f"Evicted {len(evicted)} cache entries ({freed} bytes)")
+        return len(evicted), freed
+
+    def rebuild_index(self) -> int:
+        """
+        Re-index every entry on disk, dropping rows for missing files.
+
+        This is the one operation that scans the directory; it runs when the
+        index is first created and on demand from `cache prune --reindex`.
+
+        Returns:
+            Number of indexed entries
+        """
+        on_disk = {}
+        for entry in self.cache_dir.glob(f"*{CACHE_SUFFIX}"):
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            on_disk[entry.stem] = stat
+        indexed = self.index.keys()
+        self.index.remove(indexed - on_disk.keys())
+        for key, stat in on_disk.items():
+            if key not in indexed:
+                self.index.record_write(key, stat.st_size, accessed_at=stat.st_mtime)
+        return len(on_disk)
+
+    def stats(self) -> Dict[str, Any]:
+        """Entry count, total size, hits and access range from the index."""
+        stats = self.index.stats()
+        stats["cache_dir"] = str(self.cache_dir)
+        stats["parser_version"] = self.parser_version
+        return stats
@@ -0,0 +1,172 @@
+"""
+SQLite index over the parse cache directory.
+
+Tracks size, last access time and hit count per cache entry so the cache can
+be held to a byte budget without listing or stat()-ing the directory. Running
+totals are maintained by triggers, which makes the over-budget check a single
+row read and LRU eviction proportional to the number of evicted entries.
+"""
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Set, Tuple
+
+INDEX_FILENAME = "index.sqlite"
+LRU_FETCH_SIZE = 256
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    last_access REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_entries_last_access ON entries(last_access);
+
+CREATE TABLE IF NOT EXISTS totals (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    entries INTEGER NOT NULL,
+    bytes INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO totals (id, entries, bytes) VALUES (0, 0, 0);
+
+CREATE TRIGGER IF NOT EXISTS entries_after_insert AFTER INSERT ON entries BEGIN
+    UPDATE totals SET entries = entries + 1, bytes = bytes + NEW.size WHERE id = 0;
+END;
+CREATE TRIGGER IF NOT EXISTS entries_after_delete AFTER DELETE ON entries BEGIN
+    UPDATE totals SET entries = entries - 1, bytes = bytes - OLD.size WHERE id = 0;
+END;
+CREATE TRIGGER IF NOT EXISTS entries_after_resize AFTER UPDATE OF size ON entries BEGIN
+    UPDATE totals SET bytes = bytes - OLD.size + NEW.size WHERE id = 0;
+END;
+"""
+
+
+class ParseCacheIndex:
+    """
+    Size / recency / hit-count index for parse cache entries.
+
+    Connections are per thread and per process, so the index is safe to use
+    from parse_many() worker processes as well as the main process.
+    """
+
+    def __init__(self, db_path: Path):
+        """
+        Open (or create) the index.
+
+        Args:
+            db_path: Path of the SQLite index file
+        """
+        self.db_path = Path(db_path)
+        self.is_new = not self.db_path.exists()
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Get a connection owned by the current thread and process."""
+        conn = getattr(self._local, "connection", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(str(self.db_path), timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    def record_write(self, key: str, size: int, accessed_at: float = None) -> None:
+        """Insert or refresh an entry after it has been written."""
+        now = accessed_at if accessed_at is not None else time.time()
+        with self._connect() as conn:
+            conn.execute(
+                """
+                INSERT INTO entries (key, size, created_at, last_access, hits)
+                VALUES (?, ?, ?, ?, 0)
+                ON CONFLICT(key) DO UPDATE SET
+                    size = excluded.size,
+                    last_access = excluded.last_access
+                """,
+                (key, size, now, now),
+            )
+
+    def record_hit(self, key: str) -> bool:
+        """
+        Bump the hit count and access time of an entry.
+
+        Returns:
+            False if the key is not indexed
+        """
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE entries SET hits = hits + 1, last_access = ? WHERE key = ?",
+                (time.time(), key),
+            )
+            return cursor.rowcount > 0
+
+    def remove(self, keys: Iterable[str]) -> None:
+        """Drop entries from the index."""
+        with self._connect() as conn:
+            conn.executemany("DELETE FROM entries WHERE key = ?", ((k,) for k in keys))
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def total_bytes(self) -> int:
+        """Total size of indexed entries (single row read)."""
+        row = self._connect().execute("SELECT bytes FROM totals WHERE id = 0").fetchone()
+        return row[0] if row else 0
+
+    def keys(self) -> Set[str]:
+        """All indexed keys (used only when rebuilding the index)."""
+        return {row[0] for row in self._connect().execute("SELECT key FROM entries")}
+
+    def lru_candidates(self, bytes_to_free: int) -> List[Tuple[str, int]]:
+        """
+        Least recently used entries whose sizes add up to bytes_to_free.
+
+        Rows are read in small batches off the last_access index, so only the
+        entries that will actually be evicted are fetched.
+        """
+        candidates = []
+        freed = 0
+        cursor = self._connect().execute(
+            "SELECT key, size FROM entries ORDER BY last_access ASC"
+        )
+        try:
+            while freed < bytes_to_free:
+                rows = cursor.fetchmany(LRU_FETCH_SIZE)
+                if not rows:
+                    break
+                for key, size in rows:
+                    if freed >= bytes_to_free:
+                        break
+                    candidates.append((key, size))
+                    freed += size
+        finally:
+            cursor.close()
+        return candidates
+
+    def stats(self) -> Dict[str, Any]:
+        """Aggregate statistics for reporting."""
+        conn = self._connect()
+        entries, total = conn.execute(
+            "SELECT entries, bytes FROM totals WHERE id = 0"
+        ).fetchone()
+        hits, oldest, newest = conn.execute(
+            "SELECT COALESCE(SUM(hits), 0), MIN(last_access), MAX(last_access) FROM entries"
+        ).fetchone()
+        return {
+            "entries": entries,
+            "total_bytes": total,
+            "total_hits": hits,
+            "oldest_access": oldest,
+            "newest_access": newest,
+        }
@@ -0,0 +1,463 @@
+"""
+Warm Docling worker daemon over a Unix socket.
+
+Loading Docling's layout and table models dominates the cost of a first
+parse, and every DocumentParser used to pay it again. The daemon keeps N
+worker processes with a converter already loaded and serves parse jobs to
+any local client. Each job runs in a worker process under a wall-clock
+timeout and a resident-memory cap; a worker that exceeds either is killed
+and replaced, so one pathological PDF cannot stall or OOM a batch. A
+replacement that fails to start is retried with backoff, and jobs that find
+no idle worker within the queue timeout are rejected rather than left
+waiting.
+
+Wire protocol: one request per connection, each message a 4-byte big-endian
+length followed by a JSON object.
+
+    {"op": "parse", "path": ..., "page_range": [first, last] | null}
+    {"op": "ping"} / {"op": "shutdown"}
+"""
+import json
+import multiprocessing
+import os
+import queue
+import socket
+import socketserver
+import struct
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+from ..config import settings
+from ..utils import get_logger
+from .base import ParsedDocument
+
+logger = get_logger("DoclingDaemon")
+
+POLL_INTERVAL = 0.1
+CONNECT_TIMEOUT = 2.0
+CLIENT_TIMEOUT_MARGIN = 30.0  # Seconds a client waits beyond the daemon's queue wait and job timeout
+RESPAWN_BACKOFF = 1.0  # Seconds before retrying a failed worker respawn (doubles per attempt)
+RESPAWN_MAX_BACKOFF = 60.0
+
+
+class DaemonUnavailable(ConnectionError):
+    """No daemon is listening on the socket."""
+
+
+class DaemonJobError(RuntimeError):
+    """A daemon parse job failed, timed out or exceeded its memory cap."""
+
+    def __init__(self, message: str, kind: str = "error"):
+        super().__init__(message)
+        self.kind = kind
+
+
+# ----------------------------------------------------------------------
+# Framing
+# ----------------------------------------------------------------------
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes:
+    data = bytearray()
+    while len(data) < size:
+        block = sock.recv(size - len(data))
+        if not block:
+            raise ConnectionError("Connection closed mid-message")
+        data.extend(block)
+    return bytes(data)
+
+
+def send_message(sock: socket.socket, message: Dict[str, Any]) -> None:
+    payload = json.dumps(message).encode("utf-8")
+    sock.sendall(struct.pack(">I", len(payload)) + payload)
+
+
+def recv_message(sock: socket.socket) -> Dict[str, Any]:
+    (size,) = struct.unpack(">I", _recv_exact(sock, 4))
+    return json.loads(_recv_exact(sock, size).decode("utf-8"))
+
+
+# ----------------------------------------------------------------------
+# Worker processes
+# ----------------------------------------------------------------------
+
+def _default_parser_factory():
+    from .docling import DoclingParser
+    parser = DoclingParser(use_daemon=False)
+    parser._ensure_docling()
+    return parser
+
+
+def _worker_main(conn, parser_factory: Callable[[], Any]) -> None:
+    """Load a converter once, then serve jobs from the pipe until closed."""
+    try:
+        parser = parser_factory()
+    except Exception as e:
+        conn.send(("error", f"{type(e).__name__}: {e}"))
+        return
+    conn.send(("ready", None))
+
+    while True:
+        try:
+            job = conn.recv()
+        except EOFError:
+            return
+        if job is None:
+            return
+        path, page_range = job
+        try:
+            doc = parser.parse(Path(path), page_range=tuple(page_range) if page_range else None)
+            conn.send(("ok", doc.model_dump()))
+        except Exception as e:
+            conn.send(("error", f"{type(e).__name__}: {e}"))
+
+
+class _Worker:
+    """One warm worker process and its pipe."""
+
+    def __init__(self, ctx, parser_factory: Callable[[], Any], startup_timeout: float):
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(
+            target=_worker_main, args=(child_conn, parser_factory), daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+        if not self.conn.poll(startup_timeout):
+            self.kill()
+            raise RuntimeError("Docling worker did not start in time")
+        status, payload = self.conn.recv()
+        if status != "ready":
+            self.kill()
+            raise RuntimeError(f"Docling worker failed to start: {payload}")
+
+    def run(
+        self,
+        path: str,
+        page_range: Optional[Tuple[int, int]],
+        timeout: float,
+        max_memory_bytes: Optional[int],
+    ) -> Dict[str, Any]:
+        """
+        Run one job, enforcing the timeout and memory cap.
+
+        Raises:
+            DaemonJobError: On job failure; kind is "timeout", "memory",
+                "crash" (the worker must be replaced) or "error"
+        """
+        self.conn.send((path, page_range))
+        monitor = psutil.Process(self.process.pid) if psutil and max_memory_bytes else None
+        deadline = time.monotonic() + timeout
+
+        while not self.conn.poll(POLL_INTERVAL):
+            if not self.process.is_alive():
+                raise DaemonJobError(f"Worker died while parsing {path}", kind="crash")
+            if time.monotonic() > deadline:
+                self.kill()
+                raise DaemonJobError(f"Timed out after {timeout:.0f}s parsing {path}", kind="timeout")
+            if monitor is not None:
+                try:
+                    rss = monitor.memory_info().rss
+                except psutil.Error:
+                    continue
+                if rss > max_memory_bytes:
+                    self.kill()
+                    raise DaemonJobError(
+                        f"Exceeded {max_memory_bytes // (1024 * 1024)} MB parsing {path}", kind="memory"
+                    )
+
+        try:
+            status, payload = self.conn.recv()
+        except EOFError:
+            raise DaemonJobError(f"Worker died while parsing {path}", kind="crash")
+        if status != "ok":
+            raise DaemonJobError(payload)
+        return payload
+
+    @property
+    def healthy(self) -> bool:
+        return self.process.is_alive()
+
+    def kill(self) -> None:
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join(timeout=5)
+        self.conn.close()
+
+    def stop(self) -> None:
+        try:
+            self.conn.send(None)
+        except (OSError, ValueError):
+            pass
+        self.process.join(timeout=5)
+        if self.process.is_alive():
+            self.process.kill()
+        self.conn.close()
+
+
+# ----------------------------------------------------------------------
+# Server
+# ----------------------------------------------------------------------
+
+class _RequestHandler(socketserver.BaseRequestHandler):
+    def handle(self) -> None:
+        daemon: "DoclingDaemon" = self.server.daemon_ref
+        try:
+            request = recv_message(self.request)
+        except (ConnectionError, ValueError, struct.error):
+            return
+        send_message(self.request, daemon.handle(request))
+
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class DoclingDaemon:
+    """
+    Pool of warm Docling worker processes behind a Unix socket.
+
+    Run with `python cli.py daemon start` (or DoclingDaemon(...).serve_forever()).
+    """
+
+    def __init__(
+        self,
+        socket_path: Optional[str] = None,
+        workers: Optional[int] = None,
+        job_timeout: Optional[float] = None,
+        max_memory_mb: Optional[int] = None,
+        parser_factory: Callable[[], Any] = _default_parser_factory,
+        start_method: str = "spawn",
+        startup_timeout: float = 600.0,
+        queue_timeout: Optional[float] = None,
+    ):
+        """
+        Initialize the daemon (workers start in serve_forever/start).
+
+        Args:
+            socket_path: Unix socket path (default: DOCLING_DAEMON_SOCKET)
+            workers: Warm worker processes (default: DOCLING_DAEMON_WORKERS)
+            job_timeout: Seconds per job (default: DOCLING_JOB_TIMEOUT)
+            max_memory_mb: Resident memory cap per worker; 0 disables
+                (default: DOCLING_JOB_MAX_MEMORY_MB)
+            parser_factory: Builds the per-worker parser (must be picklable
+                for the "spawn" start method)
+            start_method: multiprocessing start method for workers
+            startup_timeout: Seconds to wait for a worker to load its models
+            queue_timeout: Seconds a job waits for an idle worker before it
+                is rejected (default: the job timeout)
+        """
+        self.socket_path = Path(socket_path or settings.DOCLING_DAEMON_SOCKET)
+        self.num_workers = workers or settings.DOCLING_DAEMON_WORKERS
+        self.job_timeout = job_timeout or settings.DOCLING_JOB_TIMEOUT
+        memory_mb = settings.DOCLING_JOB_MAX_MEMORY_MB if max_memory_mb is None else max_memory_mb
+        self.max_memory_bytes = memory_mb * 1024 * 1024 if memory_mb else None
+        self.parser_factory = parser_factory
+        self.startup_timeout = startup_timeout
+        self.queue_timeout = queue_timeout or self.job_timeout
+        self._ctx = multiprocessing.get_context(start_method)
+        self._idle: "queue.Queue[_Worker]" = queue.Queue()
+        self._server: Optional[_UnixServer] = None
+        self._stats = {"jobs": 0, "failed": 0, "timeouts": 0, "memory_kills": 0}
+        self._stats_lock = threading.Lock()
+        self._live_workers = 0
+        self._stopping = threading.Event()
+
+    def _spawn_worker(self) -> _Worker:
+        worker = _Worker(self._ctx, self.parser_factory, self.startup_timeout)
+        with self._stats_lock:
+            self._live_workers += 1
+        return worker
+
+    def _retire_worker(self, worker: _Worker) -> None:
+        worker.kill()
+        with self._stats_lock:
+            self._live_workers -= 1
+
+    @property
+    def live_workers(self) -> int:
+        with self._stats_lock:
+            return self._live_workers
+
+    def _replace_worker(self) -> None:
+        """Start a replacement worker, retrying with backoff until it starts or the daemon stops."""
+        delay = RESPAWN_BACKOFF
+        while not self._stopping.is_set():
+            try:
+                self._idle.put(self._spawn_worker())
+                return
+            except Exception as e:
+                logger.error(f"Could not replace worker (retrying in {delay:.0f}s): {e}")
+            if self._stopping.wait(delay):
+                return
+            delay = min(delay * 2, RESPAWN_MAX_BACKOFF)
+
+    def _count(self, key: str) -> None:
+        with self._stats_lock:
+            self._stats[key] += 1
+
+    def handle(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Serve one decoded request."""
+        op = request.get("op")
+        if op == "ping":
+            with self._stats_lock:
+                stats = dict(self._stats)
+            return {
+                "ok": True,
+                "workers": self.live_workers,
+                "configured_workers": self.num_workers,
+                "pid": os.getpid(),
+                **stats,
+            }
+        if op == "shutdown":
+            threading.Thread(target=self.shutdown, daemon=True).start()
+            return {"ok": True}
+        if op != "parse":
+            return {"ok": False, "kind": "error", "error": f"Unknown op: {op}"}
+
+        try:
+            worker = self._idle.get(timeout=self.queue_timeout)
+        except queue.Empty:
+            self._count("failed")
+            message = (
+                f"No Docling worker available after {self.queue_timeout:.0f}s "
+                f"({self.live_workers}/{self.num_workers} workers alive)"
+            )
+            logger.warning(message)
+            return {"ok": False, "kind": "unavailable", "error": message}
+        try:
+            document = worker.run(
+                request["path"],
+                request.get("page_range"),
+                self.job_timeout,
+                self.max_memory_bytes,
+            )
+            self._count("jobs")
+            return {"ok": True, "document": document}
+        except DaemonJobError as e:
+            self._count("failed")
+            if e.kind == "timeout":
+                self._count("timeouts")
+            elif e.kind == "memory":
+                self._count("memory_kills")
+            logger.warning(f"Job failed ({e.kind}): {e}")
+            return {"ok": False, "kind": e.kind, "error": str(e)}
+        finally:
+            if worker.healthy:
+                self._idle.put(worker)
+            else:
+                self._retire_worker(worker)
+                threading.Thread(target=self._replace_worker, daemon=True).start()
+
+    def start(self) -> None:
+        """Start the workers and bind the socket (does not block)."""
+        if self.socket_path.exists():
+            if DoclingDaemonClient(str(self.socket_path)).is_running():
+                raise RuntimeError(f"Docling daemon already running on {self.socket_path}")
+            self.socket_path.unlink()
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+
+        for _ in range(self.num_workers):
+            self._idle.put(self._spawn_worker())
+        self._server = _UnixServer(str(self.socket_path), _RequestHandler)
+        self._server.daemon_ref = self
+        logger.info(f"Docling daemon listening on {self.socket_path} with {self.num_workers} workers")
+
+    def serve_forever(self) -> None:
+        """Start (if needed) and serve until shutdown()."""
+        if self._server is None:
+            self.start()
+        try:
+            self._server.serve_forever(poll_interval=0.2)
+        finally:
+            self._cleanup()
+
+    def shutdown(self) -> None:
+        self._stopping.set()
+        if self._server is not None:
+            self._server.shutdown()
+
+    def _cleanup(self) -> None:
+        self._stopping.set()
+        self._server.server_close()
+        while not self._idle.empty():
+            self._idle.get_nowait().stop()
+        try:
+            self.socket_path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+# ----------------------------------------------------------------------
+# Client
+# ----------------------------------------------------------------------
+
+class DoclingDaemonClient:
+    """Submits parse jobs to a running DoclingDaemon."""
+
+    def __init__(self, socket_path: Optional[str] = None, timeout: Optional[float] = None):
+        """
+        Args:
+            socket_path: Unix socket path (default: DOCLING_DAEMON_SOCKET)
+            timeout: Seconds to wait for a parse response (default: the
+                daemon's default queue wait and job timeout plus a margin)
+        """
+        self.socket_path = Path(socket_path or settings.DOCLING_DAEMON_SOCKET)
+        self.timeout = timeout or 2 * settings.DOCLING_JOB_TIMEOUT + CLIENT_TIMEOUT_MARGIN
+
+    def _request(self, message: Dict[str, Any], timeout: Optional[float]) -> Dict[str, Any]:
+        if not self.socket_path.exists():
+            raise DaemonUnavailable(f"No daemon socket at {self.socket_path}")
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.settimeout(CONNECT_TIMEOUT)
+            try:
+                sock.connect(str(self.socket_path))
+            except OSError as e:
+                raise DaemonUnavailable(f"Daemon not reachable at {self.socket_path}: {e}")
+            sock.settimeout(timeout)
+            send_message(sock, message)
+            return recv_message(sock)
+        finally:
+            sock.close()
+
+    def is_running(self) -> bool:
+        try:
+            return self._request({"op": "ping"}, CONNECT_TIMEOUT).get("ok", False)
+        except (OSError, ValueError):
+            return False
+
+    def status(self) -> Dict[str, Any]:
+        return self._request({"op": "ping"}, CONNECT_TIMEOUT)
+
+    def shutdown(self) -> None:
+        self._request({"op": "shutdown"}, CONNECT_TIMEOUT)
+
+    def parse(self, path: Path, page_range: Optional[Tuple[int, int]] = None) -> ParsedDocument:
+        """
+        Parse a PDF in the daemon.
+
+        Raises:
+            DaemonUnavailable: If no daemon is listening
+            DaemonJobError: If the job failed, timed out (in the daemon or
+                waiting for its response) or hit the memory cap
+        """
+        try:
+            response = self._request(
+                {
+                    "op": "parse",
+                    "path": str(Path(path).resolve()),
+                    "page_range": list(page_range) if page_range else None,
+                },
+                timeout=self.timeout,
+            )
+        except socket.timeout:
+            raise DaemonJobError(f"No response from daemon after {self.timeout:.0f}s parsing {path}", kind="timeout")
+        if not response.get("ok"):
+            raise DaemonJobError(response.get("error", "unknown error"), kind=response.get("kind", "error"))
+        return ParsedDocument(**response["document"])
@@ -2,21 +2,32 @@
 Docling parser implementation for handling PDF to markdown conversion and hierarchical chunking.
 """
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from ..config import settings
 from ..utils import get_logger
-from ..text_splitter import split_text_into_chunks
+from ..text_splitter import get_splitter
 from .base import ParsedDocument, DocumentChunk
+from .daemon import DaemonUnavailable, DoclingDaemonClient
 
 logger = get_logger("DoclingParser")
 
 class DoclingParser:
     """Handles parsing using IBM Docling."""
     
-    def __init__(self):
+    def __init__(self, use_daemon: bool = True, daemon_socket: Optional[str] = None):
+        """
+        Initialize the parser.
+        
+        Args:
+            use_daemon: Submit to the warm worker daemon when it is running
+            daemon_socket: Daemon socket path (default: DOCLING_DAEMON_SOCKET)
+        """
         self._converter = None
         self._chunker = None
+        self._daemon = None
+        if use_daemon:
+            self._daemon = DoclingDaemonClient(daemon_socket)
         
     def _ensure_docling(self):
         """Lazy-load Docling to avoid import errors if not installed."""
@@ -41,25 +52,61 @@ class DoclingParser:
         if chunk_size is None:
             chunk_size = settings.PARSER_CHUNK_SIZE
 
-        text_chunks = split_text_into_chunks(text, chunk_size=chunk_size, chunk_overlap=settings.PARSER_CHUNK_OVERLAP)
+        spans = get_splitter(chunk_size, settings.PARSER_CHUNK_OVERLAP).split_spans(text)
         chunks = []
         
-        for i, chunk_text in enumerate(text_chunks):
+        for i, span in enumerate(spans):
             chunks.append(DocumentChunk(
-                text=chunk_text,
+                text=span.text,
                 section=f"Chunk {i+1}",
                 source_file=filename,
+                start=span.start,
+                end=span.end,
             ))
         
         return chunks
 
-    def parse(self, path: Path) -> ParsedDocument:
-        """Parse a PDF file using Docling."""
+    @staticmethod
+    def _chunk_page(chunk, default: int = 0) -> int:
+        """Page number of a Docling chunk (from item provenance when available)."""
+        page = getattr(chunk, 'page', None)
+        if isinstance(page, int) and page > 0:
+            return page
+        meta = getattr(chunk, 'meta', None)
+        for item in getattr(meta, 'doc_items', None) or []:
+            for prov in getattr(item, 'prov', None) or []:
+                page_no = getattr(prov, 'page_no', None)
+                if isinstance(page_no, int) and page_no > 0:
+                    return page_no
+        return default
+
+    def parse(self, path: Path, page_range: Optional[Tuple[int, int]] = None) -> ParsedDocument:
+        """
+        Parse a PDF file using Docling.
+        
+        Args:
+            path: PDF file
+            page_range: Optional inclusive 1-based (first, last) pages to convert
+            
+        Raises:
+            DaemonJobError: If the daemon is running and the job failed,
+                timed out or exceeded its memory cap (not retried in-process)
+        """
+        if self._daemon is not None:
+            try:
+                return self._daemon.parse(path, page_range=page_range)
+            except DaemonUnavailable:
+                pass
+        
         self._ensure_docling()
         
         # Convert PDF
-        logger.info(f"Parsing {path.name} using Docling...")
-        result = self._converter.convert(str(path))
+        if page_range is None:
+            logger.info(f"Parsing {path.name} using Docling...")
+            result = self._converter.convert(str(path))
+        else:
+            logger.info(f"Parsing {path.name} pages {page_range[0]}-{page_range[1]} using Docling...")
+            result = self._converter.convert(str(path), page_range=page_range)
         doc = result.document
         
         # Extract full text
@@ -86,7 +133,7 @@ class DoclingParser:
                     section=section,
                     subsection=subsection,
                     chunk_type=chunk_type,
-                    page_number=getattr(chunk, 'page', 0),
+                    page_number=self._chunk_page(chunk, default=page_range[0] if page_range else 0),
                     source_file=path.name,
                 ))
         except Exception as e:
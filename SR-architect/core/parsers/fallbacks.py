@@ -2,7 +2,7 @@
 Fallback parser implementations using PyMuPDF and PDFPlumber.
 """
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
 
 try:
     import fitz  # PyMuPDF
@@ -16,11 +16,50 @@ except ImportError:
 
 from ..config import settings
 from ..utils import get_logger
-from ..text_splitter import split_text_into_chunks
+from ..text_splitter import TextSpan, get_splitter, split_text_into_chunks
 from .base import ParsedDocument, DocumentChunk
 
 logger = get_logger("FallbackParsers")
 
+# Appended after every page in full_text
+PAGE_SEPARATOR = "\n\n"
+
+
+class PageSegment(NamedTuple):
+    """One parsed page: its text, chunks (offsets into full_text) and tables."""
+    page_number: int
+    text: str
+    chunks: List[DocumentChunk]
+    tables: Tuple[Dict[str, Any], ...] = ()
+
+
+def assemble_document(path: Path, segments: Iterable[PageSegment], **metadata: Any) -> ParsedDocument:
+    """
+    Build a ParsedDocument from streamed page segments.
+    
+    Page texts are collected and joined once, so assembly is linear in the
+    document length and no intermediate full_text strings are created.
+    """
+    parts: List[str] = []
+    chunks: List[DocumentChunk] = []
+    tables: List[Dict[str, Any]] = []
+    for segment in segments:
+        parts.append(segment.text)
+        parts.append(PAGE_SEPARATOR)
+        chunks.extend(segment.chunks)
+        tables.extend(segment.tables)
+    
+    metadata = {"path": str(path), "num_chunks": len(chunks), **metadata}
+    if tables:
+        metadata["num_tables"] = len(tables)
+    return ParsedDocument(
+        filename=path.name,
+        chunks=chunks,
+        full_text="".join(parts),
+        tables=tables,
+        metadata=metadata,
+    )
+
 
 def chunk_text(text: str) -> List[str]:
     """Split text into chunks using configured size and overlap."""
@@ -31,6 +70,12 @@ def chunk_text(text: str) -> List[str]:
     )
 
 
+def chunk_spans(text: str, offset: int = 0, page_number: int = 0) -> List[TextSpan]:
+    """Split text into offset-carrying spans using configured size and overlap."""
+    splitter = get_splitter(settings.PARSER_CHUNK_SIZE, settings.PARSER_CHUNK_OVERLAP)
+    return splitter.split_spans(text, offset=offset, page_number=page_number)
+
+
 def simple_chunk(text: str, filename: str, chunk_size: Optional[int] = None) -> List[DocumentChunk]:
     """Simple fallback chunking."""
     if not text:
@@ -39,14 +84,16 @@ def simple_chunk(text: str, filename: str, chunk_size: Optional[int] = None) ->
     if chunk_size is None:
         chunk_size = settings.PARSER_CHUNK_SIZE
 
-    text_chunks = split_text_into_chunks(text, chunk_size=chunk_size, chunk_overlap=settings.PARSER_CHUNK_OVERLAP)
+    spans = get_splitter(chunk_size, settings.PARSER_CHUNK_OVERLAP).split_spans(text)
     chunks = []
     
-    for i, chunk_text in enumerate(text_chunks):
+    for i, span in enumerate(spans):
         chunks.append(DocumentChunk(
-            text=chunk_text,
+            text=span.text,
             section=f"Chunk {i+1}",
             source_file=filename,
+            start=span.start,
+            end=span.end,
         ))
     
     return chunks
@@ -55,44 +102,75 @@ def simple_chunk(text: str, filename: str, chunk_size: Optional[int] = None) ->
 class PyMuPDFParser:
     """Fallback PDF parser using PyMuPDF (fitz)."""
     
-    def parse(self, path: Path) -> ParsedDocument:
+    def iter_pages(self, path: Path, pages: Optional[Iterable[int]] = None) -> Iterator[Tuple[int, str]]:
+        """
+        Yield (page_number, text) for each page, 1-based.
+        
+        Args:
+            path: PDF file
+            pages: Optional subset of 1-based page numbers to extract
+        """
         if fitz is None:
             logger.error("PyMuPDF not installed")
             raise ImportError("PyMuPDF not installed. Run: pip install pymupdf")
-            
-        logger.info(f"Parsing {path.name} using PyMuPDF (fallback)...")
-        pdf_document = fitz.open(path)
-        full_text = ""
-        chunks = []
         
-        for i, page in enumerate(pdf_document):
-            text = page.get_text()
-            full_text += text + "\n\n"
-            
-            # Robust chunking for each page
-            page_chunks = chunk_text(text)
-            
-            for chunk in page_chunks:
-                chunks.append(DocumentChunk(
-                    text=chunk,
-                    section="",
-                    chunk_type="text",
-                    page_number=i + 1,
-                    source_file=path.name,
-                ))
+        wanted = set(pages) if pages is not None else None
+        with fitz.open(path) as pdf_document:
+            for i, page in enumerate(pdf_document):
+                if wanted is None or i + 1 in wanted:
+                    yield i + 1, page.get_text()
+    
+    @staticmethod
+    def page_chunks(text: str, page_number: int, filename: str, offset: int = 0) -> List[DocumentChunk]:
+        """
+        Chunk one page of text.
         
-        pdf_document.close()
-        return ParsedDocument(
-            filename=path.name,
-            chunks=chunks,
-            full_text=full_text,
-            metadata={
-                "path": str(path),
-                "num_chunks": len(chunks),
-                "parser": "pymupdf",
-                # "page_count": len(pdf_document) # pdf_document is closed
-            }
-        )
+        Args:
+            text: Page text
+            page_number: 1-based page number
+            filename: Source file name
+            offset: Position of the page in the document's full_text
+        """
+        return [
+            DocumentChunk(
+                text=span.text,
+                section="",
+                chunk_type="text",
+                page_number=page_number,
+                source_file=filename,
+                start=span.start,
+                end=span.end,
+            )
+            for span in chunk_spans(text, offset=offset, page_number=page_number)
+        ]
+    
+    def stream(self, path: Path, pages: Optional[Iterable[int]] = None) -> Iterator[PageSegment]:
+        """
+        Yield one PageSegment per page as it is extracted.
+        
+        Chunk offsets refer to the full_text that assemble_document() builds
+        from the same segments, so consumers can process chunks page by page
+        and still get exact document positions.
+        
+        Args:
+            path: PDF file
+            pages: Optional 1-based page numbers to parse (default: all)
+        """
+        offset = 0
+        for page_number, text in self.iter_pages(path, pages):
+            yield PageSegment(page_number, text, self.page_chunks(text, page_number, path.name, offset=offset))
+            offset += len(text) + len(PAGE_SEPARATOR)
+    
+    def parse(self, path: Path, pages: Optional[Iterable[int]] = None) -> ParsedDocument:
+        """
+        Parse a PDF, optionally restricted to a subset of pages.
+        
+        Args:
+            path: PDF file
+            pages: Optional 1-based page numbers to parse (default: all)
+        """
+        logger.info(f"Parsing {path.name} using PyMuPDF (fallback)...")
+        return assemble_document(path, self.stream(path, pages), parser="pymupdf")
 
 
 class PDFPlumberParser:
@@ -122,37 +200,42 @@ class PDFPlumberParser:
         
         return "\n".join(lines)
 
-    def parse(self, path: Path) -> ParsedDocument:
+    def stream(self, path: Path) -> Iterator[PageSegment]:
+        """
+        Yield one PageSegment per page, with tables as extra chunks.
+        
+        Chunk offsets refer to the full_text built by assemble_document().
+        """
         if pdfplumber is None:
             raise ImportError("pdfplumber not installed. Run: pip install pdfplumber")
-            
-        logger.info(f"Parsing {path.name} using pdfplumber (tertiary fallback)...")
-        
-        full_text = ""
-        chunks = []
-        tables = []
         
+        offset = 0
+        table_count = 0
         with pdfplumber.open(path) as pdf:
             for i, page in enumerate(pdf.pages):
                 # Extract text
                 text = page.extract_text() or ""
-                full_text += text + "\n\n"
+                chunks = []
+                tables = []
                 
                 # Chunk the page text
-                page_chunks = chunk_text(text)
-                for chunk_text in page_chunks:
+                for span in chunk_spans(text, offset=offset, page_number=i + 1):
                     chunks.append(DocumentChunk(
-                        text=chunk_text,
+                        text=span.text,
                         section=f"Page {i+1}",
                         page_number=i+1,
-                        source_file=path.name
+                        source_file=path.name,
+                        start=span.start,
+                        end=span.end,
                     ))
+                offset += len(text) + len(PAGE_SEPARATOR)
                 
                 # Extract tables if enabled
                 if self.extract_tables:
                     page_tables = page.extract_tables()
                     for j, table in enumerate(page_tables or []):
                         if table:
+                            table_count += 1
                             tables.append({
                                 "page": i + 1,
                                 "table_index": j,
@@ -163,24 +246,22 @@ class PDFPlumberParser:
                             if table_markdown:
                                 chunks.append(DocumentChunk(
                                     text=table_markdown,
-                                    section=f"Table {len(tables)}",
+                                    section=f"Table {table_count}",
                                     chunk_type="table",
                                     page_number=i+1,
                                     source_file=path.name
                                 ))
-        
-        return ParsedDocument(
-            filename=path.name,
-            chunks=chunks,
-            full_text=full_text,
-            tables=tables,
-            metadata={
-                "path": str(path),
-                "num_chunks": len(chunks),
-                "num_tables": len(tables),
-                "parser": "pdfplumber",
-            }
-        )
+                
+                yield PageSegment(i + 1, text, chunks, tuple(tables))
+
+    def parse(self, path: Path) -> ParsedDocument:
+        if pdfplumber is None:
+            raise ImportError("pdfplumber not installed. Run: pip install pdfplumber")
+            
+        logger.info(f"Parsing {path.name} using pdfplumber (tertiary fallback)...")
+        doc = assemble_document(path, self.stream(path), parser="pdfplumber")
+        doc.metadata.setdefault("num_tables", 0)
+        return doc
 
 
 class TextParser:
@@ -0,0 +1,88 @@
+"""
+Page-level hybrid parsing: Docling only for the pages that need it.
+
+Pages flagged by the layout probe (tables, scans) are converted with Docling
+in contiguous page ranges; every other page is taken from PyMuPDF. The pieces
+are merged back into a single ParsedDocument in page order.
+"""
+from pathlib import Path
+from typing import Iterable, List, Tuple
+
+from ..utils import get_logger
+from .base import DocumentChunk, ParsedDocument
+from .docling import DoclingParser
+from .fallbacks import PyMuPDFParser
+
+logger = get_logger("HybridParser")
+
+
+def page_ranges(pages: Iterable[int]) -> List[Tuple[int, int]]:
+    """Collapse page numbers into inclusive (first, last) runs."""
+    ranges: List[Tuple[int, int]] = []
+    for page in sorted(set(pages)):
+        if ranges and page == ranges[-1][1] + 1:
+            ranges[-1] = (ranges[-1][0], page)
+        else:
+            ranges.append((page, page))
+    return ranges
+
+
+class HybridParser:
+    """Merges Docling page ranges with PyMuPDF pages into one document."""
+
+    def __init__(self, pymupdf_parser: PyMuPDFParser, docling_parser: DoclingParser):
+        self.pymupdf_parser = pymupdf_parser
+        self.docling_parser = docling_parser
+
+    def parse(self, path: Path, docling_pages: Iterable[int], page_count: int) -> ParsedDocument:
+        """
+        Parse a PDF, sending only docling_pages through Docling.
+
+        Args:
+            path: PDF file
+            docling_pages: 1-based pages that need layout-aware parsing
+            page_count: Total pages in the document
+
+        Returns:
+            Merged ParsedDocument with chunks and text in page order. If a
+            Docling range fails, its pages are taken from PyMuPDF instead.
+        """
+        # (first_page, text, chunks) segments, merged by first_page at the end
+        segments: List[Tuple[int, str, List[DocumentChunk]]] = []
+        routed: List[int] = []
+
+        for first, last in page_ranges(docling_pages):
+            try:
+                doc = self.docling_parser.parse(path, page_range=(first, last))
+            except Exception as e:
+                logger.warning(f"Docling failed on {path.name} pages {first}-{last}: {e}")
+                continue
+            for chunk in doc.chunks:
+                if not chunk.page_number or not first <= chunk.page_number <= last:
+                    chunk.page_number = first
+            segments.append((first, doc.full_text, doc.chunks))
+            routed.extend(range(first, last + 1))
+
+        docling_set = set(routed)
+        remaining = [p for p in range(1, page_count + 1) if p not in docling_set]
+        for page_number, text in self.pymupdf_parser.iter_pages(path, remaining):
+            segments.append((page_number, text, self.pymupdf_parser.page_chunks(text, page_number, path.name)))
+
+        segments.sort(key=lambda segment: segment[0])
+        chunks = [chunk for _, _, segment_chunks in segments for chunk in segment_chunks]
+        full_text = "\n\n".join(text for _, text, _ in segments)
+
+        logger.info(
+            f"Hybrid parse of {path.name}: {len(docling_set)}/{page_count} pages via Docling"
+        )
+        return ParsedDocument(
+            filename=path.name,
+            chunks=chunks,
+            full_text=full_text,
+            metadata={
+                "path": str(path),
+                "num_chunks": len(chunks),
+                "parser": "hybrid" if docling_set else "pymupdf",
+                "docling_pages": sorted(docling_set),
+            },
+        )
@@ -1,20 +1,45 @@
 """
 Document parser manager that orchestrates parsing strategies and caching.
 """
-import json
-import hashlib
+import os
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from ..config import settings
 from ..utils import get_logger
-from .base import ParsedDocument
+from .base import DocumentChunk, ParsedDocument
+from .cache import ParseCache
 from .docling import DoclingParser
 from .fallbacks import PyMuPDFParser, PDFPlumberParser, TextParser, simple_chunk
-from ..complexity_classifier import ComplexityClassifier
+from .hybrid import HybridParser
+from .probe import PDFProbe, probe_pdf
+from ..complexity_classifier import ComplexityClassifier, ComplexityResult
 
 logger = get_logger("DocumentParser")
 
+# Per-process parser used by parse_many() worker processes
+_worker_parser: Optional["DocumentParser"] = None
+
+
+def _init_parse_worker(parser_kwargs: Dict[str, Any]) -> None:
+    """Build one DocumentParser per worker process (reused across files)."""
+    global _worker_parser
+    _worker_parser = DocumentParser(**parser_kwargs)
+
+
+def _parse_in_worker(file_path: str) -> ParsedDocument:
+    """Parse a single file inside a worker process."""
+    return _worker_parser.parse_file(file_path)
+
+
 class DocumentParser:
     """Parse academic documents with caching and fallback strategies."""
     
@@ -27,7 +52,7 @@ class DocumentParser:
         cache_dir: str = ".cache/parsed_docs",
         use_imrad: bool = False,
         extract_tables: bool = True,
-        max_cache_size: int = None,
+        max_cache_bytes: int = None,
     ):
         """
         Initialize the parser manager.
@@ -36,10 +61,17 @@ class DocumentParser:
         self.cache_dir = Path(cache_dir)
         self.use_imrad = use_imrad
         self.extract_tables = extract_tables
-        if max_cache_size is None:
-            max_cache_size = settings.PARSER_CACHE_MAX_SIZE
-        self.max_cache_size = max_cache_size
+        if max_cache_bytes is None:
+            max_cache_bytes = settings.PARSER_CACHE_MAX_BYTES
+        self.max_cache_bytes = max_cache_bytes
         self.logger = logger
+        self._init_kwargs = {
+            "use_ocr": use_ocr,
+            "cache_dir": cache_dir,
+            "use_imrad": use_imrad,
+            "extract_tables": extract_tables,
+            "max_cache_bytes": max_cache_bytes,
+        }
         
         self._docling_parser = DoclingParser()
         self._pymupdf_parser = PyMuPDFParser()
@@ -48,11 +80,10 @@ class DocumentParser:
         self._imrad_parser = None
         self.classifier = ComplexityClassifier()
         
-        # Ensure cache directory exists
-        if not self.cache_dir.exists():
-            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # Content-addressed parse cache (creates the directory)
+        self.cache = ParseCache(self.cache_dir)
         
-        # Evict old cache entries if over limit
+        # Evict least recently used entries if over the byte budget
         self._evict_cache_if_needed()
         
         # Lazy-load IMRAD parser if enabled
@@ -64,61 +95,123 @@ class DocumentParser:
                 self.logger.warning("IMRADParser not available")
     
     def _evict_cache_if_needed(self):
-        """Evict oldest cache entries if over max_cache_size limit."""
-        if not self.cache_dir.exists():
-            return
-            
-        cache_files = list(self.cache_dir.glob("*.json"))
-        if len(cache_files) <= self.max_cache_size:
-            return
-            
-        # Sort by modification time (oldest first)
-        cache_files.sort(key=lambda f: f.stat().st_mtime)
-        
-        # Evict oldest entries
-        to_evict = len(cache_files) - self.max_cache_size
-        for cache_file in cache_files[:to_evict]:
-            try:
-                cache_file.unlink()
-                self.logger.debug(f"Evicted cache entry: {cache_file.name}")
-            except Exception as e:
-                self.logger.warning(f"Failed to evict cache {cache_file}: {e}")
+        """Evict least recently used cache entries beyond the byte budget."""
+        try:
+            self.cache.evict(self.max_cache_bytes)
+        except Exception as e:
+            self.logger.warning(f"Parse cache eviction failed: {e}")
     
     def _get_cache_path(self, file_path: Path) -> Path:
-        """Generate a unique cache path based on file content hash."""
-        stat = file_path.stat()
-        key = f"{str(file_path)}_{stat.st_mtime}_{stat.st_size}"
-        hash_key = hashlib.md5(key.encode()).hexdigest()
-        return self.cache_dir / f"{hash_key}.json"
+        """Cache entry path, keyed by a SHA-256 of the file contents."""
+        return self.cache.entry_path(self.cache.key_for(file_path))
         
     def _load_cached(self, file_path: Path) -> Optional[ParsedDocument]:
-        """Try to load parsed document from cache (JSON)."""
-        cache_path = self._get_cache_path(file_path)
-        if cache_path.exists():
-            try:
-                self.logger.debug(f"Loading cached parse for {file_path.name}")
-                with open(cache_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    return ParsedDocument(**data)
-            except Exception as e:
-                self.logger.warning(f"Cache load failed for {file_path}: {e}")
-        return None
+        """Try to load parsed document from the content-addressed cache."""
+        try:
+            doc = self.cache.load(file_path)
+        except Exception as e:
+            self.logger.warning(f"Cache load failed for {file_path}: {e}")
+            return None
+        if doc is not None:
+            self.logger.debug(f"Loading cached parse for {file_path.name}")
+        return doc
         
     def _save_to_cache(self, doc: ParsedDocument, file_path: Path):
-        """Save parsed document to cache as JSON."""
+        """Save parsed document to the binary cache (atomic write)."""
         try:
-            cache_path = self._get_cache_path(file_path)
-            # Use atomic write via temp file
-            temp_path = cache_path.with_suffix(".tmp")
-            with open(temp_path, "w", encoding="utf-8") as f:
-                json.dump(doc.model_dump(), f, indent=2)
-            temp_path.replace(cache_path)
+            self.cache.save(doc, file_path)
             self.logger.debug(f"Saved parse for {file_path.name} to cache")
         except Exception as e:
             self.logger.error(f"Cache save failed for {file_path}: {e}")
+            return
+        self._evict_cache_if_needed()
+
+    def load_cached_chunks(self, file_path: str) -> Optional[List[DocumentChunk]]:
+        """
+        Load only the chunks of a previously parsed file.
+        
+        Skips decompressing full_text, which keeps warm runs over large
+        corpora cheap when only chunks are needed (e.g. vectorization).
+        
+        Returns:
+            Cached chunks, or None if the file has not been parsed yet
+        """
+        path = Path(file_path)
+        if not path.exists():
+            raise FileNotFoundError(f"File not found: {file_path}")
+        return self.cache.load_chunks(path)
+
+    @property
+    def _pdf_parsers(self) -> Dict[str, Any]:
+        """PDF parsers by strategy name (resolved late so they can be swapped)."""
+        return {
+            "docling": self._docling_parser,
+            "pymupdf": self._pymupdf_parser,
+            "pdfplumber": self._pdfplumber_parser,
+        }
+    
+    def _parser_order(self, strategy: Dict[str, Any]) -> List[str]:
+        """Recommended primary and fallback parsers, then the rest of the chain."""
+        order = []
+        for name in [strategy.get("primary"), strategy.get("fallback"), *self.PARSER_CHAIN]:
+            if name in self._pdf_parsers and name not in order:
+                order.append(name)
+        return order
+    
+    def _probe_complexity(self, path: Path) -> Optional[Tuple[PDFProbe, ComplexityResult]]:
+        """Probe and classify a PDF before parsing, or None if probing fails."""
+        try:
+            probe = probe_pdf(path)
+        except Exception as e:
+            self.logger.warning(f"Layout probe failed for {path.name}: {e}")
+            return None
+        try:
+            complexity = self.classifier.classify_probe(probe)
+        except Exception as e:
+            self.logger.warning(f"Complexity classification failed for {path.name}: {e}")
+            return None
+        self.logger.debug(
+            f"Probed {path.name} in {probe.elapsed_ms:.1f}ms: "
+            f"{complexity.level.value} -> {complexity.recommendations.get('primary')}"
+        )
+        return probe, complexity
+
+    def _parse_with_fallbacks(self, path: Path, strategy: Dict[str, Any]) -> ParsedDocument:
+        """Run the recommended parser, then its fallbacks, until one succeeds."""
+        parsers = self._pdf_parsers
+        for name in self._parser_order(strategy):
+            try:
+                return parsers[name].parse(path)
+            except Exception as e:
+                self.logger.warning(f"{name} parse failed for {path.name}: {e}")
+        raise RuntimeError(f"Failed to parse {path}: all strategies failed")
+    
+    def _parse_hybrid(self, path: Path, probe: PDFProbe) -> Optional[ParsedDocument]:
+        """
+        Page-level hybrid parse, or None to parse the whole document instead.
+        
+        Returns None when page routing is off, when most pages need Docling
+        anyway, or when the hybrid parse fails.
+        """
+        docling_pages = self.classifier.docling_pages(probe)
+        if docling_pages is None:
+            return None
+        try:
+            hybrid = HybridParser(self._pymupdf_parser, self._docling_parser)
+            return hybrid.parse(path, docling_pages, probe.page_count)
+        except Exception as e:
+            self.logger.warning(f"Hybrid parse failed for {path.name}: {e}")
+            return None
 
     def parse_pdf(self, pdf_path: str) -> ParsedDocument:
-        """Parse a single PDF file with fallbacks."""
+        """
+        Parse a single PDF file with fallbacks.
+        
+        The parser is chosen up front from a layout probe, so documents
+        routed to Docling are never parsed with PyMuPDF first. For those
+        documents only the pages that need Docling (tables, scans) are sent
+        to it; the remaining pages come from PyMuPDF.
+        """
         path = Path(pdf_path)
         if not path.exists():
             raise FileNotFoundError(f"PDF not found: {pdf_path}")
@@ -128,44 +221,31 @@ class DocumentParser:
         if cached_doc:
             return cached_doc
         
-        # 1. Fast Path: Always try PyMuPDF first (Scanner)
-        try:
-            parsed_doc = self._pymupdf_parser.parse(path)
-            self.logger.debug(f"Initial scan with PyMuPDF successful for {path.name}")
-        except (ImportError, Exception) as e:
-            self.logger.warning(f"PyMuPDF scan failed: {e}. Defaulting to Docling.")
-            parsed_doc = None
-
-        # 2. Check Complexity & Upgrade if needed
-        used_docling = False
+        # 1. Probe layout (milliseconds) and pick the parser before parsing
+        probed = self._probe_complexity(path)
+        if probed is not None:
+            probe, complexity = probed
+            strategy = complexity.recommendations
+        else:
+            strategy = {"primary": "pymupdf", "fallback": "docling"}
+        
+        # 2. Docling-bound documents: convert only the pages that need it
+        parsed_doc = None
+        if probed is not None and strategy.get("primary") == "docling":
+            parsed_doc = self._parse_hybrid(path, probe)
+        
+        # 3. Otherwise parse with the chosen parser, falling back down the chain
+        if parsed_doc is None:
+            parsed_doc = self._parse_with_fallbacks(path, strategy)
+        
+        if probed is not None:
+            parsed_doc.metadata["page_count"] = probe.page_count
+            parsed_doc.metadata["complexity"] = complexity.to_dict()
+            parsed_doc.metadata["probe"] = probe.to_dict()
+        
+        # Chunks become spans of full_text (exact offsets, no duplicate text)
         if parsed_doc:
-            try:
-                # Classify complexity
-                strategy = self.classifier.get_parser_strategy(parsed_doc)
-                primary_parser = strategy.get("primary", "pymupdf")
-                
-                # Upgrade to Docling if recommended
-                if primary_parser == "docling":
-                    self.logger.info(f"Complexity Upgrade: Re-parsing {path.name} with Docling (Strategy: {strategy})")
-                    try:
-                        parsed_doc = self._docling_parser.parse(path)
-                        used_docling = True
-                    except Exception as e:
-                        self.logger.error(f"Docling upgrade failed: {e}. Keeping PyMuPDF result.")
-            except Exception as e:
-                self.logger.warning(f"Complexity classification failed: {e}")
-
-        # 3. Fallback: If PyMuPDF failed initially or we haven't succeeded yet
-        if not parsed_doc and not used_docling:
-            try:
-                parsed_doc = self._docling_parser.parse(path)
-            except Exception as e:
-                self.logger.error(f"Docling fallback failed: {e}")
-                
-                # Ultimate fallback if we haven't tried PyMuPDF yet (e.g. init failure)
-                # But logic above guarantees we tried PyMuPDF first.
-                # Just raise error if nothing worked.
-                raise RuntimeError(f"Failed to parse {pdf_path}: all strategies failed")
+            parsed_doc.bind_chunks()
         
         # Post-processing: IMRAD parsing
         if parsed_doc and self._imrad_parser and self.use_imrad:
@@ -194,8 +274,143 @@ class DocumentParser:
             return self.parse_pdf(file_path)
         elif ext == ".txt":
             parsed_doc = self._text_parser.parse(path)
+            parsed_doc.bind_chunks()
             # Save to cache also for txt files?
             self._save_to_cache(parsed_doc, path)
             return parsed_doc
             
         raise ValueError(f"Unsupported file extension: {ext}")
+
+    def parse_many(
+        self,
+        file_paths: Iterable[Union[str, Path]],
+        workers: Optional[int] = None,
+        ordered: bool = False,
+        on_error: Optional[Callable[[Path, Exception], None]] = None,
+    ) -> Iterator[ParsedDocument]:
+        """
+        Parse many files in parallel using a process pool.
+
+        Cached documents are served from the main process; only cache misses
+        are submitted to worker processes. A file that raises (or crashes
+        its worker) is reported through ``on_error`` and never aborts the
+        rest of the batch.
+
+        Args:
+            file_paths: Files to parse (.pdf or .txt)
+            workers: Worker processes (defaults to settings.PARSER_WORKERS,
+                then CPU count). ``1`` parses in-process without a pool.
+            ordered: Yield in input order instead of completion order
+            on_error: Optional callback(path, exception) for failed files
+
+        Yields:
+            ParsedDocument for each successfully parsed file
+        """
+        paths = [Path(p) for p in file_paths]
+        if not paths:
+            return
+
+        if workers is None:
+            workers = settings.PARSER_WORKERS or os.cpu_count() or 1
+        workers = max(1, min(workers, len(paths)))
+
+        def report(path: Path, error: Exception) -> None:
+            self.logger.error(f"Failed to parse {path.name}: {error}")
+            if on_error:
+                on_error(path, error)
+
+        if workers == 1:
+            for path in paths:
+                try:
+                    yield self.parse_file(str(path))
+                except Exception as e:
+                    report(path, e)
+            return
+
+        # index -> ParsedDocument, or None once the file has failed
+        done: Dict[int, Optional[ParsedDocument]] = {}
+        pending = []
+        for index, path in enumerate(paths):
+            cached = None
+            if path.exists():
+                cached = self._load_cached(path)
+            if cached is not None:
+                done[index] = cached
+            else:
+                pending.append(index)
+
+        next_index = 0
+
+        def drain() -> Iterator[ParsedDocument]:
+            """Yield finished documents that are ready to be emitted."""
+            nonlocal next_index
+            if ordered:
+                while next_index in done:
+                    doc = done.pop(next_index)
+                    next_index += 1
+                    if doc is not None:
+                        yield doc
+            else:
+                for index in list(done):
+                    doc = done.pop(index)
+                    if doc is not None:
+                        yield doc
+
+        yield from drain()
+        if not pending:
+            return
+
+        # A crashed worker breaks the whole pool, failing every unfinished
+        # future. Those files are retried in isolated single-use processes so
+        # only the pathological PDF is reported as failed.
+        crashed = []
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(pending)),
+            initializer=_init_parse_worker,
+            initargs=(self._init_kwargs,),
+        ) as executor:
+            futures = {
+                executor.submit(_parse_in_worker, str(paths[index])): index
+                for index in pending
+            }
+            while futures:
+                finished, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    index = futures.pop(future)
+                    try:
+                        done[index] = future.result()
+                    except BrokenProcessPool:
+                        crashed.append(index)
+                    except Exception as e:
+                        report(paths[index], e)
+                        done[index] = None
+                yield from drain()
+
+        if not crashed:
+            return
+
+        self.logger.warning(
+            f"Parser worker crashed; retrying {len(crashed)} files in isolation"
+        )
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(self._parse_isolated, paths[index]): index
+                for index in sorted(crashed)
+            }
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    done[index] = future.result()
+                except Exception as e:
+                    report(paths[index], e)
+                    done[index] = None
+                yield from drain()
+
+    def _parse_isolated(self, path: Path) -> ParsedDocument:
+        """Parse one file in its own short-lived worker process."""
+        with ProcessPoolExecutor(
+            max_workers=1,
+            initializer=_init_parse_worker,
+            initargs=(self._init_kwargs,),
+        ) as executor:
+            return executor.submit(_parse_in_worker, str(path)).result()
@@ -0,0 +1,188 @@
+"""
+Cheap pre-parse probe of PDF layout signals.
+
+Reads PDF-level structure (text and image block boxes, vector paths, span
+font sizes on the first pages) without assembling or chunking text, so the
+parser can be chosen before any full parse. Takes a few milliseconds per page.
+"""
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List
+
+try:
+    import fitz  # PyMuPDF
+except ImportError:
+    fitz = None
+
+# A stroked path counts as a table ruling when it is at least this long (pt)
+# and no thicker than RULING_MAX_THICKNESS
+RULING_MIN_LENGTH = 20.0
+RULING_MAX_THICKNESS = 2.0
+# Blocks must sit this far (pt) clear of the page centre to count as a column
+COLUMN_GUTTER = 10.0
+# Font sizes need a span-level pass, so only the first pages are sampled
+FONT_SAMPLE_PAGES = 2
+
+
+@dataclass
+class PageProbe:
+    """Layout signals for a single page."""
+    page_number: int
+    text_chars: int = 0
+    image_coverage: float = 0.0
+    vector_paths: int = 0
+    ruling_lines: int = 0
+    font_sizes: List[float] = field(default_factory=list)
+    multi_column: bool = False
+
+
+@dataclass
+class PDFProbe:
+    """Document-level summary of per-page probe signals."""
+    page_count: int
+    pages: List[PageProbe]
+    elapsed_ms: float = 0.0
+
+    @property
+    def text_chars(self) -> int:
+        return sum(p.text_chars for p in self.pages)
+
+    @property
+    def chars_per_page(self) -> float:
+        return self.text_chars / self.page_count if self.page_count else 0.0
+
+    @property
+    def image_coverage(self) -> float:
+        """Mean fraction of page area covered by images."""
+        if not self.pages:
+            return 0.0
+        return sum(p.image_coverage for p in self.pages) / len(self.pages)
+
+    @property
+    def vector_paths(self) -> int:
+        return sum(p.vector_paths for p in self.pages)
+
+    @property
+    def ruling_lines(self) -> int:
+        return sum(p.ruling_lines for p in self.pages)
+
+    @property
+    def font_size_count(self) -> int:
+        return len({size for p in self.pages for size in p.font_sizes})
+
+    @property
+    def multi_column_ratio(self) -> float:
+        if not self.pages:
+            return 0.0
+        return sum(1 for p in self.pages if p.multi_column) / len(self.pages)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Compact summary for ParsedDocument metadata (per-page detail omitted)."""
+        return {
+            "page_count": self.page_count,
+            "text_chars": self.text_chars,
+            "chars_per_page": round(self.chars_per_page, 1),
+            "image_coverage": round(self.image_coverage, 3),
+            "vector_paths": self.vector_paths,
+            "ruling_lines": self.ruling_lines,
+            "font_size_count": self.font_size_count,
+            "multi_column_ratio": round(self.multi_column_ratio, 3),
+            "elapsed_ms": round(self.elapsed_ms, 1),
+        }
+
+
+def _count_rulings(drawings: List[Dict[str, Any]]) -> int:
+    """Count long, thin horizontal/vertical strokes (table rules)."""
+    rulings = 0
+    for path in drawings:
+        for item in path.get("items", []):
+            kind = item[0]
+            if kind == "l":
+                (x0, y0), (x1, y1) = item[1], item[2]
+            elif kind == "re":
+                x0, y0, x1, y1 = item[1]
+            else:
+                continue
+            dx, dy = abs(x1 - x0), abs(y1 - y0)
+            if max(dx, dy) >= RULING_MIN_LENGTH and min(dx, dy) <= RULING_MAX_THICKNESS:
+                rulings += 1
+    return rulings
+
+
+def _font_sizes(page) -> List[float]:
+    """Distinct span font sizes on a page (rounded to 0.1 pt)."""
+    sizes = set()
+    for block in page.get_text("dict", flags=0)["blocks"]:
+        for line in block.get("lines", []):
+            for span in line.get("spans", []):
+                if span.get("text", "").strip():
+                    sizes.add(round(span.get("size", 0.0), 1))
+    return sorted(sizes)
+
+
+def _probe_page(page, page_number: int, sample_fonts: bool) -> PageProbe:
+    """Collect layout signals for one page."""
+    probe = PageProbe(page_number=page_number)
+    page_rect = page.rect
+    page_area = page_rect.width * page_rect.height or 1.0
+    centre = page_rect.x0 + page_rect.width / 2
+
+    # "blocks" yields text and image block bboxes in one cheap pass
+    left = right = 0
+    covered = 0.0
+    blocks = page.get_text("blocks", flags=fitz.TEXTFLAGS_BLOCKS | fitz.TEXT_PRESERVE_IMAGES)
+    for x0, y0, x1, y1, text, _, block_type in blocks:
+        if block_type == 1:
+            bbox = fitz.Rect(x0, y0, x1, y1) & page_rect
+            if not bbox.is_empty:
+                covered += bbox.width * bbox.height
+            continue
+        chars = len(text.strip())
+        if not chars:
+            continue
+        probe.text_chars += chars
+        if x1 < centre - COLUMN_GUTTER:
+            left += 1
+        elif x0 > centre + COLUMN_GUTTER:
+            right += 1
+    probe.multi_column = left >= 2 and right >= 2
+    probe.image_coverage = min(covered / page_area, 1.0)
+
+    drawings = page.get_cdrawings()
+    probe.vector_paths = len(drawings)
+    probe.ruling_lines = _count_rulings(drawings)
+
+    if sample_fonts:
+        probe.font_sizes = _font_sizes(page)
+    return probe
+
+
+def probe_pdf(path: Path) -> PDFProbe:
+    """
+    Probe a PDF's layout without parsing it.
+
+    Args:
+        path: PDF file
+
+    Returns:
+        PDFProbe with per-page signals
+
+    Raises:
+        ImportError: If PyMuPDF is not installed
+    """
+    if fitz is None:
+        raise ImportError("PyMuPDF not installed. Run: pip install pymupdf")
+
+    start = time.perf_counter()
+    with fitz.open(path) as pdf:
+        pages = [
+            _probe_page(page, i + 1, sample_fonts=i < FONT_SAMPLE_PAGES)
+            for i, page in enumerate(pdf)
+        ]
+        page_count = len(pdf)
+    return PDFProbe(
+        page_count=page_count,
+        pages=pages,
+        elapsed_ms=(time.perf_counter() - start) * 1000,
+    )
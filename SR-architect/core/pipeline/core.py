@@ -8,7 +8,12 @@ Filter → Classify → Extract → Check → Iterate
 Refactored for clarity with dependency injection and composition patterns.
 """
 
+import asyncio
+import dataclasses
 import hashlib
+import json
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime
 from typing import Type, TypeVar, Optional, Dict, Any, List
 from pydantic import BaseModel
@@ -20,8 +25,10 @@ from core.content_filter import ContentFilter
 from core.classification import RelevanceClassifier
 from core.data_types import PipelineResult
 from core.semantic_chunker import SemanticChunker
+from core.context_packer import ContextPacker
+from core.chunk_index import ChunkIndex
 from core.extractors import StructuredExtractor
-from core.validation import ExtractionChecker
+from core.validation import ExtractionChecker, LocalEvidenceVerifier
 from core.regex_extractor import RegexExtractor
 from core.two_pass_extractor import TwoPassExtractor
 from core.sentence_extractor import SentenceExtractor
@@ -32,10 +39,17 @@ from agents.quality_auditor import QualityAuditorAgent
 from agents.meta_analyst import MetaAnalystAgent
 
 # Import extraction executor
-from .extraction import ExtractionExecutor
+from .extraction import ExtractionExecutor, SharedContext
+from .extraction.helpers import merge_pipeline_results
+from .field_groups import group_fields
+from .incremental import FieldPlan, merge_cached_fields, plan_fields, reduced_schema, store_fields
 
 T = TypeVar('T', bound=BaseModel)
 
+# Schema/model key of the extraction in progress, so cached results are
+# never reused for a different schema (task-local under asyncio.gather)
+_schema_key: ContextVar[str] = ContextVar("schema_key", default="")
+
 
 class HierarchicalExtractionPipeline:
     """
@@ -57,6 +71,12 @@ class HierarchicalExtractionPipeline:
         schema_discoverer: Optional[SchemaDiscoveryAgent] = None,
         meta_analyst: Optional[MetaAnalystAgent] = None,
         token_tracker: Optional["TokenTracker"] = None,
+        relevance_cache: Optional["CacheManager"] = None,
+        fingerprint_store: Optional["FingerprintStore"] = None,
+        field_cache: Optional["CacheManager"] = None,
+        evidence_mode: Optional[str] = None,
+        field_groups: Optional[bool] = None,
+        resume: bool = False,
     ):
         """
         Initialize the hierarchical pipeline.
@@ -72,14 +92,28 @@ class HierarchicalExtractionPipeline:
             schema_discoverer: Optional injected SchemaDiscoveryAgent
             meta_analyst: Optional injected MetaAnalystAgent
             token_tracker: Optional token usage tracker
+            relevance_cache: Optional persistent cache for chunk relevance decisions
+            fingerprint_store: Optional persistent store for reusing results of
+                exact and near-duplicate documents across runs
+            field_cache: Optional persistent cache of per-field values, so only
+                new or changed schema fields are re-extracted
+            evidence_mode: "two_call" or "single_call" evidence extraction
+                (default: EXTRACTION_EVIDENCE_MODE)
+            field_groups: Extract async runs per field group from retrieved
+                chunks (default: FIELD_GROUP_RETRIEVAL)
+            resume: Reuse results and field values persisted by earlier runs
+                in the fingerprint store and field cache (validated results
+                are stored either way)
         """
         # Resolve model name if not provided
         if model is None:
             model = settings.get_model_for_provider(provider)
         
+        self.model = model
         self.score_threshold = score_threshold
         self.max_iterations = max_iterations
         self.verbose = verbose
+        self.field_groups = settings.FIELD_GROUP_RETRIEVAL if field_groups is None else field_groups
         
         # Initialize TokenTracker if not provided
         if token_tracker is None:
@@ -94,12 +128,14 @@ class HierarchicalExtractionPipeline:
             provider=provider,
             model=model,
             token_tracker=self.token_tracker,
+            cache=relevance_cache,
         )
         self.extractor = StructuredExtractor(
             provider=provider,
             model=model,
             examples=examples,
             token_tracker=self.token_tracker,
+            evidence_mode=evidence_mode,
         )
         self.checker = ExtractionChecker(
             provider=provider,
@@ -148,6 +184,13 @@ class HierarchicalExtractionPipeline:
         
         # Document fingerprint cache for duplicate detection
         self._fingerprint_cache: Dict[str, PipelineResult] = {}
+        self.fingerprint_store = fingerprint_store
+        self.resume = resume
+        self.prompt_version = self._compute_prompt_version()
+        self._signatures: Dict[str, "Signature"] = {}
+        # Fingerprints of documents whose schema chunks or field groups are still extracting
+        self._shared_fingerprints: Dict[str, int] = {}
+        self.field_cache = field_cache
         
         self.logger = utils.get_logger("HierarchicalPipeline")
         
@@ -164,6 +207,9 @@ class HierarchicalExtractionPipeline:
             cache_result=self._cache_result,
             filter_and_classify=self._filter_and_classify,
             quality_auditor=self.quality_auditor,
+            filter_and_classify_async=self._filter_and_classify_async,
+            local_verifier=LocalEvidenceVerifier() if settings.LOCAL_VERIFICATION_ENABLED else None,
+            context_packer=ContextPacker(model) if settings.CONTEXT_PACKING_ENABLED else None,
         )
     
     def set_hybrid_mode(self, enabled: bool = True):
@@ -213,29 +259,201 @@ class HierarchicalExtractionPipeline:
             max_chars = settings.CACHE_HASH_CHARS
         
         sample = text[:max_chars]
-        return hashlib.sha256(sample.encode()).hexdigest()
+        fingerprint = hashlib.sha256(sample.encode()).hexdigest()
+        if self.fingerprint_store is not None and fingerprint not in self._signatures:
+            from core.cache import compute_signature
+            self._signatures[fingerprint] = compute_signature(text)
+        return fingerprint
+    
+    def _compute_prompt_version(self) -> str:
+        """Digest of the extraction and checker prompts, so prompt edits invalidate cached results."""
+        payload = json.dumps([
+            self.extractor.SYSTEM_PROMPT_TEMPLATE,
+            self.extractor.examples,
+            self.extractor.evidence_mode,
+            self.checker.SYSTEM_PROMPT,
+        ], default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()[:16]
+    
+    def _schema_key_for(self, schema: Type[BaseModel], theme: str) -> str:
+        """
+        Key identifying everything that shapes a result: schema, model, theme,
+        prompts and validation settings, for scoped result caching.
+        """
+        try:
+            shape = json.dumps(schema.model_json_schema(), sort_keys=True)
+        except Exception:
+            shape = getattr(schema, "__qualname__", repr(schema))
+        payload = json.dumps([
+            shape,
+            self.model,
+            theme,
+            self.prompt_version,
+            self.score_threshold,
+            self.max_iterations,
+        ])
+        return hashlib.sha256(payload.encode()).hexdigest()
     
     def _check_duplicate(self, fingerprint: str) -> Optional[PipelineResult]:
         """
         Check if document has already been processed.
         
+        Looks in the in-memory cache first, then (when resuming) in the
+        persistent fingerprint store, which also matches near-duplicate
+        documents (e.g. a preprint and its published version).
+        
         Args:
             fingerprint: Document fingerprint
             
         Returns:
             Cached PipelineResult if duplicate, None otherwise
         """
-        return self._fingerprint_cache.get(fingerprint)
+        key = _schema_key.get()
+        cached = self._fingerprint_cache.get(f"{key}:{fingerprint}")
+        if cached is not None or self.fingerprint_store is None or not self.resume:
+            return cached
+        
+        signature = self._signatures.get(fingerprint)
+        if signature is None:
+            return None
+        try:
+            found = self.fingerprint_store.get_result(signature, key)
+        except Exception as e:
+            self.logger.warning(f"Fingerprint store lookup failed: {e}")
+            return None
+        if found is None:
+            return None
+        
+        match, result = found
+        if match.exact:
+            return result
+        self.logger.info(
+            f"  ✓ Near-duplicate of a stored document (similarity {match.similarity:.2f})"
+        )
+        return dataclasses.replace(
+            result,
+            warnings=result.warnings + [
+                f"Reused extraction from near-duplicate document (similarity {match.similarity:.2f})"
+            ],
+        )
     
     def _cache_result(self, fingerprint: str, result: PipelineResult):
         """
         Cache extraction result by fingerprint.
         
+        Only results that passed validation are persisted, so failed
+        extractions are retried by later runs.
+        
         Args:
             fingerprint: Document fingerprint
             result: Pipeline result to cache
         """
-        self._fingerprint_cache[fingerprint] = result
+        key = _schema_key.get()
+        self._fingerprint_cache[f"{key}:{fingerprint}"] = result
+        
+        if fingerprint in self._shared_fingerprints:
+            signature = self._signatures.get(fingerprint)
+        else:
+            signature = self._signatures.pop(fingerprint, None)
+        if self.fingerprint_store is not None and signature is not None and result.passed_validation:
+            try:
+                self.fingerprint_store.put_result(signature, key, result)
+            except Exception as e:
+                self.logger.warning(f"Fingerprint store write failed: {e}")
+    
+    @contextmanager
+    def _pinned_signature(self, document: ParsedDocument):
+        """Keep the document signature until every concurrent part has cached its result."""
+        fingerprint = self._compute_fingerprint(document.full_text)
+        self._shared_fingerprints[fingerprint] = self._shared_fingerprints.get(fingerprint, 0) + 1
+        try:
+            yield
+        finally:
+            self._shared_fingerprints[fingerprint] -= 1
+            if not self._shared_fingerprints[fingerprint]:
+                del self._shared_fingerprints[fingerprint]
+                self._signatures.pop(fingerprint, None)
+    
+    def _plan_fields(
+        self,
+        document: ParsedDocument,
+        schema: Type[BaseModel],
+        theme: str,
+    ) -> Optional[FieldPlan]:
+        """Cached/missing field split for a document, or None without a field cache."""
+        if self.field_cache is None:
+            return None
+        try:
+            return plan_fields(
+                self.field_cache, document, schema, theme, self.model,
+                score_threshold=self.score_threshold,
+                max_iterations=self.max_iterations,
+                prompt_version=self.prompt_version,
+                refresh=not self.resume,
+            )
+        except Exception as e:
+            self.logger.warning(f"Field cache lookup failed: {e}")
+            return None
+    
+    def _target_schema(self, schema: Type[T], plan: Optional[FieldPlan]) -> Type[BaseModel]:
+        """Schema to extract: the full schema, or only its uncached fields."""
+        if plan is None or not plan.cached:
+            return schema
+        self.logger.info(
+            f"  Field cache: {len(plan.cached)} cached, extracting {len(plan.missing)}: "
+            f"{', '.join(plan.missing)}"
+        )
+        return reduced_schema(schema, plan.missing)
+    
+    def _finish_fields(
+        self,
+        plan: Optional[FieldPlan],
+        schema: Type[BaseModel],
+        document: ParsedDocument,
+        result: PipelineResult,
+    ) -> PipelineResult:
+        """Cache newly extracted fields and merge in the cached ones."""
+        if plan is None:
+            return result
+        try:
+            store_fields(self.field_cache, plan, result, plan.missing, self.logger)
+        except Exception as e:
+            self.logger.warning(f"Field cache write failed: {e}")
+        if not plan.cached:
+            return result
+        return merge_cached_fields(plan, schema, document, result)
+    
+    def _filter_chunks(self, document: ParsedDocument, warnings: List[str]) -> tuple:
+        """Stage 1: Filter content, keeping all chunks if everything is filtered."""
+        filter_result = self.content_filter.filter_chunks(document.chunks)
+        filtered_chunks = filter_result.filtered_chunks
+        
+        if not filtered_chunks:
+            warnings.append("All chunks were filtered out - using original chunks")
+            filtered_chunks = document.chunks
+        return filtered_chunks, filter_result.token_stats
+    
+    def _finish_classification(
+        self,
+        filtered_chunks: List[DocumentChunk],
+        relevant_chunks: List[DocumentChunk],
+        relevance_results: list,
+        warnings: List[str],
+    ) -> tuple:
+        """Stage 2 bookkeeping shared by the sync and async paths."""
+        relevance_stats = self.relevance_classifier.get_classification_summary(relevance_results)
+        
+        if not relevant_chunks:
+            warnings.append("No chunks classified as relevant - using all filtered chunks")
+            relevant_chunks = filtered_chunks
+        
+        # Probability each kept chunk is relevant, for ranking in the context packer
+        probability = {}
+        for chunk, result in zip(filtered_chunks, relevance_results):
+            confidence = result.confidence if result.confidence is not None else 0.5
+            probability[id(chunk)] = confidence if result.is_relevant else 1.0 - confidence
+        relevance_stats["chunk_scores"] = [round(probability.get(id(c), 0.5), 3) for c in relevant_chunks]
+        return relevant_chunks, relevance_stats
     
     def _filter_and_classify(
         self, 
@@ -257,24 +475,42 @@ class HierarchicalExtractionPipeline:
         warnings = []
         
         # Stage 1: Filter
-        filter_result = self.content_filter.filter_chunks(document.chunks)
-        filtered_chunks = filter_result.filtered_chunks
-        
-        if not filtered_chunks:
-            warnings.append("All chunks were filtered out - using original chunks")
-            filtered_chunks = document.chunks
+        filtered_chunks, filter_stats = self._filter_chunks(document, warnings)
         
         # Stage 2: Classify relevance
         relevant_chunks, relevance_results = self.relevance_classifier.get_relevant_chunks(
             filtered_chunks, theme, schema_fields
         )
-        relevance_stats = self.relevance_classifier.get_classification_summary(relevance_results)
+        relevant_chunks, relevance_stats = self._finish_classification(
+            filtered_chunks, relevant_chunks, relevance_results, warnings
+        )
+            
+        return relevant_chunks, filter_stats, relevance_stats, warnings
+    
+    async def _filter_and_classify_async(
+        self, 
+        document: ParsedDocument, 
+        theme: str, 
+        schema_fields: List[str]
+    ) -> tuple:
+        """
+        Stage 1 & 2 (async): relevance classification awaits the async client.
         
-        if not relevant_chunks:
-            warnings.append("No chunks classified as relevant - using all filtered chunks")
-            relevant_chunks = filtered_chunks
+        Returns:
+            Tuple of (relevant_chunks, filter_stats, relevance_stats, warnings)
+        """
+        warnings = []
+        
+        filtered_chunks, filter_stats = self._filter_chunks(document, warnings)
+        
+        relevant_chunks, relevance_results = await self.relevance_classifier.get_relevant_chunks_async(
+            filtered_chunks, theme, schema_fields
+        )
+        relevant_chunks, relevance_stats = self._finish_classification(
+            filtered_chunks, relevant_chunks, relevance_results, warnings
+        )
             
-        return relevant_chunks, filter_result.token_stats, relevance_stats, warnings
+        return relevant_chunks, filter_stats, relevance_stats, warnings
     
     def extract_document(
         self,
@@ -296,7 +532,18 @@ class HierarchicalExtractionPipeline:
             PipelineResult with extracted data and validation metrics
         """
         self.logger.info(f"Starting extraction for: {document.filename}")
-        return self._extraction_executor.extract_sync(document, schema, theme)
+        plan = self._plan_fields(document, schema, theme)
+        if plan is not None and plan.complete:
+            self.logger.info(f"  ✓ All {len(plan.cached)} fields cached for {document.filename}")
+            return merge_cached_fields(plan, schema, document)
+        
+        target = self._target_schema(schema, plan)
+        token = _schema_key.set(self._schema_key_for(target, theme))
+        try:
+            result = self._extraction_executor.extract_sync(document, target, theme)
+        finally:
+            _schema_key.reset(token)
+        return self._finish_fields(plan, schema, document, result)
     
     async def extract_document_async(
         self,
@@ -318,7 +565,125 @@ class HierarchicalExtractionPipeline:
             PipelineResult with extracted data and validation metrics
         """
         self.logger.info(f"Starting async extraction for: {document.filename}")
-        return await self._extraction_executor.extract_async(document, schema, theme)
+        if self.field_groups:
+            return await self.extract_document_grouped_async(document, schema, theme)
+        return await self._extract_async(document, schema, theme)
+    
+    async def _extract_async(
+        self,
+        document: ParsedDocument,
+        schema: Type[T],
+        theme: str,
+        shared: Optional[SharedContext] = None,
+    ) -> PipelineResult:
+        """Field cache, schema-scoped duplicate check and extraction for one schema."""
+        plan = self._plan_fields(document, schema, theme)
+        if plan is not None and plan.complete:
+            self.logger.info(f"  ✓ All {len(plan.cached)} fields cached for {document.filename}")
+            return merge_cached_fields(plan, schema, document)
+        
+        target = self._target_schema(schema, plan)
+        token = _schema_key.set(self._schema_key_for(target, theme))
+        try:
+            result = await self._extraction_executor.extract_async(document, target, theme, shared=shared)
+        finally:
+            _schema_key.reset(token)
+        return self._finish_fields(plan, schema, document, result)
+    
+    async def extract_document_chunked_async(
+        self,
+        document: ParsedDocument,
+        schemas: List[Type[BaseModel]],
+        theme: str,
+    ) -> PipelineResult:
+        """
+        Extract several schema chunks from one document concurrently.
+        
+        Filtering, relevance classification and context building run once
+        per document (against the union of the chunks' fields). Every chunk
+        then runs its own field-cache lookup, duplicate check and validation
+        loop over that shared context at the same time, so wall time tracks
+        the slowest chunk rather than the sum of all chunks.
+        
+        Args:
+            document: Parsed document to extract from
+            schemas: Schema chunk models (e.g. from chunk_schema)
+            theme: Meta-analysis theme
+            
+        Returns:
+            PipelineResult with chunk data merged by merge_extraction_results
+        """
+        self.logger.info(
+            f"Starting chunked extraction for: {document.filename} ({len(schemas)} schema chunks)"
+        )
+        shared = SharedContext(
+            lambda: self._extraction_executor.prepare_shared_context_async(document, schemas, theme)
+        )
+        with self._pinned_signature(document):
+            results = await asyncio.gather(
+                *(self._extract_async(document, schema, theme, shared) for schema in schemas)
+            )
+        return merge_pipeline_results(list(results))
+    
+    def _retrieval_index(self, document: ParsedDocument) -> Dict[str, Any]:
+        """Filter a document's chunks and index them for field-group retrieval."""
+        warnings = []
+        filtered_chunks, filter_stats = self._filter_chunks(document, warnings)
+        return {"index": ChunkIndex(filtered_chunks), "filter_stats": filter_stats, "warnings": warnings}
+    
+    async def extract_document_grouped_async(
+        self,
+        document: ParsedDocument,
+        schema: Type[T],
+        theme: str,
+        top_k: Optional[int] = None,
+    ) -> PipelineResult:
+        """
+        Extract a schema group by group, each from its own retrieved chunks.
+        
+        Fields are grouped by topic (group_fields), the filtered chunks are
+        indexed once per document (BM25, no LLM relevance classification),
+        and every group is extracted concurrently from only its top_k
+        chunks. Each group runs its own field-cache lookup, duplicate check
+        and validation loop. Schemas that form a single group, and
+        documents with no more than top_k chunks (every group would see
+        the whole paper), are extracted as usual.
+        
+        Args:
+            document: Parsed document to extract from
+            schema: Pydantic schema defining extraction fields
+            theme: Meta-analysis theme
+            top_k: Chunks retrieved per group (default: FIELD_GROUP_TOP_K)
+            
+        Returns:
+            PipelineResult with group data merged in schema field order
+        """
+        top_k = top_k or settings.FIELD_GROUP_TOP_K
+        groups = group_fields(schema)
+        if len(groups) < 2 or len(document.chunks) <= top_k:
+            return await self._extract_async(document, schema, theme)
+        
+        self.logger.info(
+            f"  Field groups: {', '.join(f'{g.name} ({len(g.fields)})' for g in groups)}; top {top_k} chunks each"
+        )
+        index = SharedContext(lambda: asyncio.to_thread(self._retrieval_index, document))
+        contexts = [
+            SharedContext(
+                lambda group=group: self._extraction_executor.prepare_group_context_async(
+                    document, group.schema, group.query, top_k, index
+                )
+            )
+            for group in groups
+        ]
+        with self._pinned_signature(document):
+            results = await asyncio.gather(
+                *(self._extract_async(document, group.schema, theme, context)
+                  for group, context in zip(groups, contexts))
+            )
+        merged = merge_pipeline_results(list(results))
+        order = {name: i for i, name in enumerate(schema.model_fields)}
+        final_data = dict(sorted(merged.final_data.items(), key=lambda item: order.get(item[0], len(order))))
+        return dataclasses.replace(merged, final_data=final_data)
     
     def extract_from_text(
         self,
@@ -1,6 +1,6 @@
 """
 Extraction module exports.
 """
-from .executor import ExtractionExecutor
+from .executor import ExtractionExecutor, SharedContext
 
-__all__ = ['ExtractionExecutor']
+__all__ = ['ExtractionExecutor', 'SharedContext']
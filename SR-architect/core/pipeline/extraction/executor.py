@@ -3,7 +3,8 @@ Extraction executor with dependency injection.
 
 Orchestrates extraction with explicit dependencies to avoid circular imports.
 """
-from typing import Type, TypeVar, Callable, Optional, Any, Dict, List
+import asyncio
+from typing import Awaitable, Type, TypeVar, Callable, Optional, Any, Dict, List
 from pydantic import BaseModel
 from core.parser import ParsedDocument
 from core.config import settings
@@ -11,6 +12,24 @@ from core.config import settings
 T = TypeVar('T', bound=BaseModel)
 
 
+class SharedContext:
+    """
+    Extraction context prepared once per document for several schema chunks.
+    
+    Preparation (filter, classify, build context) starts when the first
+    chunk needs it; concurrent chunks await the same task.
+    """
+    
+    def __init__(self, prepare: Callable[[], Awaitable[Dict[str, Any]]]):
+        self._prepare = prepare
+        self._task: Optional[asyncio.Future] = None
+    
+    async def get(self) -> Dict[str, Any]:
+        if self._task is None:
+            self._task = asyncio.ensure_future(self._prepare())
+        return await self._task
+
+
 class ExtractionExecutor:
     """
     Extraction orchestrator with explicit dependencies.
@@ -39,6 +58,9 @@ class ExtractionExecutor:
         
         # Optional components
         quality_auditor=None,
+        filter_and_classify_async: Optional[Callable] = None,
+        local_verifier=None,
+        context_packer=None,
     ):
         """
         Initialize with explicit dependencies.
@@ -60,6 +82,13 @@ class ExtractionExecutor:
             cache_result: Function to cache extraction results
             filter_and_classify: Function to filter and classify chunks
             quality_auditor: Optional quality auditor
+            filter_and_classify_async: Coroutine version of filter_and_classify
+                used by extract_async (falls back to running the sync one in
+                a worker thread)
+            local_verifier: Optional LocalEvidenceVerifier run before the
+                LLM checker
+            context_packer: Optional ContextPacker that builds the context
+                by token budget (default: stages.build_context)
         """
         self.extractor = extractor
         self.checker = checker
@@ -74,16 +103,25 @@ class ExtractionExecutor:
         self.check_duplicate = check_duplicate
         self.cache_result = cache_result
         self.filter_and_classify = filter_and_classify
+        self.filter_and_classify_async = filter_and_classify_async
         
-        # Optional components
         # Optional components
         self.quality_auditor = quality_auditor
+        self.local_verifier = local_verifier
+        self.context_packer = context_packer
         self.sentence_extractor = None
         
     def set_sentence_extractor(self, extractor):
         """Inject sentence extractor."""
         self.sentence_extractor = extractor
     
+    def _context_builder(self) -> Callable:
+        """Context builder injected into the stage functions."""
+        if self.context_packer is not None:
+            return self.context_packer.build_context
+        from core.pipeline.stages import build_context
+        return build_context
+    
     def _prepare_context(
         self, 
         document: ParsedDocument, 
@@ -101,16 +139,123 @@ class ExtractionExecutor:
         Returns:
             Context dict with all preparation data
         """
-        from core.pipeline.stages import prepare_extraction_context, build_context
+        from core.pipeline.stages import prepare_extraction_context
         
         return prepare_extraction_context(
             document, schema, theme,
             self.compute_fingerprint,
             self.check_duplicate,
             self.filter_and_classify,
-            build_context
+            self._context_builder()
+        )
+    
+    async def _prepare_context_async(
+        self, 
+        document: ParsedDocument, 
+        schema: Type[T], 
+        theme: str
+    ) -> Dict[str, Any]:
+        """
+        Async context preparation that never blocks the event loop.
+        
+        Uses the injected async filter/classify function when available;
+        otherwise the sync preparation runs in a worker thread.
+        
+        Returns:
+            Context dict with all preparation data
+        """
+        if self.filter_and_classify_async is None:
+            return await asyncio.to_thread(self._prepare_context, document, schema, theme)
+        
+        from core.pipeline.stages import prepare_extraction_context_async
+        
+        return await prepare_extraction_context_async(
+            document, schema, theme,
+            self.compute_fingerprint,
+            self.check_duplicate,
+            self.filter_and_classify_async,
+            self._context_builder()
         )
     
+    async def prepare_shared_context_async(
+        self,
+        document: ParsedDocument,
+        schemas: List[Type[BaseModel]],
+        theme: str
+    ) -> Dict[str, Any]:
+        """
+        Prepare one context for all schema chunks of a document.
+        
+        Args:
+            document: Parsed document
+            schemas: Schema chunk models
+            theme: Extraction theme
+            
+        Returns:
+            Context dict with all preparation data
+        """
+        from core.pipeline.stages import prepare_shared_extraction_context_async
+        
+        filter_and_classify = self.filter_and_classify_async
+        if filter_and_classify is None:
+            async def filter_and_classify(*args):
+                return await asyncio.to_thread(self.filter_and_classify, *args)
+        
+        return await prepare_shared_extraction_context_async(
+            document, schemas, theme,
+            self.compute_fingerprint,
+            filter_and_classify,
+            self._context_builder()
+        )
+    
+    async def prepare_group_context_async(
+        self,
+        document: ParsedDocument,
+        schema: Type[T],
+        query: List[str],
+        top_k: int,
+        index: SharedContext
+    ) -> Dict[str, Any]:
+        """
+        Prepare the context of one field group from retrieved chunks.
+        
+        Args:
+            document: Parsed document
+            schema: Group extraction schema
+            query: Retrieval terms of the group
+            top_k: Chunks to retrieve
+            index: Shared dict with the document's ChunkIndex ("index"),
+                "filter_stats" and "warnings"
+            
+        Returns:
+            Context dict with all preparation data
+        """
+        from core.pipeline.stages import prepare_retrieved_context
+        
+        retrieval = await index.get()
+        return prepare_retrieved_context(
+            retrieval["index"], query, top_k, schema,
+            retrieval["filter_stats"],
+            retrieval["warnings"],
+            self.compute_fingerprint(document.full_text),
+            self._context_builder()
+        )
+    
+    async def _context_from_shared(
+        self,
+        document: ParsedDocument,
+        schema: Type[T],
+        shared: SharedContext
+    ) -> Dict[str, Any]:
+        """Duplicate check for this schema, then the shared context narrowed to its fields."""
+        from core.pipeline.stages import narrow_shared_context
+        
+        fingerprint = self.compute_fingerprint(document.full_text)
+        cached = self.check_duplicate(fingerprint)
+        if cached:
+            return {"cached": cached, "fingerprint": fingerprint}
+        return narrow_shared_context(await shared.get(), schema, fingerprint)
+    
     def _apply_regex(
         self, 
         context: str, 
@@ -183,6 +328,7 @@ class ExtractionExecutor:
             theme=theme,
             logger=self.logger,
             quality_auditor=self.quality_auditor,
+            local_verifier=self.local_verifier,
         )
         
         # Cache result
@@ -193,7 +339,8 @@ class ExtractionExecutor:
         self, 
         document: ParsedDocument, 
         schema: Type[T], 
-        theme: str
+        theme: str,
+        shared: Optional[SharedContext] = None
     ) -> Any:  # PipelineResult
         """
         Async extraction - same structure, async I/O.
@@ -202,14 +349,19 @@ class ExtractionExecutor:
             document: Parsed document
             schema: Extraction schema
             theme: Extraction theme
+            shared: Context shared with the document's other schema chunks
+                (prepared once instead of per schema)
             
         Returns:
             PipelineResult with extraction data
         """
         from core.pipeline.extraction.validation import run_validation_loop_async
         
-        # Prepare context (pure function - REUSED!)
-        ctx = self._prepare_context(document, schema, theme)
+        # Prepare context (async relevance classification)
+        if shared is None:
+            ctx = await self._prepare_context_async(document, schema, theme)
+        else:
+            ctx = await self._context_from_shared(document, schema, shared)
         
         # Check cache
         if ctx.get("cached"):
@@ -282,6 +434,7 @@ class ExtractionExecutor:
             theme=theme,
             logger=self.logger,
             quality_auditor=self.quality_auditor,
+            local_verifier=self.local_verifier,
         )
         
         # Cache result
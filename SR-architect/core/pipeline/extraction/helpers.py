@@ -5,6 +5,7 @@ from typing import Any, List, Optional
 from datetime import datetime
 from core.data_types import PipelineResult, IterationRecord
 from core.parser import ParsedDocument
+from core.schema_chunker import merge_extraction_results
 
 
 def build_pipeline_result(
@@ -35,6 +36,8 @@ def build_pipeline_result(
         passed = check_result.passed
     
     evidence_dicts = [e.model_dump() if hasattr(e, 'model_dump') else e for e in extraction.evidence]
+    metadata = getattr(extraction, "extraction_metadata", None)
+    verification = metadata.get("verification", {}) if isinstance(metadata, dict) else {}
     
     return PipelineResult(
         source_filename=document.filename,
@@ -49,6 +52,7 @@ def build_pipeline_result(
         content_filter_stats={},
         relevance_stats={},
         warnings=[],
+        field_verification=verification,
         extraction_timestamp=datetime.now().isoformat(),
     )
 
@@ -84,3 +88,43 @@ def build_failed_result(
         warnings=[error_message],
         extraction_timestamp=datetime.now().isoformat(),
     )
+
+
+def merge_pipeline_results(results: List[PipelineResult]) -> PipelineResult:
+    """
+    Merge results of schema chunks extracted from the same document.
+    
+    Data is merged with merge_extraction_results; evidence, iteration
+    history, warnings and field verification are combined, scores are
+    averaged and validation passes only if every chunk passed.
+    
+    Args:
+        results: Per-chunk PipelineResults, in schema chunk order
+        
+    Returns:
+        Single PipelineResult covering all chunk fields
+    """
+    if len(results) == 1:
+        return results[0]
+    
+    count = len(results)
+    verification = {}
+    for result in results:
+        verification.update(result.field_verification)
+    
+    return PipelineResult(
+        source_filename=results[0].source_filename,
+        final_data=merge_extraction_results([r.final_data for r in results]),
+        evidence=[item for r in results for item in r.evidence],
+        passed_validation=all(r.passed_validation for r in results),
+        final_overall_score=sum(r.final_overall_score for r in results) / count,
+        final_accuracy_score=sum(r.final_accuracy_score for r in results) / count,
+        final_consistency_score=sum(r.final_consistency_score for r in results) / count,
+        iterations=max(r.iterations for r in results),
+        iteration_history=[record for r in results for record in r.iteration_history],
+        content_filter_stats=results[0].content_filter_stats,
+        relevance_stats=results[0].relevance_stats,
+        warnings=list(dict.fromkeys(w for r in results for w in r.warnings)),
+        field_verification=verification,
+        extraction_timestamp=max(r.extraction_timestamp for r in results),
+    )
@@ -9,6 +9,8 @@ from pydantic import BaseModel
 from core.parser import ParsedDocument
 from core.data_types import IterationRecord
 
+from core import constants
+
 # Constants
 QUALITY_AUDIT_PENALTY = 0.8  # Score penalty for failed quality audit
 
@@ -18,6 +20,7 @@ def _process_iteration_result(
     check_result,
     quality_auditor,
     iteration: int,
+    audit_fields: Optional[List[str]] = None,
 ) -> IterationRecord:
     """
     Process iteration result with quality audit.
@@ -30,13 +33,17 @@ def _process_iteration_result(
         check_result: Checker result to potentially modify
         quality_auditor: Optional quality auditor
         iteration: Current iteration number (0-indexed)
+        audit_fields: Only audit these fields (None audits all evidence)
         
     Returns:
         IterationRecord for this iteration
     """
+    evidence_dicts = [evidence_item.model_dump() for evidence_item in extraction.evidence]
+    if audit_fields is not None:
+        evidence_dicts = [e for e in evidence_dicts if e.get("field_name") in audit_fields]
+    
     # Apply quality audit if available
-    if quality_auditor:
-        evidence_dicts = [evidence_item.model_dump() for evidence_item in extraction.evidence]
+    if quality_auditor and evidence_dicts:
         audit_report = quality_auditor.audit_extraction(extraction.data, evidence_dicts)
         if not audit_report.passed:
             check_result.overall_score *= QUALITY_AUDIT_PENALTY
@@ -61,6 +68,59 @@ def _process_iteration_result(
     )
 
 
+def _checker_weights(checker) -> tuple:
+    accuracy = getattr(checker, "accuracy_weight", None)
+    consistency = getattr(checker, "consistency_weight", None)
+    if not isinstance(accuracy, (int, float)) or not isinstance(consistency, (int, float)):
+        return constants.VALIDATION_WEIGHT_COMPLETENESS, constants.VALIDATION_WEIGHT_ACCURACY
+    return accuracy, consistency
+
+
+def _verify_locally(local_verifier, document: ParsedDocument, context: str, extraction, evidence_dicts, logger):
+    """
+    Verify evidence locally and record spans on the extraction.
+    
+    Quotes are resolved against the document's full text (falling back to
+    the context), so evidence start_char/end_char are document offsets.
+    
+    Returns:
+        VerificationReport, or None when no verifier is configured
+    """
+    if local_verifier is None:
+        return None
+    
+    source_text = document.full_text or context
+    report = local_verifier.verify(source_text, extraction.data, evidence_dicts)
+    
+    for item in extraction.evidence:
+        result = report.fields.get(item.field_name)
+        if result is None or result.span is None or item.start_char is not None:
+            continue
+        item.start_char, item.end_char = result.span
+        for chunk_index, chunk in enumerate(document.chunks):
+            if chunk.start is not None and chunk.start <= item.start_char < chunk.end:
+                item.chunk_index = chunk_index
+                if item.page_number is None and chunk.page_number is not None:
+                    item.page_number = chunk.page_number
+                break
+    
+    if isinstance(extraction.extraction_metadata, dict):
+        extraction.extraction_metadata["verification"] = report.to_dict()
+    logger.info(f"    Local verification: {len(report.verified)}/{len(report.fields)} fields verified")
+    return report
+
+
+def _unverified_subset(report, data: Dict[str, Any], evidence_dicts: List[Dict[str, Any]]) -> tuple:
+    """Data and evidence restricted to fields that failed local verification (all of them if none verified)."""
+    if report is None or not report.verified:
+        return data, evidence_dicts
+    failed = set(report.failed)
+    return (
+        {name: value for name, value in data.items() if name in failed},
+        [e for e in evidence_dicts if e.get("field_name") in failed],
+    )
+
+
 def run_validation_loop(
     context: str,
     schema: Type[BaseModel],
@@ -75,6 +135,7 @@ def run_validation_loop(
     logger,
     regex_extractor=None,
     quality_auditor=None,
+    local_verifier=None,
 ) -> Any:  # PipelineResult (avoid circular import)
     """
     Validation loop logic - sync version.
@@ -93,6 +154,8 @@ def run_validation_loop(
         logger: Logger instance
         regex_extractor: Optional regex extractor
         quality_auditor: Optional quality auditor
+        local_verifier: Optional LocalEvidenceVerifier; fields it verifies
+            skip the LLM checker and auditor
         
     Returns:
         PipelineResult with extraction data
@@ -130,19 +193,28 @@ def run_validation_loop(
             )
             continue
         
-        # Validate (sync I/O)
+        # Verify locally, then send only unverified fields to the LLM checker (sync I/O)
         evidence_dicts = [evidence_item.model_dump() for evidence_item in extraction.evidence]
-        check_result = checker.check(
-            relevant_chunks,
-            extraction.data,
-            evidence_dicts,
-            theme,
-            threshold=score_threshold
-        )
+        report = _verify_locally(local_verifier, document, context, extraction, evidence_dicts, logger)
+        weights = _checker_weights(checker)
+        if report is not None and not report.needs_checker:
+            check_result = report.to_checker_result(score_threshold, *weights)
+        else:
+            data, evidence = _unverified_subset(report, extraction.data, evidence_dicts)
+            check_result = checker.check(
+                relevant_chunks,
+                data,
+                evidence,
+                theme,
+                threshold=score_threshold
+            )
+            if report is not None:
+                check_result = report.to_checker_result(score_threshold, *weights, checker_result=check_result)
         
         # Process iteration result (apply audit, create record)
         iteration_record = _process_iteration_result(
-            extraction, check_result, quality_auditor, iteration
+            extraction, check_result, quality_auditor, iteration,
+            audit_fields=report.failed if report is not None and report.verified else None,
         )
         iteration_history.append(iteration_record)
         
@@ -192,6 +264,7 @@ async def run_validation_loop_async(
     logger,
     regex_extractor=None,
     quality_auditor=None,
+    local_verifier=None,
 ) -> Any:  # PipelineResult (avoid circular import)
     """
     Validation loop logic - async version.
@@ -231,19 +304,28 @@ async def run_validation_loop_async(
             )
             continue
         
-        # Validate (async I/O)
+        # Verify locally, then send only unverified fields to the LLM checker (async I/O)
         evidence_dicts = [evidence_item.model_dump() for evidence_item in extraction.evidence]
-        check_result = await checker.check_async(
-            relevant_chunks,
-            extraction.data,
-            evidence_dicts,
-            theme,
-            threshold=score_threshold
-        )
+        report = _verify_locally(local_verifier, document, context, extraction, evidence_dicts, logger)
+        weights = _checker_weights(checker)
+        if report is not None and not report.needs_checker:
+            check_result = report.to_checker_result(score_threshold, *weights)
+        else:
+            data, evidence = _unverified_subset(report, extraction.data, evidence_dicts)
+            check_result = await checker.check_async(
+                relevant_chunks,
+                data,
+                evidence,
+                theme,
+                threshold=score_threshold
+            )
+            if report is not None:
+                check_result = report.to_checker_result(score_threshold, *weights, checker_result=check_result)
         
         # Process iteration result (apply audit, create record)
         iteration_record = _process_iteration_result(
-            extraction, check_result, quality_auditor, iteration
+            extraction, check_result, quality_auditor, iteration,
+            audit_fields=report.failed if report is not None and report.verified else None,
         )
         iteration_history.append(iteration_record)
         
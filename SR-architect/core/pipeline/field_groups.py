@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Semantic grouping of schema fields for per-group extraction.
+
+Assigns each field of an extraction schema to a topical module (by default
+the sub-schemas in schemas/dpm_modular.py: imaging, pathology, outcomes,
+...) by exact field name or by the words its name and description share
+with the module. Each group gets a reduced schema and a retrieval query,
+so it can be extracted from only the chunks that discuss its topic.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Set, Type
+
+from pydantic import BaseModel
+
+from core import constants
+from core.chunk_index import STOPWORDS, index_terms, stem
+from .incremental import reduced_schema
+
+GENERAL_GROUP = "general"
+
+# Words shared by fields of every module, useless for telling groups apart
+GENERIC_TERMS = {
+    "narrative", "full", "present", "type", "status", "other", "total", "number",
+    "details", "described", "reported", "quote", "schema", "e", "g",
+}
+
+
+@dataclass
+class FieldGroup:
+    """Fields extracted together from one retrieved context."""
+    name: str
+    fields: List[str]  # data fields, with their "_quote" companions
+    query: List[str] = field(default_factory=list)  # retrieval terms
+    schema: Optional[Type[BaseModel]] = None  # group fields plus metadata fields
+
+
+def _snake(class_name: str) -> str:
+    words = re.findall(r"[A-Z][a-z0-9]*", class_name.replace("Schema", ""))
+    return "_".join(w.lower() for w in words) or class_name.lower()
+
+
+def _words(text: str) -> Set[str]:
+    return {w for w in index_terms(text.replace("_", " ")) if w not in GENERIC_TERMS}
+
+
+def _overlap(words: Set[str], vocabulary: Set[str]) -> float:
+    """Words found in the vocabulary; long words contained in one another
+    ("histopathology" / "pathology") count half."""
+    count = 0.0
+    for word in words:
+        if word in vocabulary:
+            count += 1
+        elif len(word) >= 5 and any(len(v) >= 5 and (v in word or word in v) for v in vocabulary):
+            count += 0.5
+    return count
+
+
+class _Module:
+    """Vocabulary of one topical sub-schema."""
+
+    def __init__(self, model: Type[BaseModel]):
+        self.name = _snake(model.__name__)
+        self.fields = set(model.model_fields)
+        self.name_words = _words(self.name)
+        self.description_words: Set[str] = set()
+        for name, info in model.model_fields.items():
+            self.name_words |= _words(name)
+            self.description_words |= _words(info.description or "")
+
+    def score(self, name_words: Set[str], description_words: Set[str]) -> float:
+        return (
+            _overlap(name_words, self.name_words)
+            + constants.FIELD_GROUP_DESCRIPTION_WEIGHT * _overlap(description_words, self.description_words)
+        )
+
+
+def default_modules() -> List[Type[BaseModel]]:
+    """Topical sub-schemas used for grouping when none are given."""
+    from schemas.dpm_modular import (
+        AssociatedConditionsSchema,
+        DemographicsSchema,
+        DiagnosticApproachSchema,
+        ImagingSchema,
+        ImmunohistochemistrySchema,
+        OutcomesSchema,
+        PathologySchema,
+        StudyMetadataSchema,
+        SymptomsSchema,
+    )
+    return [
+        StudyMetadataSchema, DemographicsSchema, SymptomsSchema, AssociatedConditionsSchema,
+        ImagingSchema, PathologySchema, ImmunohistochemistrySchema, DiagnosticApproachSchema,
+        OutcomesSchema,
+    ]
+
+
+def _library_keywords() -> Dict[str, List[str]]:
+    try:
+        from core.classification.embedding import library_specs
+        return {name: spec.high_confidence_keywords or [] for name, spec in library_specs().items()}
+    except Exception:
+        return {}
+
+
+def group_query(schema: Type[BaseModel], fields: Sequence[str], group_name: str = "") -> List[str]:
+    """
+    Retrieval terms for a group: field name and description words, FieldLibrary
+    keywords and the group name.
+    """
+    keywords = _library_keywords()
+    terms = _words(group_name)
+    for name in fields:
+        if name.endswith("_quote"):
+            continue
+        terms |= _words(name)
+        terms |= _words(schema.model_fields[name].description or "")
+        for keyword in keywords.get(name, []):
+            terms |= _words(keyword)
+    return sorted(t for t in terms if len(t) > 1 and t not in STOPWORDS)
+
+
+def group_fields(
+    schema: Type[BaseModel],
+    modules: Optional[Sequence[Type[BaseModel]]] = None,
+    min_fields: int = constants.FIELD_GROUP_MIN_FIELDS,
+) -> List[FieldGroup]:
+    """
+    Split a schema's fields into semantic groups.
+
+    A field joins the module that defines a field of the same name,
+    otherwise the module whose field names (and, at lower weight,
+    descriptions) share the most words with it. Unmatched fields, and
+    groups smaller than min_fields, form the general group. "_quote"
+    fields follow their base field; metadata fields are added to every
+    group's schema.
+
+    Args:
+        schema: Extraction schema
+        modules: Topical sub-schemas (default: schemas.dpm_modular)
+        min_fields: Minimum data fields for a group of its own
+
+    Returns:
+        Groups in module order, general group last
+    """
+    module_list = [_Module(m) for m in (modules if modules is not None else default_modules())]
+    names = list(schema.model_fields)
+    data_fields = [
+        n for n in names
+        if n not in constants.METADATA_FIELDS and not (n.endswith("_quote") and n[:-len("_quote")] in names)
+    ]
+
+    assigned: Dict[str, List[str]] = {m.name: [] for m in module_list}
+    assigned[GENERAL_GROUP] = []
+    for name in data_fields:
+        target = next((m.name for m in module_list if name in m.fields), None)
+        if target is None:
+            name_words = _words(name)
+            description_words = _words(schema.model_fields[name].description or "")
+            best = max(module_list, key=lambda m: m.score(name_words, description_words), default=None)
+            if best is not None and best.score(name_words, description_words) > 0:
+                target = best.name
+        assigned[target or GENERAL_GROUP].append(name)
+
+    for group_name in list(assigned):
+        if group_name != GENERAL_GROUP and 0 < len(assigned[group_name]) < min_fields:
+            assigned[GENERAL_GROUP].extend(assigned.pop(group_name))
+
+    metadata = [n for n in names if n in constants.METADATA_FIELDS]
+    groups = []
+    for group_name, members in assigned.items():
+        if not members:
+            continue
+        # Keep schema order; quote companions follow their base field
+        member_set = set(members)
+        fields = [n for n in names if n in member_set or (n.endswith("_quote") and n[:-len("_quote")] in member_set)]
+        groups.append(FieldGroup(
+            name=group_name,
+            fields=fields,
+            query=group_query(schema, fields, "" if group_name == GENERAL_GROUP else group_name),
+            schema=reduced_schema(schema, fields + metadata, name=f"{schema.__name__}_{group_name}"),
+        ))
+    return groups
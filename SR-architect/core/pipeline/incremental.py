@@ -0,0 +1,244 @@
+"""
+Field-level incremental extraction.
+
+Diffs a schema against field values cached in CacheManager's
+extraction_cache table, so only missing or changed fields are sent to the
+extractor. Each field is versioned by a hash of its JSON-schema definition,
+the theme, the model, the prompts and the validation settings: editing one
+field's description re-extracts that field only, and adding a column costs
+one reduced extraction per paper. Documents are keyed by a hash of their
+full text. Only values from validated extractions are cached, and the
+pipeline reads them back only when resuming.
+"""
+import dataclasses
+import hashlib
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Type
+
+from pydantic import BaseModel, create_model
+
+from core.data_types import PipelineResult
+from core.parser import ParsedDocument
+
+# Bump to invalidate every cached field value (e.g. after prompt changes)
+FIELD_CACHE_VERSION = 1
+LLM_TIER = 1
+
+
+def field_versions(
+    schema: Type[BaseModel],
+    theme: str,
+    model: str,
+    score_threshold: Optional[float] = None,
+    max_iterations: Optional[int] = None,
+    prompt_version: str = "",
+) -> Dict[str, int]:
+    """
+    Version number per schema field, derived from its definition.
+
+    Args:
+        schema: Extraction schema
+        theme: Extraction theme
+        model: Extraction model name
+        score_threshold: Validation score threshold
+        max_iterations: Maximum checker feedback iterations
+        prompt_version: Digest of the extraction prompts
+
+    Returns:
+        Dict of field name -> 60-bit integer version
+    """
+    json_schema = schema.model_json_schema()
+    properties = json_schema.get("properties", {})
+    definitions = json_schema.get("$defs", {})
+
+    versions = {}
+    for name in schema.model_fields:
+        definition = json.dumps(properties.get(name, {}), sort_keys=True)
+        # Nested models are referenced, so include the definitions they point to
+        referenced = {
+            key: value for key, value in definitions.items()
+            if f"#/$defs/{key}" in definition
+        }
+        payload = json.dumps(
+            [
+                FIELD_CACHE_VERSION, name, definition, referenced, theme, model,
+                score_threshold, max_iterations, prompt_version,
+            ],
+            sort_keys=True,
+        )
+        versions[name] = int(hashlib.sha256(payload.encode()).hexdigest()[:15], 16)
+    return versions
+
+
+def reduced_schema(
+    schema: Type[BaseModel], fields: List[str], name: Optional[str] = None
+) -> Type[BaseModel]:
+    """
+    Build a Pydantic model containing only the given fields of a schema.
+
+    Field types, defaults and descriptions are copied; model-level
+    validators of the original schema are not. The model is named
+    ``name`` (default: "<schema>Delta").
+    """
+    definitions = {
+        name: (info.annotation, info)
+        for name, info in schema.model_fields.items()
+        if name in fields
+    }
+    return create_model(
+        name or f"{schema.__name__}Delta",
+        __doc__=schema.__doc__,
+        __module__=schema.__module__,
+        **definitions,
+    )
+
+
+@dataclass
+class FieldPlan:
+    """Cached and missing fields of one document for one schema."""
+    doc_hash: str
+    versions: Dict[str, int]
+    cached: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    missing: List[str] = field(default_factory=list)
+
+    @property
+    def complete(self) -> bool:
+        return not self.missing
+
+
+def plan_fields(
+    cache,  # CacheManager (avoid circular import)
+    document: ParsedDocument,
+    schema: Type[BaseModel],
+    theme: str,
+    model: str,
+    score_threshold: Optional[float] = None,
+    max_iterations: Optional[int] = None,
+    prompt_version: str = "",
+    refresh: bool = False,
+) -> FieldPlan:
+    """
+    Split a schema's fields into cached and missing for a document.
+
+    Args:
+        cache: CacheManager holding the extraction_cache table
+        document: Parsed document
+        schema: Requested extraction schema
+        theme: Extraction theme
+        model: Extraction model name
+        score_threshold: Validation score threshold
+        max_iterations: Maximum checker feedback iterations
+        prompt_version: Digest of the extraction prompts
+        refresh: Ignore cached values and extract every field
+
+    Returns:
+        FieldPlan with cached entries and the fields still to extract
+    """
+    plan = FieldPlan(
+        doc_hash=hashlib.sha256(document.full_text.encode("utf-8")).hexdigest(),
+        versions=field_versions(
+            schema, theme, model, score_threshold, max_iterations, prompt_version
+        ),
+    )
+    for name, version in plan.versions.items():
+        entry = None if refresh else cache.get_field(plan.doc_hash, name, version)
+        # Values from failed validations are never reused
+        if entry is None or not entry["result"].get("passed"):
+            plan.missing.append(name)
+        else:
+            plan.cached[name] = {**entry["result"], "overall": entry["confidence"]}
+    return plan
+
+
+def store_fields(
+    cache,  # CacheManager (avoid circular import)
+    plan: FieldPlan,
+    result: PipelineResult,
+    fields: List[str],
+    logger=None,
+) -> None:
+    """
+    Cache the extracted value and evidence of each field.
+
+    Failed extractions (no data, or not validated) are not cached, so they
+    are retried.
+    """
+    if not result.final_data or not result.passed_validation:
+        return
+    for name in fields:
+        if name not in result.final_data:
+            continue
+        entry = {
+            "value": result.final_data[name],
+            "evidence": [e for e in result.evidence if e.get("field_name") == name],
+            "accuracy": result.final_accuracy_score,
+            "consistency": result.final_consistency_score,
+            "passed": result.passed_validation,
+        }
+        try:
+            cache.set_field(
+                plan.doc_hash,
+                name,
+                entry,
+                schema_version=plan.versions[name],
+                tier_used=LLM_TIER,
+                confidence=result.final_overall_score,
+            )
+        except (TypeError, ValueError) as e:
+            # Values that are not JSON-serializable are simply not cached
+            if logger:
+                logger.warning(f"  Could not cache field {name}: {e}")
+
+
+def _ordered(schema: Type[BaseModel], data: Dict[str, Any]) -> Dict[str, Any]:
+    ordered = {name: data[name] for name in schema.model_fields if name in data}
+    ordered.update({key: value for key, value in data.items() if key not in ordered})
+    return ordered
+
+
+def merge_cached_fields(
+    plan: FieldPlan,
+    schema: Type[BaseModel],
+    document: ParsedDocument,
+    result: Optional[PipelineResult] = None,
+) -> PipelineResult:
+    """
+    Combine cached field values with a fresh extraction of the missing fields.
+
+    Args:
+        plan: Field plan for the document
+        schema: Full requested schema
+        document: Parsed document
+        result: Extraction of the missing fields (None if all were cached)
+
+    Returns:
+        PipelineResult covering every schema field
+    """
+    cached_data = {name: entry["value"] for name, entry in plan.cached.items()}
+    cached_evidence = [e for entry in plan.cached.values() for e in entry["evidence"]]
+    note = f"Reused {len(plan.cached)} cached field(s), extracted {len(plan.missing)}"
+
+    if result is not None:
+        return dataclasses.replace(
+            result,
+            final_data=_ordered(schema, {**cached_data, **result.final_data}),
+            evidence=cached_evidence + result.evidence,
+            warnings=result.warnings + [note],
+        )
+
+    entries = list(plan.cached.values())
+    count = max(len(entries), 1)
+    return PipelineResult(
+        final_data=_ordered(schema, cached_data),
+        evidence=cached_evidence,
+        final_accuracy_score=sum(entry["accuracy"] for entry in entries) / count,
+        final_consistency_score=sum(entry["consistency"] for entry in entries) / count,
+        final_overall_score=sum(entry["overall"] for entry in entries) / count,
+        passed_validation=all(entry["passed"] for entry in entries),
+        iterations=0,
+        warnings=[note],
+        source_filename=document.filename,
+        extraction_timestamp=datetime.now().isoformat(),
+    )
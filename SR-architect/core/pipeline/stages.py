@@ -13,13 +13,23 @@ from core import constants
 T = TypeVar('T', bound=BaseModel)
 
 
-def build_context(chunks: List[DocumentChunk], max_chars: int = None) -> str:
+def build_context(
+    chunks: List[DocumentChunk],
+    max_chars: int = None,
+    schema_fields: Optional[List[str]] = None,
+    scores: Optional[List[float]] = None,
+) -> str:
     """
     Pure function: Build extraction context from chunks.
     
+    Takes chunks in document order up to a character limit. See
+    ContextPacker.build_context for the token-budgeted alternative.
+    
     Args:
         chunks: List of document chunks
         max_chars: Maximum characters to include
+        schema_fields: Unused (accepted for ContextPacker compatibility)
+        scores: Unused (accepted for ContextPacker compatibility)
         
     Returns:
         Concatenated context string
@@ -82,14 +92,158 @@ def prepare_extraction_context(
         return {"cached": cached, "fingerprint": fingerprint}
     
     # Extract schema fields
-    schema_fields = list(schema.model_fields.keys()) if hasattr(schema, 'model_fields') else []
+    schema_fields = _schema_fields(schema)
     
     # Stage 1 & 2: Filter and classify
     relevant_chunks, filter_stats, relevance_stats, warnings = \
         filter_and_classify_fn(document, theme, schema_fields)
     
-    # Build context
-    context = build_context_fn(relevant_chunks)
+    return _assemble_context(
+        relevant_chunks, filter_stats, relevance_stats, warnings,
+        schema_fields, fingerprint, build_context_fn,
+    )
+
+
+async def prepare_extraction_context_async(
+    document: ParsedDocument,
+    schema: Type[T],
+    theme: str,
+    compute_fingerprint: Callable[[str], str],
+    check_duplicate: Callable[[str], Optional[Any]],
+    filter_and_classify_fn: Callable,
+    build_context_fn: Callable,
+) -> Dict[str, Any]:
+    """
+    Async counterpart of prepare_extraction_context.
+    
+    Identical except that filter_and_classify_fn is a coroutine function, so
+    relevance classification awaits the LLM instead of blocking the loop.
+    
+    Returns:
+        Same dict as prepare_extraction_context
+    """
+    fingerprint = compute_fingerprint(document.full_text)
+    cached = check_duplicate(fingerprint)
+    if cached:
+        return {"cached": cached, "fingerprint": fingerprint}
+    
+    schema_fields = _schema_fields(schema)
+    
+    relevant_chunks, filter_stats, relevance_stats, warnings = \
+        await filter_and_classify_fn(document, theme, schema_fields)
+    
+    return _assemble_context(
+        relevant_chunks, filter_stats, relevance_stats, warnings,
+        schema_fields, fingerprint, build_context_fn,
+    )
+
+
+async def prepare_shared_extraction_context_async(
+    document: ParsedDocument,
+    schemas: List[Type[BaseModel]],
+    theme: str,
+    compute_fingerprint: Callable[[str], str],
+    filter_and_classify_fn: Callable,
+    build_context_fn: Callable,
+) -> Dict[str, Any]:
+    """
+    Async context shared by several schema chunks of one document.
+    
+    Relevance is classified once against the union of the chunks' fields,
+    so each chunk sees every chunk relevant to any of them. Duplicate
+    checks are schema-specific and left to each chunk.
+    
+    Returns:
+        Same dict as prepare_extraction_context (never cached), with
+        schema_fields listing the union of fields
+    """
+    schema_fields = list(dict.fromkeys(f for schema in schemas for f in _schema_fields(schema)))
+    
+    relevant_chunks, filter_stats, relevance_stats, warnings = \
+        await filter_and_classify_fn(document, theme, schema_fields)
+    
+    return _assemble_context(
+        relevant_chunks, filter_stats, relevance_stats, warnings,
+        schema_fields, compute_fingerprint(document.full_text), build_context_fn,
+    )
+
+
+def narrow_shared_context(shared: Dict[str, Any], schema: Type[T], fingerprint: str) -> Dict[str, Any]:
+    """Copy of a shared context for one schema chunk (its own fields and fingerprint)."""
+    ctx = dict(shared)
+    ctx["schema_fields"] = _schema_fields(schema)
+    ctx["fingerprint"] = fingerprint
+    return ctx
+
+
+def prepare_retrieved_context(
+    index: Any,
+    query: List[str],
+    top_k: int,
+    schema: Type[T],
+    filter_stats: Any,
+    warnings: List[str],
+    fingerprint: str,
+    build_context_fn: Callable,
+) -> Dict[str, Any]:
+    """
+    Pure function: Context for one field group from its retrieved chunks.
+    
+    Takes the group's top_k chunks from a ChunkIndex (falling back to the
+    first chunks when none matches the query) in document order, and
+    scores them relative to the best hit for the context builder.
+    
+    Args:
+        index: ChunkIndex over the document's filtered chunks
+        query: Retrieval terms of the group
+        top_k: Maximum chunks to retrieve
+        schema: Group extraction schema
+        filter_stats: Content filtering statistics
+        warnings: Warnings from filtering (copied, not modified)
+        fingerprint: Document fingerprint
+        build_context_fn: Function to build context string
+    
+    Returns:
+        Same dict as prepare_extraction_context, with retrieval statistics
+        as relevance_stats
+    """
+    warnings = list(warnings)
+    hits = index.search(query, top_k)
+    if not hits:
+        warnings.append("No chunk matched the field group's terms - using the first chunks")
+        hits = [(i, 0.0) for i in range(min(top_k, len(index)))]
+    hits.sort()
+    
+    best = max(score for _, score in hits) or 1.0
+    relevance_stats = {
+        "retrieval": "bm25",
+        "total_chunks": len(index),
+        "relevant_chunks": len(hits),
+        "chunk_scores": [round(score / best, 3) for _, score in hits],
+    }
+    return _assemble_context(
+        [index.chunks[i] for i, _ in hits], filter_stats, relevance_stats, warnings,
+        _schema_fields(schema), fingerprint, build_context_fn,
+    )
+
+
+def _schema_fields(schema: Type[T]) -> List[str]:
+    """Field names of an extraction schema."""
+    return list(schema.model_fields.keys()) if hasattr(schema, 'model_fields') else []
+
+
+def _assemble_context(
+    relevant_chunks: List[DocumentChunk],
+    filter_stats: Any,
+    relevance_stats: Any,
+    warnings: List[str],
+    schema_fields: List[str],
+    fingerprint: str,
+    build_context_fn: Callable,
+) -> Dict[str, Any]:
+    """Build the context string and the preparation result dict."""
+    scores = relevance_stats.get("chunk_scores") if isinstance(relevance_stats, dict) else None
+    context = build_context_fn(relevant_chunks, schema_fields=schema_fields, scores=scores)
     
     return {
         "relevant_chunks": relevant_chunks,
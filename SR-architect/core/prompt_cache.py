@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Prompt layout helpers for provider-side prefix caching.
+
+Providers cache the longest prompt prefix they have seen recently
+(OpenAI and Gemini automatically, Anthropic at explicit cache_control
+breakpoints). Messages are therefore laid out stable-first: tools/schema,
+then instructions and few-shots in the system message, then the document
+text, and only then what changes between calls for the same document
+(pre-filled values, revision instructions, extracted data).
+"""
+
+from typing import Any, Dict, List, Optional, Union
+
+from core import constants
+from core.config import settings
+
+Content = Union[str, List[Dict[str, Any]]]
+
+
+def supports_cache_control(provider: str, model: Optional[str]) -> bool:
+    """Whether requests to this provider/model accept cache_control content parts."""
+    return (
+        settings.PROMPT_CACHE_HINTS
+        and provider == "openrouter"
+        and bool(model)
+        and model.startswith(constants.PROMPT_CACHE_CONTROL_PREFIXES)
+    )
+
+
+def cached_content(stable: str, volatile: str = "", cache_control: bool = False) -> Content:
+    """
+    Message content with a cacheable prefix.
+
+    Args:
+        stable: Text repeated across calls (cached up to its end)
+        volatile: Text that changes between calls, appended after it
+        cache_control: Emit content parts with a cache_control breakpoint
+            after the stable text instead of a plain string
+
+    Returns:
+        Plain string, or list of text content parts
+    """
+    if not cache_control:
+        return f"{stable}\n\n{volatile}" if volatile else stable
+    parts: List[Dict[str, Any]] = [
+        {"type": "text", "text": stable, "cache_control": {"type": "ephemeral"}}
+    ]
+    if volatile:
+        parts.append({"type": "text", "text": volatile})
+    return parts
+
+
+def content_text(content: Content) -> str:
+    """Plain text of message content built by cached_content."""
+    if isinstance(content, str):
+        return content
+    return "\n\n".join(part.get("text", "") for part in content)
@@ -3,6 +3,7 @@ import os
 import csv
 import asyncio
 import functools
+import threading
 from pathlib import Path
 from typing import List, Optional, Type, Dict, Any, Callable, TextIO
 
@@ -85,7 +86,10 @@ class ExtractionService:
         threshold: float, 
         max_iter: int, 
         examples: Optional[str], 
-        hybrid_mode: bool
+        hybrid_mode: bool,
+        evidence_mode: Optional[str] = None,
+        field_groups: Optional[bool] = None,
+        resume: bool = False,
     ) -> HierarchicalExtractionPipeline:
         """Initialize and configure the extraction pipeline."""
         pipeline = HierarchicalExtractionPipeline(
@@ -95,7 +99,13 @@ class ExtractionService:
             max_iterations=max_iter,
             verbose=self.verbose,
             examples=examples,
-            token_tracker=self.tracker
+            token_tracker=self.tracker,
+            relevance_cache=self._relevance_cache(),
+            fingerprint_store=self._fingerprint_store(),
+            field_cache=self._field_cache(),
+            evidence_mode=evidence_mode,
+            field_groups=field_groups,
+            resume=resume,
         )
         
         # COST-001: Enable hybrid mode for local-first extraction
@@ -105,6 +115,39 @@ class ExtractionService:
             
         return pipeline
 
+    def _relevance_cache(self) -> Optional[Any]:
+        """Persistent relevance cache, or None if disabled or unavailable."""
+        if not settings.RELEVANCE_CACHE_ENABLED:
+            return None
+        try:
+            from .cache import CacheManager
+            return CacheManager()
+        except Exception as e:
+            logger.warning(f"Relevance cache unavailable: {e}")
+            return None
+
+    def _field_cache(self) -> Optional[Any]:
+        """Persistent per-field extraction cache, or None if disabled or unavailable."""
+        if not settings.FIELD_CACHE_ENABLED:
+            return None
+        try:
+            from .cache import CacheManager
+            return CacheManager()
+        except Exception as e:
+            logger.warning(f"Field cache unavailable: {e}")
+            return None
+
+    def _fingerprint_store(self) -> Optional[Any]:
+        """Persistent document fingerprint store, or None if disabled or unavailable."""
+        if not settings.FINGERPRINT_STORE_ENABLED:
+            return None
+        try:
+            from .cache import FingerprintStore
+            return FingerprintStore()
+        except Exception as e:
+            logger.warning(f"Fingerprint store unavailable: {e}")
+            return None
+
     def _initialize_vector_store(self, output_path: Path, vectorize: bool) -> Optional[Any]:
         """Initialize vector store if requested."""
         if not vectorize:
@@ -122,33 +165,32 @@ class ExtractionService:
         pdf_files: List[Path], 
         callback: Optional[Callable[[str, Any, str], None]] = None
     ) -> List[ParsedDocument]:
-        """Parse PDF documents."""
-        parsed_docs = []
-        for pdf_path in pdf_files:
-            try:
-                doc = self.parser.parse_pdf(str(pdf_path))
-                parsed_docs.append(doc)
-            except Exception as e:
-                logger.error(f"Failed to parse {pdf_path.name}: {e}")
-                if callback:
-                    callback(pdf_path.name, str(e), "failed")
-        return parsed_docs
+        """Parse PDF documents in parallel (input order preserved)."""
+        def on_error(pdf_path: Path, error: Exception):
+            if callback:
+                callback(pdf_path.name, str(error), "failed")
+
+        return list(self.parser.parse_many(pdf_files, ordered=True, on_error=on_error))
 
     def _build_summary(
         self, 
         pdf_files: List[Path], 
         parsed_docs: List[ParsedDocument], 
-        failed_files: List[Any]
+        failed_files: List[Any],
+        pipeline: Optional[HierarchicalExtractionPipeline] = None,
     ) -> Dict[str, Any]:
         """Build extraction summary."""
         summary = self.tracker.get_session_summary()
-        return {
+        result = {
             "total_files": len(pdf_files),
             "parsed_files": len(parsed_docs),
             "failed_files": failed_files,
             "cost_usd": summary.get("total_cost_usd", 0.0),
             "tokens": summary.get("total_tokens", 0)
         }
+        if pipeline is not None:
+            result["relevance_cache"] = pipeline.relevance_classifier.get_cache_stats()
+        return result
 
     def _handle_extraction_success(
         self, 
@@ -328,6 +370,96 @@ class ExtractionService:
                 vector_store, parsed_docs, fieldnames, callback
             )
 
+    def _execute_concurrent_chunked_extraction(
+        self,
+        batch_executor: BatchExecutor,
+        parsed_docs: List[ParsedDocument],
+        schema_chunks: List[List[FieldDefinition]],
+        theme: str,
+        workers: int,
+        resume: bool,
+        result_handler: Callable
+    ):
+        """
+        Execute schema-chunked extraction with all chunks of a paper in flight at once.
+        
+        Each document is filtered, classified and given a context once; its
+        chunk models are then extracted concurrently and merged, so every
+        paper finishes (and can be resumed) as a single unit.
+        """
+        logger.info(f"Schema chunking enabled: {len(schema_chunks)} chunks (concurrent)")
+        chunk_models = [
+            build_extraction_model(chunk_fields, f"ChunkModel_{chunk_idx}")
+            for chunk_idx, chunk_fields in enumerate(schema_chunks)
+        ]
+        asyncio.run(batch_executor.process_batch_async(
+            documents=parsed_docs,
+            schema=chunk_models,
+            theme=theme,
+            resume=resume,
+            callback=result_handler,
+            concurrency_limit=workers
+        ))
+
+    def _execute_pipelined_extraction(
+        self,
+        batch_executor: BatchExecutor,
+        pdf_files: List[Path],
+        parsed_docs: List[ParsedDocument],
+        model: Type[Any],
+        theme: str,
+        workers: int,
+        resume: bool,
+        result_handler: Callable,
+        callback: Optional[Callable] = None
+    ):
+        """
+        Execute extraction overlapped with parsing.
+        
+        A parser thread feeds a bounded asyncio queue that extraction workers
+        drain, so CPU-bound parsing and network-bound LLM calls run at the
+        same time and CSV rows are written as soon as each paper finishes.
+        Parsed documents are appended to ``parsed_docs`` as they arrive.
+        """
+        def on_error(pdf_path: Path, error: Exception):
+            if callback:
+                callback(pdf_path.name, str(error), "failed")
+
+        async def run():
+            loop = asyncio.get_running_loop()
+            queue: asyncio.Queue = asyncio.Queue(maxsize=settings.PIPELINE_QUEUE_SIZE)
+            stop = threading.Event()
+
+            def produce():
+                try:
+                    for doc in self.parser.parse_many(pdf_files, on_error=on_error):
+                        if stop.is_set():
+                            return
+                        parsed_docs.append(doc)
+                        # Blocks while the queue is full (backpressure)
+                        asyncio.run_coroutine_threadsafe(queue.put(doc), loop).result()
+                finally:
+                    asyncio.run_coroutine_threadsafe(queue.put(None), loop)
+
+            producer = loop.run_in_executor(None, produce)
+            try:
+                await batch_executor.process_stream_async(
+                    queue=queue,
+                    schema=model,
+                    theme=theme,
+                    resume=resume,
+                    callback=result_handler,
+                    concurrency_limit=workers
+                )
+            finally:
+                stop.set()
+                # Unblock the producer if extraction stopped early
+                while not queue.empty():
+                    queue.get_nowait()
+                await producer
+
+        asyncio.run(run())
+
     def run_extraction(
         self,
         papers_dir: str,
@@ -344,10 +476,24 @@ class ExtractionService:
         limit: Optional[int] = None,
         hybrid_mode: bool = True,  # COST-001: Enable hybrid local-first extraction
         schema_chunks: Optional[List[List[FieldDefinition]]] = None,  # Schema chunking for cost optimization
-        callback: Optional[Callable[[str, Any, str], None]] = None
+        callback: Optional[Callable[[str, Any, str], None]] = None,
+        pipelined: bool = False,
+        evidence_mode: Optional[str] = None,
+        field_groups: Optional[bool] = None,
     ) -> Dict[str, Any]:
         """
         Run the full extraction pipeline on a directory of papers.
+        
+        With ``pipelined=True`` parsing and extraction overlap (streamed
+        through bounded queues) instead of parsing every PDF up front.
+        Pipelining needs hierarchical extraction without schema chunking
+        (chunked runs need all documents first); other runs are staged.
+        With CONCURRENT_SCHEMA_CHUNKS hierarchical runs extract a paper's
+        chunks concurrently over one shared context.
+        ``evidence_mode`` selects two-call or single-call evidence extraction
+        for this run (default: EXTRACTION_EVIDENCE_MODE).
+        ``field_groups`` extracts hierarchical, non-chunked runs per field
+        group from retrieved chunks (default: FIELD_GROUP_RETRIEVAL).
         """
         output_path = Path(output_csv)
         output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -362,7 +508,9 @@ class ExtractionService:
         pdf_files = self._load_papers(papers_dir, limit)
             
         # 4. Initialize Pipeline & Extractor
-        pipeline = self._initialize_pipeline(threshold, max_iter, examples, hybrid_mode)
+        pipeline = self._initialize_pipeline(
+            threshold, max_iter, examples, hybrid_mode, evidence_mode, field_groups, resume
+        )
         
         # 5. Initialize Vector Store
         vector_store = self._initialize_vector_store(output_path, vectorize)
@@ -374,8 +522,15 @@ class ExtractionService:
             max_workers=workers
         )
         
-        # 7. Parse PDFs
-        parsed_docs = self._parse_documents(pdf_files, callback)
+        if pipelined and schema_chunks:
+            logger.info("Pipelined mode is not available with schema chunking; parsing up front")
+            pipelined = False
+        if pipelined and not hierarchical:
+            logger.info("Pipelined mode requires hierarchical extraction; parsing up front")
+            pipelined = False
+        
+        # 7. Parse PDFs (deferred to the extraction stream when pipelined)
+        parsed_docs = [] if pipelined else self._parse_documents(pdf_files, callback)
 
         # 8. Execute Batch
         failed_files = []
@@ -384,27 +539,36 @@ class ExtractionService:
             writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore")
             writer.writeheader()
             
-            if schema_chunks:
+            def result_handler(filename, data, status):
+                if status == "success":
+                    self._handle_extraction_success(
+                        filename, data, writer, f, vector_store, parsed_docs, fieldnames, callback
+                    )
+                else:
+                    failed_files.append((filename, str(data)))
+                    # Write error row to CSV
+                    self._write_error_row(
+                        filename, data, writer, f, fieldnames, callback
+                    )
+            
+            if schema_chunks and hierarchical and settings.CONCURRENT_SCHEMA_CHUNKS:
+                self._execute_concurrent_chunked_extraction(
+                    batch_executor, parsed_docs, schema_chunks, theme, workers, resume, result_handler
+                )
+            elif schema_chunks:
                 self._execute_chunked_extraction(
                     batch_executor, parsed_docs, schema_chunks, theme, hierarchical, workers,
                     writer, f, vector_store, fieldnames, callback, failed_files
                 )
+            elif pipelined:
+                self._execute_pipelined_extraction(
+                    batch_executor, pdf_files, parsed_docs, ExtractionModel,
+                    theme, workers, resume, result_handler, callback
+                )
             else:
-                def result_handler(filename, data, status):
-                    if status == "success":
-                        self._handle_extraction_success(
-                            filename, data, writer, f, vector_store, parsed_docs, fieldnames, callback
-                        )
-                    else:
-                        failed_files.append((filename, str(data)))
-                        # Write error row to CSV
-                        self._write_error_row(
-                            filename, data, writer, f, fieldnames, callback
-                        )
-                            
                 self._execute_standard_extraction(
                     batch_executor, parsed_docs, ExtractionModel, theme, hierarchical, workers, resume, result_handler
                 )
                 
         # 9. Return Summary
-        return self._build_summary(pdf_files, parsed_docs, failed_files)
+        return self._build_summary(pdf_files, parsed_docs, failed_files, pipeline)
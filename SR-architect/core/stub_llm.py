@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+"""
+Offline OpenAI-compatible stub LLM server for throughput benchmarking.
+
+Serves POST /v1/chat/completions with simulated latency, server errors,
+429 rate limits and token counts, so pipeline orchestration overhead can be
+measured at thousands of documents without API spend or a local model.
+Responses are schema-valid JSON generated from the request:
+- tools (Instructor TOOLS mode): a tool call whose arguments satisfy the
+  function's parameter schema
+- response_format json_schema, or a JSON schema embedded in the messages
+  (Instructor JSON mode): message content satisfying that schema
+- otherwise: a short text reply
+
+Target it with provider "stub" (STUB_LLM_BASE_URL), e.g.:
+
+    python cli.py stub serve --port 8765 --latency lognormal --rate-limit-rate 0.02
+"""
+
+import json
+import random
+import threading
+import time
+import uuid
+from dataclasses import asdict, dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+
+from core import constants
+from core.config import settings
+from core.utils import get_logger
+
+logger = get_logger("StubLLM")
+
+LATENCY_DISTRIBUTIONS = ("none", "fixed", "uniform", "exponential", "lognormal")
+
+
+@dataclass
+class StubLLMConfig:
+    """Behaviour of the stub server."""
+    latency: str = "lognormal"  # One of LATENCY_DISTRIBUTIONS
+    latency_ms: float = constants.STUB_LLM_LATENCY_MS  # Mean latency
+    latency_sigma: float = constants.STUB_LLM_LATENCY_SIGMA  # Lognormal shape; uniform spread is +/- latency_ms
+    error_rate: float = 0.0  # Share of requests answered with HTTP 500
+    rate_limit_rate: float = 0.0  # Share of requests answered with HTTP 429
+    retry_after: int = constants.STUB_LLM_RETRY_AFTER_SECONDS
+    prompt_tokens: Optional[int] = None  # Fixed usage; None estimates from request size
+    completion_tokens: Optional[int] = None  # Fixed usage; None estimates from response size
+    seed: Optional[int] = None
+
+    def __post_init__(self):
+        if self.latency not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(f"Unknown latency distribution {self.latency!r}; expected one of {LATENCY_DISTRIBUTIONS}")
+
+
+# ----------------------------------------------------------------------
+# Schema instances
+# ----------------------------------------------------------------------
+
+def instance_from_schema(schema: Dict[str, Any], defs: Optional[Dict[str, Any]] = None, name: str = "value") -> Any:
+    """
+    A value that validates against a JSON schema.
+
+    Defaults, consts and the first enum member win; every object property
+    (required or not) is filled so response models come back fully
+    populated; numbers honour minimum/maximum bounds.
+
+    Args:
+        schema: JSON schema (as produced by pydantic model_json_schema)
+        defs: Definitions for $ref resolution (default: schema's $defs)
+        name: Property name, used in generated strings
+
+    Returns:
+        JSON-serializable value
+    """
+    defs = schema.get("$defs", schema.get("definitions", {})) if defs is None else defs
+    if "$ref" in schema:
+        return instance_from_schema(defs.get(schema["$ref"].rsplit("/", 1)[-1], {}), defs, name)
+    if "default" in schema and schema["default"] is not None:
+        return schema["default"]
+    if "const" in schema:
+        return schema["const"]
+    if schema.get("enum"):
+        return schema["enum"][0]
+    for key in ("anyOf", "oneOf"):
+        if key in schema:
+            options = [option for option in schema[key] if option.get("type") != "null"] or schema[key]
+            return instance_from_schema(options[0], defs, name)
+    if "allOf" in schema:
+        merged: Dict[str, Any] = {}
+        for part in schema["allOf"]:
+            value = instance_from_schema(part, defs, name)
+            if isinstance(value, dict):
+                merged.update(value)
+        return merged
+
+    kind = schema.get("type")
+    if isinstance(kind, list):
+        kind = next((k for k in kind if k != "null"), "null")
+    if kind == "object" or (kind is None and "properties" in schema):
+        return {
+            prop: instance_from_schema(sub, defs, prop)
+            for prop, sub in schema.get("properties", {}).items()
+        }
+    if kind == "array":
+        count = max(schema.get("minItems", 1), 1)
+        return [instance_from_schema(schema.get("items", {}), defs, name) for _ in range(count)]
+    if kind in ("integer", "number"):
+        low = schema.get("minimum", schema.get("exclusiveMinimum"))
+        high = schema.get("maximum", schema.get("exclusiveMaximum"))
+        if low is not None and high is not None:
+            value = (low + high) / 2
+        elif low is not None:
+            value = low + 1
+        elif high is not None:
+            value = high - 1
+        else:
+            value = 1
+        return int(value) if kind == "integer" else float(value)
+    if kind == "boolean":
+        return True
+    if kind == "null":
+        return None
+    if kind == "string" or kind is None:
+        if schema.get("format") == "date":
+            return "2024-01-01"
+        if schema.get("format") == "date-time":
+            return "2024-01-01T00:00:00Z"
+        text = f"stub {name}"
+        if "maxLength" in schema:
+            text = text[:schema["maxLength"]]
+        return text.ljust(schema.get("minLength", 0), "x")
+    return None
+
+
+def _embedded_schema(messages: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """First JSON schema object found in message text (Instructor JSON modes)."""
+    decoder = json.JSONDecoder()
+    for message in messages:
+        content = message.get("content")
+        if isinstance(content, list):
+            content = "\n".join(part.get("text", "") for part in content if isinstance(part, dict))
+        if not isinstance(content, str) or '"properties"' not in content:
+            continue
+        start = content.find("{")
+        while start != -1:
+            try:
+                value, _ = decoder.raw_decode(content, start)
+            except ValueError:
+                value = None
+            if isinstance(value, dict) and "properties" in value:
+                return value
+            start = content.find("{", start + 1)
+    return None
+
+
+# ----------------------------------------------------------------------
+# Server
+# ----------------------------------------------------------------------
+
+class StubLLMServer(ThreadingHTTPServer):
+    """
+    Threaded HTTP server speaking the OpenAI chat completions API.
+
+    Each request is handled on its own thread, so simulated latency
+    overlaps across concurrent clients as it would against a real API.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, config: Optional[StubLLMConfig] = None, host: str = "127.0.0.1", port: int = 0):
+        """
+        Bind the server (call start() or serve_forever() to serve).
+
+        Args:
+            config: Simulated behaviour (default: StubLLMConfig())
+            host: Interface to bind
+            port: Port to bind (0 picks a free port)
+        """
+        self.config = config or StubLLMConfig()
+        self._rng = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+        self._stats = {"requests": 0, "completed": 0, "errors": 0, "rate_limited": 0,
+                       "prompt_tokens": 0, "completion_tokens": 0}
+        self._thread: Optional[threading.Thread] = None
+        super().__init__((host, port), _StubHandler)
+
+    @property
+    def base_url(self) -> str:
+        """OpenAI-compatible base URL (for LLMClientFactory base_url / STUB_LLM_BASE_URL)."""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self) -> "StubLLMServer":
+        """Serve on a background thread."""
+        self._thread = threading.Thread(target=self.serve_forever, name="stub-llm", daemon=True)
+        self._thread.start()
+        logger.info(f"Stub LLM server listening on {self.base_url}")
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and release the socket."""
+        self.shutdown()
+        self.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "StubLLMServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {**self._stats, "config": asdict(self.config)}
+
+    def _count(self, **increments: int) -> None:
+        with self._lock:
+            for key, value in increments.items():
+                self._stats[key] += value
+
+    def _draw(self) -> Tuple[float, str]:
+        """Simulated delay in seconds and outcome ("ok", "error" or "rate_limited")."""
+        config = self.config
+        mean = config.latency_ms / 1000
+        with self._lock:
+            if config.latency == "fixed":
+                delay = mean
+            elif config.latency == "uniform":
+                delay = self._rng.uniform(0, 2 * mean)
+            elif config.latency == "exponential":
+                delay = self._rng.expovariate(1 / mean) if mean > 0 else 0.0
+            elif config.latency == "lognormal":
+                # mu chosen so the distribution's mean is latency_ms
+                mu = -config.latency_sigma ** 2 / 2
+                delay = mean * self._rng.lognormvariate(mu, config.latency_sigma)
+            else:
+                delay = 0.0
+            roll = self._rng.random()
+        if roll < config.rate_limit_rate:
+            return delay, "rate_limited"
+        if roll < config.rate_limit_rate + config.error_rate:
+            return delay, "error"
+        return delay, "ok"
+
+    def completion(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Chat completion response body for a request."""
+        messages = request.get("messages", [])
+        message: Dict[str, Any] = {"role": "assistant", "content": None}
+        finish_reason = "stop"
+
+        tools = request.get("tools") or []
+        response_format = request.get("response_format") or {}
+        if tools:
+            choice = request.get("tool_choice")
+            wanted = choice.get("function", {}).get("name") if isinstance(choice, dict) else None
+            function = next(
+                (t["function"] for t in tools if t.get("function", {}).get("name") == wanted),
+                tools[0].get("function", {}),
+            )
+            arguments = json.dumps(instance_from_schema(function.get("parameters", {})))
+            message["tool_calls"] = [{
+                "id": f"call_{uuid.uuid4().hex[:24]}",
+                "type": "function",
+                "function": {"name": function.get("name", "response"), "arguments": arguments},
+            }]
+            finish_reason = "tool_calls"
+            output = arguments
+        else:
+            schema = (response_format.get("json_schema") or {}).get("schema") or _embedded_schema(messages)
+            if schema is not None:
+                output = json.dumps(instance_from_schema(schema))
+            elif response_format.get("type") == "json_object":
+                output = "{}"
+            else:
+                output = "Stub response."
+            message["content"] = output
+
+        chars_per_token = settings.CHARS_PER_TOKEN_ESTIMATE
+        prompt_tokens = self.config.prompt_tokens
+        if prompt_tokens is None:
+            prompt_tokens = max(len(json.dumps(messages)) + len(json.dumps(tools)), 1) // chars_per_token
+        completion_tokens = self.config.completion_tokens
+        if completion_tokens is None:
+            completion_tokens = max(len(output) // chars_per_token, 1)
+        self._count(completed=1, prompt_tokens=prompt_tokens, completion_tokens=completion_tokens)
+
+        return {
+            "id": f"chatcmpl-{uuid.uuid4().hex[:24]}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": request.get("model") or settings.STUB_LLM_MODEL,
+            "choices": [{"index": 0, "message": message, "finish_reason": finish_reason}],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        }
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    server: StubLLMServer
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug(format % args)
+
+    def _send(self, status: int, body: Dict[str, Any], headers: Optional[Dict[str, str]] = None) -> None:
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _error(self, status: int, message: str, kind: str, headers: Optional[Dict[str, str]] = None) -> None:
+        self._send(status, {"error": {"message": message, "type": kind, "code": kind}}, headers)
+
+    def do_GET(self) -> None:
+        path = self.path.rstrip("/")
+        if path.endswith("/models"):
+            self._send(200, {"object": "list", "data": [{"id": settings.STUB_LLM_MODEL, "object": "model"}]})
+        elif path.endswith("/stats"):
+            self._send(200, self.server.stats())
+        elif path in ("", "/health"):
+            self._send(200, {"status": "ok"})
+        else:
+            self._error(404, f"Unknown path {self.path}", "not_found")
+
+    def do_POST(self) -> None:
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            self._error(404, f"Unknown path {self.path}", "not_found")
+            return
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > constants.STUB_LLM_MAX_BODY_BYTES:
+            self._error(413, "Request body too large", "invalid_request_error")
+            return
+        try:
+            request = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            self._error(400, "Request body is not valid JSON", "invalid_request_error")
+            return
+
+        server = self.server
+        server._count(requests=1)
+        delay, outcome = server._draw()
+        if delay > 0:
+            time.sleep(delay)
+        if outcome == "rate_limited":
+            server._count(rate_limited=1)
+            self._error(429, "Rate limit exceeded (simulated)", "rate_limit_exceeded",
+                        {"Retry-After": str(server.config.retry_after)})
+        elif outcome == "error":
+            server._count(errors=1)
+            self._error(500, "Internal server error (simulated)", "server_error")
+        else:
+            self._send(200, server.completion(request))
@@ -3,7 +3,8 @@ Text splitter wrapper using LangChain's RecursiveCharacterTextSplitter.
 Provides robust text chunking capabilities.
 """
 
-from typing import List, Optional
+from functools import lru_cache
+from typing import List, NamedTuple, Optional
 
 try:
     from langchain_text_splitters import RecursiveCharacterTextSplitter
@@ -15,6 +16,14 @@ except ImportError:
     )
 
 
+class TextSpan(NamedTuple):
+    """A chunk of text with its absolute offsets and page anchor."""
+    text: str
+    start: int
+    end: int
+    page_number: int = 0
+
+
 class TextSplitter:
     """Wrapper for robust text splitting."""
 
@@ -59,6 +68,44 @@ class TextSplitter:
         
         return self._splitter.split_text(text)
 
+    def split_spans(self, text: str, offset: int = 0, page_number: int = 0) -> List[TextSpan]:
+        """
+        Split text into chunks with character offsets.
+
+        Chunks are located in order from a moving cursor, so overlapping
+        and repeated chunks resolve to the right occurrence in linear time.
+
+        Args:
+            text: Input text to split.
+            offset: Absolute position of text in the enclosing document.
+            page_number: Page anchor attached to every span.
+
+        Returns:
+            List of TextSpan with start/end relative to the enclosing document.
+        """
+        spans = []
+        cursor = 0
+        for chunk in self.split_text(text):
+            start = text.find(chunk, cursor)
+            if start < 0:
+                # Splitter output is always a substring; guard anyway
+                start = text.find(chunk)
+            end = start + len(chunk)
+            spans.append(TextSpan(chunk, offset + start, offset + end, page_number))
+            cursor = start + 1
+        return spans
+
+
+@lru_cache(maxsize=32)
+def get_splitter(chunk_size: int = 1000, chunk_overlap: int = 200) -> TextSplitter:
+    """
+    Shared splitter for a (chunk_size, chunk_overlap) config.
+
+    Splitters are stateless after construction, so one instance per config
+    is reused across pages, documents and threads.
+    """
+    return TextSplitter(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
+
 
 def split_text_into_chunks(
     text: str, 
@@ -76,5 +123,4 @@ def split_text_into_chunks(
     Returns:
         List of chunks.
     """
-    splitter = TextSplitter(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
-    return splitter.split_text(text)
+    return get_splitter(chunk_size, chunk_overlap).split_text(text)
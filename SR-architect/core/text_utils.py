@@ -6,7 +6,12 @@ to improve quote validation robustness.
 """
 
 import re
-from typing import List, Tuple, Optional, Set
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Tuple, Optional, Set
+
+_TOKEN_PATTERN = re.compile(r'\b\w+\b')
 
 def tokenize(text: str) -> List[str]:
     """
@@ -28,6 +33,160 @@ def jaccard_score(tokens1: Set[str], tokens2: Set[str]) -> float:
     
     return intersection / union if union > 0 else 0.0
 
+@dataclass
+class QuoteMatch:
+    """A located quote: matched source text, Jaccard score and character span."""
+    text: str
+    score: float
+    start: int
+    end: int
+
+
+class QuoteIndex:
+    """
+    Token index over one document for repeated fuzzy quote lookups.
+
+    The document is tokenized once and every token keeps a posting list of
+    its positions. A lookup only scans windows that start on a token of the
+    quote: each such start gets an upper bound on its Jaccard score (quote
+    tokens within reach / distinct quote tokens), starts are visited in
+    bound order, and each start's windows are scored with counts updated
+    one token at a time. The scan stops once no remaining start can beat
+    the current matches, so cost depends on how often the quote's tokens
+    occur rather than on document length times window size.
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self.tokens: List[str] = []
+        self.spans: List[Tuple[int, int]] = []
+        self.postings: Dict[str, List[int]] = defaultdict(list)
+        for position, match in enumerate(_TOKEN_PATTERN.finditer(text)):
+            token = match.group().lower()
+            self.tokens.append(token)
+            self.spans.append((match.start(), match.end()))
+            self.postings[token].append(position)
+
+    def _best_window(
+        self, first: int, pattern: Set[str], min_window: int, max_window: int
+    ) -> Tuple[float, int]:
+        """Best (score, last token) over windows starting at token `first`."""
+        counts: Dict[str, int] = {}
+        shared = 0
+        best_score, best_last = 0.0, first
+        for last in range(first, min(first + max_window, len(self.tokens))):
+            token = self.tokens[last]
+            seen = counts.get(token, 0)
+            counts[token] = seen + 1
+            if not seen and token in pattern:
+                shared += 1
+            if last - first + 1 >= min_window:
+                score = shared / (len(counts) + len(pattern) - shared)
+                if score > best_score:
+                    best_score, best_last = score, last
+        return best_score, best_last
+
+    def _match(self, score: float, first: int, last: int) -> QuoteMatch:
+        start, end = self.spans[first][0], self.spans[last][1]
+        return QuoteMatch(self.text[start:end], score, start, end)
+
+    def locate(
+        self,
+        quote: str,
+        threshold: float = 0.8,
+        window_slack: float = 0.5,
+        top_k: int = 1,
+    ) -> List[QuoteMatch]:
+        """
+        Find the best non-overlapping matches for a quote.
+
+        An exact occurrence is returned on its own with score 1.0.
+
+        Args:
+            quote: Quote to locate (e.g. LLM extracted quote).
+            threshold: Minimum Jaccard score for a match.
+            window_slack: How much shorter or longer (in tokens) than the
+                          quote a matching window may be.
+            top_k: Maximum number of matches to return.
+
+        Returns:
+            Matches ranked by score (ties by position); empty if none
+            reach the threshold.
+        """
+        return [m for m in self._ranked(quote, threshold, window_slack, top_k) if m.score >= threshold]
+
+    def _ranked(
+        self, quote: str, threshold: float, window_slack: float, top_k: int
+    ) -> List[QuoteMatch]:
+        """Ranked matches, including the best one seen below the threshold."""
+        if not quote or not self.text:
+            return []
+        exact = self.text.find(quote)
+        if exact != -1:
+            return [QuoteMatch(quote, 1.0, exact, exact + len(quote))]
+
+        quote_tokens = tokenize(quote)
+        pattern = set(quote_tokens)
+        if not quote_tokens or not self.tokens:
+            return []
+
+        min_window = max(1, int(len(quote_tokens) * (1 - window_slack)))
+        max_window = int(len(quote_tokens) * (1 + window_slack))
+        hits = sorted(p for token in pattern for p in self.postings.get(token, ()))
+
+        # Upper bound per start: quote-token occurrences reachable from it
+        starts = []
+        reach = 0
+        for i, first in enumerate(hits):
+            if first + min_window > len(self.tokens):
+                break
+            while reach < len(hits) and hits[reach] < first + max_window:
+                reach += 1
+            starts.append((min(reach - i, len(pattern)) / len(pattern), first))
+        starts.sort(key=lambda s: (-s[0], s[1]))
+
+        matches: List[Tuple[float, int, int]] = []
+        best_below = None
+        for bound, first in starts:
+            if len(matches) >= top_k and bound < matches[-1][0]:
+                break
+            if bound < threshold and (matches or best_below is not None and bound <= best_below[0]):
+                break
+            score, last = self._best_window(first, pattern, min_window, max_window)
+            if score < threshold:
+                if score > 0 and (best_below is None or (score, -first) > (best_below[0], -best_below[1])):
+                    best_below = (score, first, last)
+                continue
+            overlapping = [m for m in matches if m[1] <= last and first <= m[2]]
+            if any((m[0], -m[1]) >= (score, -first) for m in overlapping):
+                continue
+            matches = [m for m in matches if m not in overlapping] + [(score, first, last)]
+            matches.sort(key=lambda m: (-m[0], m[1]))
+            del matches[top_k:]
+
+        if not matches and best_below is not None:
+            matches = [best_below]
+        return [self._match(*m) for m in matches]
+
+    def best_match(
+        self, quote: str, threshold: float = 0.8, window_slack: float = 0.5
+    ) -> Tuple[Optional[str], float, Optional[Tuple[int, int]]]:
+        """Best match in find_best_substring_match's (text, score, span) form."""
+        ranked = self._ranked(quote, threshold, window_slack, top_k=1)
+        if not ranked:
+            return None, 0.0, None
+        best = ranked[0]
+        if best.score < threshold:
+            return None, best.score, None
+        return best.text, best.score, (best.start, best.end)
+
+
+@lru_cache(maxsize=8)
+def get_quote_index(text: str) -> QuoteIndex:
+    """Shared QuoteIndex for a document, built on first use."""
+    return QuoteIndex(text)
+
+
 def find_best_substring_match(
     text: str, 
     pattern: str, 
@@ -37,7 +196,8 @@ def find_best_substring_match(
     """
     Find the best fuzzy match for a pattern within a text using Jaccard similarity.
     
-    Adapted from llm-ie project.
+    Adapted from llm-ie project. Lookups go through a cached QuoteIndex,
+    so repeated quotes against the same document tokenize it only once.
     
     Args:
         text: The source text to search in.
@@ -48,75 +208,9 @@ def find_best_substring_match(
                       
     Returns:
         Tuple of (matched_text, score, (start_index, end_index))
-        Returns (None, 0.0, None) if no match found above threshold.
+        Returns (None, score, None) if no match reaches the threshold, where
+        score is the best below-threshold score seen (0.0 if none).
     """
     if not pattern or not text:
         return None, 0.0, None
-        
-    # Quick exact match check
-    exact_idx = text.find(pattern)
-    if exact_idx != -1:
-        return pattern, 1.0, (exact_idx, exact_idx + len(pattern))
-        
-    # Fuzzy match logic
-    text_tokens = tokenize(text)
-    pattern_tokens = tokenize(pattern)
-    pattern_set = set(pattern_tokens)
-    
-    if not pattern_tokens:
-        return None, 0.0, None
-        
-    n_pattern = len(pattern_tokens)
-    n_text = len(text_tokens)
-    
-    # Define window size limits
-    min_window = max(1, int(n_pattern * (1 - window_slack)))
-    max_window = int(n_pattern * (1 + window_slack)) + 1
-    
-    best_score = 0.0
-    best_window_indices = None
-    
-    # Sliding window over tokens
-    # Note: iterating tokens is faster than characters but requires mapping back to char indices
-    # To map back, we need token positions.
-    
-    # Build token map: (token, start_char, end_char)
-    token_map = []
-    for match in re.finditer(r'\b\w+\b', text):
-        token_map.append((match.group().lower(), match.start(), match.end()))
-        
-    if not token_map:
-        return None, 0.0, None
-
-    for i in range(len(token_map)):
-        # Optimization: Early exit if remaining text is too short for pattern
-        if i + min_window > len(token_map):
-            break
-            
-        for w_len in range(min_window, min(max_window, len(token_map) - i + 1)):
-            window_slice = token_map[i : i + w_len]
-            window_tokens = set(t[0] for t in window_slice)
-            
-            # Simple heuristic: First word must allow match (optional, but speeds up)
-            # if window_slice[0][0] not in pattern_set:
-            #     continue
-            
-            score = jaccard_score(window_tokens, pattern_set)
-            
-            if score > best_score:
-                best_score = score
-                best_window_indices = (i, i + w_len)
-    
-    if best_score >= threshold and best_window_indices:
-        start_idx = best_window_indices[0]
-        end_idx = best_window_indices[1] - 1  # Inclusive of last token
-        
-        start_char = token_map[start_idx][1]
-        end_char = token_map[end_idx][2]
-        
-        # Extend to cover full captured text (including spaces between first/last token)
-        matched_text = text[start_char:end_char]
-        
-        return matched_text, best_score, (start_char, end_char)
-        
-    return None, best_score, None
+    return get_quote_index(text).best_match(pattern, threshold, window_slack)
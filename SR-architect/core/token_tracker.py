@@ -7,6 +7,7 @@ Provides:
 - Price lookups from OpenRouter models API
 - Pre-flight cost estimation
 - Session-level cost aggregation
+- Cached vs uncached prompt token accounting (provider prompt caching)
 - Standardized cost reports
 """
 
@@ -19,6 +20,7 @@ from typing import Dict, Any, Optional, List
 from dataclasses import dataclass, field
 from pydantic import BaseModel
 
+from core import constants
 from core.config import settings
 from core.utils import get_logger
 
@@ -38,6 +40,45 @@ class UsageRecord:
     operation: str = "extraction"
     tier: Optional[str] = None
     field: Optional[str] = None
+    cached_prompt_tokens: int = 0  # prompt tokens read from the provider's prompt cache
+    cache_write_tokens: int = 0  # prompt tokens written to the cache (Anthropic-style caching)
+
+    @property
+    def uncached_prompt_tokens(self) -> int:
+        return self.prompt_tokens - self.cached_prompt_tokens
+
+
+def usage_from_completion(completion: Any) -> Optional[Dict[str, int]]:
+    """
+    Usage dict for TokenTracker.record_usage from an OpenAI-compatible completion.
+
+    Cached prompt tokens are read from ``usage.prompt_tokens_details``
+    (OpenAI, OpenRouter) or Anthropic's ``cache_read_input_tokens`` /
+    ``cache_creation_input_tokens``.
+
+    Returns:
+        Dict with prompt/completion/total tokens (plus cached_tokens and
+        cache_write_tokens when reported), or None without usage
+    """
+    usage = getattr(completion, "usage", None)
+    if not usage:
+        return None
+    result = {
+        "prompt_tokens": usage.prompt_tokens,
+        "completion_tokens": usage.completion_tokens,
+        "total_tokens": usage.total_tokens,
+    }
+    details = getattr(usage, "prompt_tokens_details", None)
+    for key, sources in (
+        ("cached_tokens", [(details, "cached_tokens"), (usage, "cache_read_input_tokens")]),
+        ("cache_write_tokens", [(details, "cache_write_tokens"), (usage, "cache_creation_input_tokens")]),
+    ):
+        for source, attribute in sources:
+            value = getattr(source, attribute, None) if source is not None else None
+            if isinstance(value, int) and not isinstance(value, bool) and value > 0:
+                result[key] = value
+                break
+    return result
 
 
 @dataclass
@@ -162,6 +203,9 @@ class TokenTracker:
                                 "prompt": float(pricing.get("prompt", 0)) * settings.TOKENS_PER_MILLION,
                                 "completion": float(pricing.get("completion", 0)) * settings.TOKENS_PER_MILLION,
                             }
+                            for key, api_key in (("cache_read", "input_cache_read"), ("cache_write", "input_cache_write")):
+                                if pricing.get(api_key) is not None:
+                                    result[key] = float(pricing[api_key]) * settings.TOKENS_PER_MILLION
                             self._pricing_cache[model] = result
                             logger.debug(f"Fetched pricing for {model} from OpenRouter API")
                             return result
@@ -192,21 +236,35 @@ class TokenTracker:
         prompt_tokens: int,
         completion_tokens: int,
         model: str,
+        cached_tokens: int = 0,
+        cache_write_tokens: int = 0,
     ) -> float:
         """
         Calculate cost for a given token usage.
         
         Args:
-            prompt_tokens: Number of input tokens
+            prompt_tokens: Number of input tokens (including cached ones)
             completion_tokens: Number of output tokens
             model: Model identifier
+            cached_tokens: Input tokens read from the prompt cache, billed at
+                the model's cache-read price (default: PROMPT_CACHE_READ_PRICE_RATIO
+                of the input price)
+            cache_write_tokens: Input tokens written to the prompt cache,
+                billed at the cache-write price (default: input price)
             
         Returns:
             Cost in USD
         """
         pricing = self.get_model_pricing(model)
-        
-        prompt_cost = (prompt_tokens / settings.TOKENS_PER_MILLION) * pricing["prompt"]
+        cache_read_price = pricing.get("cache_read", pricing["prompt"] * constants.PROMPT_CACHE_READ_PRICE_RATIO)
+        cache_write_price = pricing.get("cache_write", pricing["prompt"])
+        uncached_tokens = max(prompt_tokens - cached_tokens - cache_write_tokens, 0)
+        
+        prompt_cost = (
+            uncached_tokens * pricing["prompt"]
+            + cached_tokens * cache_read_price
+            + cache_write_tokens * cache_write_price
+        ) / settings.TOKENS_PER_MILLION
         completion_cost = (completion_tokens / settings.TOKENS_PER_MILLION) * pricing["completion"]
         
         return prompt_cost + completion_cost
@@ -267,6 +325,8 @@ class TokenTracker:
         prompt_tokens = usage.get("prompt_tokens", 0)
         completion_tokens = usage.get("completion_tokens", 0)
         total_tokens = usage.get("total_tokens", prompt_tokens + completion_tokens)
+        cached_tokens = usage.get("cached_tokens", 0)
+        cache_write_tokens = usage.get("cache_write_tokens", 0)
         
         # Check for direct cost
         if "cost" in usage:
@@ -274,7 +334,9 @@ class TokenTracker:
         elif "cost_usd" in usage:
             cost = float(usage["cost_usd"])
         else:
-            cost = self.calculate_cost(prompt_tokens, completion_tokens, model)
+            cost = self.calculate_cost(
+                prompt_tokens, completion_tokens, model, cached_tokens, cache_write_tokens
+            )
         
         return UsageRecord(
             timestamp=datetime.now().isoformat(),
@@ -287,6 +349,8 @@ class TokenTracker:
             operation=operation,
             tier=tier,
             field=field,
+            cached_prompt_tokens=cached_tokens,
+            cache_write_tokens=cache_write_tokens,
         )
     
     def _append_to_log(self, record: UsageRecord):
@@ -356,6 +420,9 @@ class TokenTracker:
                 "total_completion_tokens": 0,
                 "total_tokens": 0,
                 "total_cost_usd": 0.0,
+                "total_cached_prompt_tokens": 0,
+                "total_uncached_prompt_tokens": 0,
+                "cache_hit_rate": 0.0,
                 "session_duration_seconds": 0,
             }
         
@@ -363,6 +430,7 @@ class TokenTracker:
         total_completion = sum(r.completion_tokens for r in self.records)
         total_tokens = sum(r.total_tokens for r in self.records)
         total_cost = sum(r.cost_usd for r in self.records)
+        total_cached = sum(r.cached_prompt_tokens for r in self.records)
         
         duration = (datetime.now() - self.session_start).total_seconds()
         
@@ -370,9 +438,10 @@ class TokenTracker:
         by_model: Dict[str, Dict[str, Any]] = {}
         for r in self.records:
             if r.model not in by_model:
-                by_model[r.model] = {"calls": 0, "tokens": 0, "cost": 0.0}
+                by_model[r.model] = {"calls": 0, "tokens": 0, "cached_tokens": 0, "cost": 0.0}
             by_model[r.model]["calls"] += 1
             by_model[r.model]["tokens"] += r.total_tokens
+            by_model[r.model]["cached_tokens"] += r.cached_prompt_tokens
             by_model[r.model]["cost"] += r.cost_usd
         
         return {
@@ -381,6 +450,9 @@ class TokenTracker:
             "total_completion_tokens": total_completion,
             "total_tokens": total_tokens,
             "total_cost_usd": round(total_cost, 4),
+            "total_cached_prompt_tokens": total_cached,
+            "total_uncached_prompt_tokens": total_prompt - total_cached,
+            "cache_hit_rate": round(total_cached / total_prompt, 3) if total_prompt else 0.0,
             "session_duration_seconds": round(duration, 1),
             "by_model": by_model,
         }
@@ -433,6 +505,8 @@ class TokenTracker:
 ╠══════════════════════════════════════════════════════════════════╣
 ║ TOKEN USAGE:                                                      ║
 ║   Prompt tokens:     {summary['total_prompt_tokens']:>12,}                              ║
+║     cached:          {summary['total_cached_prompt_tokens']:>12,} ({summary['cache_hit_rate']:>6.1%})                     ║
+║     uncached:        {summary['total_uncached_prompt_tokens']:>12,}                              ║
 ║   Completion tokens: {summary['total_completion_tokens']:>12,}                              ║
 ║   Total tokens:      {summary['total_tokens']:>12,}                              ║
 ╠══════════════════════════════════════════════════════════════════╣
@@ -145,7 +145,12 @@ def make_request(
 
 
 class LLMCache:
-    """Persistent JSON cache for LLM responses."""
+    """
+    Persistent JSON cache for LLM responses (one file per request).
+
+    Deprecated: not used by the pipeline. LLM calls are cached by
+    core.cache.LLMResponseCache, wired into LLMClientFactory via LLM_CACHE_MODE.
+    """
     def __init__(self, cache_dir: str = ".cache/llm_responses"):
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
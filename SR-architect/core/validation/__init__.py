@@ -1,5 +1,14 @@
 """Validation module for extraction checking."""
 from .models import Issue, CheckerResponse, CheckerResult
 from .checker import ExtractionChecker
+from .local_verifier import FieldVerification, LocalEvidenceVerifier, VerificationReport
 
-__all__ = ["ExtractionChecker", "Issue", "CheckerResponse", "CheckerResult"]
+__all__ = [
+    "ExtractionChecker",
+    "Issue",
+    "CheckerResponse",
+    "CheckerResult",
+    "LocalEvidenceVerifier",
+    "FieldVerification",
+    "VerificationReport",
+]
@@ -9,6 +9,7 @@ from typing import List, Dict, Any, Optional
 from core.parser import DocumentChunk
 from core.config import settings
 from core import constants
+from core.token_tracker import usage_from_completion
 from .models import CheckerResponse, CheckerResult, Issue
 from .formatters import format_source_text, format_extracted_data, format_evidence
 
@@ -159,13 +160,10 @@ Provide scores, issues, and specific revision suggestions."""
             )
             
             # Record usage
-            if self.token_tracker and hasattr(completion, 'usage') and completion.usage:
+            usage = usage_from_completion(completion)
+            if self.token_tracker and usage:
                 self.token_tracker.record_usage(
-                    usage={
-                        "prompt_tokens": completion.usage.prompt_tokens,
-                        "completion_tokens": completion.usage.completion_tokens,
-                        "total_tokens": completion.usage.total_tokens
-                    },
+                    usage=usage,
                     model=self.model,
                     operation="extraction_check"
                 )
@@ -257,13 +255,10 @@ Provide scores, issues, and specific revision suggestions."""
             )
             
             # Record usage
-            if self.token_tracker and hasattr(completion, 'usage') and completion.usage:
+            usage = usage_from_completion(completion)
+            if self.token_tracker and usage:
                 await self.token_tracker.record_usage_async(
-                    usage={
-                        "prompt_tokens": completion.usage.prompt_tokens,
-                        "completion_tokens": completion.usage.completion_tokens,
-                        "total_tokens": completion.usage.total_tokens
-                    },
+                    usage=usage,
                     model=self.model,
                     operation="extraction_validation"
                 )
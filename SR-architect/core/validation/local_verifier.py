@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+"""
+Deterministic local verification of extraction evidence.
+
+Resolves each evidence quote to a character span in the source (exact,
+whitespace/case-normalized, or fuzzy) and checks that the extracted value
+is supported by that span: numbers must appear among the span's numbers,
+categorical and free-text values must share most of their words with it.
+Fields that verify locally skip the LLM checker and quality auditor; empty
+fields are not scored, so an extraction with no quote-verified field always
+goes to the checker.
+"""
+
+import re
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from core import constants
+from core.text_utils import QuoteIndex, get_quote_index
+from .models import CheckerResult
+
+EMPTY_VALUES = {"", "not reported", "none", "null", "n/a", "na", "unknown", "not stated", "not applicable"}
+
+STOPWORDS = {
+    "a", "an", "and", "the", "of", "in", "on", "at", "to", "for", "with", "by", "or",
+    "was", "were", "is", "are", "be", "as", "from", "that", "this", "which", "had", "has",
+}
+
+NUMBER_WORDS = {
+    "zero": 0, "one": 1, "two": 2, "three": 3, "four": 4, "five": 5, "six": 6,
+    "seven": 7, "eight": 8, "nine": 9, "ten": 10, "eleven": 11, "twelve": 12,
+    "thirteen": 13, "fourteen": 14, "fifteen": 15, "sixteen": 16, "seventeen": 17,
+    "eighteen": 18, "nineteen": 19, "twenty": 20, "single": 1, "twice": 2,
+}
+
+# Categorical values are often paraphrased in the source
+SYNONYMS = {
+    "female": {"woman", "women", "girl", "she", "her", "lady"},
+    "male": {"man", "men", "boy", "he", "his", "gentleman"},
+    "asymptomatic": {"incidental", "incidentally", "asymptomatic"},
+    "observation": {"follow", "surveillance", "monitoring", "observed"},
+}
+
+
+def _words(text: str) -> List[str]:
+    return re.findall(r"[a-z0-9]+(?:\.[0-9]+)?", text.lower())
+
+
+def _stem(word: str) -> str:
+    return word[:-1] if len(word) > 3 and word.endswith("s") else word
+
+
+def _numbers(text: str) -> List[float]:
+    values = [float(n) for n in re.findall(r"\d+(?:\.\d+)?", text.replace(",", ""))]
+    values += [float(NUMBER_WORDS[w]) for w in _words(text) if w in NUMBER_WORDS]
+    return values
+
+
+def _value_text(value: Any) -> Optional[str]:
+    """Text form of a value, or None when there is nothing to verify."""
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, (list, tuple, set)):
+        value = ", ".join(str(v) for v in value if v is not None)
+    elif isinstance(value, dict):
+        value = ", ".join(str(v) for v in value.values() if v is not None)
+    text = str(value).strip()
+    return None if text.lower() in EMPTY_VALUES else text
+
+
+class _NormalizedText:
+    """Lowercased, whitespace-collapsed text with a map back to original offsets."""
+
+    def __init__(self, text: str):
+        chars: List[str] = []
+        index: List[int] = []
+        previous_space = True
+        for i, ch in enumerate(text):
+            if ch.isspace():
+                if not previous_space:
+                    chars.append(" ")
+                    index.append(i)
+                previous_space = True
+            else:
+                chars.append(ch.lower())
+                index.append(i)
+                previous_space = False
+        self.text = "".join(chars)
+        self.index = index
+
+    def find(self, quote: str) -> Optional[Tuple[int, int]]:
+        needle = " ".join(quote.lower().split())
+        if not needle:
+            return None
+        position = self.text.find(needle)
+        if position == -1:
+            return None
+        return self.index[position], self.index[position + len(needle) - 1] + 1
+
+
+@dataclass
+class FieldVerification:
+    """Local verification outcome for one field."""
+    field_name: str
+    status: str  # "verified", "empty", "no_quote", "quote_not_found", "value_mismatch", "unverifiable"
+    score: float
+    quote_score: float = 0.0
+    value_score: float = 0.0
+    span: Optional[Tuple[int, int]] = None
+    detail: str = ""
+
+    @property
+    def passed(self) -> bool:
+        return self.status in ("verified", "empty")
+
+
+@dataclass
+class VerificationReport:
+    """Per-field verification for one extraction."""
+    fields: Dict[str, FieldVerification] = field(default_factory=dict)
+
+    @property
+    def failed(self) -> List[str]:
+        return [name for name, result in self.fields.items() if not result.passed]
+
+    @property
+    def verified(self) -> List[str]:
+        return [name for name, result in self.fields.items() if result.status == "verified"]
+
+    @property
+    def needs_checker(self) -> bool:
+        """True unless every non-empty field verified and at least one did."""
+        return bool(self.failed) or not self.verified
+
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        return {name: asdict(result) for name, result in self.fields.items()}
+
+    def to_checker_result(
+        self,
+        threshold: float,
+        accuracy_weight: float,
+        consistency_weight: float,
+        checker_result: Optional[CheckerResult] = None,
+    ) -> CheckerResult:
+        """
+        Combine local scores with an LLM check of the failed fields.
+
+        Locally verified fields contribute their verification score to both
+        accuracy and consistency; the checker's scores stand for the fields
+        it was given. Empty fields are left out. Without a checker result
+        every field must have passed, and nothing verified scores 0.
+        """
+        verified = [self.fields[name].score for name in self.verified]
+        failed = len(self.failed) if checker_result is not None else 0
+        total = len(verified) + failed
+        if total == 0:
+            accuracy = checker_result.accuracy_score if checker_result is not None else 0.0
+            consistency = checker_result.consistency_score if checker_result is not None else 0.0
+        else:
+            accuracy = sum(verified) / total
+            consistency = sum(verified) / total
+            if checker_result is not None:
+                accuracy += checker_result.accuracy_score * failed / total
+                consistency += checker_result.consistency_score * failed / total
+        overall = accuracy * accuracy_weight + consistency * consistency_weight
+        return CheckerResult(
+            accuracy_score=accuracy,
+            consistency_score=consistency,
+            overall_score=overall,
+            issues=list(checker_result.issues) if checker_result else [],
+            suggestions=list(checker_result.suggestions) if checker_result else [],
+            passed=overall >= threshold,
+        )
+
+
+class LocalEvidenceVerifier:
+    """Verifies evidence quotes and values against the source text without LLM calls."""
+
+    def __init__(
+        self,
+        quote_threshold: float = constants.LOCAL_VERIFY_QUOTE_THRESHOLD,
+        value_threshold: float = constants.LOCAL_VERIFY_VALUE_THRESHOLD,
+    ):
+        """
+        Initialize the verifier.
+
+        Args:
+            quote_threshold: Minimum fuzzy match score for a quote to be found
+            value_threshold: Minimum share of the value supported by the span
+        """
+        self.quote_threshold = quote_threshold
+        self.value_threshold = value_threshold
+
+    def resolve_quote(
+        self,
+        source_text: str,
+        quote: str,
+        normalized: Optional[_NormalizedText] = None,
+        index: Optional[QuoteIndex] = None,
+    ) -> Tuple[Optional[Tuple[int, int]], float]:
+        """
+        Locate a quote in the source text.
+
+        Returns:
+            Tuple of ((start, end) span or None, match score)
+        """
+        position = source_text.find(quote)
+        if position != -1:
+            return (position, position + len(quote)), 1.0
+        span = (normalized or _NormalizedText(source_text)).find(quote)
+        if span is not None:
+            return span, 1.0
+        index = index or get_quote_index(source_text)
+        _, score, span = index.best_match(quote, threshold=self.quote_threshold)
+        return span, score
+
+    def value_score(self, value_text: str, span_text: str) -> float:
+        """Share of the value's numbers (or content words) supported by the span."""
+        value_numbers = _numbers(value_text)
+        if value_numbers:
+            span_numbers = set(_numbers(span_text))
+            return sum(1 for n in value_numbers if n in span_numbers) / len(value_numbers)
+
+        span_words = {_stem(w) for w in _words(span_text)}
+        value_words = [w for w in _words(value_text) if w not in STOPWORDS]
+        if not value_words:
+            return 0.0
+        supported = 0
+        for word in value_words:
+            if _stem(word) in span_words or SYNONYMS.get(word, set()) & span_words:
+                supported += 1
+        return supported / len(value_words)
+
+    def verify_field(
+        self,
+        source_text: str,
+        field_name: str,
+        value: Any,
+        quotes: Sequence[str],
+        normalized: Optional[_NormalizedText] = None,
+        index: Optional[QuoteIndex] = None,
+    ) -> FieldVerification:
+        """Verify one field against its best supporting quote."""
+        value_text = _value_text(value)
+        if value_text is None:
+            if isinstance(value, bool):
+                return FieldVerification(field_name, "unverifiable", 0.0, detail="Boolean value")
+            return FieldVerification(field_name, "empty", 1.0, detail="No value to verify")
+
+        quotes = [q for q in quotes if q and q.strip()]
+        if not quotes:
+            return FieldVerification(field_name, "no_quote", 0.0, detail="No supporting quote")
+
+        best: Optional[FieldVerification] = None
+        for quote in quotes:
+            span, quote_score = self.resolve_quote(source_text, quote, normalized, index)
+            if span is None or quote_score < self.quote_threshold:
+                candidate = FieldVerification(
+                    field_name, "quote_not_found", 0.0, quote_score=quote_score,
+                    detail=f"Quote not found in source (best score {quote_score:.2f})",
+                )
+            else:
+                value_score = self.value_score(value_text, source_text[span[0]:span[1]])
+                status = "verified" if value_score >= self.value_threshold else "value_mismatch"
+                candidate = FieldVerification(
+                    field_name, status, round(quote_score * value_score, 3),
+                    quote_score=round(quote_score, 3), value_score=round(value_score, 3), span=span,
+                    detail="" if status == "verified" else f"Value '{value_text}' not supported by quote",
+                )
+            if best is None or (candidate.passed, candidate.score) > (best.passed, best.score):
+                best = candidate
+        return best
+
+    def verify(
+        self,
+        source_text: str,
+        data: Dict[str, Any],
+        evidence: List[Dict[str, Any]],
+    ) -> VerificationReport:
+        """
+        Verify every extracted field.
+
+        Quotes come from evidence items; a schema's own "<field>_quote"
+        column is used when a field has no evidence item.
+
+        Args:
+            source_text: Text the extraction was made from
+            data: Extracted field values
+            evidence: Evidence dicts (field_name, exact_quote, ...)
+
+        Returns:
+            VerificationReport keyed by field name
+        """
+        quotes: Dict[str, List[str]] = {}
+        for item in evidence:
+            quotes.setdefault(item.get("field_name", ""), []).append(item.get("exact_quote") or "")
+
+        normalized = _NormalizedText(source_text)
+        index = get_quote_index(source_text)
+        report = VerificationReport()
+        for name, value in data.items():
+            if name in constants.METADATA_FIELDS or name.endswith("_quote"):
+                continue
+            field_quotes = quotes.get(name) or []
+            if not any(q.strip() for q in field_quotes):
+                companion = data.get(f"{name}_quote")
+                field_quotes = [companion] if isinstance(companion, str) else []
+            report.fields[name] = self.verify_field(source_text, name, value, field_quotes, normalized, index)
+        return report
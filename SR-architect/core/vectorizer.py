@@ -234,6 +234,9 @@ class ChromaVectorStore:
             "chunk_type": chunk.chunk_type,
             "chunk_index": index,
         }
+        if chunk.start is not None:
+            metadata["char_start"] = chunk.start
+            metadata["char_end"] = chunk.end
         
         if extracted_data:
             self._enrich_metadata_from_extraction(metadata, extracted_data)
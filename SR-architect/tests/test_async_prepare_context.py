@@ -0,0 +1,94 @@
+"""
+Tests for the async context-preparation path of ExtractionExecutor.
+"""
+import asyncio
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from pydantic import BaseModel
+
+from core.parser import DocumentChunk, ParsedDocument
+from core.pipeline.extraction.executor import ExtractionExecutor
+
+
+class Schema(BaseModel):
+    patient_age: str = ""
+
+
+def _doc(i):
+    text = f"Document {i} body."
+    return ParsedDocument(filename=f"{i}.pdf", full_text=text, chunks=[DocumentChunk(text=text)])
+
+
+def _executor(filter_and_classify, filter_and_classify_async=None):
+    regex = MagicMock()
+    regex.extract_all.return_value = {}
+    return ExtractionExecutor(
+        extractor=MagicMock(),
+        checker=MagicMock(),
+        regex_extractor=regex,
+        max_iterations=1,
+        score_threshold=0.8,
+        logger=MagicMock(),
+        compute_fingerprint=lambda text: text,
+        check_duplicate=lambda fingerprint: None,
+        cache_result=lambda fingerprint, result: None,
+        filter_and_classify=filter_and_classify,
+        filter_and_classify_async=filter_and_classify_async,
+    )
+
+
+@pytest.fixture
+def validation_loop():
+    with patch(
+        "core.pipeline.extraction.validation.run_validation_loop_async",
+        new=AsyncMock(return_value="result"),
+    ) as mock:
+        yield mock
+
+
+@pytest.mark.asyncio
+async def test_extract_async_uses_async_classification(validation_loop):
+    sync_filter = MagicMock()
+    chunks = [DocumentChunk(text="Relevant.")]
+    async_filter = AsyncMock(return_value=(chunks, {}, {}, []))
+    executor = _executor(sync_filter, async_filter)
+
+    result = await executor.extract_async(_doc(0), Schema, "theme")
+
+    assert result == "result"
+    sync_filter.assert_not_called()
+    async_filter.assert_awaited_once()
+    assert async_filter.await_args.args[2] == ["patient_age"]
+    assert validation_loop.await_args.kwargs["relevant_chunks"] is chunks
+
+
+@pytest.mark.asyncio
+async def test_relevance_phase_overlaps_across_documents(validation_loop):
+    """Ten documents classify concurrently instead of one after another."""
+    async def slow_classify(document, theme, schema_fields):
+        await asyncio.sleep(0.1)
+        return document.chunks, {}, {}, []
+
+    executor = _executor(MagicMock(), slow_classify)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(executor.extract_async(_doc(i), Schema, "theme") for i in range(10)))
+    assert time.perf_counter() - start < 0.5
+
+
+@pytest.mark.asyncio
+async def test_sync_classifier_runs_off_the_event_loop(validation_loop):
+    loop_thread = threading.get_ident()
+    seen = []
+
+    def sync_classify(document, theme, schema_fields):
+        seen.append(threading.get_ident())
+        return document.chunks, {}, {}, []
+
+    executor = _executor(sync_classify)
+    await executor.extract_async(_doc(0), Schema, "theme")
+
+    assert seen and seen[0] != loop_thread
@@ -0,0 +1,111 @@
+"""
+Tests for span-backed DocumentChunk and ParsedDocument.bind_chunks.
+"""
+import pickle
+
+import pytest
+
+from core.parsers.base import DocumentChunk, ParsedDocument
+
+
+FULL_TEXT = "Abstract text.\n\nMethods: we did things.\n\nResults: things happened."
+
+
+def _doc(chunks):
+    return ParsedDocument(filename="a.pdf", chunks=chunks, full_text=FULL_TEXT)
+
+
+def test_chunk_keeps_model_api():
+    chunk = DocumentChunk(text="hello", section="Intro", page_number=2, chunk_index=0)
+    assert chunk.text == "hello"
+    assert chunk.start is None
+    assert chunk.to_dict() == {
+        "text": "hello", "section": "Intro", "subsection": "",
+        "chunk_type": "text", "page_number": 2, "source_file": "",
+    }
+    assert chunk == DocumentChunk(**chunk.model_dump())
+
+
+def test_from_span_slices_lazily():
+    chunk = DocumentChunk.from_span(FULL_TEXT, 16, 38, section="Methods")
+    assert chunk.text == FULL_TEXT[16:38]
+    assert (chunk.start, chunk.end) == (16, 38)
+    assert len(chunk) == 22
+    assert chunk.is_span_of(FULL_TEXT)
+
+
+def test_bind_chunks_points_into_full_text():
+    doc = _doc([
+        DocumentChunk(text="Abstract text."),
+        DocumentChunk(text="Methods: we did things."),
+        DocumentChunk(text="| table |", chunk_type="table"),
+        DocumentChunk(text="Results: things happened."),
+    ])
+
+    assert doc.bind_chunks() == 3
+    methods = doc.chunks[1]
+    assert methods.is_span_of(doc.full_text)
+    assert doc.full_text[methods.start:methods.end] == "Methods: we did things."
+    # Text that is not in full_text stays owned by the chunk
+    assert doc.chunks[2].start is None
+    assert doc.chunks[2].text == "| table |"
+
+
+def test_bind_chunks_resolves_repeated_text_in_order():
+    text = "same. same. same."
+    doc = ParsedDocument(filename="a.txt", full_text=text, chunks=[
+        DocumentChunk(text="same."), DocumentChunk(text="same."), DocumentChunk(text="same."),
+    ])
+    doc.bind_chunks()
+    assert [c.start for c in doc.chunks] == [0, 6, 12]
+
+
+def test_bind_chunks_uses_offset_hints():
+    doc = _doc([DocumentChunk(text="things", start=FULL_TEXT.rindex("things"))])
+    doc.bind_chunks()
+    assert doc.chunks[0].start == FULL_TEXT.rindex("things")
+
+
+def test_setting_text_detaches_span():
+    chunk = DocumentChunk.from_span(FULL_TEXT, 0, 8)
+    chunk.text = "edited"
+    assert chunk.text == "edited"
+    assert chunk.start is None
+    assert not chunk.is_span_of(FULL_TEXT)
+
+
+def test_parsed_document_round_trips():
+    doc = _doc([DocumentChunk(text="Methods: we did things.", page_number=1)])
+    doc.bind_chunks()
+
+    restored = ParsedDocument(**doc.model_dump())
+    assert restored.chunks[0].text == "Methods: we did things."
+    assert restored.chunks[0].start == doc.chunks[0].start
+    assert '"start":16' in doc.model_dump_json()
+
+    unpickled = pickle.loads(pickle.dumps(doc))
+    assert unpickled.chunks[0].is_span_of(unpickled.full_text)
+
+
+def test_rejects_non_string_text():
+    with pytest.raises(TypeError):
+        DocumentChunk(text=None)
+    with pytest.raises(Exception):
+        ParsedDocument(filename="a", chunks=[42])
+
+
+def test_pymupdf_chunks_carry_page_offsets(tmp_path):
+    fitz = pytest.importorskip("fitz")
+    from core.parsers.fallbacks import PyMuPDFParser
+
+    pdf = fitz.open()
+    for i in range(3):
+        pdf.new_page().insert_text((72, 72), f"Page {i + 1} body text.")
+    path = tmp_path / "three.pdf"
+    pdf.save(path)
+    pdf.close()
+
+    doc = PyMuPDFParser().parse(path)
+    assert [c.page_number for c in doc.chunks] == [1, 2, 3]
+    for chunk in doc.chunks:
+        assert doc.full_text[chunk.start:chunk.end] == chunk.text
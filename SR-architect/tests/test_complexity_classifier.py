@@ -1,12 +1,16 @@
 """
 Unit tests for ComplexityClassifier.
 """
+import tempfile
 import unittest
 from unittest.mock import patch, MagicMock
 from pathlib import Path
 
+import pytest
+
 from core.complexity_classifier import ComplexityClassifier, ComplexityLevel, ComplexityResult
 from core.parser import ParsedDocument, DocumentChunk
+from core.parsers.probe import PageProbe, PDFProbe, probe_pdf
 
 
 class TestComplexityClassifier(unittest.TestCase):
@@ -105,6 +109,59 @@ class TestComplexityClassifier(unittest.TestCase):
         self.assertIsInstance(strategy, dict)
         self.assertIn("primary", strategy)
 
+    def test_classify_probe_simple_text_paper(self):
+        """Text-only single-column probe should route to PyMuPDF."""
+        probe = PDFProbe(
+            page_count=6,
+            pages=[PageProbe(page_number=i + 1, text_chars=3000, font_sizes=[9.0, 10.0, 14.0]) for i in range(6)],
+        )
+        
+        result = self.classifier.classify_probe(probe)
+        
+        self.assertEqual(result.level, ComplexityLevel.SIMPLE)
+        self.assertEqual(result.recommendations["primary"], "pymupdf")
+
+    def test_classify_probe_tables_and_columns_route_to_docling(self):
+        """Ruled tables in a two-column layout should be upgraded to Docling."""
+        pages = [PageProbe(page_number=i + 1, text_chars=3000, multi_column=True) for i in range(6)]
+        pages[2].ruling_lines = 12
+        
+        result = self.classifier.classify_probe(PDFProbe(page_count=6, pages=pages))
+        
+        self.assertTrue(result.signals["has_tables"])
+        self.assertTrue(result.signals["multi_column"])
+        self.assertEqual(result.recommendations["primary"], "docling")
+
+    def test_classify_probe_flags_scanned(self):
+        pages = [PageProbe(page_number=i + 1, text_chars=0, image_coverage=0.95) for i in range(3)]
+        
+        result = self.classifier.classify_probe(PDFProbe(page_count=3, pages=pages))
+        
+        self.assertTrue(result.signals["scanned_document"])
+
+
+class TestProbePDF(unittest.TestCase):
+    def test_probe_detects_rulings_and_text(self):
+        fitz = pytest.importorskip("fitz")
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "table.pdf"
+            pdf = fitz.open()
+            page = pdf.new_page()
+            page.insert_text((72, 72), "Table 1. Patient characteristics", fontsize=12)
+            for y in (100, 120, 140, 160, 180):
+                page.draw_line((72, y), (500, y))
+            pdf.new_page().insert_text((72, 72), "Discussion text", fontsize=10)
+            pdf.save(path)
+            pdf.close()
+            
+            probe = probe_pdf(path)
+        
+        self.assertEqual(probe.page_count, 2)
+        self.assertEqual(probe.pages[0].ruling_lines, 5)
+        self.assertEqual(probe.pages[1].ruling_lines, 0)
+        self.assertGreater(probe.text_chars, 0)
+        self.assertEqual(probe.font_size_count, 2)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -8,6 +8,7 @@ from pathlib import Path
 from core.parsers.manager import DocumentParser
 from core.complexity_classifier import ComplexityClassifier, ComplexityLevel, ComplexityResult
 from core.parsers.base import ParsedDocument, DocumentChunk
+from core.parsers.probe import PageProbe, PDFProbe
 
 @pytest.fixture
 def mock_classifier():
@@ -29,68 +30,109 @@ def mock_pymupdf():
 def parser(mock_classifier, mock_docling, mock_pymupdf):
     return DocumentParser()
 
-def test_parse_pdf_uses_pymupdf_initially(parser, mock_pymupdf, mock_classifier):
-    """Test that parser starts with PyMuPDF (scanner)."""
-    # Setup
-    pdf_path = "test.pdf"
-    with patch("pathlib.Path.exists", return_value=True), \
-         patch.object(parser, "_load_cached", return_value=None), \
-         patch.object(parser, "_save_to_cache"):
-        parser.parse_pdf(pdf_path)
-    
-    # Verification
-    mock_pymupdf.parse.assert_called_once()
-    # Should calculate complexity
-    mock_classifier.get_parser_strategy.assert_called_once()
-
-def test_parse_pdf_switches_to_docling_for_complex(parser, mock_pymupdf, mock_docling, mock_classifier):
-    """Test that parser switches to Docling if classified as complex."""
-    # Setup
-    pdf_path = "complex.pdf"
-    
-    # Mock PyMuPDF result
-    simple_doc = ParsedDocument(filename="complex.pdf", chunks=[], full_text="Complex layout", metadata={})
-    mock_pymupdf.parse.return_value = simple_doc
-    
-    # Mock Classifier result -> Recommend Docling
-    mock_classifier.get_parser_strategy.return_value = {
-        "primary": "docling",
-        "fallback": "pdfplumber", 
-        "use_ocr": True
-    }
-    
+@pytest.fixture
+def mock_probe():
+    probe = PDFProbe(page_count=4, pages=[PageProbe(page_number=i + 1) for i in range(4)])
+    with patch("core.parsers.manager.probe_pdf", return_value=probe) as mock:
+        yield mock
+
+
+def _complexity(primary, fallback=None):
+    return ComplexityResult(
+        level=ComplexityLevel.SIMPLE if primary == "pymupdf" else ComplexityLevel.MEDIUM,
+        score=0,
+        recommendations={"primary": primary, "fallback": fallback, "use_ocr": False},
+    )
+
+
+def _parse(parser, pdf_path):
     with patch("pathlib.Path.exists", return_value=True), \
          patch.object(parser, "_load_cached", return_value=None), \
          patch.object(parser, "_save_to_cache"):
-        result = parser.parse_pdf(pdf_path)
-        
-    # Verification
-    mock_pymupdf.parse.assert_called_once() # Scan
-    mock_classifier.get_parser_strategy.assert_called_with(simple_doc) # Classify
-    mock_docling.parse.assert_called_once() # Re-parse
-
-def test_parse_pdf_keeps_pymupdf_for_simple(parser, mock_pymupdf, mock_docling, mock_classifier):
-    """Test that parser keeps PyMuPDF result if classified as simple."""
-    # Setup
-    pdf_path = "simple.pdf"
-    
-    # Mock PyMuPDF result
+        return parser.parse_pdf(pdf_path)
+
+
+def test_parse_pdf_probes_before_parsing(parser, mock_probe, mock_pymupdf, mock_classifier):
+    """The parser is chosen from the layout probe, not from a first parse."""
+    mock_classifier.classify_probe.return_value = _complexity("pymupdf")
+    mock_pymupdf.parse.return_value = ParsedDocument(filename="test.pdf", chunks=[], full_text="x", metadata={})
+
+    result = _parse(parser, "test.pdf")
+
+    mock_probe.assert_called_once()
+    mock_classifier.classify_probe.assert_called_once_with(mock_probe.return_value)
+    mock_classifier.get_parser_strategy.assert_not_called()
+    assert result.metadata["page_count"] == 4
+    assert result.metadata["complexity"]["level"] == "simple"
+
+
+def test_parse_pdf_routes_complex_straight_to_docling(parser, mock_probe, mock_pymupdf, mock_docling, mock_classifier):
+    """Docling-routed documents never pay for a PyMuPDF parse."""
+    mock_classifier.classify_probe.return_value = _complexity("docling", "pdfplumber")
+    mock_classifier.docling_pages.return_value = None  # whole document
+    docling_doc = ParsedDocument(filename="complex.pdf", chunks=[], full_text="Docling", metadata={})
+    mock_docling.parse.return_value = docling_doc
+
+    result = _parse(parser, "complex.pdf")
+
+    mock_docling.parse.assert_called_once()
+    mock_pymupdf.parse.assert_not_called()
+    assert result is docling_doc
+
+
+def test_parse_pdf_keeps_pymupdf_for_simple(parser, mock_probe, mock_pymupdf, mock_docling, mock_classifier):
+    """Simple documents are parsed once with PyMuPDF."""
+    mock_classifier.classify_probe.return_value = _complexity("pymupdf")
     simple_doc = ParsedDocument(filename="simple.pdf", chunks=[], full_text="Simple text", metadata={})
     mock_pymupdf.parse.return_value = simple_doc
-    
-    # Mock Classifier result -> Recommend PyMuPDF
-    mock_classifier.get_parser_strategy.return_value = {
-        "primary": "pymupdf",
-        "fallback": None, 
-        "use_ocr": False
-    }
-    
-    with patch("pathlib.Path.exists", return_value=True), \
-         patch.object(parser, "_load_cached", return_value=None), \
-         patch.object(parser, "_save_to_cache"):
-        result = parser.parse_pdf(pdf_path)
-        
-    # Verification
-    mock_pymupdf.parse.assert_called_once() # Scan
-    mock_docling.parse.assert_not_called() # No re-parse
+
+    result = _parse(parser, "simple.pdf")
+
+    mock_pymupdf.parse.assert_called_once()
+    mock_docling.parse.assert_not_called()
     assert result == simple_doc
+
+
+def test_parse_pdf_falls_back_when_docling_fails(parser, mock_probe, mock_pymupdf, mock_docling, mock_classifier):
+    mock_classifier.classify_probe.return_value = _complexity("docling")
+    mock_classifier.docling_pages.return_value = None
+    mock_docling.parse.side_effect = ImportError("Docling not installed")
+    mock_pymupdf.parse.return_value = ParsedDocument(filename="a.pdf", chunks=[], full_text="x", metadata={})
+
+    result = _parse(parser, "a.pdf")
+
+    assert result.full_text == "x"
+
+
+def test_parse_pdf_without_probe_uses_pymupdf(parser, mock_pymupdf, mock_docling, mock_classifier):
+    """If probing fails, PyMuPDF is tried first and Docling is the fallback."""
+    mock_pymupdf.parse.return_value = ParsedDocument(filename="a.pdf", chunks=[], full_text="x", metadata={})
+
+    with patch("core.parsers.manager.probe_pdf", side_effect=RuntimeError("broken xref")):
+        _parse(parser, "a.pdf")
+
+    mock_pymupdf.parse.assert_called_once()
+    mock_docling.parse.assert_not_called()
+
+
+def test_parse_pdf_hybrid_sends_only_flagged_pages_to_docling(parser, mock_probe, mock_pymupdf, mock_docling, mock_classifier):
+    """Only the pages that need Docling are converted with it."""
+    mock_classifier.classify_probe.return_value = _complexity("docling")
+    mock_classifier.docling_pages.return_value = [3]
+    mock_docling.parse.return_value = ParsedDocument(
+        filename="a.pdf",
+        chunks=[DocumentChunk(text="| a | b |", section="Results", chunk_type="table", page_number=3)],
+        full_text="| a | b |",
+    )
+    mock_pymupdf.iter_pages.return_value = iter([(1, "p1"), (2, "p2"), (4, "p4")])
+    mock_pymupdf.page_chunks.side_effect = lambda text, page, name: [DocumentChunk(text=text, page_number=page)]
+
+    result = _parse(parser, "a.pdf")
+
+    mock_docling.parse.assert_called_once_with(Path("a.pdf"), page_range=(3, 3))
+    mock_pymupdf.iter_pages.assert_called_once_with(Path("a.pdf"), [1, 2, 4])
+    mock_pymupdf.parse.assert_not_called()
+    assert [c.page_number for c in result.chunks] == [1, 2, 3, 4]
+    assert result.chunks[2].section == "Results"
+    assert result.metadata["parser"] == "hybrid"
+    assert result.metadata["docling_pages"] == [3]
@@ -0,0 +1,131 @@
+"""
+Tests for concurrent schema-chunk extraction over a shared context.
+"""
+import asyncio
+import time
+from typing import Optional
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from pydantic import BaseModel
+
+from core.batch import BatchExecutor
+from core.data_types import PipelineResult
+from core.parser import DocumentChunk, ParsedDocument
+from core.pipeline import HierarchicalExtractionPipeline
+from core.pipeline.extraction.helpers import merge_pipeline_results
+
+
+class Demographics(BaseModel):
+    patient_age: Optional[str] = None
+    filename: Optional[str] = None
+    extraction_confidence: Optional[float] = None
+
+
+class Imaging(BaseModel):
+    ct_findings: Optional[str] = None
+    filename: Optional[str] = None
+    extraction_confidence: Optional[float] = None
+
+
+class Outcome(BaseModel):
+    follow_up: Optional[str] = None
+    filename: Optional[str] = None
+    extraction_confidence: Optional[float] = None
+
+
+CHUNKS = [Demographics, Imaging, Outcome]
+DOCUMENT = ParsedDocument(
+    filename="case.pdf",
+    full_text="A 62-year-old woman. CT showed micronodules. Stable at follow-up.",
+    chunks=[DocumentChunk(text="A 62-year-old woman. CT showed micronodules. Stable at follow-up.")],
+)
+
+
+def _result(schema, score=0.9, warnings=()):
+    data = {name: f"{name}-value" for name in schema.model_fields}
+    data.update(filename="case.pdf", extraction_confidence=score)
+    return PipelineResult(
+        final_data=data,
+        evidence=[{"field_name": name} for name in schema.model_fields if name not in ("filename", "extraction_confidence")],
+        final_accuracy_score=score,
+        final_consistency_score=score,
+        final_overall_score=score,
+        passed_validation=score >= 0.8,
+        iterations=1,
+        warnings=list(warnings),
+        source_filename="case.pdf",
+        extraction_timestamp="2026-01-01T00:00:00",
+    )
+
+
+@pytest.fixture
+def pipeline():
+    with patch("core.pipeline.core.utils.get_async_llm_client"):
+        pipeline = HierarchicalExtractionPipeline(provider="openrouter", model="model-a")
+    classify = AsyncMock(side_effect=lambda document, theme, fields: (document.chunks, {}, {}, []))
+    pipeline._extraction_executor.filter_and_classify_async = classify
+    pipeline._extraction_executor.local_verifier = None
+    return pipeline
+
+
+@pytest.fixture
+def slow_validation():
+    async def validate(**kwargs):
+        await asyncio.sleep(0.2)
+        return _result(kwargs["schema"])
+
+    with patch("core.pipeline.extraction.validation.run_validation_loop_async", new=AsyncMock(side_effect=validate)) as mock:
+        yield mock
+
+
+def test_chunks_share_one_context_and_run_concurrently(pipeline, slow_validation):
+    start = time.perf_counter()
+    result = asyncio.run(pipeline.extract_document_chunked_async(DOCUMENT, CHUNKS, "theme"))
+    elapsed = time.perf_counter() - start
+
+    classify = pipeline._extraction_executor.filter_and_classify_async
+    assert classify.await_count == 1
+    assert classify.await_args.args[2] == ["patient_age", "filename", "extraction_confidence", "ct_findings", "follow_up"]
+    assert elapsed < 0.45
+    contexts = {call.kwargs["context"] for call in slow_validation.await_args_list}
+    assert len(contexts) == 1
+    assert set(result.final_data) == {"patient_age", "ct_findings", "follow_up", "filename", "extraction_confidence"}
+    assert len(result.evidence) == 3
+
+
+def test_repeat_run_reuses_each_chunk_result_without_preparing(pipeline, slow_validation):
+    asyncio.run(pipeline.extract_document_chunked_async(DOCUMENT, CHUNKS, "theme"))
+    result = asyncio.run(pipeline.extract_document_chunked_async(DOCUMENT, CHUNKS, "theme"))
+
+    assert pipeline._extraction_executor.filter_and_classify_async.await_count == 1
+    assert slow_validation.await_count == 3
+    assert result.final_data["follow_up"] == "follow_up-value"
+    assert pipeline._shared_fingerprints == {}
+
+
+def test_merge_pipeline_results_combines_chunks():
+    merged = merge_pipeline_results([
+        _result(Demographics, 0.9, ["shared warning"]),
+        _result(Imaging, 0.6, ["shared warning", "imaging warning"]),
+    ])
+
+    assert merged.final_data["patient_age"] == "patient_age-value"
+    assert merged.final_data["ct_findings"] == "ct_findings-value"
+    assert merged.final_data["extraction_confidence"] == pytest.approx(0.75)
+    assert merged.final_overall_score == pytest.approx(0.75)
+    assert not merged.passed_validation
+    assert merged.warnings == ["shared warning", "imaging warning"]
+
+
+def test_batch_executor_routes_chunk_lists_to_chunked_extraction():
+    pipeline = MagicMock()
+    pipeline.extract_document_chunked_async = AsyncMock(return_value=_result(Demographics))
+    executor = BatchExecutor(pipeline=pipeline, state_manager=MagicMock(save_async=AsyncMock()), max_workers=2)
+    callback = MagicMock()
+
+    asyncio.run(executor.process_batch_async([DOCUMENT], CHUNKS, "theme", resume=False, callback=callback))
+
+    pipeline.extract_document_chunked_async.assert_awaited_once_with(DOCUMENT, CHUNKS, "theme")
+    pipeline.extract_document_async.assert_not_called()
+    assert callback.call_args.args[2] == "success"
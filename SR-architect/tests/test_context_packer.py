@@ -0,0 +1,99 @@
+"""
+Tests for token-budget context packing.
+"""
+from core.context_packer import ContextPacker
+from core.context_window_monitor import context_limit_for
+from core.parser import DocumentChunk
+from core.pipeline.stages import prepare_extraction_context
+
+FIELDS = ["tumor_size", "treatment", "patient_age", "filename"]
+
+DISCUSSION = DocumentChunk(
+    text=" ".join(f"Prior series discussed pathogenesis hypothesis number {i} at length." for i in range(60)),
+    section="Discussion",
+)
+RESULTS = DocumentChunk(
+    text="Table 1. Tumor size 6 mm; treatment: observation; patient age 62 years.",
+    section="Results",
+)
+INTRO = DocumentChunk(text="Meningotheliomatosis is a rare entity of unknown origin.", section="Introduction")
+
+
+def test_model_limits_resolve_through_prefixes():
+    assert context_limit_for("openai/gpt-4o-2024-08-06") == 128000
+    assert context_limit_for("google/gemini-2.5-flash-lite") == 1048576
+    assert context_limit_for("llama3.1:8b") == 8192
+    assert context_limit_for("some-new-model") == context_limit_for("default")
+
+
+def test_budget_is_capped_by_model_window():
+    assert ContextPacker("gpt-4", token_budget=None).token_budget <= 8192 // 2
+    assert ContextPacker("gpt-4o", token_budget=500).token_budget == 500
+
+
+def test_short_field_dense_chunk_beats_long_discussion():
+    packer = ContextPacker("gpt-4o", token_budget=150)
+    packed = packer.pack([INTRO, DISCUSSION, RESULTS], FIELDS)
+
+    assert packed.selected == [0, 2]
+    assert packed.skipped == [1]
+    assert packed.text.startswith("Meningotheliomatosis")
+    assert packed.text.endswith("62 years.")
+    assert packed.tokens <= packed.budget
+
+
+def test_relevance_scores_rank_chunks():
+    packer = ContextPacker("gpt-4o", token_budget=20)
+    packed = packer.pack([INTRO, RESULTS], [], scores=[0.1, 0.9])
+    assert packed.selected == [1]
+
+
+def test_overlapping_windows_are_trimmed():
+    text = " ".join(f"Sentence {i} describes finding {i} in detail." for i in range(40))
+    middle = len(text) // 2
+    first = DocumentChunk(text=text[:middle + 120])
+    second = DocumentChunk(text=text[middle - 120:])
+
+    packed = ContextPacker("gpt-4o", token_budget=5000).pack([first, second], FIELDS)
+
+    assert packed.selected == [0, 1]
+    assert packed.trimmed_chars > 150
+    for i in range(40):
+        assert packed.text.count(f"Sentence {i} describes") == 1
+
+
+def test_duplicate_window_is_skipped():
+    packed = ContextPacker("gpt-4o", token_budget=5000).pack([RESULTS, DocumentChunk(text=RESULTS.text)], FIELDS)
+    assert packed.selected == [0]
+    assert packed.skipped == [1]
+
+
+def test_oversized_single_chunk_is_truncated_to_budget():
+    packer = ContextPacker("gpt-4o", token_budget=50)
+    packed = packer.pack([DISCUSSION], FIELDS)
+    assert packed.selected == [0]
+    assert 0 < packed.tokens <= 55
+
+
+def test_context_builder_receives_fields_and_scores():
+    calls = {}
+
+    def build(chunks, schema_fields=None, scores=None):
+        calls.update(schema_fields=schema_fields, scores=scores)
+        return "context"
+
+    class Schema:
+        model_fields = {"tumor_size": None}
+
+    ctx = prepare_extraction_context(
+        document=type("Doc", (), {"full_text": "text"})(),
+        schema=Schema,
+        theme="theme",
+        compute_fingerprint=lambda text: "fp",
+        check_duplicate=lambda fp: None,
+        filter_and_classify_fn=lambda doc, theme, fields: ([RESULTS], {}, {"chunk_scores": [0.9]}, []),
+        build_context_fn=build,
+    )
+
+    assert ctx["context"] == "context"
+    assert calls == {"schema_fields": ["tumor_size"], "scores": [0.9]}
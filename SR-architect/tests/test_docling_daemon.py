@@ -0,0 +1,144 @@
+"""
+Tests for the warm Docling worker daemon and its client.
+"""
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from core.parsers.base import DocumentChunk, ParsedDocument
+from core.parsers.daemon import (
+    DaemonJobError,
+    DaemonUnavailable,
+    DoclingDaemon,
+    DoclingDaemonClient,
+)
+from core.parsers.docling import DoclingParser
+
+
+class FakeParser:
+    """Stands in for a warm DoclingParser inside worker processes."""
+
+    def parse(self, path, page_range=None):
+        if "slow" in path.name:
+            time.sleep(30)
+        if "huge" in path.name:
+            ballast = bytearray(300 * 1024 * 1024)
+            time.sleep(30)
+        if "bad" in path.name:
+            raise ValueError("unreadable PDF")
+        first = page_range[0] if page_range else 1
+        return ParsedDocument(
+            filename=path.name,
+            chunks=[DocumentChunk(text="chunk", page_number=first, source_file=path.name)],
+            full_text=f"parsed {path.name}",
+            metadata={"parser": "docling"},
+        )
+
+
+@contextmanager
+def serve(socket_path, **kwargs):
+    daemon = DoclingDaemon(
+        socket_path=str(socket_path),
+        workers=1,
+        parser_factory=FakeParser,
+        start_method="fork",
+        **kwargs,
+    )
+    daemon.start()
+    thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield daemon
+    finally:
+        daemon.shutdown()
+        thread.join(timeout=10)
+
+
+@pytest.fixture
+def running_daemon(tmp_path):
+    with serve(tmp_path / "d.sock", job_timeout=1.0, max_memory_mb=0) as daemon:
+        yield daemon
+
+
+def test_client_parses_through_daemon(running_daemon, tmp_path):
+    client = DoclingDaemonClient(str(running_daemon.socket_path))
+
+    doc = client.parse(tmp_path / "paper.pdf", page_range=(3, 4))
+
+    assert client.is_running()
+    assert doc.full_text == "parsed paper.pdf"
+    assert doc.chunks[0].page_number == 3
+
+
+def test_job_errors_are_reported(running_daemon, tmp_path):
+    client = DoclingDaemonClient(str(running_daemon.socket_path))
+
+    with pytest.raises(DaemonJobError, match="unreadable PDF"):
+        client.parse(tmp_path / "bad.pdf")
+
+
+def test_timeout_kills_job_and_worker_is_replaced(running_daemon, tmp_path):
+    client = DoclingDaemonClient(str(running_daemon.socket_path))
+
+    with pytest.raises(DaemonJobError) as exc:
+        client.parse(tmp_path / "slow.pdf")
+
+    assert exc.value.kind == "timeout"
+    assert client.parse(tmp_path / "next.pdf").full_text == "parsed next.pdf"
+    assert client.status()["timeouts"] == 1
+
+
+def test_failed_respawn_rejects_jobs_instead_of_blocking(tmp_path):
+    with serve(tmp_path / "r.sock", job_timeout=1.0, max_memory_mb=0, queue_timeout=0.5) as daemon:
+        client = DoclingDaemonClient(str(daemon.socket_path))
+        with patch.object(daemon, "_spawn_worker", side_effect=RuntimeError("models missing")):
+            with pytest.raises(DaemonJobError):
+                client.parse(tmp_path / "slow.pdf")
+            with pytest.raises(DaemonJobError) as exc:
+                client.parse(tmp_path / "next.pdf")
+            status = client.status()
+
+    assert exc.value.kind == "unavailable"
+    assert status["workers"] == 0
+    assert status["configured_workers"] == 1
+
+
+def test_memory_cap_kills_job(tmp_path):
+    psutil = pytest.importorskip("psutil")
+    rss_mb = psutil.Process().memory_info().rss // (1024 * 1024)
+
+    with serve(tmp_path / "m.sock", job_timeout=20.0, max_memory_mb=rss_mb + 100) as daemon:
+        with pytest.raises(DaemonJobError) as exc:
+            DoclingDaemonClient(str(daemon.socket_path)).parse(tmp_path / "huge.pdf")
+
+    assert exc.value.kind == "memory"
+
+
+def test_client_without_daemon_is_unavailable(tmp_path):
+    client = DoclingDaemonClient(str(tmp_path / "missing.sock"))
+
+    assert not client.is_running()
+    with pytest.raises(DaemonUnavailable):
+        client.parse(tmp_path / "paper.pdf")
+
+
+def test_docling_parser_prefers_running_daemon(running_daemon, tmp_path):
+    parser = DoclingParser(daemon_socket=str(running_daemon.socket_path))
+
+    with patch.object(DoclingParser, "_ensure_docling") as ensure:
+        doc = parser.parse(tmp_path / "paper.pdf")
+
+    ensure.assert_not_called()
+    assert doc.full_text == "parsed paper.pdf"
+
+
+def test_docling_parser_falls_back_in_process(tmp_path):
+    parser = DoclingParser(daemon_socket=str(tmp_path / "missing.sock"))
+
+    with patch.object(DoclingParser, "_ensure_docling", side_effect=ImportError("Docling not installed")):
+        with pytest.raises(ImportError):
+            parser.parse(tmp_path / "paper.pdf")
@@ -0,0 +1,128 @@
+"""
+Tests for the local embedding relevance tier.
+"""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+import pytest
+
+from core.classification import EmbeddingRelevanceScorer, RelevanceClassifier, RelevanceResult
+from core.classification.embedding import library_specs
+from core.parser import DocumentChunk
+
+VOCAB = ["age", "years", "old", "patient", "funding", "acknowledge", "grant", "female", "women", "ct", "nodule"]
+
+
+def bag_of_words(texts):
+    """Deterministic stand-in encoder: word counts over a tiny vocabulary."""
+    rows = []
+    for text in texts:
+        words = text.lower().replace(".", " ").replace(":", " ").split()
+        rows.append([words.count(term) for term in VOCAB] + [0.01])
+    return np.array(rows, dtype=np.float32)
+
+
+@pytest.fixture
+def scorer():
+    return EmbeddingRelevanceScorer(encoder=bag_of_words, high_threshold=0.5, low_threshold=0.2)
+
+
+CHUNKS = [
+    DocumentChunk(text="Patient age: 54 years old, female."),
+    DocumentChunk(text="We acknowledge grant funding."),
+    DocumentChunk(text="The patient had a CT nodule."),
+]
+
+
+def test_library_specs_expose_keywords():
+    specs = library_specs()
+    assert "age" in specs
+    assert "years old" in specs["age"].high_confidence_keywords
+
+
+def test_scores_follow_field_similarity_and_keywords(scorer):
+    scores = scorer.score(CHUNKS, "case report", ["age", "sex_female"])
+    assert scores[0] > 0.5  # similarity + "years old"/"female" keyword boosts
+    assert scores[1] < 0.2
+
+
+def test_classify_leaves_ambiguous_chunks_undecided(scorer):
+    results = scorer.classify(CHUNKS, "case report", ["age"])
+    assert results[0].is_relevant
+    assert results[1].is_relevant is False
+    assert results[2] is None
+
+
+def test_query_embeddings_are_cached(scorer):
+    encoder = MagicMock(side_effect=bag_of_words)
+    scorer._encoder = encoder
+    scorer.score(CHUNKS, "theme", ["age"])
+    scorer.score(CHUNKS, "theme", ["age"])
+    assert encoder.call_count == 3  # queries once, chunks twice
+
+
+def _llm_classifier(mode, scorer):
+    classifier = RelevanceClassifier(api_key="mock", mode=mode, scorer=scorer)
+    classifier._classify_llm = MagicMock(side_effect=lambda chunks, *a: [
+        RelevanceResult(chunk_index=i, is_relevant=False, confidence=0.5, reason="llm")
+        for i in range(len(chunks))
+    ])
+    return classifier
+
+
+def test_hybrid_escalates_only_ambiguous_chunks(scorer):
+    classifier = _llm_classifier("hybrid", scorer)
+
+    results = classifier.classify_batch(CHUNKS, "case report", ["age"])
+
+    escalated = classifier._classify_llm.call_args.args[0]
+    assert [c.text for c in escalated] == [CHUNKS[2].text]
+    assert [r.chunk_index for r in results] == [0, 1, 2]
+    assert results[2].reason == "llm"
+
+
+def test_local_mode_makes_no_llm_calls(scorer):
+    classifier = _llm_classifier("local", scorer)
+
+    results = classifier.classify_batch(CHUNKS, "case report", ["age"])
+
+    classifier._classify_llm.assert_not_called()
+    assert [r.is_relevant for r in results] == [True, False, True]
+
+
+def test_hybrid_async_path(scorer):
+    classifier = RelevanceClassifier(api_key="mock", mode="hybrid", scorer=scorer)
+    classifier._classify_llm_async = AsyncMock(return_value=[
+        RelevanceResult(chunk_index=0, is_relevant=True, confidence=0.9, reason="llm")
+    ])
+
+    results = asyncio.run(classifier.classify_batch_async(CHUNKS, "case report", ["age"]))
+
+    assert classifier._classify_llm_async.await_count == 1
+    assert results[2].chunk_index == 2 and results[2].reason == "llm"
+
+
+def test_missing_encoder_falls_back_to_llm():
+    broken = EmbeddingRelevanceScorer(encoder=MagicMock(side_effect=ImportError("no model")))
+    classifier = _llm_classifier("hybrid", broken)
+
+    classifier.classify_batch(CHUNKS, "theme", ["age"])
+
+    assert len(classifier._classify_llm.call_args.args[0]) == 3
+
+
+def test_local_mode_without_encoder_keeps_chunks_without_llm():
+    broken = EmbeddingRelevanceScorer(encoder=MagicMock(side_effect=ImportError("no model")))
+    classifier = _llm_classifier("local", broken)
+
+    results = classifier.classify_batch(CHUNKS, "theme", ["age"])
+
+    classifier._classify_llm.assert_not_called()
+    assert all(r.is_relevant for r in results)
+    assert all(r.reason.startswith("Local scoring unavailable") for r in results)
+
+
+def test_unknown_mode_rejected():
+    with pytest.raises(ValueError):
+        RelevanceClassifier(api_key="mock", mode="psychic")
@@ -0,0 +1,109 @@
+"""
+Tests for single-call extraction-with-evidence mode.
+"""
+import asyncio
+from typing import Optional
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from pydantic import BaseModel, Field
+
+from core.extractors import StructuredExtractor, cited_response_model
+from core.schema_builder import FlexibleStr
+
+
+class Schema(BaseModel):
+    patient_age: Optional[int] = Field(default=None, description="Age in years")
+    diagnosis: Optional[str] = Field(default=None, description="Final diagnosis")
+    notes: FlexibleStr = Field(default=None, description="Free-text notes")
+
+
+def _response(**values):
+    model = cited_response_model(Schema)
+    return model.model_validate({
+        name: {"value": value, "exact_quote": f"quote for {name}", "confidence": 0.7}
+        for name, value in values.items()
+    })
+
+
+def _completion():
+    completion = MagicMock()
+    completion.usage.prompt_tokens = 100
+    completion.usage.completion_tokens = 20
+    completion.usage.total_tokens = 120
+    return completion
+
+
+def _extractor(create):
+    extractor = StructuredExtractor(provider="openrouter", model="model-a", evidence_mode="single_call")
+    client = MagicMock()
+    client.chat.completions.create_with_completion = create
+    extractor._instructor_client = client
+    extractor._async_instructor_client = client
+    return extractor
+
+
+def test_single_call_returns_data_and_evidence():
+    create = MagicMock(return_value=(_response(patient_age=45, diagnosis="DPM"), _completion()))
+    extractor = _extractor(create)
+
+    result = extractor.extract_with_evidence("A 45-year-old with DPM.", Schema, filename="a.pdf")
+
+    assert create.call_count == 1
+    assert create.call_args.kwargs["response_model"] is cited_response_model(Schema)
+    assert "exact_quote" in create.call_args.kwargs["messages"][0]["content"]
+    assert result.data == {"patient_age": 45, "diagnosis": "DPM", "notes": None}
+    assert [(e.field_name, e.exact_quote, e.confidence) for e in result.evidence] == [
+        ("patient_age", "quote for patient_age", 0.7),
+        ("diagnosis", "quote for diagnosis", 0.7),
+    ]
+    assert result.extraction_metadata["evidence_mode"] == "single_call"
+    assert extractor.call_count == 1
+
+
+def test_prefilled_values_fill_gaps_without_llm_quote():
+    create = MagicMock(return_value=(_response(patient_age=None, diagnosis="DPM"), _completion()))
+    extractor = _extractor(create)
+
+    result = extractor.extract_with_evidence(
+        "text", Schema, pre_filled_fields={"patient_age": 45}
+    )
+
+    assert result.data["patient_age"] == 45
+    age = next(e for e in result.evidence if e.field_name == "patient_age")
+    assert age.exact_quote == ""
+    assert "PRE-EXTRACTED FIELDS" in create.call_args.kwargs["messages"][1]["content"]
+
+
+def test_wrapped_fields_keep_annotated_validators():
+    result = cited_response_model(Schema).model_validate({"notes": {"value": ["a", "b"]}})
+    assert result.notes.value == "a b"
+
+
+def test_async_single_call():
+    create = AsyncMock(return_value=(_response(diagnosis="DPM"), _completion()))
+    extractor = _extractor(create)
+
+    result = asyncio.run(extractor.extract_with_evidence_async("text", Schema))
+
+    assert create.await_count == 1
+    assert result.data["diagnosis"] == "DPM"
+
+
+def test_two_call_mode_is_default():
+    data = Schema(diagnosis="DPM")
+    evidence = MagicMock(evidence=[])
+    create = MagicMock(side_effect=[(data, _completion()), (evidence, _completion())])
+    extractor = StructuredExtractor(provider="openrouter", model="model-a")
+    extractor._instructor_client = MagicMock()
+    extractor._instructor_client.chat.completions.create_with_completion = create
+
+    extractor.extract_with_evidence("text", Schema)
+
+    assert extractor.evidence_mode == "two_call"
+    assert create.call_count == 2
+
+
+def test_unknown_mode_rejected():
+    with pytest.raises(ValueError, match="evidence mode"):
+        StructuredExtractor(provider="openrouter", evidence_mode="three_call")
@@ -0,0 +1,79 @@
+"""
+Tests for streamed page parsing in the fallback parsers.
+"""
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from core.parsers import fallbacks
+from core.parsers.fallbacks import PAGE_SEPARATOR, PDFPlumberParser, PyMuPDFParser, assemble_document
+
+
+@pytest.fixture
+def pdf_path(tmp_path):
+    fitz = pytest.importorskip("fitz")
+    pdf = fitz.open()
+    for i in range(5):
+        pdf.new_page().insert_text((72, 72), f"Page {i + 1} text.")
+    path = tmp_path / "five.pdf"
+    pdf.save(path)
+    pdf.close()
+    return path
+
+
+def test_stream_yields_pages_lazily(pdf_path):
+    stream = PyMuPDFParser().stream(pdf_path)
+    first = next(stream)
+    assert first.page_number == 1
+    assert first.chunks[0].start == 0
+    assert [segment.page_number for segment in stream] == [2, 3, 4, 5]
+
+
+def test_parse_joins_pages_once_with_offsets(pdf_path):
+    parser = PyMuPDFParser()
+    texts = [text for _, text in parser.iter_pages(pdf_path)]
+
+    doc = parser.parse(pdf_path)
+
+    assert doc.full_text == "".join(text + PAGE_SEPARATOR for text in texts)
+    assert doc.metadata["parser"] == "pymupdf"
+    assert doc.metadata["num_chunks"] == len(doc.chunks) == 5
+    for chunk in doc.chunks:
+        assert doc.full_text[chunk.start:chunk.end] == chunk.text
+
+
+def test_parse_page_subset(pdf_path):
+    doc = PyMuPDFParser().parse(pdf_path, pages=[2, 4])
+    assert [c.page_number for c in doc.chunks] == [2, 4]
+    for chunk in doc.chunks:
+        assert doc.full_text[chunk.start:chunk.end] == chunk.text
+
+
+def test_assemble_document_empty(tmp_path):
+    doc = assemble_document(tmp_path / "x.pdf", iter([]), parser="pymupdf")
+    assert doc.full_text == ""
+    assert doc.chunks == []
+    assert "num_tables" not in doc.metadata
+
+
+def test_pdfplumber_stream_offsets_and_tables(tmp_path):
+    pages = []
+    for i in range(2):
+        page = MagicMock()
+        page.extract_text.return_value = f"Plumber page {i + 1}."
+        page.extract_tables.return_value = [[["a", "b"], ["1", "2"]]] if i == 1 else []
+        pages.append(page)
+    pdf = MagicMock()
+    pdf.__enter__.return_value.pages = pages
+    fake = MagicMock()
+    fake.open.return_value = pdf
+
+    with patch.object(fallbacks, "pdfplumber", fake):
+        doc = PDFPlumberParser().parse(tmp_path / "p.pdf")
+
+    text_chunks = [c for c in doc.chunks if c.chunk_type == "text"]
+    for chunk in text_chunks:
+        assert doc.full_text[chunk.start:chunk.end] == chunk.text
+    assert doc.metadata["num_tables"] == 1
+    assert doc.tables[0]["page"] == 2
+    assert doc.chunks[-1].section == "Table 1"
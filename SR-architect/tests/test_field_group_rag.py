@@ -0,0 +1,164 @@
+"""
+Tests for per-field-group retrieval-augmented extraction.
+"""
+import asyncio
+from typing import Optional
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from pydantic import BaseModel, Field
+
+from core.chunk_index import ChunkIndex
+from core.data_types import PipelineResult
+from core.parser import DocumentChunk, ParsedDocument
+from core.pipeline import HierarchicalExtractionPipeline
+from core.pipeline.field_groups import GENERAL_GROUP, group_fields
+from core.pipeline.stages import build_context, prepare_retrieved_context
+from schemas import DPMFullExtractionSchema
+
+
+class CaseSchema(BaseModel):
+    patient_age: Optional[str] = Field(None, description="Patient age in years")
+    patient_age_quote: Optional[str] = None
+    patient_sex: Optional[str] = Field(None, description="Patient sex")
+    ct_nodule_size: Optional[str] = Field(None, description="Nodule size on CT")
+    ct_ground_glass: Optional[bool] = Field(None, description="Ground glass nodules present")
+    outcome_dpm_stable: Optional[bool] = Field(None, description="Disease stable at follow-up")
+    mgmt_observation: Optional[bool] = Field(None, description="Conservative observation")
+    funding_source: Optional[str] = Field(None, description="Grant funding")
+    filename: Optional[str] = None
+    extraction_confidence: Optional[float] = None
+
+
+TEXTS = [
+    "Introduction. Minute pulmonary meningothelial-like nodules are rare lesions.",
+    "A 62-year-old woman, a non-smoker, was referred. The patient age and sex were recorded.",
+    "CT showed multiple ground glass nodules, the largest nodule size 4 mm, with a cheerio sign.",
+    "Management was observation. At follow-up the disease remained stable without progression.",
+    "Acknowledgements. This work received no grant funding.",
+]
+DOCUMENT = ParsedDocument(
+    filename="case.pdf",
+    full_text=" ".join(TEXTS),
+    chunks=[DocumentChunk(text=text) for text in TEXTS],
+)
+
+
+def test_chunk_index_ranks_chunks_by_bm25():
+    index = ChunkIndex(DOCUMENT.chunks)
+
+    hits = index.search(["ground", "glass", "nodules"], top_k=2)
+
+    assert hits[0][0] == 2
+    assert index.search(["transplant"], top_k=3) == []
+    assert index.scores("stable follow-up")[3] > 0
+
+
+def test_group_fields_uses_modular_schemas_and_keeps_companions():
+    groups = {g.name: g for g in group_fields(CaseSchema)}
+
+    assert groups["demographics"].fields == ["patient_age", "patient_age_quote", "patient_sex"]
+    assert groups["imaging"].fields == ["ct_nodule_size", "ct_ground_glass"]
+    assert groups["outcomes"].fields == ["outcome_dpm_stable", "mgmt_observation"]
+    assert groups[GENERAL_GROUP].fields == ["funding_source"]
+    assert list(groups["imaging"].schema.model_fields) == [
+        "ct_nodule_size", "ct_ground_glass", "filename", "extraction_confidence"
+    ]
+    assert {"ct", "ground", "glass"} <= set(groups["imaging"].query)
+
+
+def test_group_fields_exact_names_and_small_groups():
+    groups = {g.name: g.fields for g in group_fields(DPMFullExtractionSchema)}
+
+    assert groups["imaging"] == ["ct_narrative", "ct_ground_glass", "ct_cheerio_sign"]
+    assert "ihc_ema_pos" in groups["immunohistochemistry"]
+    # A single pathology field is folded into the general group
+    assert "pathology" not in groups and groups[GENERAL_GROUP] == ["histology_narrative"]
+
+
+def test_retrieved_context_keeps_document_order_and_falls_back():
+    index = ChunkIndex(DOCUMENT.chunks)
+
+    ctx = prepare_retrieved_context(
+        index, ["observation", "stable", "ct", "nodule"], 2, CaseSchema, {}, [], "fp", build_context
+    )
+    assert [c.text for c in ctx["relevant_chunks"]] == TEXTS[2:4]
+    assert ctx["context"].startswith("CT showed")
+    assert max(ctx["relevance_stats"]["chunk_scores"]) == 1.0
+
+    fallback = prepare_retrieved_context(index, ["transplant"], 2, CaseSchema, {}, [], "fp", build_context)
+    assert [c.text for c in fallback["relevant_chunks"]] == TEXTS[:2]
+    assert fallback["warnings"]
+
+
+def _result(schema):
+    data = {name: f"{name}-value" for name in schema.model_fields}
+    data.update(filename="case.pdf", extraction_confidence=0.9)
+    return PipelineResult(
+        final_data=data,
+        evidence=[],
+        final_accuracy_score=0.9,
+        final_consistency_score=0.9,
+        final_overall_score=0.9,
+        passed_validation=True,
+        iterations=1,
+        source_filename="case.pdf",
+        extraction_timestamp="2026-01-01T00:00:00",
+    )
+
+
+@pytest.fixture
+def pipeline():
+    with patch("core.pipeline.core.utils.get_async_llm_client"):
+        pipeline = HierarchicalExtractionPipeline(provider="openrouter", model="model-a", field_groups=True)
+    pipeline._extraction_executor.filter_and_classify_async = AsyncMock()
+    pipeline._extraction_executor.local_verifier = None
+    pipeline._extraction_executor.context_packer = None
+    return pipeline
+
+
+@pytest.fixture
+def validation():
+    async def validate(**kwargs):
+        return _result(kwargs["schema"])
+
+    with patch("core.pipeline.extraction.validation.run_validation_loop_async", new=AsyncMock(side_effect=validate)) as mock:
+        yield mock
+
+
+def test_groups_extract_from_retrieved_chunks_without_classification(pipeline, validation):
+    result = asyncio.run(pipeline.extract_document_async(DOCUMENT, CaseSchema, "theme"))
+
+    pipeline._extraction_executor.filter_and_classify_async.assert_not_called()
+    contexts = {
+        tuple(call.kwargs["schema"].model_fields)[0]: call.kwargs["context"]
+        for call in validation.await_args_list
+    }
+    assert len(contexts) == 4
+    assert "ground glass" in contexts["ct_nodule_size"]
+    assert "grant funding" not in contexts["ct_nodule_size"]
+    assert "grant funding" in contexts["funding_source"]
+    assert list(result.final_data) == list(CaseSchema.model_fields)
+    assert pipeline._shared_fingerprints == {}
+
+
+def test_repeat_run_reuses_group_results(pipeline, validation):
+    asyncio.run(pipeline.extract_document_async(DOCUMENT, CaseSchema, "theme"))
+    result = asyncio.run(pipeline.extract_document_async(DOCUMENT, CaseSchema, "theme"))
+
+    assert validation.await_count == 4
+    assert result.final_data["patient_sex"] == "patient_sex-value"
+
+
+def test_single_group_schema_uses_regular_extraction(pipeline, validation):
+    class Small(BaseModel):
+        patient_age: Optional[str] = None
+        patient_sex: Optional[str] = None
+
+    classify = pipeline._extraction_executor.filter_and_classify_async
+    classify.side_effect = lambda document, theme, fields: (document.chunks, {}, {}, [])
+
+    asyncio.run(pipeline.extract_document_async(DOCUMENT, Small, "theme"))
+
+    classify.assert_awaited_once()
+    assert validation.await_count == 1
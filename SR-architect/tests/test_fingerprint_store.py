@@ -0,0 +1,196 @@
+"""
+Tests for the persistent document fingerprint store.
+"""
+import random
+from unittest.mock import patch
+
+import pytest
+from pydantic import BaseModel
+
+from core.cache import FingerprintStore, compute_signature
+from core.data_types import IterationRecord, PipelineResult
+from core.pipeline import HierarchicalExtractionPipeline
+from core.pipeline.core import _schema_key
+
+
+def _article(seed, n_words=3000):
+    rng = random.Random(seed)
+    vocabulary = [f"term{i}" for i in range(2000)]
+    return " ".join(rng.choice(vocabulary) for _ in range(n_words))
+
+
+ARTICLE = _article(0)
+# Preprint of the same paper: watermark, line numbers and a reworded sentence
+PREPRINT = "PREPRINT - not peer reviewed.\n" + "\n".join(
+    f"{n} {line}" for n, line in enumerate(ARTICLE.split("term1 "), start=1)
+).replace("term5 term6", "revised wording here", 1)
+UNRELATED = _article(1)
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = FingerprintStore(db_path=tmp_path / "fingerprints.db")
+    yield store
+    store.close()
+
+
+def _result(name="paper.pdf", passed=True):
+    return PipelineResult(
+        final_data={"patient_age": "45"},
+        evidence=[],
+        final_accuracy_score=0.9,
+        final_consistency_score=0.9,
+        final_overall_score=0.9,
+        passed_validation=passed,
+        iterations=1,
+        source_filename=name,
+    )
+
+
+def test_exact_match(store):
+    store.put_result(compute_signature(ARTICLE), "schema", _result())
+
+    match, result = store.get_result(compute_signature(ARTICLE), "schema")
+
+    assert match.exact and match.similarity == 1.0
+    assert result.final_data == {"patient_age": "45"}
+
+
+def test_near_duplicate_found_across_instances(store, tmp_path):
+    store.put_result(compute_signature(ARTICLE), "schema", _result())
+    store.close()
+
+    reopened = FingerprintStore(db_path=tmp_path / "fingerprints.db")
+    match, result = reopened.get_result(compute_signature(PREPRINT), "schema")
+    reopened.close()
+
+    assert not match.exact
+    assert match.similarity >= 0.85
+    assert result.source_filename == "paper.pdf"
+
+
+def test_unrelated_document_misses(store):
+    store.put_result(compute_signature(ARTICLE), "schema", _result())
+
+    assert store.find(compute_signature(UNRELATED)) == []
+    assert store.get_result(compute_signature(UNRELATED), "schema") is None
+
+
+def test_documents_differing_only_in_data_do_not_match(store):
+    report = "A {age}-year-old woman received {dose} mg daily for {weeks} weeks. " * 40
+    store.put_result(compute_signature(report.format(age=54, dose=20, weeks=6)), "schema", _result())
+
+    assert store.get_result(compute_signature(report.format(age=61, dose=40, weeks=8)), "schema") is None
+
+
+def test_line_numbers_are_stripped_but_leading_data_is_kept():
+    from core.cache.fingerprints import _normalized_words
+
+    assert _normalized_words("1 first line\n2 second line\n3 third") == [
+        "first", "line", "second", "line", "third",
+    ]
+    assert _normalized_words("54 patients enrolled\nno counter here") == [
+        "54", "patients", "enrolled", "no", "counter", "here",
+    ]
+
+
+def test_results_round_trip_as_json(store):
+    result = _result()
+    result.iteration_history = [IterationRecord(1, 0.9, 0.8, 0.85, 0, ["none"])]
+    store.put_result(compute_signature(ARTICLE), "schema", result)
+
+    raw = store._connect().execute("SELECT result FROM results").fetchone()[0]
+    _, loaded = store.get_result(compute_signature(ARTICLE), "schema")
+
+    assert isinstance(raw, str)
+    assert loaded == result
+
+
+def test_results_are_scoped_by_schema_key(store):
+    store.put_result(compute_signature(ARTICLE), "schema-a", _result())
+
+    assert store.get_result(compute_signature(ARTICLE), "schema-b") is None
+    assert store.stats()["documents"] == 1
+
+
+def test_bands_indexed_once(store):
+    signature = compute_signature(ARTICLE)
+    store.add(signature)
+    store.add(signature)
+
+    rows = store._connect().execute("SELECT COUNT(*) FROM bands").fetchone()[0]
+    assert rows == len(signature.bands())
+
+
+class Schema(BaseModel):
+    patient_age: str = ""
+
+
+class OtherSchema(BaseModel):
+    diagnosis: str = ""
+
+
+@pytest.fixture
+def pipeline(store):
+    with patch("core.pipeline.core.utils.get_async_llm_client"):
+        yield HierarchicalExtractionPipeline(
+            provider="openrouter", model="model-a", fingerprint_store=store, resume=True
+        )
+
+
+def _lookup(pipeline, schema, text, theme="theme"):
+    token = _schema_key.set(pipeline._schema_key_for(schema, theme))
+    try:
+        return pipeline._check_duplicate(pipeline._compute_fingerprint(text))
+    finally:
+        _schema_key.reset(token)
+
+
+def _cache(pipeline, schema, text, result, theme="theme"):
+    token = _schema_key.set(pipeline._schema_key_for(schema, theme))
+    try:
+        pipeline._cache_result(pipeline._compute_fingerprint(text), result)
+    finally:
+        _schema_key.reset(token)
+
+
+def test_pipeline_reuses_near_duplicate_with_warning(pipeline):
+    _cache(pipeline, Schema, ARTICLE, _result())
+    pipeline._fingerprint_cache.clear()
+
+    reused = _lookup(pipeline, Schema, PREPRINT)
+
+    assert reused.final_data == {"patient_age": "45"}
+    assert any("near-duplicate" in warning for warning in reused.warnings)
+
+
+def test_pipeline_does_not_reuse_across_schemas(pipeline):
+    _cache(pipeline, Schema, ARTICLE, _result())
+
+    assert _lookup(pipeline, OtherSchema, ARTICLE) is None
+    assert _lookup(pipeline, Schema, ARTICLE) is not None
+
+
+def test_pipeline_does_not_reuse_across_themes_or_settings(pipeline):
+    _cache(pipeline, Schema, ARTICLE, _result())
+    pipeline._fingerprint_cache.clear()
+
+    assert _lookup(pipeline, Schema, ARTICLE, theme="other theme") is None
+    pipeline.score_threshold += 0.1
+    assert _lookup(pipeline, Schema, ARTICLE) is None
+
+
+def test_failed_results_are_not_persisted(pipeline, store):
+    _cache(pipeline, Schema, ARTICLE, _result(passed=False))
+    pipeline._fingerprint_cache.clear()
+
+    assert _lookup(pipeline, Schema, ARTICLE) is None
+    assert store.get_result(compute_signature(ARTICLE), pipeline._schema_key_for(Schema, "theme")) is None
+
+
+def test_store_is_only_read_when_resuming(pipeline):
+    _cache(pipeline, Schema, ARTICLE, _result())
+    pipeline._fingerprint_cache.clear()
+    pipeline.resume = False
+
+    assert _lookup(pipeline, Schema, ARTICLE) is None
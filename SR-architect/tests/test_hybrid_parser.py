@@ -0,0 +1,86 @@
+"""
+Tests for page-level hybrid (PyMuPDF + Docling) parsing.
+"""
+from unittest.mock import MagicMock
+
+import pytest
+
+from core.complexity_classifier import ComplexityClassifier
+from core.parsers.base import DocumentChunk, ParsedDocument
+from core.parsers.fallbacks import PyMuPDFParser
+from core.parsers.hybrid import HybridParser, page_ranges
+from core.parsers.probe import PageProbe, PDFProbe
+
+fitz = pytest.importorskip("fitz")
+
+
+@pytest.fixture
+def five_page_pdf(tmp_path):
+    path = tmp_path / "paper.pdf"
+    pdf = fitz.open()
+    for i in range(5):
+        pdf.new_page().insert_text((72, 72), f"Body text of page {i + 1}")
+    pdf.save(path)
+    pdf.close()
+    return path
+
+
+def _fake_docling():
+    docling = MagicMock()
+
+    def parse(path, page_range):
+        first, last = page_range
+        return ParsedDocument(
+            filename=path.name,
+            chunks=[
+                DocumentChunk(text=f"| table p{p} |", section="Results", chunk_type="table", page_number=p)
+                for p in range(first, last + 1)
+            ],
+            full_text=f"docling {first}-{last}",
+        )
+
+    docling.parse.side_effect = parse
+    return docling
+
+
+def test_page_ranges_collapses_runs():
+    assert page_ranges([5, 1, 2, 3, 7, 8]) == [(1, 3), (5, 5), (7, 8)]
+    assert page_ranges([]) == []
+
+
+def test_hybrid_merges_in_page_order(five_page_pdf):
+    docling = _fake_docling()
+    hybrid = HybridParser(PyMuPDFParser(), docling)
+
+    doc = hybrid.parse(five_page_pdf, docling_pages=[2, 3], page_count=5)
+
+    docling.parse.assert_called_once_with(five_page_pdf, page_range=(2, 3))
+    assert [c.page_number for c in doc.chunks] == [1, 2, 3, 4, 5]
+    assert [c.chunk_type for c in doc.chunks] == ["text", "table", "table", "text", "text"]
+    assert doc.chunks[1].section == "Results"
+    assert doc.full_text.index("page 1") < doc.full_text.index("docling 2-3") < doc.full_text.index("page 4")
+    assert doc.metadata["docling_pages"] == [2, 3]
+
+
+def test_hybrid_falls_back_to_pymupdf_for_failed_ranges(five_page_pdf):
+    docling = MagicMock()
+    docling.parse.side_effect = ImportError("Docling not installed")
+    hybrid = HybridParser(PyMuPDFParser(), docling)
+
+    doc = hybrid.parse(five_page_pdf, docling_pages=[4], page_count=5)
+
+    assert [c.page_number for c in doc.chunks] == [1, 2, 3, 4, 5]
+    assert doc.metadata["parser"] == "pymupdf"
+
+
+def test_classifier_selects_table_pages():
+    pages = [PageProbe(page_number=i + 1, text_chars=3000) for i in range(10)]
+    pages[6].ruling_lines = 8
+
+    assert ComplexityClassifier().docling_pages(PDFProbe(page_count=10, pages=pages)) == [7]
+
+
+def test_classifier_routes_whole_document_when_most_pages_qualify():
+    pages = [PageProbe(page_number=i + 1, text_chars=3000, ruling_lines=8) for i in range(4)]
+
+    assert ComplexityClassifier().docling_pages(PDFProbe(page_count=4, pages=pages)) is None
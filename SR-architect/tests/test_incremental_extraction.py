@@ -0,0 +1,171 @@
+"""
+Tests for field-level incremental re-extraction.
+"""
+import asyncio
+from typing import Optional
+from unittest.mock import patch
+
+import pytest
+from pydantic import BaseModel, Field
+
+from core.cache import CacheManager
+from core.data_types import PipelineResult
+from core.parser import DocumentChunk, ParsedDocument
+from core.pipeline import HierarchicalExtractionPipeline
+from core.pipeline.incremental import field_versions, reduced_schema
+
+
+class V1(BaseModel):
+    """Case report fields."""
+    patient_age: Optional[str] = Field(default=None, description="Age at diagnosis")
+    patient_sex: Optional[str] = Field(default=None, description="Sex")
+
+
+class V2(V1):
+    tumor_size: Optional[str] = Field(default=None, description="Largest tumor dimension")
+
+
+class V1Reworded(BaseModel):
+    patient_age: Optional[str] = Field(default=None, description="Age at diagnosis")
+    patient_sex: Optional[str] = Field(default=None, description="Biological sex of the patient")
+
+
+DOCUMENT = ParsedDocument(
+    filename="case.pdf",
+    full_text="A 45-year-old man with a 3 cm mass.",
+    chunks=[DocumentChunk(text="A 45-year-old man with a 3 cm mass.")],
+)
+
+
+def _result(schema, failed=False, passed=True):
+    data = {} if failed else {name: f"{name}-value" for name in schema.model_fields}
+    return PipelineResult(
+        final_data=data,
+        evidence=[{"field_name": name, "exact_quote": "quote"} for name in data],
+        final_accuracy_score=0.9,
+        final_consistency_score=0.8,
+        final_overall_score=0.85,
+        passed_validation=passed and not failed,
+        iterations=1,
+        source_filename="case.pdf",
+    )
+
+
+class FakeExecutor:
+    def __init__(self):
+        self.schemas = []
+        self.failed = False
+        self.passed = True
+
+    def extract_sync(self, document, schema, theme):
+        self.schemas.append(schema)
+        return _result(schema, self.failed, self.passed)
+
+    async def extract_async(self, document, schema, theme, shared=None):
+        return self.extract_sync(document, schema, theme)
+
+
+@pytest.fixture
+def pipeline(tmp_path):
+    cache = CacheManager(db_path=tmp_path / "cache.db")
+    with patch("core.pipeline.core.utils.get_async_llm_client"):
+        pipeline = HierarchicalExtractionPipeline(
+            provider="openrouter", model="model-a", field_cache=cache, resume=True
+        )
+    pipeline._extraction_executor = FakeExecutor()
+    yield pipeline
+    cache.close()
+
+
+def _extracted_fields(pipeline):
+    return [list(schema.model_fields) for schema in pipeline._extraction_executor.schemas]
+
+
+def test_new_column_extracts_only_the_delta(pipeline):
+    pipeline.extract_document(DOCUMENT, V1, "theme")
+    result = pipeline.extract_document(DOCUMENT, V2, "theme")
+
+    assert _extracted_fields(pipeline) == [["patient_age", "patient_sex"], ["tumor_size"]]
+    assert list(result.final_data) == ["patient_age", "patient_sex", "tumor_size"]
+    assert {e["field_name"] for e in result.evidence} == {"patient_age", "patient_sex", "tumor_size"}
+    assert "Reused 2 cached field(s), extracted 1" in result.warnings
+
+
+def test_fully_cached_schema_skips_extraction(pipeline):
+    pipeline.extract_document(DOCUMENT, V2, "theme")
+    result = pipeline.extract_document(DOCUMENT, V1, "theme")
+
+    assert len(pipeline._extraction_executor.schemas) == 1
+    assert result.final_data == {"patient_age": "patient_age-value", "patient_sex": "patient_sex-value"}
+    assert result.iterations == 0
+    assert result.passed_validation
+    assert result.final_overall_score == pytest.approx(0.85)
+
+
+def test_changed_field_definition_is_re_extracted(pipeline):
+    pipeline.extract_document(DOCUMENT, V1, "theme")
+    pipeline.extract_document(DOCUMENT, V1Reworded, "theme")
+
+    assert _extracted_fields(pipeline)[-1] == ["patient_sex"]
+
+
+def test_theme_model_and_settings_are_part_of_the_version():
+    assert field_versions(V1, "theme", "model-a") != field_versions(V1, "other", "model-a")
+    assert field_versions(V1, "theme", "model-a") != field_versions(V1, "theme", "model-b")
+    assert field_versions(V1, "t", "m")["patient_age"] == field_versions(V1Reworded, "t", "m")["patient_age"]
+    assert field_versions(V1, "t", "m", score_threshold=0.8) != field_versions(V1, "t", "m", score_threshold=0.9)
+    assert field_versions(V1, "t", "m", max_iterations=1) != field_versions(V1, "t", "m", max_iterations=3)
+
+
+def test_failed_extraction_is_not_cached(pipeline):
+    pipeline._extraction_executor.failed = True
+    pipeline.extract_document(DOCUMENT, V1, "theme")
+    pipeline._extraction_executor.failed = False
+    pipeline.extract_document(DOCUMENT, V1, "theme")
+
+    assert _extracted_fields(pipeline) == [["patient_age", "patient_sex"]] * 2
+
+
+def test_unvalidated_extraction_is_not_cached(pipeline):
+    pipeline._extraction_executor.passed = False
+    pipeline.extract_document(DOCUMENT, V1, "theme")
+    pipeline._extraction_executor.passed = True
+    pipeline.extract_document(DOCUMENT, V1, "theme")
+
+    assert _extracted_fields(pipeline) == [["patient_age", "patient_sex"]] * 2
+
+
+def test_cache_is_only_read_when_resuming(pipeline):
+    pipeline.extract_document(DOCUMENT, V1, "theme")
+    pipeline.resume = False
+    pipeline.extract_document(DOCUMENT, V1, "theme")
+
+    assert _extracted_fields(pipeline) == [["patient_age", "patient_sex"]] * 2
+
+
+def test_documents_are_keyed_by_full_text(pipeline):
+    prefix = "x" * 20000
+    first = ParsedDocument(filename="a.pdf", full_text=prefix + " aged 45", chunks=DOCUMENT.chunks)
+    second = ParsedDocument(filename="b.pdf", full_text=prefix + " aged 61", chunks=DOCUMENT.chunks)
+
+    pipeline.extract_document(first, V1, "theme")
+    pipeline.extract_document(second, V1, "theme")
+
+    assert _extracted_fields(pipeline) == [["patient_age", "patient_sex"]] * 2
+
+
+def test_async_path_uses_field_cache(pipeline):
+    pipeline.extract_document(DOCUMENT, V1, "theme")
+    result = asyncio.run(pipeline.extract_document_async(DOCUMENT, V2, "theme"))
+
+    assert _extracted_fields(pipeline)[-1] == ["tumor_size"]
+    assert len(result.final_data) == 3
+
+
+def test_reduced_schema_keeps_field_definitions():
+    delta = reduced_schema(V2, ["tumor_size"])
+
+    assert list(delta.model_fields) == ["tumor_size"]
+    assert delta.model_fields["tumor_size"].description == "Largest tumor dimension"
+    assert delta.__doc__ == V2.__doc__
+    assert delta().tumor_size is None
@@ -0,0 +1,130 @@
+"""
+Tests for the sharded SQLite LLM response cache and its client wrapper.
+"""
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from openai.types.chat import ChatCompletion
+from pydantic import BaseModel
+
+from core.cache import CachedLLMClient, LLMCacheMiss, LLMResponseCache, configure_llm_cache
+from core.cache.llm_responses import request_key
+from core.client import LLMClientFactory
+
+
+class Answer(BaseModel):
+    value: str
+
+
+class OtherAnswer(BaseModel):
+    value: str
+    note: str = ""
+
+
+def _completion(text: str = "{}") -> ChatCompletion:
+    return ChatCompletion.model_validate({
+        "id": "cmpl-1",
+        "object": "chat.completion",
+        "created": 0,
+        "model": "model-a",
+        "choices": [{"index": 0, "finish_reason": "stop", "message": {"role": "assistant", "content": text}}],
+        "usage": {"prompt_tokens": 100, "completion_tokens": 5, "total_tokens": 105},
+    })
+
+
+def _client(value: str = "42") -> MagicMock:
+    client = MagicMock()
+    client.chat.completions.create_with_completion.return_value = (Answer(value=value), _completion())
+    client.chat.completions.create.return_value = _completion("raw")
+    return client
+
+
+REQUEST = {"model": "model-a", "messages": [{"role": "user", "content": "age?"}], "temperature": 0.0}
+
+
+def test_read_write_serves_repeat_requests_from_cache(tmp_path):
+    inner = _client()
+    client = CachedLLMClient(inner, LLMResponseCache(tmp_path, mode="read_write"))
+
+    first, completion = client.chat.completions.create_with_completion(response_model=Answer, **REQUEST)
+    second, cached = client.chat.completions.create_with_completion(response_model=Answer, max_retries=3, **REQUEST)
+
+    assert first == second == Answer(value="42")
+    assert completion.usage.total_tokens == 105
+    assert cached.usage is None
+    assert inner.chat.completions.create_with_completion.call_count == 1
+    assert client.cache.stats()["session_hits"] == 1
+
+
+def test_key_covers_schema_temperature_and_messages():
+    base = request_key({**REQUEST, "response_model": Answer})
+
+    assert base == request_key({**REQUEST, "response_model": Answer, "extra_body": {"usage": {"include": True}}})
+    assert base != request_key({**REQUEST, "response_model": OtherAnswer})
+    assert base != request_key({**REQUEST, "response_model": Answer, "temperature": 0.7})
+    assert base != request_key({**REQUEST, "response_model": Answer, "messages": [{"role": "user", "content": "sex?"}]})
+
+
+def test_replay_fails_on_miss_and_ignores_ttl(tmp_path):
+    LLMResponseCache(tmp_path, mode="record").put(request_key({**REQUEST, "response_model": Answer}), "model-a", Answer(value="7"), _completion())
+    inner = _client()
+    client = CachedLLMClient(inner, LLMResponseCache(tmp_path, mode="replay", ttl_seconds=0))
+
+    assert client.chat.completions.create(response_model=Answer, **REQUEST) == Answer(value="7")
+    with pytest.raises(LLMCacheMiss):
+        client.chat.completions.create(response_model=OtherAnswer, **REQUEST)
+    inner.chat.completions.create_with_completion.assert_not_called()
+
+
+def test_record_always_calls_and_overwrites(tmp_path):
+    cache = LLMResponseCache(tmp_path, mode="record")
+    CachedLLMClient(_client("1"), cache).chat.completions.create(response_model=Answer, **REQUEST)
+    CachedLLMClient(_client("2"), cache).chat.completions.create(response_model=Answer, **REQUEST)
+
+    replay = CachedLLMClient(_client(), LLMResponseCache(tmp_path, mode="replay"))
+    assert replay.chat.completions.create(response_model=Answer, **REQUEST) == Answer(value="2")
+    assert cache.stats()["entries"] == 1
+
+
+def test_ttl_and_byte_budget(tmp_path):
+    cache = LLMResponseCache(tmp_path, mode="read_write", ttl_seconds=60, shards=1, max_bytes=10_000)
+    cache.put("a" * 64, "model-a", Answer(value="old"), _completion())
+    with cache._connect(0) as conn:
+        conn.execute("UPDATE responses SET created_at = ?", (time.time() - 120,))
+    assert cache.get("a" * 64, Answer) is None
+
+    for i in range(100):
+        cache.put(f"{i:064x}", "model-a", Answer(value="x" * 500), _completion())
+    stats = cache.stats()
+    assert stats["total_bytes"] <= 10_000
+    assert 0 < stats["entries"] < 100
+    assert cache.get(f"{99:064x}", Answer) is not None
+
+
+def test_async_client_and_raw_completions(tmp_path):
+    inner = MagicMock()
+    inner.chat.completions.create = AsyncMock(return_value=_completion("raw"))
+    client = CachedLLMClient(inner, LLMResponseCache(tmp_path, mode="read_write"), is_async=True)
+
+    async def run():
+        first = await client.chat.completions.create(**REQUEST)
+        second = await client.chat.completions.create(**REQUEST)
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert second.choices[0].message.content == first.choices[0].message.content == "raw"
+    assert second.usage is None
+    assert inner.chat.completions.create.await_count == 1
+
+
+def test_factory_wraps_clients_when_cache_configured(tmp_path):
+    try:
+        configure_llm_cache("replay", cache_dir=tmp_path)
+        client = LLMClientFactory.create("openai", api_key="sk-test")
+        assert isinstance(client, CachedLLMClient) and client.cache.mode == "replay"
+        assert isinstance(LLMClientFactory.create_async("openai", api_key="sk-test"), CachedLLMClient)
+    finally:
+        configure_llm_cache("off")
+    assert not isinstance(LLMClientFactory.create("openai", api_key="sk-test"), CachedLLMClient)
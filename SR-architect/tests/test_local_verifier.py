@@ -0,0 +1,195 @@
+"""
+Tests for deterministic local evidence verification.
+"""
+import asyncio
+import logging
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from core.extractors import EvidenceItem, ExtractionWithEvidence
+from core.parser import DocumentChunk, ParsedDocument
+from core.pipeline.extraction.validation import run_validation_loop, run_validation_loop_async
+from core.validation import CheckerResult, LocalEvidenceVerifier
+
+SOURCE = (
+    "This case describes a woman in her 50s who presented with recurrent\n"
+    "lower respiratory tract infections. CT showed multiple bilateral nodules,  the largest 6 mm. "
+    "Twenty patients were enrolled and treated with observation only."
+)
+
+
+@pytest.fixture
+def verifier():
+    return LocalEvidenceVerifier()
+
+
+def test_exact_quote_with_matching_value(verifier):
+    result = verifier.verify_field(SOURCE, "patient_sex", "Female", ["This case describes a woman in her 50s"])
+    assert result.status == "verified"
+    assert result.span == (0, 38)
+    assert result.score == 1.0
+
+
+def test_whitespace_and_case_differences_resolve(verifier):
+    quote = "A WOMAN in her 50s who presented with recurrent lower respiratory"
+    result = verifier.verify_field(SOURCE, "patient_age", "50s", [quote])
+    assert result.status == "verified"
+    assert SOURCE[result.span[0]:result.span[1]].startswith("a woman")
+
+
+def test_numbers_checked_against_span(verifier):
+    quote = "multiple bilateral nodules, the largest 6 mm"
+    assert verifier.verify_field(SOURCE, "size", "6 mm", [quote]).passed
+    assert verifier.verify_field(SOURCE, "size", "8 mm", [quote]).status == "value_mismatch"
+    assert verifier.verify_field(SOURCE, "n", 20, ["Twenty patients were enrolled"]).passed
+
+
+def test_unsupported_categorical_value_fails(verifier):
+    result = verifier.verify_field(SOURCE, "treatment", "Surgery", ["treated with observation only"])
+    assert result.status == "value_mismatch"
+    assert not result.passed
+
+
+def test_hallucinated_quote_fails(verifier):
+    result = verifier.verify_field(SOURCE, "age", "42", ["The median age was 42 years"])
+    assert result.status == "quote_not_found"
+
+
+def test_report_skips_metadata_and_uses_companion_quotes(verifier):
+    data = {
+        "patient_sex": "Female",
+        "patient_sex_quote": "a woman in her 50s",
+        "comorbidities": "Not reported",
+        "filename": "case.pdf",
+    }
+    report = verifier.verify(SOURCE, data, evidence=[])
+    assert set(report.fields) == {"patient_sex", "comorbidities"}
+    assert report.failed == []
+    assert report.fields["comorbidities"].status == "empty"
+
+
+def test_checker_result_combines_local_and_llm_scores(verifier):
+    report = verifier.verify(SOURCE, {"sex": "Female", "treatment": "Surgery"}, [
+        {"field_name": "sex", "exact_quote": "a woman in her 50s"},
+        {"field_name": "treatment", "exact_quote": "treated with observation only"},
+    ])
+    llm = CheckerResult(0.0, 0.5, 0.2, issues=[], suggestions=["Fix treatment"], passed=False)
+
+    combined = report.to_checker_result(0.8, 0.6, 0.4, checker_result=llm)
+
+    assert combined.accuracy_score == pytest.approx(0.5)
+    assert combined.consistency_score == pytest.approx(0.75)
+    assert combined.suggestions == ["Fix treatment"]
+    assert not combined.passed
+
+
+# --- Validation loop integration ---
+
+def _document():
+    chunk = DocumentChunk(text=SOURCE, start=0, end=len(SOURCE), page_number=3)
+    return ParsedDocument(filename="case.pdf", full_text=SOURCE, chunks=[chunk])
+
+
+def _extraction(treatment="Observation"):
+    return ExtractionWithEvidence(
+        data={"patient_sex": "Female", "treatment": treatment},
+        evidence=[
+            EvidenceItem(field_name="patient_sex", extracted_value="Female",
+                         exact_quote="a woman in her 50s"),
+            EvidenceItem(field_name="treatment", extracted_value=treatment,
+                         exact_quote="treated with observation only"),
+        ],
+    )
+
+
+def _loop_kwargs(extractor, checker, auditor=None):
+    return dict(
+        context=SOURCE,
+        schema=MagicMock(),
+        extractor=extractor,
+        checker=checker,
+        max_iterations=1,
+        score_threshold=0.8,
+        pre_filled={},
+        document=_document(),
+        relevant_chunks=[],
+        theme="theme",
+        logger=logging.getLogger("test"),
+        quality_auditor=auditor,
+        local_verifier=LocalEvidenceVerifier(),
+    )
+
+
+def test_fully_verified_extraction_skips_checker_and_auditor():
+    extractor = MagicMock()
+    extractor.extract_with_evidence.return_value = _extraction()
+    checker = MagicMock()
+    auditor = MagicMock()
+
+    result = run_validation_loop(**_loop_kwargs(extractor, checker, auditor))
+
+    checker.check.assert_not_called()
+    auditor.audit_extraction.assert_not_called()
+    assert result.passed_validation
+    assert result.field_verification["treatment"]["status"] == "verified"
+    sex = next(e for e in result.evidence if e["field_name"] == "patient_sex")
+    assert SOURCE[sex["start_char"]:sex["end_char"]] == "a woman in her 50s"
+    assert sex["page_number"] == 3 and sex["chunk_index"] == 0
+
+
+def test_only_failed_fields_reach_checker_and_auditor():
+    extractor = MagicMock()
+    extractor.extract_with_evidence.return_value = _extraction(treatment="Surgery")
+    checker = MagicMock()
+    checker.check.return_value = CheckerResult(1.0, 1.0, 1.0, issues=[], suggestions=[], passed=True)
+    auditor = MagicMock()
+    auditor.audit_extraction.return_value = MagicMock(passed=True)
+
+    result = run_validation_loop(**_loop_kwargs(extractor, checker, auditor))
+
+    data, evidence = checker.check.call_args.args[1:3]
+    assert data == {"treatment": "Surgery"}
+    assert [e["field_name"] for e in evidence] == ["treatment"]
+    audited = auditor.audit_extraction.call_args.args[1]
+    assert [e["field_name"] for e in audited] == ["treatment"]
+    assert result.passed_validation
+
+
+def test_all_empty_extraction_still_reaches_checker():
+    extractor = MagicMock()
+    extractor.extract_with_evidence.return_value = ExtractionWithEvidence(
+        data={"patient_sex": "Not reported", "treatment": None}, evidence=[],
+    )
+    checker = MagicMock()
+    checker.check.return_value = CheckerResult(0.2, 0.2, 0.2, issues=[], suggestions=[], passed=False)
+
+    result = run_validation_loop(**_loop_kwargs(extractor, checker))
+
+    data = checker.check.call_args.args[1]
+    assert data == {"patient_sex": "Not reported", "treatment": None}
+    assert not result.passed_validation
+
+
+def test_empty_fields_are_left_out_of_local_scores(verifier):
+    report = verifier.verify(SOURCE, {"sex": "Female", "comorbidities": "Not reported"}, [
+        {"field_name": "sex", "exact_quote": "a woman in her 50s"},
+    ])
+    empty_only = verifier.verify(SOURCE, {"comorbidities": "Not reported"}, [])
+
+    assert report.verified == ["sex"]
+    assert report.to_checker_result(0.8, 0.6, 0.4).accuracy_score == pytest.approx(report.fields["sex"].score)
+    assert empty_only.needs_checker
+    assert not empty_only.to_checker_result(0.8, 0.6, 0.4).passed
+
+
+def test_async_loop_uses_local_verification():
+    extractor = MagicMock()
+    extractor.extract_with_evidence_async = AsyncMock(return_value=_extraction())
+    checker = MagicMock()
+    checker.check_async = AsyncMock()
+
+    result = asyncio.run(run_validation_loop_async(**_loop_kwargs(extractor, checker)))
+
+    checker.check_async.assert_not_awaited()
+    assert result.passed_validation
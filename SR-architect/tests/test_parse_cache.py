@@ -0,0 +1,121 @@
+"""
+Tests for the content-addressed binary parse cache.
+"""
+import pytest
+
+from core.parser import DocumentParser, DocumentChunk, ParsedDocument
+from core.parsers import cache as cache_module
+from core.parsers.cache import ParseCache, CACHE_SUFFIX
+
+
+def _doc(name: str) -> ParsedDocument:
+    return ParsedDocument(
+        filename=name,
+        chunks=[
+            DocumentChunk(text="Abstract text", section="Abstract", page_number=1, source_file=name),
+            DocumentChunk(text="Results text", section="Results", page_number=2, source_file=name),
+        ],
+        full_text="Abstract text\n\nResults text",
+        metadata={"path": f"/old/{name}", "parser": "pymupdf"},
+    )
+
+
+@pytest.fixture
+def source(tmp_path):
+    f = tmp_path / "paper.pdf"
+    f.write_bytes(b"%PDF-1.4 identical bytes")
+    return f
+
+
+def test_roundtrip(tmp_path, source):
+    cache = ParseCache(tmp_path / "cache")
+    cache.save(_doc("paper.pdf"), source)
+
+    loaded = cache.load(source)
+
+    assert loaded.full_text == "Abstract text\n\nResults text"
+    assert [c.section for c in loaded.chunks] == ["Abstract", "Results"]
+    assert loaded.metadata["parser"] == "pymupdf"
+
+
+def test_renamed_copy_is_a_hit(tmp_path, source):
+    """Identical bytes under another name reuse the entry, with the new name."""
+    cache = ParseCache(tmp_path / "cache")
+    cache.save(_doc("paper.pdf"), source)
+
+    copy = tmp_path / "other_dir_copy.pdf"
+    copy.write_bytes(source.read_bytes())
+    loaded = cache.load(copy)
+
+    assert loaded is not None
+    assert loaded.filename == "other_dir_copy.pdf"
+    assert loaded.metadata["path"] == str(copy)
+    assert all(c.source_file == "other_dir_copy.pdf" for c in loaded.chunks)
+
+
+def test_changed_content_is_a_miss(tmp_path, source):
+    cache = ParseCache(tmp_path / "cache")
+    cache.save(_doc("paper.pdf"), source)
+
+    source.write_bytes(b"%PDF-1.4 different bytes now")
+
+    assert cache.load(source) is None
+
+
+def test_parser_version_mismatch_is_a_miss(tmp_path, source):
+    ParseCache(tmp_path / "cache", parser_version="1.0").save(_doc("paper.pdf"), source)
+
+    assert ParseCache(tmp_path / "cache", parser_version="2.0").load(source) is None
+
+
+def test_load_chunks_skips_full_text(tmp_path, source, monkeypatch):
+    cache = ParseCache(tmp_path / "cache")
+    cache.save(_doc("paper.pdf"), source)
+    decoded = []
+    original = cache._codec.decode
+    monkeypatch.setattr(cache._codec, "decode", lambda data: decoded.append(1) or original(data))
+
+    chunks = cache.load_chunks(source)
+
+    assert [c.text for c in chunks] == ["Abstract text", "Results text"]
+    assert len(decoded) == 1
+
+
+def test_json_zlib_fallback_codec(tmp_path, source, monkeypatch):
+    """Without msgpack/zstandard the cache still works via json+zlib."""
+    monkeypatch.setattr(cache_module, "msgpack", None)
+    cache = ParseCache(tmp_path / "cache")
+    assert cache._codec.name == "json+zlib"
+
+    cache.save(_doc("paper.pdf"), source)
+
+    assert cache.load(source).full_text == "Abstract text\n\nResults text"
+
+
+def test_corrupt_entry_is_a_miss(tmp_path, source):
+    cache = ParseCache(tmp_path / "cache")
+    cache.entry_path(cache.key_for(source)).write_bytes(b"garbage")
+
+    assert cache.load(source) is None
+
+
+def test_document_parser_uses_content_cache(tmp_path):
+    parser = DocumentParser(cache_dir=str(tmp_path / "cache"))
+    f = tmp_path / "notes.txt"
+    f.write_text("Some cached text.")
+
+    parser.parse_file(str(f))
+
+    entries = list((tmp_path / "cache").glob(f"*{CACHE_SUFFIX}"))
+    assert len(entries) == 1
+    assert parser.load_cached_chunks(str(f))[0].text == "Some cached text."
+
+
+def test_empty_files_are_not_cached(tmp_path):
+    """Zero-byte files would all collide on one content hash."""
+    cache = ParseCache(tmp_path / "cache")
+    empty = tmp_path / "empty.pdf"
+    empty.write_bytes(b"")
+
+    assert cache.save(_doc("empty.pdf"), empty) is None
+    assert cache.load(empty) is None
@@ -0,0 +1,123 @@
+"""
+Tests for the parse cache index and byte-budget LRU eviction.
+"""
+import pytest
+from typer.testing import CliRunner
+
+from core.parser import DocumentChunk, DocumentParser, ParsedDocument
+from core.parsers.cache import ParseCache, CACHE_SUFFIX
+from core.parsers.cache_index import INDEX_FILENAME, ParseCacheIndex
+
+
+def _doc(name: str, text: str = "body") -> ParsedDocument:
+    return ParsedDocument(
+        filename=name,
+        chunks=[DocumentChunk(text=text, source_file=name)],
+        full_text=text,
+    )
+
+
+@pytest.fixture
+def sources(tmp_path):
+    paths = []
+    for i in range(4):
+        f = tmp_path / f"paper{i}.pdf"
+        f.write_bytes(f"%PDF-1.4 paper {i}".encode())
+        paths.append(f)
+    return paths
+
+
+def test_index_tracks_writes_and_hits(tmp_path, sources):
+    cache = ParseCache(tmp_path / "cache")
+    entry = cache.save(_doc("paper0.pdf"), sources[0])
+
+    cache.load(sources[0])
+    cache.load_chunks(sources[0])
+
+    stats = cache.stats()
+    assert stats["entries"] == 1
+    assert stats["total_bytes"] == entry.stat().st_size
+    assert stats["total_hits"] == 2
+
+
+def test_evict_removes_least_recently_used(tmp_path, sources):
+    cache = ParseCache(tmp_path / "cache")
+    for i, path in enumerate(sources):
+        cache.save(_doc(path.name), path)
+        cache.index.record_write(cache.key_for(path), 100, accessed_at=float(i))
+    # Touching paper0 makes paper1 the oldest entry
+    cache.load(sources[0])
+
+    evicted, freed = cache.evict(250)
+
+    assert (evicted, freed) == (2, 200)
+    assert cache.load(sources[0]) is not None
+    assert cache.load(sources[1]) is None
+    assert cache.load(sources[2]) is None
+    assert cache.index.total_bytes() == 200
+
+
+def test_evict_under_budget_is_noop(tmp_path, sources):
+    cache = ParseCache(tmp_path / "cache")
+    cache.save(_doc("paper0.pdf"), sources[0])
+
+    assert cache.evict(10 ** 9) == (0, 0)
+
+
+def test_existing_entries_are_adopted_by_new_index(tmp_path, sources):
+    cache_dir = tmp_path / "cache"
+    cache = ParseCache(cache_dir)
+    for path in sources[:2]:
+        cache.save(_doc(path.name), path)
+    (cache_dir / INDEX_FILENAME).unlink()
+
+    rebuilt = ParseCache(cache_dir)
+
+    assert rebuilt.stats()["entries"] == 2
+
+
+def test_rebuild_drops_missing_files(tmp_path, sources):
+    cache = ParseCache(tmp_path / "cache")
+    entry = cache.save(_doc("paper0.pdf"), sources[0])
+    entry.unlink()
+
+    assert cache.rebuild_index() == 0
+    assert cache.index.total_bytes() == 0
+
+
+def test_totals_follow_resized_entries(tmp_path):
+    index = ParseCacheIndex(tmp_path / INDEX_FILENAME)
+    index.record_write("a", 100)
+    index.record_write("a", 40)
+    index.record_write("b", 10)
+    index.remove(["b"])
+
+    assert index.total_bytes() == 40
+    assert index.stats()["entries"] == 1
+
+
+def test_document_parser_enforces_byte_budget(tmp_path, sources):
+    parser = DocumentParser(cache_dir=str(tmp_path / "cache"), max_cache_bytes=0)
+    text = tmp_path / "notes.txt"
+    text.write_text("Some text.")
+
+    parser.parse_file(str(text))
+
+    assert list((tmp_path / "cache").glob(f"*{CACHE_SUFFIX}")) == []
+
+
+def test_cache_cli_stats_and_prune(tmp_path, sources):
+    from cli import app
+
+    cache_dir = tmp_path / "cache"
+    cache = ParseCache(cache_dir)
+    for path in sources:
+        cache.save(_doc(path.name), path)
+    runner = CliRunner()
+
+    stats = runner.invoke(app, ["cache", "stats", "--dir", str(cache_dir)])
+    prune = runner.invoke(app, ["cache", "prune", "--dir", str(cache_dir), "--max-bytes", "0"])
+
+    assert stats.exit_code == 0 and "Entries" in stats.output
+    assert prune.exit_code == 0 and "Evicted 4 entries" in prune.output
+    assert list(cache_dir.glob(f"*{CACHE_SUFFIX}")) == []
@@ -0,0 +1,82 @@
+"""
+Tests for DocumentParser.parse_many (process-pool batch parsing).
+"""
+from pathlib import Path
+
+import pytest
+
+from core.parser import DocumentParser
+
+
+@pytest.fixture
+def parser(tmp_path):
+    return DocumentParser(cache_dir=str(tmp_path / "cache"))
+
+
+@pytest.fixture
+def text_files(tmp_path):
+    paths = []
+    for i in range(5):
+        f = tmp_path / f"paper{i}.txt"
+        f.write_text(f"Paper {i} abstract.\n\nPaper {i} results.")
+        paths.append(f)
+    return paths
+
+
+def test_parse_many_ordered_matches_input(parser, text_files):
+    """Ordered mode yields documents in input order."""
+    docs = list(parser.parse_many(text_files, workers=2, ordered=True))
+
+    assert [d.filename for d in docs] == [p.name for p in text_files]
+    assert "Paper 3 results" in docs[3].full_text
+
+
+def test_parse_many_unordered_yields_all(parser, text_files):
+    """Completion-order mode still yields every document exactly once."""
+    docs = list(parser.parse_many(text_files, workers=3))
+
+    assert sorted(d.filename for d in docs) == sorted(p.name for p in text_files)
+
+
+def test_parse_many_isolates_failures(parser, text_files, tmp_path):
+    """A failing file is reported via on_error and does not stop the batch."""
+    bad = tmp_path / "broken.docx"
+    bad.write_text("not supported")
+    errors = []
+
+    docs = list(parser.parse_many(
+        [text_files[0], bad, text_files[1]],
+        workers=2,
+        ordered=True,
+        on_error=lambda path, e: errors.append((path.name, type(e))),
+    ))
+
+    assert [d.filename for d in docs] == [text_files[0].name, text_files[1].name]
+    assert errors == [("broken.docx", ValueError)]
+
+
+def test_parse_many_single_worker_runs_in_process(parser, text_files):
+    """workers=1 parses serially without spawning a pool."""
+    docs = list(parser.parse_many(text_files[:2], workers=1, ordered=True))
+
+    assert [d.filename for d in docs] == [p.name for p in text_files[:2]]
+
+
+def test_parse_many_serves_cache_hits_without_pool(parser, text_files, monkeypatch):
+    """Already-cached files are loaded in the main process."""
+    for path in text_files:
+        parser.parse_file(str(path))
+
+    import core.parsers.manager as manager
+
+    def fail_pool(*args, **kwargs):
+        raise AssertionError("process pool should not be used for cache hits")
+
+    monkeypatch.setattr(manager, "ProcessPoolExecutor", fail_pool)
+    docs = list(parser.parse_many(text_files, workers=4, ordered=True))
+
+    assert len(docs) == len(text_files)
+
+
+def test_parse_many_empty_input(parser):
+    assert list(parser.parse_many([])) == []
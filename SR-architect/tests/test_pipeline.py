@@ -2,6 +2,7 @@ import pytest
 from unittest.mock import MagicMock, patch
 from core.pipeline import HierarchicalExtractionPipeline
 from core.parser import DocumentChunk, ParsedDocument
+from core.classification import RelevanceResult
 from pydantic import BaseModel
 
 class SampleSchema(BaseModel):
@@ -43,7 +44,10 @@ def test_extract_document_flow(mock_pipeline_components):
     mocks["filter"].filter_chunks.return_value = mock_filter_res
     
     # Mock Relevance
-    mocks["relevance"].get_relevant_chunks.return_value = ([DocumentChunk(text="foo")], {"stats": {}})
+    mocks["relevance"].get_relevant_chunks.return_value = (
+        [DocumentChunk(text="foo")],
+        [RelevanceResult(chunk_index=0, is_relevant=True, confidence=0.9, reason="data")],
+    )
     mocks["relevance"].get_classification_summary.return_value = {"relevant_chunks": 1, "total_chunks": 1}
     
     # Mock Extractor
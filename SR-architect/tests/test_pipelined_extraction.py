@@ -0,0 +1,139 @@
+"""
+Tests for pipelined (streaming) parse -> extract execution.
+"""
+import asyncio
+import csv
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from core.batch import BatchExecutor
+from core.parser import ParsedDocument
+from core.schema_builder import FieldDefinition, FieldType
+from core.service import ExtractionService
+from core.state_manager import PipelineCheckpoint, StateManager
+
+
+def _doc(name: str) -> ParsedDocument:
+    return ParsedDocument(filename=name, chunks=[], full_text=f"text of {name}")
+
+
+@pytest.fixture
+def mock_state_manager():
+    sm = MagicMock(spec=StateManager)
+    sm.load.return_value = PipelineCheckpoint()
+    sm.save_async = AsyncMock()
+    return sm
+
+
+@pytest.fixture
+def mock_pipeline():
+    p = MagicMock()
+    result = MagicMock()
+    result.model_dump.return_value = {"title": "value"}
+    p.extract_document_async = AsyncMock(return_value=result)
+    return p
+
+
+def test_process_stream_consumes_until_sentinel(mock_pipeline, mock_state_manager):
+    """Every queued document is extracted and workers stop on None."""
+    executor = BatchExecutor(mock_pipeline, mock_state_manager, max_workers=2)
+    seen = []
+
+    async def run():
+        queue = asyncio.Queue(maxsize=1)
+
+        async def produce():
+            for name in ["a.pdf", "b.pdf", "c.pdf"]:
+                await queue.put(_doc(name))
+            await queue.put(None)
+
+        await asyncio.gather(
+            produce(),
+            executor.process_stream_async(
+                queue, MagicMock(), "theme",
+                callback=lambda f, d, s: seen.append((f, s)),
+            ),
+        )
+
+    asyncio.run(run())
+
+    assert mock_pipeline.extract_document_async.call_count == 3
+    assert sorted(seen) == [("a.pdf", "success"), ("b.pdf", "success"), ("c.pdf", "success")]
+
+
+def test_process_stream_skips_processed_on_resume(mock_pipeline, mock_state_manager):
+    state = PipelineCheckpoint()
+    state.processed_files.add("a.pdf")
+    mock_state_manager.load.return_value = state
+    executor = BatchExecutor(mock_pipeline, mock_state_manager, max_workers=2)
+
+    async def run():
+        queue = asyncio.Queue()
+        for name in ["a.pdf", "b.pdf"]:
+            queue.put_nowait(_doc(name))
+        queue.put_nowait(None)
+        await executor.process_stream_async(queue, MagicMock(), "theme", resume=True)
+
+    asyncio.run(run())
+
+    assert mock_pipeline.extract_document_async.call_count == 1
+
+
+def test_run_extraction_pipelined_writes_rows(tmp_path):
+    """Pipelined mode streams parsed docs into extraction and the CSV."""
+    for name in ["a.pdf", "b.pdf"]:
+        (tmp_path / name).write_bytes(b"%PDF-1.4\n")
+    output_csv = tmp_path / "out" / "results.csv"
+    fields = [FieldDefinition(name="title", field_type=FieldType.TEXT, description="Title")]
+
+    service = ExtractionService(provider="ollama", model="llama3")
+    service.parser = MagicMock()
+    service.parser.parse_many.side_effect = lambda paths, **kw: (_doc(p.name) for p in paths)
+
+    async def fake_stream(queue, schema, theme, resume, callback, concurrency_limit):
+        while (doc := await queue.get()) is not None:
+            callback(doc.filename, {"title": doc.filename}, "success")
+
+    with patch.object(service, "_initialize_pipeline"), \
+         patch("core.service.BatchExecutor") as MockBatchExecutor:
+        MockBatchExecutor.return_value.process_stream_async.side_effect = fake_stream
+        summary = service.run_extraction(
+            papers_dir=str(tmp_path),
+            fields=fields,
+            output_csv=str(output_csv),
+            vectorize=False,
+            hierarchical=True,
+            pipelined=True,
+        )
+
+    assert summary["parsed_files"] == 2
+    with open(output_csv) as f:
+        rows = list(csv.DictReader(f))
+    assert sorted(r["title"] for r in rows) == ["a.pdf", "b.pdf"]
+    MockBatchExecutor.return_value.process_batch.assert_not_called()
+
+
+def test_pipelined_without_hierarchical_runs_staged(tmp_path):
+    """Non-hierarchical runs ignore pipelined and keep the sync batch path."""
+    for name in ["a.pdf", "b.pdf"]:
+        (tmp_path / name).write_bytes(b"%PDF-1.4\n")
+    fields = [FieldDefinition(name="title", field_type=FieldType.TEXT, description="Title")]
+
+    service = ExtractionService(provider="ollama", model="llama3")
+    service.parser = MagicMock()
+    service.parser.parse_many.side_effect = lambda paths, **kw: (_doc(p.name) for p in paths)
+
+    with patch.object(service, "_initialize_pipeline"), \
+         patch("core.service.BatchExecutor") as MockBatchExecutor:
+        service.run_extraction(
+            papers_dir=str(tmp_path),
+            fields=fields,
+            output_csv=str(tmp_path / "out" / "results.csv"),
+            vectorize=False,
+            pipelined=True,
+        )
+
+    MockBatchExecutor.return_value.process_batch.assert_called_once()
+    MockBatchExecutor.return_value.process_stream_async.assert_not_called()
@@ -0,0 +1,92 @@
+"""
+Tests for stable-prefix prompt layout and cached token accounting.
+"""
+from types import SimpleNamespace
+
+import pytest
+
+from core.extractors import StructuredExtractor
+from core.prompt_cache import cached_content, content_text, supports_cache_control
+from core.token_tracker import TokenTracker, usage_from_completion
+
+TEXT = "A 62-year-old woman presented with multiple ground glass nodules."
+
+
+def _user_text(messages):
+    return content_text(messages[-1]["content"])
+
+
+def test_extraction_prompt_puts_document_before_volatile_parts():
+    extractor = StructuredExtractor(provider="openai", model="gpt-4o-mini")
+
+    first = extractor._build_extraction_messages(TEXT)
+    revised = extractor._build_extraction_messages(
+        TEXT, revision_prompts=["Check the age"], pre_filled_fields={"doi": "10.1/x"}
+    )
+
+    text = _user_text(revised)
+    assert text.index(TEXT) < text.index("PRE-EXTRACTED FIELDS") < text.index("REVISION INSTRUCTIONS")
+    assert text.startswith(_user_text(first))
+    assert revised[0] == first[0]
+
+
+def test_evidence_prompt_puts_source_before_extracted_data():
+    extractor = StructuredExtractor(provider="openai", model="gpt-4o-mini")
+
+    a = _user_text(extractor._build_evidence_messages(TEXT, {"patient_age": "62"}))
+    b = _user_text(extractor._build_evidence_messages(TEXT, {"patient_age": "63"}))
+
+    assert a.index("SOURCE TEXT") < a.index("EXTRACTED DATA")
+    prefix = a[:a.index("EXTRACTED DATA")]
+    assert b.startswith(prefix) and TEXT in prefix
+
+
+def test_cache_control_parts_only_where_supported():
+    anthropic = StructuredExtractor(provider="openrouter", model="anthropic/claude-3.5-sonnet")
+    messages = anthropic._build_extraction_messages(TEXT, revision_prompts=["Check the age"])
+
+    stable, volatile = messages[1]["content"]
+    assert stable["cache_control"] == {"type": "ephemeral"} and TEXT in stable["text"]
+    assert "cache_control" not in volatile
+    assert messages[0]["content"][0]["cache_control"] == {"type": "ephemeral"}
+
+    assert isinstance(
+        StructuredExtractor(provider="openai", model="gpt-4o")._build_extraction_messages(TEXT)[1]["content"], str
+    )
+    assert not supports_cache_control("openrouter", "openai/gpt-4o")
+    assert cached_content("stable") == "stable"
+
+
+def test_usage_from_completion_reads_cached_tokens():
+    openai = SimpleNamespace(usage=SimpleNamespace(
+        prompt_tokens=2000, completion_tokens=100, total_tokens=2100,
+        prompt_tokens_details=SimpleNamespace(cached_tokens=1500),
+    ))
+    anthropic = SimpleNamespace(usage=SimpleNamespace(
+        prompt_tokens=2000, completion_tokens=100, total_tokens=2100,
+        cache_read_input_tokens=0, cache_creation_input_tokens=1800,
+    ))
+
+    assert usage_from_completion(openai)["cached_tokens"] == 1500
+    assert usage_from_completion(anthropic) == {
+        "prompt_tokens": 2000, "completion_tokens": 100, "total_tokens": 2100, "cache_write_tokens": 1800,
+    }
+    assert usage_from_completion(SimpleNamespace(usage=None)) is None
+
+
+def test_tracker_discounts_cached_tokens_and_reports_hit_rate():
+    tracker = TokenTracker(api_key="")
+    tracker._pricing_cache["test/model"] = {"prompt": 1.0, "completion": 2.0, "cache_read": 0.1}
+
+    full = tracker.calculate_cost(1_000_000, 0, "test/model")
+    cached = tracker.calculate_cost(1_000_000, 0, "test/model", cached_tokens=750_000)
+    assert full == pytest.approx(1.0)
+    assert cached == pytest.approx(0.25 + 0.075)
+
+    tracker.record_usage({"prompt_tokens": 2000, "completion_tokens": 10, "cached_tokens": 1500}, "test/model")
+    tracker.record_usage({"prompt_tokens": 2000, "completion_tokens": 10}, "test/model")
+    summary = tracker.get_session_summary()
+
+    assert summary["total_cached_prompt_tokens"] == 1500
+    assert summary["total_uncached_prompt_tokens"] == 2500
+    assert summary["cache_hit_rate"] == 0.375
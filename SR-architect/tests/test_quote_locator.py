@@ -0,0 +1,81 @@
+"""
+Tests for the indexed fuzzy quote locator.
+"""
+import random
+import re
+
+import pytest
+
+from core.text_utils import QuoteIndex, find_best_substring_match, jaccard_score, tokenize
+
+TEXT = (
+    "Diffuse pulmonary meningotheliomatosis is a rare condition. "
+    "A 62-year-old woman presented with cough and dyspnea. "
+    "CT revealed innumerable bilateral micronodules measuring up to 4 mm. "
+    "Transbronchial biopsy confirmed minute meningothelial-like nodules. "
+    "The patient remained stable without treatment."
+)
+
+
+def _scan(text, pattern, window_slack=0.5):
+    """Best Jaccard score over every token window (the previous algorithm)."""
+    pattern_set = set(tokenize(pattern))
+    n = len(tokenize(pattern))
+    tokens = [m.group().lower() for m in re.finditer(r"\b\w+\b", text)]
+    min_window = max(1, int(n * (1 - window_slack)))
+    max_window = int(n * (1 + window_slack)) + 1
+    best = 0.0
+    for i in range(len(tokens) - min_window + 1):
+        for w in range(min_window, min(max_window, len(tokens) - i + 1)):
+            best = max(best, jaccard_score(set(tokens[i:i + w]), pattern_set))
+    return best
+
+
+def test_exact_quote_short_circuits():
+    quote = "A 62-year-old woman presented with cough"
+    matches = QuoteIndex(TEXT).locate(quote)
+    assert len(matches) == 1
+    assert matches[0].score == 1.0
+    assert TEXT[matches[0].start:matches[0].end] == quote
+
+
+def test_paraphrased_quote_returns_span_offsets():
+    quote = "CT revealed numerous bilateral micronodules measuring up to 4 mm"
+    match = QuoteIndex(TEXT).locate(quote, threshold=0.7)[0]
+    assert match.text == TEXT[match.start:match.end]
+    assert match.text.startswith("CT revealed innumerable")
+    assert match.score == pytest.approx(_scan(TEXT, quote))
+
+
+def test_top_k_returns_non_overlapping_ranked_matches():
+    text = "the tumor measured 3 cm in diameter. later the tumor measured 5 cm in diameter."
+    matches = QuoteIndex(text).locate("tumor measured 4 cm in diameter", threshold=0.5, top_k=3)
+    assert len(matches) == 2
+    assert matches[0].start < matches[1].start
+    assert matches[0].end <= matches[1].start
+    assert matches[0].score == matches[1].score
+
+
+def test_missing_quote_reports_best_score_without_span():
+    matched, score, span = find_best_substring_match(TEXT, "The median survival was 14 months")
+    assert matched is None and span is None
+    assert 0.0 < score < 0.8
+    assert QuoteIndex(TEXT).locate("completely unrelated words here") == []
+
+
+def test_scores_match_exhaustive_scan():
+    random.seed(7)
+    vocab = [f"w{i}" for i in range(40)] + ["the", "of", "and"] * 8
+    for _ in range(200):
+        words = [random.choice(vocab) for _ in range(random.randint(20, 200))]
+        text = " ".join(words)
+        start = random.randrange(len(words) - 2)
+        quote = words[start:start + random.randint(2, 15)]
+        quote[random.randrange(len(quote))] = random.choice(vocab)
+        quote = " ".join(quote) + "."
+
+        _, score, span = find_best_substring_match(text, quote, threshold=0.5)
+        expected = _scan(text, quote)
+        if expected >= 0.5:
+            assert score == pytest.approx(expected)
+            assert span is not None
@@ -0,0 +1,140 @@
+"""
+Tests for the persistent chunk relevance cache.
+"""
+import asyncio
+import re
+from unittest.mock import MagicMock
+
+import pytest
+
+from core.cache import CacheManager
+from core.classification import RelevanceClassifier
+from core.classification.models import ChunkRelevance, RelevanceResponse
+from core.parser import DocumentChunk
+
+
+def _respond(messages, fail=False):
+    if fail:
+        raise RuntimeError("offline")
+    indices = [int(i) for i in re.findall(r"^\[(\d+)\]", messages[-1]["content"], re.M)]
+    response = RelevanceResponse(classifications=[
+        ChunkRelevance(index=i, relevant=1, reason="has data") for i in indices
+    ])
+    return response, MagicMock(usage=None)
+
+
+class FakeClient:
+    def __init__(self, fail=False):
+        self.calls = 0
+        self.fail = fail
+        self.chat = MagicMock()
+        self.chat.completions.create_with_completion = self.create
+
+    def create(self, model, messages, **kwargs):
+        self.calls += 1
+        return _respond(messages, self.fail)
+
+
+class FakeAsyncClient(FakeClient):
+    async def create(self, model, messages, **kwargs):
+        self.calls += 1
+        return _respond(messages, self.fail)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    manager = CacheManager(db_path=tmp_path / "cache.db")
+    yield manager
+    manager.close()
+
+
+def _classifier(cache, client=None, async_client=None, model="model-a"):
+    classifier = RelevanceClassifier(api_key="mock", model=model, batch_size=5, cache=cache)
+    classifier._instructor_client = client or FakeClient()
+    classifier._async_instructor_client = async_client or FakeAsyncClient()
+    return classifier
+
+
+CHUNKS = [DocumentChunk(text=f"Chunk {i} text", section="Results") for i in range(12)]
+
+
+def test_repeat_run_makes_no_relevance_calls(cache):
+    first = _classifier(cache)
+    first.classify_batch(CHUNKS, "theme", ["age", "sex"])
+    assert first._instructor_client.calls == 3
+
+    second = _classifier(cache)
+    results = second.classify_batch(CHUNKS, "theme", ["age", "sex"])
+
+    assert second._instructor_client.calls == 0
+    assert [r.chunk_index for r in results] == list(range(12))
+    assert all(r.is_relevant and r.reason == "has data" for r in results)
+    assert second.get_cache_stats() == {"enabled": True, "hits": 12, "misses": 0, "hit_rate": 100.0}
+
+
+def test_only_new_chunks_are_classified(cache):
+    _classifier(cache).classify_batch(CHUNKS[:10], "theme", ["age"])
+
+    classifier = _classifier(cache)
+    results = classifier.classify_batch(CHUNKS, "theme", ["age"])
+
+    assert classifier._instructor_client.calls == 1
+    assert classifier.cache_hits == 10 and classifier.cache_misses == 2
+    assert [r.chunk_index for r in results] == list(range(12))
+
+
+def test_key_includes_fields_and_model(cache):
+    _classifier(cache).classify_batch(CHUNKS, "theme", ["age"])
+
+    other_fields = _classifier(cache)
+    other_fields.classify_batch(CHUNKS, "theme", ["age", "sex"])
+    other_model = _classifier(cache, model="model-b")
+    other_model.classify_batch(CHUNKS, "theme", ["age"])
+
+    assert other_fields._instructor_client.calls == 3
+    assert other_model._instructor_client.calls == 3
+
+
+def test_fallback_decisions_are_not_cached(cache):
+    _classifier(cache, client=FakeClient(fail=True)).classify_batch(CHUNKS, "theme", ["age"])
+
+    retry = _classifier(cache)
+    retry.classify_batch(CHUNKS, "theme", ["age"])
+
+    assert retry._instructor_client.calls == 3
+
+
+def test_async_path_shares_cache(cache):
+    _classifier(cache).classify_batch(CHUNKS, "theme", ["age"])
+
+    classifier = _classifier(cache)
+    results = asyncio.run(classifier.classify_batch_async(CHUNKS, "theme", ["age"]))
+
+    assert classifier._async_instructor_client.calls == 0
+    assert len(results) == 12
+    assert cache.get_stats()["cached_relevance"] == 12
+
+
+def test_no_cache_reports_disabled():
+    classifier = RelevanceClassifier(api_key="mock")
+    assert classifier.get_cache_stats()["enabled"] is False
+
+
+def test_local_cache_key_is_stable_before_scorer_loads():
+    classifier = RelevanceClassifier(api_key="mock", mode="hybrid")
+    key = classifier._cache_model_key
+
+    classifier._scorer = MagicMock(model_name="lazily-loaded")
+
+    assert classifier._cache_model_key == key
+
+
+def test_local_cache_key_includes_thresholds():
+    low = RelevanceClassifier(api_key="mock", mode="local", scorer=MagicMock(
+        model_name="m", high_threshold=0.6, low_threshold=0.2
+    ))
+    high = RelevanceClassifier(api_key="mock", mode="local", scorer=MagicMock(
+        model_name="m", high_threshold=0.7, low_threshold=0.2
+    ))
+
+    assert low._cache_model_key != high._cache_model_key
@@ -0,0 +1,103 @@
+"""
+Tests for concurrent relevance-classification batches.
+"""
+import asyncio
+import re
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from core.classification import RelevanceClassifier
+from core.classification.models import ChunkRelevance, RelevanceResponse
+from core.parser import DocumentChunk
+
+
+class FakeAsyncClient:
+    """Stands in for the Instructor async client; tracks in-flight calls."""
+
+    def __init__(self, delay=0.05, fail_batches=()):
+        self.delay = delay
+        self.fail_batches = set(fail_batches)
+        self.in_flight = 0
+        self.peak = 0
+        self.calls = 0
+        self.chat = MagicMock()
+        self.chat.completions.create_with_completion = self.create_with_completion
+
+    async def create_with_completion(self, model, messages, response_model, extra_body):
+        self.calls += 1
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            indices = [int(i) for i in re.findall(r"^\[(\d+)\]", messages[-1]["content"], re.M)]
+            if indices[0] in self.fail_batches:
+                raise RuntimeError("rate limited")
+            classifications = [
+                ChunkRelevance(index=i, relevant=i % 2, reason="")
+                for i in indices
+            ]
+            return RelevanceResponse(classifications=classifications), MagicMock(usage=None)
+        finally:
+            self.in_flight -= 1
+
+
+def _classifier(client, **kwargs):
+    classifier = RelevanceClassifier(api_key="mock", batch_size=10, **kwargs)
+    classifier._async_instructor_client = client
+    return classifier
+
+
+def _chunks(n):
+    return [DocumentChunk(text=f"chunk {i}") for i in range(n)]
+
+
+@pytest.mark.asyncio
+async def test_batches_run_concurrently_in_chunk_order():
+    client = FakeAsyncClient()
+    classifier = _classifier(client, max_concurrent_batches=10)
+
+    start = time.perf_counter()
+    results = await classifier.classify_batch_async(_chunks(100), "theme", ["age"])
+    elapsed = time.perf_counter() - start
+
+    assert client.calls == 10
+    assert elapsed < 10 * client.delay / 2
+    assert [r.chunk_index for r in results] == list(range(100))
+    assert [r.is_relevant for r in results[:4]] == [False, True, False, True]
+
+
+@pytest.mark.asyncio
+async def test_per_document_limit():
+    client = FakeAsyncClient()
+    classifier = _classifier(client, max_concurrent_batches=3)
+
+    await classifier.classify_batch_async(_chunks(100), "theme", ["age"])
+
+    assert client.peak == 3
+
+
+@pytest.mark.asyncio
+async def test_global_limit_across_documents():
+    client = FakeAsyncClient()
+    classifier = _classifier(client, max_concurrent_batches=4, global_concurrency=5)
+
+    await asyncio.gather(*(
+        classifier.classify_batch_async(_chunks(40), "theme", ["age"]) for _ in range(4)
+    ))
+
+    assert client.peak == 5
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_falls_back_alone():
+    client = FakeAsyncClient(fail_batches={20})
+    classifier = _classifier(client)
+
+    results = await classifier.classify_batch_async(_chunks(40), "theme", ["age"])
+
+    failed = results[20:30]
+    assert all(r.is_relevant and "failed" in r.reason for r in failed)
+    assert [r.is_relevant for r in results[30:32]] == [False, True]
+    assert [r.is_relevant for r in results[:2]] == [False, True]
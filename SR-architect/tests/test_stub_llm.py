@@ -0,0 +1,99 @@
+"""
+Tests for the offline OpenAI-compatible stub LLM server.
+"""
+import asyncio
+from typing import List, Literal, Optional
+
+import instructor
+import openai
+import pytest
+from pydantic import BaseModel, Field
+
+from core.client import LLMClientFactory
+from core.stub_llm import StubLLMConfig, StubLLMServer, instance_from_schema
+
+
+class Finding(BaseModel):
+    label: Literal["nodule", "mass"]
+    size_mm: int = Field(ge=1, le=30)
+
+
+class Report(BaseModel):
+    patient_age: Optional[str] = None
+    confidence: float = Field(ge=0, le=1)
+    findings: List[Finding] = Field(min_length=2)
+    stable: bool
+
+
+MESSAGES = [{"role": "user", "content": "Extract the report."}]
+
+
+@pytest.fixture
+def server():
+    with StubLLMServer(StubLLMConfig(latency="none", seed=0)) as server:
+        yield server
+
+
+def test_instance_from_schema_validates():
+    report = Report.model_validate(instance_from_schema(Report.model_json_schema()))
+
+    assert report.findings[0].label == "nodule"
+    assert 1 <= report.findings[0].size_mm <= 30
+    assert len(report.findings) == 2
+    assert 0 <= report.confidence <= 1
+
+
+def test_factory_targets_stub_in_tools_and_json_modes(server):
+    tools = LLMClientFactory.create("stub", base_url=server.base_url)
+    json_mode = LLMClientFactory.create("stub", base_url=server.base_url, mode=instructor.Mode.JSON)
+
+    report, completion = tools.chat.completions.create_with_completion(
+        model="stub-model", messages=MESSAGES, response_model=Report
+    )
+    assert isinstance(report, Report)
+    assert completion.usage.prompt_tokens > 0 and completion.usage.completion_tokens > 0
+    assert isinstance(json_mode.chat.completions.create(model="stub-model", messages=MESSAGES, response_model=Report), Report)
+    assert server.stats()["completed"] == 2
+
+
+def test_async_requests_overlap_latency():
+    config = StubLLMConfig(latency="fixed", latency_ms=200, prompt_tokens=10, completion_tokens=3)
+    with StubLLMServer(config) as server:
+        client = LLMClientFactory.create_async("stub", base_url=server.base_url)
+
+        async def run():
+            calls = [
+                client.chat.completions.create_with_completion(model="stub-model", messages=MESSAGES, response_model=Finding)
+                for _ in range(10)
+            ]
+            return await asyncio.gather(*calls)
+
+        loop = asyncio.new_event_loop()
+        try:
+            start = loop.time()
+            results = loop.run_until_complete(run())
+            elapsed = loop.time() - start
+        finally:
+            loop.close()
+
+    assert elapsed < 1.5
+    assert all(completion.usage.total_tokens == 13 for _, completion in results)
+
+
+def test_simulated_rate_limits_and_errors():
+    config = StubLLMConfig(latency="none", rate_limit_rate=1.0, retry_after=0)
+    with StubLLMServer(config) as server:
+        client = openai.OpenAI(base_url=server.base_url, api_key="stub", max_retries=0)
+        with pytest.raises(openai.RateLimitError):
+            client.chat.completions.create(model="stub-model", messages=MESSAGES)
+
+        server.config.rate_limit_rate, server.config.error_rate = 0.0, 1.0
+        with pytest.raises(openai.InternalServerError):
+            client.chat.completions.create(model="stub-model", messages=MESSAGES)
+
+        server.config.error_rate = 0.0
+        reply = client.chat.completions.create(model="stub-model", messages=MESSAGES)
+        assert reply.choices[0].message.content
+
+    stats = server.stats()
+    assert (stats["requests"], stats["rate_limited"], stats["errors"], stats["completed"]) == (3, 1, 1, 1)
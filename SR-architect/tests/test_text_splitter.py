@@ -1,6 +1,6 @@
 
 import pytest
-from core.text_splitter import TextSplitter, split_text_into_chunks
+from core.text_splitter import TextSplitter, get_splitter, split_text_into_chunks
 
 def test_split_text_basic():
     """Test basic splitting functionality."""
@@ -37,3 +37,26 @@ def test_empty_input():
     assert split_text_into_chunks("") == []
     assert split_text_into_chunks(None) == []
 
+
+def test_get_splitter_is_shared_per_config():
+    """One splitter instance is reused per (size, overlap)."""
+    assert get_splitter(50, 10) is get_splitter(50, 10)
+    assert get_splitter(50, 10) is not get_splitter(50, 5)
+
+def test_split_spans_offsets_and_page_anchor():
+    """Spans carry absolute offsets into the enclosing document."""
+    prefix = "Earlier page.\n\n"
+    page = "Same words here. " * 12
+    document = prefix + page
+    spans = get_splitter(50, 10).split_spans(page, offset=len(prefix), page_number=3)
+
+    assert len(spans) > 1
+    for span in spans:
+        assert document[span.start:span.end] == span.text
+        assert span.page_number == 3
+    # Repeated text resolves to successive occurrences
+    assert [s.start for s in spans] == sorted(s.start for s in spans)
+    assert len({s.start for s in spans}) == len(spans)
+
+def test_split_spans_empty():
+    assert get_splitter().split_spans("") == []